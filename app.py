@@ -1,148 +1,277 @@
+import os
+
 import dash
-from dash import html, dcc, Input, Output, callback
-import plotly.express as px
+from dash import html, dcc, Input, Output, State, Patch, ALL, MATCH, ClientsideFunction, callback, ctx, no_update
 import pandas as pd
+import plotly.graph_objects as go
+
+from data_service import DatasetService, SharedResultCache
+from indicator_data import DaemonSource, ETLOutputSource, downsample, surprise_counts
+from indicator_query import IndicatorQuery
+
 
 # 과일 데이터 생성
-df_fruits = pd.DataFrame({
-    "과일": ["사과", "오렌지", "바나나", "포도", "딸기"],
-    "수량": [10, 15, 7, 12, 9],
-    "가격": [1000, 800, 500, 1500, 2000]
-})
+def load_fruits():
+    return pd.DataFrame({
+        "과일": ["사과", "오렌지", "바나나", "포도", "딸기"],
+        "수량": [10, 15, 7, 12, 9],
+        "가격": [1000, 800, 500, 1500, 2000]
+    })
 
 # 육류 데이터 생성
-df_meats = pd.DataFrame({
-    "육류": ["소고기", "돼지고기", "닭고기", "양고기", "오리고기"],
-    "수량": [8, 12, 20, 5, 7],
-    "가격": [15000, 8000, 5000, 18000, 12000]
-})
+def load_meats():
+    return pd.DataFrame({
+        "육류": ["소고기", "돼지고기", "닭고기", "양고기", "오리고기"],
+        "수량": [8, 12, 20, 5, 7],
+        "가격": [15000, 8000, 5000, 18000, 12000]
+    })
+
+# 카테고리 레지스트리: 항목을 추가하면 탭과 콜백이 자동으로 적용됨
+# name: 데이터셋/컴포넌트 id, label: 탭 이름이자 항목 이름 컬럼, unit: 수량 단위
+CATEGORIES = [
+    {"name": "fruits", "label": "과일", "unit": "개", "loader": load_fruits},
+    {"name": "meats", "label": "육류", "unit": "kg", "loader": load_meats},
+]
+CATEGORY_BY_NAME = {category["name"]: category for category in CATEGORIES}
+
+# 경제지표 대시보드: ETL 결과 파일 (CSV / Parquet / run_incremental 분할 저장 디렉터리)
+INDICATORS = "indicators"
+ETL_OUTPUT_PATH = os.environ.get("ETL_OUTPUT_PATH", "bloomberg_transformed_data.csv")
+ETL_POLL_SECONDS = 10
+MAX_POINTS_PER_SERIES = 500
+
+# 여러 워커로 서비스할 때(wsgi.py) 워커 간 공유 디렉터리: ETL 결과 Arrow 스냅샷과 콜백 결과 캐시
+SHARED_DIR = os.environ.get("DASH_SHARED_DIR") or None
+# 상주 ETL 데몬 소켓을 지정하면 파일 대신 데몬이 게시한 데이터셋 사용 (etl_daemon.py)
+ETL_DAEMON_SOCKET = os.environ.get("ETL_DAEMON_SOCKET") or None
+etl_source = DaemonSource(ETL_DAEMON_SOCKET) if ETL_DAEMON_SOCKET else \
+    ETLOutputSource(ETL_OUTPUT_PATH, shared_dir=SHARED_DIR)
+
+# 데이터 접근 계층 (지연 로딩, 색인 조회, 차트/탭 캐시)
+service = DatasetService(
+    max_figures=4 * len(CATEGORIES) + 16,
+    shared_cache=SharedResultCache(os.path.join(SHARED_DIR, "callbacks.sqlite")) if SHARED_DIR else None
+)
+for category in CATEGORIES:
+    service.register(category["name"], key_column=category["label"], value_column="수량",
+                     title=f"{category['label']}별 수량", loader=category["loader"])
+service.register(INDICATORS, loader=etl_source.data, token=etl_source.token)
 
-# Dash 앱 초기화
-app = dash.Dash(__name__)
+# Dash 앱 초기화 (탭 내용은 나중에 생성되므로 콜백 id 검증 생략)
+app = dash.Dash(__name__, suppress_callback_exceptions=True)
 
-# 레이아웃 정의
+# 레이아웃 정의 (탭 내용은 처음 선택할 때 불러옴)
 app.layout = html.Div([
     html.H1("Dash 테스트 애플리케이션", id="title"),
 
     # 탭 추가
-    dcc.Tabs(id="tabs", value='tab-fruits', children=[
-        dcc.Tab(label='과일', value='tab-fruits'),
-        dcc.Tab(label='육류', value='tab-meats'),
-    ]),
+    dcc.Tabs(id="tabs", value=f"tab-{CATEGORIES[0]['name']}", children=[
+        dcc.Tab(label=category["label"], value=f"tab-{category['name']}") for category in CATEGORIES
+    ] + [dcc.Tab(label="경제지표", value=f"tab-{INDICATORS}")]),
 
-    html.Div(id='tabs-content')
+    dcc.Store(id="tab-request"),
+    html.Div([
+        html.Div(id={"type": "tab-panel", "index": name})
+        for name in [category["name"] for category in CATEGORIES] + [INDICATORS]
+    ], id='tabs-content')
 ])
 
-# 콜백: 탭 전환
-@callback(
-    Output('tabs-content', 'children'),
-    Input('tabs', 'value')
-)
-def render_content(tab):
-    if tab == 'tab-fruits':
-        return html.Div([
-            html.Div([
-                html.Label("과일 선택:"),
-                dcc.Dropdown(
-                    id="fruit-dropdown",
-                    options=[{"label": fruit, "value": fruit} for fruit in df_fruits["과일"]],
-                    value=df_fruits["과일"].iloc[0]
-                )
-            ], style={"width": "50%", "margin": "20px"}),
-
-            html.Div(id="fruit-info", style={"margin": "20px"}),
-
-            dcc.Graph(id="fruit-chart"),
-
-            html.Div([
-                html.Button("데이터 새로고침", id="refresh-button", n_clicks=0),
-                html.Div(id="button-click-count", style={"margin": "10px"})
-            ])
-        ])
-    elif tab == 'tab-meats':
-        return html.Div([
-            html.Div([
-                html.Label("육류 선택:"),
-                dcc.Dropdown(
-                    id="meat-dropdown",
-                    options=[{"label": meat, "value": meat} for meat in df_meats["육류"]],
-                    value=df_meats["육류"].iloc[0]
-                )
-            ], style={"width": "50%", "margin": "20px"}),
-
-            html.Div(id="meat-info", style={"margin": "20px"}),
-
-            dcc.Graph(id="meat-chart"),
-
-            html.Div([
-                html.Button("데이터 새로고침", id="meat-refresh-button", n_clicks=0),
-                html.Div(id="meat-button-click-count", style={"margin": "10px"})
-            ])
+# 차트 기본/선택 막대 색상
+BAR_COLOR = "#636efa"
+HIGHLIGHT_COLOR = "#EF553B"
+
+# 탭 내용 (데이터셋 버전별로 캐시)
+def tab_content(name):
+    category = CATEGORY_BY_NAME[name]
+    items = service.items(name)
+    return html.Div([
+        html.Div([
+            html.Label(f"{category['label']} 선택:"),
+            dcc.Dropdown(
+                id={"type": "item-dropdown", "index": name},
+                options=[{"label": item, "value": item} for item in items],
+                value=items[0]
+            )
+        ], style={"width": "50%", "margin": "20px"}),
+
+        html.Div([
+            html.H3(id={"type": "info-name", "index": name}),
+            html.P(id={"type": "info-quantity", "index": name}),
+            html.P(id={"type": "info-price", "index": name})
+        ], id={"type": "info", "index": name}, style={"margin": "20px"}),
+
+        dcc.Graph(id={"type": "chart", "index": name}, figure=service.figure(name)),
+
+        html.Div([
+            html.Button("데이터 새로고침", id={"type": "refresh-button", "index": name}, n_clicks=0),
+            html.Div(id={"type": "click-count", "index": name}, style={"margin": "10px"})
         ])
+    ])
 
-# 콜백: 선택된 과일 정보 표시
-@callback(
-    Output("fruit-info", "children"),
-    Input("fruit-dropdown", "value")
+# 클라이언트 콜백: 탭 전환 (이미 불러온 탭은 서버 요청 없이 표시만 전환)
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="showTab"),
+    Output({"type": "tab-panel", "index": ALL}, "style"),
+    Output("tab-request", "data"),
+    Input("tabs", "value"),
+    State({"type": "tab-panel", "index": ALL}, "children"),
+    State({"type": "tab-panel", "index": ALL}, "id")
 )
-def display_fruit_info(selected_fruit):
-    if selected_fruit:
-        fruit_data = df_fruits[df_fruits["과일"] == selected_fruit].iloc[0]
-        return html.Div([
-            html.H3(f"선택된 과일: {selected_fruit}"),
-            html.P(f"수량: {fruit_data['수량']}개"),
-            html.P(f"가격: {fruit_data['가격']}원")
-        ])
-    return "과일을 선택해주세요."
 
-# 콜백: 과일 차트 업데이트
+# 콜백: 처음 선택한 탭의 내용 생성
 @callback(
-    Output("fruit-chart", "figure"),
-    Input("fruit-dropdown", "value")
+    Output({"type": "tab-panel", "index": ALL}, "children"),
+    Input("tab-request", "data"),
+    prevent_initial_call=True
 )
-def update_fruit_chart(selected_fruit):
-    fig = px.bar(df_fruits, x="과일", y="수량", title="과일별 수량")
-    return fig
+def render_content(name):
+    if name == INDICATORS:
+        content = indicator_tab_content()
+    else:
+        content = service.cached(name, "tab", lambda: tab_content(name))
+    return [content if output["id"]["index"] == name else no_update for output in ctx.outputs_list]
+
+def highlight_selected(name, selected):
+    """차트 전체 대신 막대 색상만 바꾸는 부분 업데이트 (Patch)"""
+    patched_figure = Patch()
+    patched_figure["data"][0]["marker"]["color"] = [
+        HIGHLIGHT_COLOR if item == selected else BAR_COLOR for item in service.items(name)
+    ]
+    return patched_figure
+
+# 목적격 조사: 받침이 있으면 '을', 없으면 '를'
+def object_particle(word):
+    code = ord(word[-1]) - 0xAC00
+    return "을" if 0 <= code < 11172 and code % 28 else "를"
+
+# 선택된 항목 정보 (제목, 수량, 가격 텍스트)
+def display_item_info(name, selected):
+    category = CATEGORY_BY_NAME[name]
+    # 데이터 버전이 바뀌어 목록에 없는 선택 값은 선택하지 않은 것으로 처리
+    item_data = service.lookup(name, selected) if selected else None
+    if item_data is None:
+        return f"{category['label']}{object_particle(category['label'])} 선택해주세요.", "", ""
+    return (
+        f"선택된 {category['label']}: {selected}",
+        f"수량: {item_data['수량']}{category['unit']}",
+        f"가격: {item_data['가격']}원"
+    )
 
-# 콜백: 과일 버튼 클릭 카운트
+# 콜백: 항목 선택 시 정보 텍스트와 차트 강조를 한 번의 요청으로 갱신 (모든 카테고리 공용)
 @callback(
-    Output("button-click-count", "children"),
-    Input("refresh-button", "n_clicks")
+    Output({"type": "info-name", "index": MATCH}, "children"),
+    Output({"type": "info-quantity", "index": MATCH}, "children"),
+    Output({"type": "info-price", "index": MATCH}, "children"),
+    Output({"type": "chart", "index": MATCH}, "figure"),
+    Input({"type": "item-dropdown", "index": MATCH}, "value")
 )
-def count_fruit_clicks(n_clicks):
-    return f"버튼 클릭 횟수: {n_clicks}"
+def select_item(selected):
+    name = ctx.outputs_list[0]["id"]["index"]
+    return *display_item_info(name, selected), highlight_selected(name, selected)
+
+# 클라이언트 콜백: 버튼 클릭 카운트 (서버 요청 없음, 모든 카테고리 공용)
+app.clientside_callback(
+    ClientsideFunction(namespace="dashboard", function_name="countClicks"),
+    Output({"type": "click-count", "index": MATCH}, "children"),
+    Input({"type": "refresh-button", "index": MATCH}, "n_clicks")
+)
+
+# 경제지표 탭 (처음 열 때 ETL 결과를 읽고, 선택 항목은 콜백에서 채움)
+def indicator_tab_content():
+    service.data(INDICATORS)
+    return html.Div([
+        html.Div([
+            dcc.Dropdown(id="indicator-countries", multi=True, placeholder="국가 (전체)"),
+            dcc.Dropdown(id="indicator-names", multi=True, placeholder="지표 (전체)"),
+            dcc.DatePickerRange(id="indicator-dates", display_format="YYYY-MM-DD"),
+        ], style={"width": "50%", "margin": "20px"}),
+
+        html.P(id="indicator-summary", style={"margin": "20px"}),
+        dcc.Graph(id="indicator-series"),
+        dcc.Graph(id="indicator-surprises"),
 
-# 콜백: 선택된 육류 정보 표시
+        # ETL 결과 갱신 확인 (파일이 바뀐 경우에만 버전이 바뀜, 워커 간 같은 값)
+        dcc.Interval(id="indicator-poll", interval=ETL_POLL_SECONDS * 1000),
+        dcc.Store(id="indicator-version", data=service.token(INDICATORS))
+    ])
+
+# 콜백: ETL 결과 파일이 바뀌었으면 바뀐 파일만 다시 읽고 버전 갱신
 @callback(
-    Output("meat-info", "children"),
-    Input("meat-dropdown", "value")
+    Output("indicator-version", "data"),
+    Input("indicator-poll", "n_intervals"),
+    State("indicator-version", "data"),
+    prevent_initial_call=True
 )
-def display_meat_info(selected_meat):
-    if selected_meat:
-        meat_data = df_meats[df_meats["육류"] == selected_meat].iloc[0]
-        return html.Div([
-            html.H3(f"선택된 육류: {selected_meat}"),
-            html.P(f"수량: {meat_data['수량']}kg"),
-            html.P(f"가격: {meat_data['가격']}원")
-        ])
-    return "육류를 선택해주세요."
+def poll_etl_output(n_intervals, version):
+    if etl_source.poll():
+        service.refresh(INDICATORS, etl_source.data())
+    current = service.token(INDICATORS)
+    return no_update if current == version else current
 
-# 콜백: 육류 차트 업데이트
+# 콜백: 데이터 버전별 국가/지표 선택 항목과 기간 범위
 @callback(
-    Output("meat-chart", "figure"),
-    Input("meat-dropdown", "value")
+    Output("indicator-countries", "options"),
+    Output("indicator-names", "options"),
+    Output("indicator-dates", "min_date_allowed"),
+    Output("indicator-dates", "max_date_allowed"),
+    Input("indicator-version", "data")
 )
-def update_meat_chart(selected_meat):
-    fig = px.bar(df_meats, x="육류", y="수량", title="육류별 수량")
-    return fig
+def update_indicator_options(version):
+    return service.cached(INDICATORS, "options", indicator_options)
 
-# 콜백: 육류 버튼 클릭 카운트
+def indicator_options():
+    df = service.data(INDICATORS)
+    if df.empty:
+        return [], [], None, None
+    return (
+        sorted(df["country"].unique()),
+        sorted(df["indicator"].unique()),
+        df["date"].min().strftime("%Y-%m-%d"),
+        df["date"].max().strftime("%Y-%m-%d")
+    )
+
+# 콜백: 필터링/구간 집계한 시계열과 서프라이즈 분포 (필터 조합별로 캐시)
 @callback(
-    Output("meat-button-click-count", "children"),
-    Input("meat-refresh-button", "n_clicks")
+    Output("indicator-summary", "children"),
+    Output("indicator-series", "figure"),
+    Output("indicator-surprises", "figure"),
+    Input("indicator-countries", "value"),
+    Input("indicator-names", "value"),
+    Input("indicator-dates", "start_date"),
+    Input("indicator-dates", "end_date"),
+    Input("indicator-version", "data")
 )
-def count_meat_clicks(n_clicks):
-    return f"버튼 클릭 횟수: {n_clicks}"
+def update_indicator_charts(countries, indicators, start_date, end_date, version):
+    key = ("charts", tuple(countries or ()), tuple(indicators or ()), start_date, end_date)
+    return service.cached(INDICATORS, key,
+                          lambda: indicator_charts(countries, indicators, start_date, end_date))
+
+def indicator_charts(countries, indicators, start_date, end_date):
+    data = service.data(INDICATORS)
+    if data.empty:
+        return f"ETL 결과가 없습니다: {ETL_OUTPUT_PATH}", go.Figure(), go.Figure()
+    # 데이터 버전별 색인 하나를 만들어 두고 필터 조합마다 전체 행 마스크 대신 이진 탐색으로 조회
+    query = service.cached(INDICATORS, "query", lambda: IndicatorQuery(data), shared=False)
+    df = query.range(indicators, countries, start_date, end_date)
+    if df.empty:
+        return "선택한 조건에 해당하는 데이터가 없습니다.", go.Figure(), go.Figure()
+
+    # 긴 시계열은 서버에서 구간 평균으로 줄이고 WebGL(scattergl)로 그림
+    points = downsample(df, MAX_POINTS_PER_SERIES)
+    series = go.Figure([
+        go.Scattergl(x=group["date"], y=group["actual"], mode="lines", name=f"{country} {indicator}")
+        for (country, indicator), group in points.groupby(["country", "indicator"], observed=True)
+    ])
+    series.update_layout(title="실제치 추이", xaxis_title="날짜", yaxis_title="실제치")
+
+    counts = surprise_counts(df)
+    surprises = go.Figure([
+        go.Bar(x=list(counts.index), y=counts[surprise].tolist(), name=surprise) for surprise in counts.columns
+    ])
+    surprises.update_layout(title="국가별 서프라이즈 분포", barmode="stack")
+
+    summary = f"{len(df):,}개 레코드 → 차트 {len(points):,}개 점"
+    return summary, series, surprises
 
 if __name__ == "__main__":
     app.run(debug=True)
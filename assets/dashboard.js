@@ -0,0 +1,21 @@
+// Dash 클라이언트 콜백 (서버 요청 없이 브라우저에서 실행)
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    dashboard: {
+        // 버튼 클릭 횟수 표시
+        countClicks: function(n_clicks) {
+            return '버튼 클릭 횟수: ' + n_clicks;
+        },
+
+        // 선택한 탭 패널만 표시하고, 아직 내용이 없는 패널이면 서버에 내용 요청
+        showTab: function(tab, panels, ids) {
+            var name = tab.replace(/^tab-/, '');
+            var styles = ids.map(function(id) {
+                return {display: id.index === name ? 'block' : 'none'};
+            });
+            var loaded = ids.some(function(id, i) {
+                return id.index === name && panels[i];
+            });
+            return [styles, loaded ? window.dash_clientside.no_update : name];
+        }
+    }
+});
@@ -0,0 +1,5 @@
+"""
+성능 벤치마크 스크립트 모음
+
+저장소 루트에서 모듈로 실행합니다. 예: python -m benchmarks.bench_report_streaming
+"""
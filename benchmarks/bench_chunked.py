@@ -0,0 +1,71 @@
+"""
+청크 ETL 벤치마크: run_pipeline(전체 메모리) vs run_chunked(지표 배치)
+
+fake_blpapi로 같은 데이터를 추출/변환/저장하며 각 모드를 별도 프로세스에서 실행하여
+소요 시간과 최대 RSS를 비교합니다.
+
+    python -m benchmarks.bench_chunked --countries 100 --indicators 40 --years 30
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def run_child(mode, output_path, countries, indicators, years):
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+    fake_blpapi.Session.latency = 0.0
+    args = ([f"IND{i:02d}" for i in range(indicators)], [f"C{i:03d}" for i in range(countries)],
+            f"{2024 - years}-01-01", "2023-12-31")
+    etl = BloombergETL(bloomberg_api=fake_blpapi, batch_size=100, max_in_flight=8)
+
+    start = time.perf_counter()
+    if mode == 'chunked':
+        rows = etl.run_chunked(*args, output_path=output_path)
+    else:
+        rows = len(etl.run_pipeline(*args, output_path=output_path))
+    print(json.dumps({
+        'rows': rows,
+        'seconds': time.perf_counter() - start,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--countries', type=int, default=100)
+    parser.add_argument('--indicators', type=int, default=40)
+    parser.add_argument('--years', type=int, default=30)
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='parquet')
+    parser.add_argument('--child', choices=['in-memory', 'chunked'], help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.output, args.countries, args.indicators, args.years)
+        return
+
+    print(f"{'mode':<10} {'rows':>10} {'seconds':>9} {'peak RSS (MB)':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ['in-memory', 'chunked']:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_chunked', '--child', mode,
+                 '--countries', str(args.countries), '--indicators', str(args.indicators),
+                 '--years', str(args.years), '--output', os.path.join(tmp, f'{mode}.{args.format}')],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:<10} {result['rows']:>10,} {result['seconds']:>9.2f} {result['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
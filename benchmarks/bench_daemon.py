@@ -0,0 +1,119 @@
+"""
+상주 ETL 데몬 벤치마크: 파이프라인 재실행 vs 데몬 데이터셋 조회
+
+합성 추출 데이터를 샘플 파일로 두고, 소비자가 최신 변환 결과를 얻는 시간을 비교합니다.
+- 파이프라인 재실행: 새 프로세스에서 BloombergETL.run_pipeline 후 결과 파일 읽기
+- 데몬 (새 프로세스): 새 프로세스에서 DaemonClient.data() (인터프리터/pandas 시작 포함)
+- 데몬 (상주 소비자): 이미 실행 중인 소비자의 DaemonClient.data() - 첫 매핑 / 변경 없을 때
+
+    python -m benchmarks.bench_daemon --rows 1000000
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_raw_data, shape_for_rows
+from etl_daemon import DaemonClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PIPELINE_SCRIPT = """
+import time
+start = time.perf_counter()
+from etl_bloomberg import BloombergETL
+from profiling import configure_logging
+from storage import get_storage
+import logging
+configure_logging(logging.WARNING)
+BloombergETL(use_sample=True).run_pipeline(output_path='out.parquet')
+df = get_storage('out.parquet').read('out.parquet')
+print(len(df), time.perf_counter() - start)
+"""
+
+CLIENT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from etl_daemon import DaemonClient
+df = DaemonClient(sys.argv[1]).data()
+print(len(df), time.perf_counter() - start)
+"""
+
+
+def run_script(script, cwd, *args):
+    """새 프로세스 실행 - (프로세스 전체 시간, 스크립트 안에서 잰 시간, 행 수)"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, '-c', script, *args], cwd=cwd, env=env,
+                            check=True, capture_output=True, text=True).stdout
+    total = time.perf_counter() - start
+    rows, inner = output.split()[-2:]
+    return total, float(inner), int(rows)
+
+
+def wait_for_socket(path, process, timeout=600):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"데몬이 종료되었습니다 (종료 코드 {process.returncode})")
+        if os.path.exists(path):
+            try:
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.connect(path)
+                return
+            except OSError:
+                pass
+        time.sleep(0.1)
+    raise TimeoutError(f"데몬이 {timeout}초 안에 시작되지 않았습니다")
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help='합성 추출 데이터 행 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_raw_data(*shape_for_rows(args.rows)).to_csv(os.path.join(tmp, 'bloomberg_sample_data.csv'),
+                                                            index=False)
+        socket_path = os.path.join(tmp, 'etl.sock')
+        pipeline_total, _, rows = run_script(PIPELINE_SCRIPT, tmp)
+
+        daemon = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'etl_daemon.py'), '--sample', '--interval', '3600',
+             '--socket', socket_path, '--snapshot-dir', os.path.join(tmp, 'snapshots')],
+            cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_for_socket(socket_path, daemon)
+            client_total, client_inner, client_rows = run_script(CLIENT_SCRIPT, tmp, socket_path)
+            client = DaemonClient(socket_path)
+            _, first = timed(client.data)
+            _, warm = timed(client.data)
+            info, refresh = timed(client.refresh)
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=60)
+
+    assert client_rows == rows
+    print(f"rows: {rows:,}")
+    print(f"{'consumer':<44} {'ms':>10}")
+    print(f"{'pipeline re-run (new process)':<44} {pipeline_total * 1000:>10.1f}")
+    print(f"{'daemon, new process (incl. startup)':<44} {client_total * 1000:>10.1f}")
+    print(f"{'daemon, new process (imports + fetch)':<44} {client_inner * 1000:>10.1f}")
+    print(f"{'daemon, resident consumer, first map':<44} {first * 1000:>10.1f}")
+    print(f"{'daemon, resident consumer, unchanged':<44} {warm * 1000:>10.1f}")
+    print(f"{'daemon refresh request (unchanged data)':<44} {refresh * 1000:>10.1f}")
+    print(json.dumps({key: info[key] for key in ('version', 'refreshes', 'rows')}))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Dash 상호작용별 서버 요청 수 및 페이로드 바이트 측정
+
+현재 app.py와 (선택) 이전 git 리비전의 app.py에서 같은 시나리오를 실행해 비교합니다.
+
+    python -m benchmarks.bench_dash_payload --baseline-rev HEAD~1
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+from benchmarks.dash_harness import NO_UPDATE, DashSession, id_key
+
+# 카테고리별 고정 id를 쓰던 이전 app.py의 컴포넌트 id
+LEGACY_IDS = {
+    ('item-dropdown', 'fruits'): 'fruit-dropdown',
+    ('refresh-button', 'fruits'): 'refresh-button',
+    ('item-dropdown', 'meats'): 'meat-dropdown',
+    ('refresh-button', 'meats'): 'meat-refresh-button',
+}
+
+
+def component(session, kind, name):
+    """패턴 매칭 id가 있으면 사용하고, 없으면 이전 고정 id 사용"""
+    pattern_id = {'type': kind, 'index': name}
+    return pattern_id if id_key(pattern_id) in session.ids else LEGACY_IDS[(kind, name)]
+
+
+def show_tab(tab, panels, ids):
+    """assets/dashboard.js의 showTab과 같은 동작"""
+    name = tab[len('tab-'):]
+    styles = [{'display': 'block' if panel_id['index'] == name else 'none'} for panel_id in ids]
+    loaded = any(panel_id['index'] == name and panel for panel_id, panel in zip(ids, panels))
+    return [styles, NO_UPDATE if loaded else name]
+
+
+CLIENTSIDE = {'dashboard.showTab': show_tab}
+
+# (상호작용 이름, 실행 함수)
+SCENARIO = [
+    ('page load', lambda session: session.load()),
+    ('select fruit', lambda session: session.set_prop(component(session, 'item-dropdown', 'fruits'), 'value', '바나나')),
+    ('click fruit button', lambda session: session.set_prop(component(session, 'refresh-button', 'fruits'), 'n_clicks', 1)),
+    ('switch to meats tab', lambda session: session.set_prop('tabs', 'value', 'tab-meats')),
+    ('select meat', lambda session: session.set_prop(component(session, 'item-dropdown', 'meats'), 'value', '닭고기')),
+    ('click meat button', lambda session: session.set_prop(component(session, 'refresh-button', 'meats'), 'n_clicks', 1)),
+    ('back to fruits tab', lambda session: session.set_prop('tabs', 'value', 'tab-fruits')),
+]
+
+
+def run_child(app_dir):
+    """app_dir의 app.py로 시나리오를 실행하고 상호작용별 측정값을 JSON으로 출력"""
+    sys.path.insert(0, app_dir)
+    os.chdir(app_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = importlib.import_module('app').app
+        session = DashSession(app, clientside=CLIENTSIDE)
+
+    results = []
+    for name, action in SCENARIO:
+        before = session.snapshot()
+        action(session)
+        after = session.snapshot()
+        results.append([name] + [b - a for a, b in zip(before, after)])
+    print(json.dumps(results))
+
+
+def measure(app_dir):
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_dash_payload', '--child', app_dir],
+        check=True, capture_output=True, text=True, cwd=os.getcwd(),
+        env={**os.environ, 'PYTHONPATH': os.getcwd()},
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def print_results(label, results):
+    print(f"[{label}]")
+    print(f"{'interaction':<22} {'requests':>8} {'sent (B)':>9} {'received (B)':>13} {'clientside':>10}")
+    for name, requests, sent, received, clientside in results:
+        print(f"{name:<22} {requests:>8} {sent:>9,} {received:>13,} {clientside:>10}")
+    totals = [sum(column) for column in list(zip(*results))[1:]]
+    print(f"{'total':<22} {totals[0]:>8} {totals[1]:>9,} {totals[2]:>13,} {totals[3]:>10}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--baseline-rev', help='비교할 이전 git 리비전 (예: HEAD~1)')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child)
+        return
+
+    if args.baseline_rev:
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = subprocess.run(['git', 'archive', '--format=tar', args.baseline_rev],
+                                     check=True, capture_output=True).stdout
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                tar.extractall(tmp)
+            print_results(f"baseline {args.baseline_rev}", measure(tmp))
+    print_results('current', measure(os.getcwd()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+상세 데이터 시트 벤치마크: 기존 3회 순회(기록 / 테두리 / 열 너비) vs 공유 스타일 1회 기록
+
+기본(메모리) 모드 워크북에서 create_detail_sheet만 실행하여 10만 행당 시간을 비교합니다.
+저장 시간은 포함하지 않습니다.
+
+    python -m benchmarks.bench_detail_sheet --rows 200000
+"""
+import argparse
+import logging
+import time
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils.dataframe import dataframe_to_rows
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+from create_excel_report import EconomicReportGenerator, register_named_styles
+from profiling import configure_logging
+
+
+def legacy_detail_sheet(ws, df):
+    """공유 스타일 도입 전 기본 모드 create_detail_sheet 구현 (비교 기준)"""
+    df_sorted = df.sort_values(['date', 'country', 'indicator'], ascending=[False, True, True])
+    columns = ['date', 'country', 'indicator', 'forecast', 'actual', 'previous',
+               'forecast_error', 'forecast_error_pct', 'mom_change', 'mom_change_pct',
+               'forecast_accuracy', 'surprise', 'trend']
+    df_display = df_sorted[columns].copy()
+    df_display['date'] = df_display['date'].dt.strftime('%Y-%m-%d')
+    headers = ['Date', 'Country', 'Indicator', 'Forecast', 'Actual', 'Previous',
+               'Forecast Error', 'Error %', 'MoM Change', 'MoM %',
+               'Accuracy %', 'Surprise', 'Trend']
+
+    for col_num, header in enumerate(headers, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = Font(bold=True, color='FFFFFF')
+        cell.fill = PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid')
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+
+    for r_idx, row in enumerate(dataframe_to_rows(df_display, index=False, header=False), 2):
+        for c_idx, value in enumerate(row, 1):
+            cell = ws.cell(row=r_idx, column=c_idx, value=value)
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+            if c_idx in [4, 5, 6, 7, 8, 9, 10, 11]:
+                cell.number_format = '#,##0.00'
+            if c_idx == 8:
+                if isinstance(value, (int, float)):
+                    if value > 0:
+                        cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
+                    elif value < 0:
+                        cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
+
+    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                         top=Side(style='thin'), bottom=Side(style='thin'))
+    for row in ws.iter_rows(min_row=1, max_row=len(df_display) + 1, min_col=1, max_col=len(headers)):
+        for cell in row:
+            cell.border = thin_border
+
+    for column in ws.columns:
+        max_length = 0
+        column_letter = column[0].column_letter
+        for cell in column:
+            try:
+                if len(str(cell.value)) > max_length:
+                    max_length = len(str(cell.value))
+            except:
+                pass
+        ws.column_dimensions[column_letter].width = min(max_length + 2, 20)
+
+    ws.auto_filter.ref = f"A1:{chr(64 + len(headers))}{len(df_display) + 1}"
+
+
+def current_detail_sheet(ws, df):
+    generator = EconomicReportGenerator(None)
+    generator.df = df
+    generator.create_detail_sheet(ws)
+
+
+def timed(func, df):
+    wb = Workbook()
+    register_named_styles(wb)
+    ws = wb.active
+    start = time.perf_counter()
+    func(ws, df)
+    return ws, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000, help='합성 데이터 행 수')
+    args = parser.parse_args()
+
+    configure_logging(logging.WARNING)
+    df = generate_transformed_data(*shape_for_rows(args.rows))
+    rows = len(df)
+
+    legacy_ws, legacy_seconds = timed(legacy_detail_sheet, df)
+    current_ws, current_seconds = timed(current_detail_sheet, df)
+
+    # 열 너비가 같은지 확인
+    assert ({k: v.width for k, v in legacy_ws.column_dimensions.items()} ==
+            {k: v.width for k, v in current_ws.column_dimensions.items()})
+
+    print(f"{'implementation':<16} {'rows':>10} {'seconds':>9} {'sec / 100k rows':>16}")
+    for name, seconds in [('legacy', legacy_seconds), ('shared styles', current_seconds)]:
+        print(f"{name:<16} {rows:>10,} {seconds:>9.2f} {seconds / rows * 100_000:>16.2f}")
+    print(f"speedup: {legacy_seconds / current_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
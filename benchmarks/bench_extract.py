@@ -0,0 +1,54 @@
+"""
+블룸버그 추출 벤치마크 (fake_blpapi 사용, 단말기 불필요)
+
+단일 요청(기존 방식: 모든 티커를 한 요청으로) vs 배치/동시 요청의 처리량을 비교합니다.
+
+    python -m benchmarks.bench_extract --countries 50 --indicators 20
+"""
+import argparse
+import logging
+import time
+
+import fake_blpapi
+from etl_bloomberg import BloombergETL
+from profiling import configure_logging
+
+
+def run(indicators, countries, start_date, end_date, batch_size, max_in_flight):
+    etl = BloombergETL(bloomberg_api=fake_blpapi, batch_size=batch_size, max_in_flight=max_in_flight)
+    start = time.perf_counter()
+    df = etl.extract_from_bloomberg(indicators, countries, start_date, end_date)
+    return len(df), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--countries', type=int, default=50)
+    parser.add_argument('--indicators', type=int, default=20)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 응답 지연(초)')
+    parser.add_argument('--latency-per-security', type=float, default=0.002, help='종목당 처리 시간(초)')
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--max-in-flight', type=int, default=8)
+    args = parser.parse_args()
+
+    configure_logging(logging.WARNING)
+    fake_blpapi.Session.latency = args.latency
+    fake_blpapi.Session.latency_per_security = args.latency_per_security
+
+    countries = [f"C{i:02d}" for i in range(args.countries)]
+    indicators = [f"IND{i:02d}" for i in range(args.indicators)]
+    start_date, end_date = f"{2024 - args.years}-01-01", "2023-12-31"
+    tickers = len(countries) * len(indicators)
+
+    print(f"{'mode':<28} {'tickers':>8} {'rows':>9} {'seconds':>8} {'rows/sec':>10}")
+    for name, batch_size, max_in_flight in [
+        ('single request', tickers, 1),
+        (f'batch {args.batch_size} x {args.max_in_flight} in flight', args.batch_size, args.max_in_flight),
+    ]:
+        rows, seconds = run(indicators, countries, start_date, end_date, batch_size, max_in_flight)
+        print(f"{name:<28} {tickers:>8,} {rows:>9,} {seconds:>8.2f} {rows / seconds:>10,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+시계열 feature 엔진 확장성 벤치마크
+
+행 수별로 전체 이력 feature 계산(compute_features) 시간과, 마지막 한 달 발표분을
+추가할 때의 증분 계산(extend_features) 시간을 측정합니다.
+5천만 행은 약 16GB 메모리가 필요합니다.
+
+    python -m benchmarks.bench_features --rows 10000 100000 1000000 10000000 50000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import generate_raw_data, shape_for_rows
+from feature_engine import compute_features, extend_features
+
+
+def feature_input(rows):
+    """feature 계산에 필요한 컬럼만 가진 입력 (transform 결과와 같은 dtype)"""
+    raw = generate_raw_data(*shape_for_rows(rows))
+    return pd.DataFrame({
+        'date': pd.to_datetime(raw['date']),
+        'country': pd.Categorical(raw['country']),
+        'indicator': pd.Categorical(raw['indicator']),
+        'actual': raw['actual'],
+        'forecast_error': raw['actual'] - raw['forecast'],
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000, 1_000_000, 10_000_000],
+                        help='합성 데이터 행 수')
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'full (s)':>9} {'rows/sec':>12} {'new rows':>9} {'extend (s)':>11}")
+    for rows in args.rows:
+        df = feature_input(rows)
+        last_date = df['date'].max()
+        history, new_rows = df[df['date'] < last_date], df[df['date'] == last_date]
+
+        start = time.perf_counter()
+        featured = compute_features(history)
+        full_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        extend_features(featured, new_rows)
+        extend_seconds = time.perf_counter() - start
+
+        print(f"{len(df):>12,} {full_seconds:>9.2f} {len(history) / full_seconds:>12,.0f} "
+              f"{len(new_rows):>9,} {extend_seconds:>11.2f}")
+        del df, history, new_rows, featured
+
+
+if __name__ == '__main__':
+    main()
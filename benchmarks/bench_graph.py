@@ -0,0 +1,67 @@
+"""
+작업 그래프 벤치마크: 순차 실행(run_pipeline + 레포트가 CSV 다시 읽기) vs run_graph
+
+fake_blpapi 응답 지연으로 I/O 대기가 있는 추출을 흉내 내고, 같은 데이터로
+레포트 2종(전체 스트리밍, 집계 전용)을 만드는 시간을 비교합니다.
+run_graph는 처음 실행(cold)과 입력이 바뀌지 않은 재실행(warm, 추출 외 작업 생략)을 측정합니다.
+
+    python -m benchmarks.bench_graph --countries 20 --indicators 8 --years 10
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import fake_blpapi
+from create_excel_report import EconomicReportGenerator
+from etl_bloomberg import BloombergETL
+from profiling import configure_logging
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--countries', type=int, default=20)
+    parser.add_argument('--indicators', type=int, default=8)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.05, help='요청당 응답 지연(초)')
+    parser.add_argument('--latency-per-security', type=float, default=0.01, help='종목당 처리 시간(초)')
+    parser.add_argument('--io-workers', type=int, default=4, help='run_graph 동시 추출 작업 수')
+    args = parser.parse_args()
+
+    configure_logging(logging.WARNING)
+    fake_blpapi.Session.latency = args.latency
+    fake_blpapi.Session.latency_per_security = args.latency_per_security
+    pipeline_args = ([f"IND{i:02d}" for i in range(args.indicators)], [f"C{i:02d}" for i in range(args.countries)],
+                     f"{2024 - args.years}-01-01", "2023-12-31")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reports = [
+            {'output_path': os.path.join(tmp, 'full.xlsx'), 'streaming': True},
+            {'output_path': os.path.join(tmp, 'summary.xlsx'), 'streaming': True, 'include_rows': False},
+        ]
+
+        start = time.perf_counter()
+        data_path = os.path.join(tmp, 'sequential.csv')
+        rows = len(BloombergETL(bloomberg_api=fake_blpapi).run_pipeline(*pipeline_args, output_path=data_path))
+        for options in reports:
+            options = dict(options)
+            output_path = options.pop('output_path')
+            EconomicReportGenerator(data_path, **options).generate_report(output_path)
+        timings = [('sequential + CSV re-read', time.perf_counter() - start, 0)]
+
+        state_dir = os.path.join(tmp, 'state')
+        for label in ['run_graph (cold)', 'run_graph (warm)']:
+            etl = BloombergETL(bloomberg_api=fake_blpapi)
+            start = time.perf_counter()
+            result = etl.run_graph(*pipeline_args, output_path=os.path.join(tmp, 'graph.csv'), reports=reports,
+                                   state_dir=state_dir, io_workers=args.io_workers)
+            timings.append((label, time.perf_counter() - start, len(result.skipped)))
+
+    print(f"{'mode':<26} {'rows':>9} {'seconds':>8} {'skipped':>8}")
+    for label, seconds, skipped in timings:
+        print(f"{label:<26} {rows:>9,} {seconds:>8.2f} {skipped:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+시작 시간 벤치마크: 진입점별 import 시간 (-X importtime), 이력 비교
+
+진입점마다 새 인터프리터에서 `python -X importtime`으로 모듈을 import하여 누적 import 시간을 재고
+(반복 실행 중앙값), 가장 무거운 하위 import와 함께 출력합니다.
+- 지연 import 확인: 진입점별로 로드하면 안 되는 모듈(예: cli의 pandas)이 로드되면 항상 실패
+- 회귀 확인: 결과를 이력 파일(JSON Lines)에 추가하고, 다른 리비전 이전 결과보다 threshold 이상
+  느려진 진입점을 회귀로 표시 (--fail-on-regression이면 종료 코드 1)
+
+    python -m benchmarks.bench_importtime
+    python -m benchmarks.bench_importtime --targets cli etl_daemon --fail-on-regression
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.suite import ROOT, git_revision, load_history
+
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'results', 'importtime.jsonl')
+
+# 진입점 모듈 -> import되면 안 되는 모듈 (하위 명령/요청 처리 시점에 로드)
+TARGETS = {
+    'cli': ['pandas', 'numpy', 'pyarrow', 'openpyxl', 'plotly', 'dash'],
+    'profiling': ['pandas'],
+    'etl_daemon': ['pandas', 'pyarrow'],
+    'create_excel_report': ['openpyxl'],
+    'etl_bloomberg': ['openpyxl', 'plotly', 'dash'],
+    'data_service': ['plotly.express'],
+    'app': ['plotly.express', 'openpyxl'],
+}
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력 -> [(모듈, 자체 μs, 누적 μs, 깊이)]"""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def measure(module):
+    """새 인터프리터에서 module import - (누적 import 시간 ms, import 기록)"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=ROOT,
+                            check=True, capture_output=True, text=True)
+    records = parse_importtime(result.stderr)
+    cumulative = next(cumulative for name, _, cumulative, depth in records if name == module and depth == 0)
+    return cumulative / 1000, records
+
+
+def heaviest(records, module, top):
+    """module이 직접 import한 모듈 중 누적 시간이 큰 순서 (importtime은 하위 모듈을 상위 모듈보다 먼저 출력)"""
+    end = next(i for i, (name, _, _, depth) in enumerate(records) if name == module and depth == 0)
+    direct = []
+    for name, _, cumulative, depth in reversed(records[:end]):
+        if depth == 0:
+            break
+        if depth == 1:
+            direct.append((name, cumulative))
+    return sorted(direct, key=lambda item: -item[1])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--targets', nargs='+', choices=list(TARGETS), default=list(TARGETS), help='측정할 진입점')
+    parser.add_argument('--repeat', type=int, default=7, help='진입점별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=3, help='출력할 무거운 하위 import 수')
+    parser.add_argument('--history', default=HISTORY_PATH, help='결과 이력 파일 (JSON Lines)')
+    parser.add_argument('--no-save', action='store_true', help='결과를 이력에 추가하지 않음')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 표시할 악화 비율')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+    context = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+    }
+    print(f"revision {context['revision']}, python {context['python']}, median of {args.repeat}")
+    print(f"{'target':<22} {'import ms':>10} {'vs':>10} {'change':>7}  heaviest imports")
+
+    results, regressed, violations = [], [], []
+    for target in args.targets:
+        runs = [measure(target) for _ in range(args.repeat)]
+        milliseconds = statistics.median(ms for ms, _ in runs)
+        records = runs[-1][1]
+        loaded = {name for name, _, _, _ in records}
+        forbidden = [name for name in TARGETS[target] if name in loaded]
+        if forbidden:
+            violations.append((target, forbidden))
+
+        result = dict(context, target=target, import_ms=milliseconds)
+        results.append(result)
+        previous = next((entry for entry in reversed(history) if entry['target'] == target and
+                         entry['revision'] != result['revision']), None)
+        change = milliseconds / previous['import_ms'] - 1 if previous else None
+        if change is not None and change > args.threshold:
+            regressed.append(target)
+        top = ', '.join(f"{name} {cumulative / 1000:.0f}" for name, cumulative in heaviest(records, target, args.top))
+        print(f"{target:<22} {milliseconds:>10.1f} {previous['revision'] if previous else '-':>10} "
+              f"{f'{change * 100:+.0f}%' if change is not None else '-':>7}  {top}"
+              f"{'  ⚠️ 회귀' if target in regressed else ''}")
+
+    for target, forbidden in violations:
+        print(f"❌ {target}: 지연 import 대상이 로드됨 - {', '.join(forbidden)}")
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result) + '\n')
+        print(f"\n💾 결과 이력: {args.history}")
+
+    if violations or (regressed and args.fail_on_regression):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
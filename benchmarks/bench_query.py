@@ -0,0 +1,86 @@
+"""
+색인 조회 벤치마크: 불리언 마스크 필터 vs IndicatorQuery
+
+데이터 크기별로 색인 생성 시간과, 같은 조회를 마스크 기반(filter_rows / groupby)과 색인 기반으로
+실행했을 때의 중앙값 지연 시간을 비교합니다.
+- point: (지표, 국가, 날짜) 한 행
+- range: 지표 2개 × 국가 3개 × 1년 구간
+- latest: 지표 1개의 국가별 기준일 이전 최신 발표
+
+    python -m benchmarks.bench_query --rows 100000 1000000 10000000
+"""
+import argparse
+import gc
+import logging
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+from indicator_data import filter_rows
+from indicator_query import IndicatorQuery
+from profiling import configure_logging
+
+
+def median_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def mask_latest(df, indicator, as_of):
+    rows = filter_rows(df, indicators=[indicator], end_date=as_of)
+    return rows.groupby(['indicator', 'country'], observed=True).tail(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000],
+                        help='합성 데이터 행 수 (여러 개 지정 가능)')
+    parser.add_argument('--repeat', type=int, default=20, help='조회별 반복 횟수 (중앙값 사용)')
+    args = parser.parse_args()
+    configure_logging(logging.WARNING)
+
+    print(f"{'rows':>12} {'build ms':>9} {'query':<7} {'mask ms':>9} {'index ms':>9} {'speedup':>8}")
+    for rows in args.rows:
+        df = generate_transformed_data(*shape_for_rows(rows))
+        gc.collect()
+        start = time.perf_counter()
+        query = IndicatorQuery(df)
+        build = (time.perf_counter() - start) * 1000
+
+        indicators, countries = query.indicators[:2], query.countries[:3]
+        first, last = query.date_range()
+        end_date = last - (last - first) / 4
+        start_date = end_date - pd.Timedelta(days=365)
+        sample = df.iloc[len(df) // 2]
+        key = (sample['indicator'], sample['country'], sample['date'])
+
+        cases = {
+            'point': (lambda: filter_rows(df, [key[1]], [key[0]], key[2], key[2]),
+                      lambda: query.point(*key)),
+            'range': (lambda: filter_rows(df, countries, indicators, start_date, end_date),
+                      lambda: query.range(indicators, countries, start_date, end_date)),
+            'latest': (lambda: mask_latest(df, indicators[0], end_date),
+                       lambda: query.latest([indicators[0]], as_of=end_date)),
+        }
+        # 두 방식의 결과가 같은지 먼저 확인
+        assert len(cases['range'][0]()) == len(cases['range'][1]())
+        expected = cases['latest'][0]().sort_values(['indicator', 'country'])
+        assert np.array_equal(expected['actual'].to_numpy(), cases['latest'][1]()['actual'].to_numpy())
+
+        for name, (mask, indexed) in cases.items():
+            mask_ms, index_ms = median_ms(mask, args.repeat), median_ms(indexed, args.repeat)
+            label = f"{len(df):>12,} {build:>9.1f}" if name == 'point' else f"{'':>12} {'':>9}"
+            print(f"{label} {name:<7} {mask_ms:>9.3f} {index_ms:>9.3f} {mask_ms / index_ms:>7.0f}x")
+        del df, query, cases
+        gc.collect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+레포트 렌더러 벤치마크: openpyxl(기본 / 스트리밍) vs xlsxwriter vs HTML vs CSV
+
+같은 데이터와 레이아웃으로 렌더러마다 별도 프로세스에서 레포트를 생성하여
+소요 시간, 처리량(rows/sec), 출력 크기, 최대 RSS를 비교합니다.
+render RSS는 렌더링 단계(데이터 로드 / 레이아웃 모델 이후)에서 늘어난 최대 RSS입니다 (openpyxl은 해당 단계 없음).
+
+    python -m benchmarks.bench_renderers --rows 200000
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+from storage import ParquetStorage
+
+# (이름, EconomicReportGenerator 옵션, 출력 경로 확장자 - CSV는 디렉터리)
+RENDERERS = [
+    ('openpyxl', {}, '.xlsx'),
+    ('openpyxl-streaming', {'streaming': True}, '.xlsx'),
+    ('xlsxwriter', {'renderer': 'xlsxwriter'}, '.xlsx'),
+    ('html', {'renderer': 'html'}, '.html'),
+    ('csv', {'renderer': 'csv'}, ''),
+]
+
+
+def _output_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def run_child(name, data_path, output_path):
+    """단일 렌더러 실행 후 결과를 JSON으로 출력"""
+    from create_excel_report import EconomicReportGenerator
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+    options = next(options for key, options, _ in RENDERERS if key == name)
+    generator = EconomicReportGenerator(data_path, **options)
+    start = time.perf_counter()
+    generator.generate_report(output_path)
+    elapsed = time.perf_counter() - start
+    stages = generator.profiler.table().set_index('name')['peak_rss_delta_bytes']
+
+    print(json.dumps({
+        'rows': len(generator.df),
+        'seconds': elapsed,
+        'size_mb': _output_size(output_path) / 1024 / 1024,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'render_rss_mb': stages['render'] / 1024 / 1024 if 'render' in stages.index else None,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000, help='합성 데이터 행 수')
+    parser.add_argument('--renderers', nargs='+', choices=[name for name, _, _ in RENDERERS],
+                        default=[name for name, _, _ in RENDERERS])
+    parser.add_argument('--child', choices=[name for name, _, _ in RENDERERS], help=argparse.SUPPRESS)
+    parser.add_argument('--data', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.data, args.output)
+        return
+
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, 'data.parquet')
+        ParquetStorage().write(generate_transformed_data(*shape_for_rows(args.rows)), data_path)
+
+        print(f"{'renderer':<20} {'rows':>10} {'seconds':>9} {'rows/sec':>10} {'size (MB)':>10} {'peak RSS (MB)':>14} "
+              f"{'render RSS (MB)':>16}")
+        for name, _, extension in RENDERERS:
+            if name not in args.renderers:
+                continue
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_renderers', '--child', name, '--data', data_path,
+                 '--output', os.path.join(tmp, f'report_{name}{extension}')],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{name:<20} {result['rows']:>10,} {result['seconds']:>9.2f} "
+                  f"{result['rows'] / result['seconds']:>10,.0f} {result['size_mb']:>10.1f} "
+                  f"{result['peak_rss_mb']:>14.1f} "
+                  f"{'-' if result['render_rss_mb'] is None else format(result['render_rss_mb'], '.1f'):>16}")
+
+
+if __name__ == '__main__':
+    main()
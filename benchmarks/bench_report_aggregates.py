@@ -0,0 +1,61 @@
+"""
+엑셀 레포트 집계 시트 벤치마크: 원본 행 시트 포함 vs 집계 시트만
+
+행 수별로 스트리밍 레포트를 생성하여 생성 시간, 파일 크기, 여는 시간(load_workbook)을 비교합니다.
+집계 시트만 생성하면 파일 크기와 여는 시간이 원본 행 수가 아닌 집계 크기(국가 × 날짜)를 따릅니다.
+
+    python -m benchmarks.bench_report_aggregates --rows 10000 50000
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from openpyxl import load_workbook
+
+from benchmarks.synthetic import generate_transformed_data
+
+
+def measure(data_path, output_path, include_rows):
+    from create_excel_report import EconomicReportGenerator
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+    start = time.perf_counter()
+    EconomicReportGenerator(data_path, streaming=True, include_rows=include_rows).generate_report(output_path)
+    generate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_workbook(output_path).close()
+    open_seconds = time.perf_counter() - start
+    return generate_seconds, os.path.getsize(output_path), open_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 50_000], help='합성 데이터 행 수')
+    parser.add_argument('--periods', type=int, default=120, help='시계열당 발표 횟수 (집계 크기 고정)')
+    args = parser.parse_args()
+
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+
+    print(f"{'rows':>10} {'sheets':<11} {'generate (s)':>12} {'size (KB)':>10} {'open (s)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            # 지표 10개, 발표 횟수 고정 -> 국가 수로 행 수 조절
+            n_countries = max(1, rows // (10 * args.periods))
+            data_path = os.path.join(tmp, f'data_{rows}.csv')
+            df = generate_transformed_data(n_countries, 10, args.periods)
+            df.to_csv(data_path, index=False)
+
+            for include_rows, label in [(True, 'all'), (False, 'aggregates')]:
+                generate_seconds, size, open_seconds = measure(
+                    data_path, os.path.join(tmp, f'report_{rows}_{label}.xlsx'), include_rows)
+                print(f"{len(df):>10,} {label:<11} {generate_seconds:>12.2f} {size / 1024:>10,.0f} {open_seconds:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
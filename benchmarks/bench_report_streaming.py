@@ -0,0 +1,78 @@
+"""
+엑셀 레포트 생성 벤치마크: 기본 모드 vs 스트리밍(write-only) 모드
+
+각 모드를 별도 프로세스에서 실행하여 처리량(rows/sec)과 최대 RSS를 측정합니다.
+--workers를 지정하면 스트리밍 모드를 지표별 시트 생성 프로세스 수별로 추가 측정합니다.
+
+    python -m benchmarks.bench_report_streaming --rows 200000 --workers 2 4
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+
+
+def run_child(data_path, output_path, streaming, workers=1):
+    """단일 모드 실행 후 결과를 JSON으로 출력"""
+    from create_excel_report import EconomicReportGenerator
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+    generator = EconomicReportGenerator(data_path, streaming=streaming, workers=workers)
+    start = time.perf_counter()
+    generator.generate_report(output_path)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        'rows': len(generator.df),
+        'seconds': elapsed,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000, help='합성 데이터 행 수')
+    parser.add_argument('--workers', type=int, nargs='*', default=[], help='스트리밍 모드 지표별 시트 프로세스 수')
+    parser.add_argument('--child', choices=['default', 'streaming'], help=argparse.SUPPRESS)
+    parser.add_argument('--child-workers', type=int, default=1, help=argparse.SUPPRESS)
+    parser.add_argument('--data', help=argparse.SUPPRESS)
+    parser.add_argument('--output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.data, args.output, args.child == 'streaming', args.child_workers)
+        return
+
+    from profiling import configure_logging
+
+    configure_logging(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, 'data.csv')
+        generate_transformed_data(*shape_for_rows(args.rows)).to_csv(data_path, index=False)
+
+        runs = [('default', 1), ('streaming', 1)] + [('streaming', workers) for workers in args.workers]
+        print(f"{'mode':<14} {'rows':>10} {'seconds':>9} {'rows/sec':>10} {'peak RSS (MB)':>14}")
+        for mode, workers in runs:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_report_streaming', '--child', mode,
+                 '--child-workers', str(workers), '--data', data_path,
+                 '--output', os.path.join(tmp, f'{mode}_{workers}.xlsx')],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            label = mode if workers == 1 else f"{mode} x{workers}"
+            print(f"{label:<14} {result['rows']:>10,} {result['seconds']:>9.2f} "
+                  f"{result['rows'] / result['seconds']:>10,.0f} {result['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
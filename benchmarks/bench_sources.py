@@ -0,0 +1,96 @@
+"""
+다중 소스 추출 벤치마크: REST 미러 연결 방식별 처리량, 소스 동시 추출 vs 순차 추출
+
+별도 프로세스로 띄운 로컬 미러 서버(fake_http_mirror)에서 시계열을 추출합니다.
+- HTTP: 순차(연결 1개, 요청마다 새 연결) / 동시 요청 + 요청마다 새 연결 / 동시 요청 + 연결 풀 / 미러 2개
+- 다중 소스: 파일 드롭 + REST 미러 + blpapi(fake_blpapi)를 소스별로 따로 추출한 시간의 합 vs 동시 추출
+
+    python -m benchmarks.bench_sources --series 400 --years 20 --latency 0.005
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import fake_blpapi
+from benchmarks.suite import ROOT
+from bloomberg_extract import BloombergExtractor, bloomberg_ticker
+from extract_sources import ExtractorSource, FileDropSource, HTTPSource, MultiSourceExtractor
+from profiling import configure_logging
+
+
+def start_mirror(latency):
+    """미러 서버 프로세스 시작 - (프로세스, 주소)"""
+    process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'fake_http_mirror.py'), '--latency', str(latency)],
+                               cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    return process, process.stdout.readline().strip()
+
+
+def series_for(count):
+    """count개 (지표, 국가) 시계열 {티커: (지표, 국가)}"""
+    countries = [f"C{i:03d}" for i in range((count + 9) // 10)]
+    pairs = [(f"IND{i}", country) for country in countries for i in range(10)][:count]
+    return {bloomberg_ticker(indicator, country): (indicator, country) for indicator, country in pairs}
+
+
+def timed_fetch(sources, series, start_date, end_date):
+    with MultiSourceExtractor(sources) as extractor:
+        start = time.perf_counter()
+        df = extractor.fetch(series, start_date, end_date)
+        return df, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--series', type=int, default=400, help='시계열 수')
+    parser.add_argument('--years', type=int, default=20, help='시계열당 연도 수 (월별 발표)')
+    parser.add_argument('--latency', type=float, default=0.005, help='미러 요청당 응답 지연(초)')
+    parser.add_argument('--concurrency', type=int, default=8, help='호스트별 동시 요청 수')
+    args = parser.parse_args()
+    configure_logging(30)
+
+    series = series_for(args.series)
+    start_date, end_date = f"{2024 - args.years + 1}-01-01", '2024-12-31'
+    mirrors = [start_mirror(args.latency) for _ in range(2)]
+    urls = [url for _, url in mirrors]
+    try:
+        cases = [
+            ('sequential, new connections', [urls[0]], 1, False),
+            (f'{args.concurrency} in flight, new connections', [urls[0]], args.concurrency, False),
+            (f'{args.concurrency} in flight, pooled', [urls[0]], args.concurrency, True),
+            (f'2 mirrors x {args.concurrency}, pooled', urls, args.concurrency, True),
+        ]
+        print(f"series: {len(series)}, mirror latency: {args.latency * 1000:.0f} ms")
+        print(f"{'HTTP source':<32} {'rows':>9} {'seconds':>8} {'rows/sec':>10} {'connections':>12}")
+        for label, base_urls, per_host, keep_alive in cases:
+            source = HTTPSource(base_urls, max_per_host=per_host, keep_alive=keep_alive)
+            df, seconds = timed_fetch([source], series, start_date, end_date)
+            print(f"{label:<32} {len(df):>9,} {seconds:>8.2f} {len(df) / seconds:>10,.0f} "
+                  f"{source.connections_opened:>12,}")
+
+        # 다중 소스: 모든 소스에 같은 시계열을 요청 (파일 드롭에는 1/3만 있음) - 소스별 순차 vs 동시
+        with tempfile.TemporaryDirectory() as tmp:
+            dropped = dict(list(series.items())[::3])
+            drop = BloombergExtractor(fake_blpapi.Session(), fake_blpapi).fetch(dropped, start_date, end_date)
+            for number, (_, frame) in enumerate(drop.groupby('indicator')):
+                frame.to_csv(os.path.join(tmp, f"drop_{number}.csv"), index=False)
+
+            def sources():
+                return [FileDropSource(tmp), HTTPSource(urls[0], max_per_host=args.concurrency),
+                        ExtractorSource(BloombergExtractor(fake_blpapi.Session(), fake_blpapi))]
+
+            separate = sum(timed_fetch([source], series, start_date, end_date)[1] for source in sources())
+            merged, together = timed_fetch(sources(), series, start_date, end_date)
+            print(f"\n{'multi-source':<32} {'rows':>9} {'seconds':>8}")
+            print(f"{'one source at a time (sum)':<32} {'':>9} {separate:>8.2f}")
+            print(f"{'all sources concurrently':<32} {len(merged):>9,} {together:>8.2f}")
+    finally:
+        for process, _ in mirrors:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+저장소 벤치마크: 기존 CSV 경로 vs Parquet 백엔드
+
+쓰기 시간, 파일 크기, 전체 읽기 시간, 컬럼 선택 + 기간 조건 읽기 시간을 비교합니다.
+
+    python -m benchmarks.bench_storage --rows 2000000
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+from profiling import configure_logging
+from storage import CSVStorage, ParquetStorage
+
+# 레포트 일부(국가별 요약)만 필요한 경우를 가정한 컬럼 선택
+PROJECTED_COLUMNS = ['date', 'country', 'indicator', 'actual', 'forecast_accuracy']
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def legacy_csv_read(path):
+    """저장소 도입 전 EconomicReportGenerator.load_data 구현 (비교 기준)"""
+    df = pd.read_csv(path)
+    df['date'] = pd.to_datetime(df['date'])
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help='합성 데이터 행 수')
+    args = parser.parse_args()
+    configure_logging(logging.WARNING)
+
+    df = generate_transformed_data(*shape_for_rows(args.rows))
+    # 최근 1년치만 읽는 경우
+    end_date = df['date'].max()
+    start_date = end_date - pd.DateOffset(years=1)
+
+    print(f"{'backend':<9} {'rows':>10} {'write (s)':>10} {'size (MB)':>10} {'read (s)':>9} "
+          f"{'projected 1y read (s)':>22}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for storage in [CSVStorage(), ParquetStorage()]:
+            path = os.path.join(tmp, f'data{storage.extension}')
+            _, write_seconds = timed(lambda: storage.write(df, path))
+            size_mb = os.path.getsize(path) / 1024 ** 2
+
+            if isinstance(storage, CSVStorage):
+                _, read_seconds = timed(lambda: legacy_csv_read(path))
+            else:
+                _, read_seconds = timed(lambda: storage.read(path))
+            subset, projected_seconds = timed(
+                lambda: storage.read(path, columns=PROJECTED_COLUMNS, start_date=start_date, end_date=end_date))
+
+            name = storage.extension.lstrip('.')
+            print(f"{name:<9} {len(df):>10,} {write_seconds:>10.2f} {size_mb:>10.1f} {read_seconds:>9.2f} "
+                  f"{projected_seconds:>22.2f}")
+    print(f"(projected read: {len(PROJECTED_COLUMNS)} columns, {len(subset):,} rows in "
+          f"{start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+품질 검증 벤치마크: 변환만 vs 검증 + 변환
+
+합성 추출 데이터에 결측 / 0 나눗수 / 중복 키 / 이상치 행을 섞고, 변환 엔진만 실행한 시간과
+검증 후 통과한 행을 변환한 시간을 비교합니다 (검증에서 파싱한 날짜/범주 컬럼을 변환이 그대로 사용).
+
+    python -m benchmarks.bench_validation --rows 10000000
+"""
+import argparse
+import gc
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import generate_raw_data, shape_for_rows
+from data_quality import format_summary, validate_raw
+from transform_engine import transform_indicators
+
+
+def inject_bad_rows(raw, fraction, seed=0):
+    """전체 행의 fraction만큼 규칙별로 나누어 잘못된 값 주입 (원본 수정)"""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(len(raw), size=int(len(raw) * fraction), replace=False)
+    missing, zero, duplicate, outlier = np.array_split(positions, 4)
+    raw.loc[missing, 'actual'] = np.nan
+    raw.loc[zero, 'forecast'] = 0.0
+    raw.loc[outlier, 'actual'] = raw.loc[outlier, 'actual'] * 1000
+    # 중복: 바로 앞 행의 키를 복사
+    for column in ('date', 'country', 'indicator'):
+        raw.loc[duplicate[duplicate > 0], column] = raw[column].to_numpy()[duplicate[duplicate > 0] - 1]
+    return raw
+
+
+def best_of(repeat, func):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+        del result
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=10_000_000, help='합성 데이터 행 수')
+    parser.add_argument('--bad-fraction', type=float, default=0.001, help='잘못된 값을 넣을 행 비율')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    raw = inject_bad_rows(generate_raw_data(*shape_for_rows(args.rows)), args.bad_fraction)
+    rows = len(raw)
+
+    transform_seconds = best_of(args.repeat, lambda: transform_indicators(raw))
+    validate_seconds = best_of(args.repeat, lambda: validate_raw(raw))
+    result = validate_raw(raw)
+    after_seconds = best_of(args.repeat, lambda: transform_indicators(result.valid))
+    total = validate_seconds + after_seconds
+
+    print(f"rows: {rows:,}, quarantined: {len(result.quarantine):,} ({format_summary(result.summary)})")
+    print(f"{'stage':<28} {'seconds':>9} {'rows/sec':>13}")
+    print(f"{'transform only':<28} {transform_seconds:>9.2f} {rows / transform_seconds:>13,.0f}")
+    print(f"{'validate':<28} {validate_seconds:>9.2f} {rows / validate_seconds:>13,.0f}")
+    print(f"{'transform (validated rows)':<28} {after_seconds:>9.2f} {rows / after_seconds:>13,.0f}")
+    print(f"{'validate + transform':<28} {total:>9.2f} {rows / total:>13,.0f}")
+    print(f"overhead vs transform only: {(total / transform_seconds - 1) * 100:+.1f}%")
+
+
+if __name__ == '__main__':
+    main()
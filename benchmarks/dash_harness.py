@@ -0,0 +1,254 @@
+"""
+Dash 렌더러 시뮬레이터 (브라우저 없이 콜백 요청 수/페이로드 측정)
+
+/_dash-layout, /_dash-dependencies를 읽어 렌더러처럼 초기 콜백과 연쇄 콜백을 실행하고,
+서버 콜백은 Flask 테스트 클라이언트로 /_dash-update-component에 요청합니다.
+패턴 매칭 id(MATCH/ALL)를 지원하며, 클라이언트 콜백은 서버 요청 없이 횟수만 세거나
+clientside 인자로 받은 Python 구현으로 흉내냅니다.
+"""
+import json
+from collections import deque
+
+# 클라이언트 콜백 흉내 함수가 "변경 없음"을 나타낼 때 반환하는 값
+NO_UPDATE = object()
+
+
+def id_key(component_id):
+    """컴포넌트 id 문자열화 (Dash와 같은 형식: 키 정렬, 공백 없는 JSON)"""
+    if isinstance(component_id, dict):
+        return json.dumps(component_id, sort_keys=True, separators=(',', ':'))
+    return component_id
+
+
+def _parse_pattern(text):
+    return json.loads(text) if text.startswith('{') else text
+
+
+def _split_outputs(output):
+    """'..a.children...b.figure..' 형식의 출력 문자열을 (id 패턴, 속성) 목록으로 분리"""
+    multi = output.startswith('..')
+    parts = output[2:-2].split('...') if multi else [output]
+    return multi, [{'id': part.rsplit('.', 1)[0], 'property': part.rsplit('.', 1)[1]} for part in parts]
+
+
+def _is_component(value):
+    return isinstance(value, dict) and 'type' in value and 'props' in value
+
+
+def _wildcard(value):
+    return value[0] if isinstance(value, list) and len(value) == 1 and value[0] in ('MATCH', 'ALL') else None
+
+
+def _match(pattern, component_id, bindings):
+    """id가 패턴과 일치하면 MATCH 바인딩을 반환, 아니면 None"""
+    if not isinstance(pattern, dict):
+        return dict(bindings) if pattern == component_id else None
+    if not isinstance(component_id, dict) or set(pattern) != set(component_id):
+        return None
+    result = dict(bindings)
+    for key, value in pattern.items():
+        wildcard = _wildcard(value)
+        if wildcard == 'MATCH':
+            if key in result and result[key] != component_id[key]:
+                return None
+            result[key] = component_id[key]
+        elif wildcard is None and value != component_id[key]:
+            return None
+    return result
+
+
+def _has_all(pattern):
+    return isinstance(pattern, dict) and any(_wildcard(value) == 'ALL' for value in pattern.values())
+
+
+class DashSession:
+    """한 명의 브라우저 세션을 흉내내는 테스트 클라이언트"""
+
+    def __init__(self, app, clientside=None):
+        """
+        Args:
+            app: Dash 앱
+            clientside: {'namespace.function_name': Python 구현} - 클라이언트 콜백 흉내
+        """
+        self.client = app.server.test_client()
+        self.clientside = clientside or {}
+        self.ids = {}
+        self.props = {}
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.clientside_calls = 0
+        self.dependencies = self._get_json('/_dash-dependencies')
+        for dependency in self.dependencies:
+            dependency['_outputs'] = _split_outputs(dependency['output'])
+
+    def _get_json(self, path):
+        response = self.client.get(path)
+        self.requests += 1
+        self.bytes_received += len(response.data)
+        return json.loads(response.data)
+
+    def snapshot(self):
+        return self.requests, self.bytes_sent, self.bytes_received, self.clientside_calls
+
+    def get_prop(self, component_id, prop):
+        return self.props.get((id_key(component_id), prop))
+
+    def _collect(self, value, new_keys):
+        """컴포넌트 트리에서 id가 있는 컴포넌트의 속성을 저장"""
+        if isinstance(value, list):
+            for item in value:
+                self._collect(item, new_keys)
+            return
+        if not _is_component(value):
+            return
+        props = value['props']
+        if 'id' in props:
+            key = id_key(props['id'])
+            self.ids[key] = props['id']
+            new_keys.add(key)
+            for name, prop_value in props.items():
+                self.props[(key, name)] = prop_value
+        for prop_value in props.values():
+            if isinstance(prop_value, (list, dict)):
+                self._collect(prop_value, new_keys)
+
+    def load(self):
+        """페이지 로드: 레이아웃을 받고 초기 콜백 실행"""
+        layout = self._get_json('/_dash-layout')
+        new_keys = set()
+        self._collect(layout, new_keys)
+        self._run(self._initial_callbacks(new_keys))
+
+    def set_prop(self, component_id, prop, value):
+        """사용자 입력: 속성을 바꾸고 해당 속성을 입력으로 갖는 콜백 실행"""
+        key = id_key(component_id)
+        self.props[(key, prop)] = value
+        self._run(self._triggered_callbacks({(key, prop)}))
+
+    # 콜백 선택
+
+    def _units(self, dependency, keys, require_all_inputs):
+        """keys 중 하나를 입력으로 갖는 (콜백, MATCH 바인딩, 변경된 입력) 실행 단위"""
+        units = {}
+        for item in dependency['inputs']:
+            pattern = _parse_pattern(item['id'])
+            for key in keys:
+                key_id, prop = key if isinstance(key, tuple) else (key, item['property'])
+                if prop != item['property'] or key_id not in self.ids:
+                    continue
+                bindings = _match(pattern, self.ids[key_id], {})
+                if bindings is None:
+                    continue
+                if require_all_inputs and not self._inputs_present(dependency, bindings):
+                    continue
+                unit_key = tuple(sorted(bindings.items()))
+                units.setdefault(unit_key, (dependency, bindings, set()))[2].add((key_id, prop))
+        return list(units.values())
+
+    def _inputs_present(self, dependency, bindings):
+        for item in dependency['inputs']:
+            pattern = _parse_pattern(item['id'])
+            if not _has_all(pattern) and not self._resolve(pattern, bindings):
+                return False
+        return True
+
+    def _initial_callbacks(self, new_keys):
+        units = []
+        for dependency in self.dependencies:
+            if not dependency.get('prevent_initial_call'):
+                units.extend(self._units(dependency, new_keys, require_all_inputs=True))
+        return units
+
+    def _triggered_callbacks(self, changed):
+        units = []
+        for dependency in self.dependencies:
+            units.extend(self._units(dependency, changed, require_all_inputs=False))
+        return units
+
+    def _resolve(self, pattern, bindings):
+        """패턴을 현재 id 목록으로 해석 (ALL이면 목록, 아니면 단일 id 또는 None)"""
+        matches = [component_id for component_id in self.ids.values()
+                   if _match(pattern, component_id, bindings) is not None]
+        if _has_all(pattern):
+            return matches
+        return matches[0] if matches else None
+
+    def _specs(self, items, bindings, with_value):
+        specs = []
+        for item in items:
+            resolved = self._resolve(_parse_pattern(item['id']), bindings)
+
+            def spec(component_id):
+                result = {'id': component_id, 'property': item['property']}
+                if with_value:
+                    result['value'] = self.props.get((id_key(component_id), item['property']))
+                return result
+
+            specs.append([spec(component_id) for component_id in resolved] if isinstance(resolved, list)
+                         else spec(resolved))
+        return specs
+
+    # 실행
+
+    def _run(self, units):
+        queue = deque(units)
+        while queue:
+            dependency, bindings, changed = queue.popleft()
+            if dependency.get('clientside_function'):
+                updated, new_keys = self._call_clientside(dependency, bindings)
+            else:
+                updated, new_keys = self._call_server(dependency, bindings, changed)
+            queue.extend(self._triggered_callbacks(updated))
+            queue.extend(self._initial_callbacks(new_keys))
+
+    def _apply(self, key, prop, value, updated, new_keys):
+        self.props[(key, prop)] = value
+        updated.add((key, prop))
+        if prop == 'children':
+            self._collect(value, new_keys)
+
+    def _call_clientside(self, dependency, bindings):
+        self.clientside_calls += 1
+        function = dependency['clientside_function']
+        emulate = self.clientside.get(f"{function['namespace']}.{function['function_name']}")
+        updated, new_keys = set(), set()
+        if emulate is None:
+            return updated, new_keys
+
+        def values(spec):
+            return [item['value'] for item in spec] if isinstance(spec, list) else spec['value']
+
+        args = [values(spec) for spec in self._specs(dependency['inputs'] + dependency['state'], bindings, True)]
+        result = emulate(*args)
+        multi, outputs = dependency['_outputs']
+        results = result if multi else [result]
+        for spec, value in zip(self._specs(outputs, bindings, False), results):
+            pairs = zip(spec, value) if isinstance(spec, list) and value is not NO_UPDATE else [(spec, value)]
+            for item, item_value in pairs:
+                if item_value is not NO_UPDATE:
+                    self._apply(id_key(item['id']), item['property'], item_value, updated, new_keys)
+        return updated, new_keys
+
+    def _call_server(self, dependency, bindings, changed):
+        multi, outputs = dependency['_outputs']
+        output_specs = self._specs(outputs, bindings, False)
+        body = json.dumps({
+            'output': dependency['output'],
+            'outputs': output_specs if multi else output_specs[0],
+            'inputs': self._specs(dependency['inputs'], bindings, True),
+            'state': self._specs(dependency['state'], bindings, True),
+            'changedPropIds': [f"{key}.{prop}" for key, prop in changed],
+        }).encode()
+        response = self.client.post('/_dash-update-component', data=body, content_type='application/json')
+        self.requests += 1
+        self.bytes_sent += len(body)
+        self.bytes_received += len(response.data)
+
+        updated, new_keys = set(), set()
+        if response.status_code != 200:
+            return updated, new_keys
+        for key, props in json.loads(response.data)['response'].items():
+            for prop, value in props.items():
+                self._apply(key, prop, value, updated, new_keys)
+        return updated, new_keys
@@ -0,0 +1,206 @@
+"""
+Dash 서비스 부하 테스트: 동시 요청 수별 경제지표 차트 콜백 지연 시간 (p50 / p90 / p99)
+
+wsgi.py 서버를 워커 수만큼 띄우고(또는 --url로 실행 중인 서버 지정), 동시 클라이언트가
+/_dash-update-component로 경제지표 차트 콜백을 필터 조합을 바꿔 가며 요청합니다.
+서버를 직접 띄운 경우 워커 프로세스의 PSS(공유 페이지를 나눈 실제 메모리) 합계도 출력합니다.
+
+    python -m benchmarks.load_test --rows 1000000 --workers 4 --concurrency 16 --requests 2000
+    python -m benchmarks.load_test --workers 4 --no-shared     # 공유 스냅샷/캐시 없이 비교
+    python -m benchmarks.load_test --url http://127.0.0.1:8050 --concurrency 32
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+from benchmarks.synthetic import generate_transformed_data, shape_for_rows
+from profiling import configure_logging
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHART_OUTPUTS = [('indicator-summary', 'children'), ('indicator-series', 'figure'),
+                 ('indicator-surprises', 'figure')]
+CHART_INPUTS = [('indicator-countries', 'value'), ('indicator-names', 'value'),
+                ('indicator-dates', 'start_date'), ('indicator-dates', 'end_date'),
+                ('indicator-version', 'data')]
+
+
+def chart_request(countries, indicators, start_date, version):
+    """경제지표 차트 콜백 요청 본문"""
+    values = [countries, indicators, start_date, None, version]
+    return {
+        'output': '..' + '...'.join(f'{id_}.{prop}' for id_, prop in CHART_OUTPUTS) + '..',
+        'outputs': [{'id': id_, 'property': prop} for id_, prop in CHART_OUTPUTS],
+        'inputs': [{'id': id_, 'property': prop, 'value': value} for (id_, prop), value in zip(CHART_INPUTS, values)],
+        'state': [],
+        'changedPropIds': ['indicator-countries.value'],
+    }
+
+
+def request_pool(url, distinct, seed=0):
+    """선택 항목 콜백으로 국가/지표/기간을 받아 서로 다른 필터 조합 distinct개 생성"""
+    body = {
+        'output': '..indicator-countries.options...indicator-names.options...'
+                  'indicator-dates.min_date_allowed...indicator-dates.max_date_allowed..',
+        'outputs': [{'id': 'indicator-countries', 'property': 'options'},
+                    {'id': 'indicator-names', 'property': 'options'},
+                    {'id': 'indicator-dates', 'property': 'min_date_allowed'},
+                    {'id': 'indicator-dates', 'property': 'max_date_allowed'}],
+        'inputs': [{'id': 'indicator-version', 'property': 'data', 'value': None}],
+        'state': [],
+        'changedPropIds': ['indicator-version.data'],
+    }
+    response = requests.post(f'{url}/_dash-update-component', json=body, timeout=600).json()['response']
+    countries, indicators = response['indicator-countries']['options'], response['indicator-names']['options']
+    start, end = (np.datetime64(response['indicator-dates'][key]) for key in ('min_date_allowed', 'max_date_allowed'))
+
+    rng = random.Random(seed)
+    pool = [chart_request(None, None, None, None)]
+    while len(pool) < distinct:
+        start_date = str(start + (end - start) * rng.choice([0, 0.5, 0.75, 0.9]))[:10]
+        pool.append(chart_request(rng.sample(countries, rng.randint(1, min(3, len(countries)))),
+                                  rng.sample(indicators, rng.randint(1, min(2, len(indicators)))),
+                                  start_date, None))
+    return pool
+
+
+def run_load(url, pool, concurrency, total, seed=0):
+    """동시 클라이언트 concurrency개로 total개 요청 - (지연 시간 목록, 오류 수, 응답 바이트, 소요 시간)"""
+    rng = random.Random(seed)
+    bodies = [json.dumps(rng.choice(pool)).encode() for _ in range(total)]
+    local = threading.local()
+    latencies, errors, received = [], [0], [0]
+    lock = threading.Lock()
+
+    def send(body):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        start = time.perf_counter()
+        try:
+            response = local.session.post(f'{url}/_dash-update-component', data=body, timeout=600,
+                                          headers={'Content-Type': 'application/json',
+                                                   'Accept-Encoding': 'gzip'})
+            ok = response.status_code == 200
+            # 전송 크기 (압축된 경우 압축 후 크기)
+            size = int(response.headers.get('Content-Length', len(response.content)))
+        except requests.RequestException:
+            ok, size = False, 0
+        elapsed = time.perf_counter() - start
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+                received[0] += size
+            else:
+                errors[0] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send, bodies))
+    return latencies, errors[0], received[0], time.perf_counter() - start
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url, process, timeout=300):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 종료되었습니다 (종료 코드 {process.returncode})")
+        try:
+            if requests.get(f'{url}/_dash-layout', timeout=5).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise TimeoutError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {url}")
+
+
+def worker_memory_mb(pid):
+    """서버 워커 프로세스(직접 띄운 서버의 하위 프로세스, 없으면 자신)의 (PSS 합계, RSS 합계) MB (Linux)"""
+    try:
+        with open(f'/proc/{pid}/task/{pid}/children') as f:
+            pids = [int(child) for child in f.read().split()] or [pid]
+    except OSError:
+        return None, None
+    pss = rss = 0
+    for worker in pids:
+        with open(f'/proc/{worker}/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    pss += int(line.split()[1])
+                elif line.startswith('Rss:'):
+                    rss += int(line.split()[1])
+    return pss / 1024, rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='실행 중인 서버 주소 (지정하지 않으면 wsgi.py 서버를 띄움)')
+    parser.add_argument('--rows', type=int, default=200_000, help='합성 ETL 결과 행 수 (서버를 띄울 때)')
+    parser.add_argument('--workers', type=int, default=2, help='워커 프로세스 수 (서버를 띄울 때)')
+    parser.add_argument('--threads', type=int, default=8, help='워커당 스레드 수 (서버를 띄울 때)')
+    parser.add_argument('--no-shared', action='store_true', help='공유 스냅샷/콜백 캐시 없이 서버 실행')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32], help='동시 클라이언트 수')
+    parser.add_argument('--requests', type=int, default=500, help='동시 클라이언트 수별 요청 수')
+    parser.add_argument('--distinct', type=int, default=50, help='서로 다른 필터 조합 수 (캐시 적중률 조절)')
+    args = parser.parse_args()
+    configure_logging(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        url = args.url
+        if url is None:
+            data_path = os.path.join(tmp, 'etl.parquet')
+            from storage import ParquetStorage
+            ParquetStorage().write(generate_transformed_data(*shape_for_rows(args.rows)), data_path)
+            port = _free_port()
+            url = f'http://127.0.0.1:{port}'
+            env = dict(os.environ, ETL_OUTPUT_PATH=data_path,
+                       DASH_SHARED_DIR='' if args.no_shared else os.path.join(tmp, 'shared'))
+            process = subprocess.Popen(
+                [sys.executable, 'wsgi.py', '--port', str(port), '--workers', str(args.workers),
+                 '--threads', str(args.threads)],
+                cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if process is not None:
+                _wait_ready(url, process)
+            pool = request_pool(url, args.distinct)
+            label = f"workers={args.workers}, shared={'off' if args.no_shared else 'on'}" if process else url
+            print(f"{label}, distinct filters={len(pool)}")
+            print(f"{'concurrency':>11} {'requests':>9} {'errors':>7} {'req/sec':>8} {'p50 ms':>8} {'p90 ms':>8} "
+                  f"{'p99 ms':>8} {'max ms':>8} {'KB/resp':>8}")
+            for concurrency in args.concurrency:
+                latencies, errors, received, elapsed = run_load(url, pool, concurrency, args.requests)
+                ms = np.array(latencies) * 1000 if latencies else np.array([np.nan])
+                p50, p90, p99 = np.percentile(ms, [50, 90, 99])
+                print(f"{concurrency:>11} {args.requests:>9} {errors:>7} {len(latencies) / elapsed:>8.1f} "
+                      f"{p50:>8.1f} {p90:>8.1f} {p99:>8.1f} {ms.max():>8.1f} "
+                      f"{received / max(len(latencies), 1) / 1024:>8.1f}")
+            if process is not None:
+                pss, rss = worker_memory_mb(process.pid)
+                if pss is not None:
+                    print(f"\n워커 메모리 합계: PSS {pss:.0f} MB, RSS {rss:.0f} MB")
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+
+
+if __name__ == '__main__':
+    main()
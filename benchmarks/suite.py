@@ -0,0 +1,240 @@
+"""
+벤치마크 모음: 변환 / 저장 / 엑셀 레포트 / Dash 콜백 처리량과 최대 메모리, 이력 비교
+
+합성 데이터(국가 × 지표 × 연도, 월별 발표)로 각 항목을 별도 프로세스에서 실행하여
+처리량(rows/sec)과 최대 RSS를 측정하고, 결과를 이력 파일(JSON Lines)에 추가합니다.
+같은 항목/규모의 다른 리비전 이전 결과와 비교하여 threshold 이상 느려지거나
+메모리가 늘어난 항목을 회귀로 표시합니다.
+
+    python -m benchmarks.suite --countries 20 --indicators 10 --years 20
+    python -m benchmarks.suite --cases transform report --fail-on-regression
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.synthetic import generate_raw_data
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'results', 'history.jsonl')
+
+CASES = ['transform', 'load_csv', 'load_parquet', 'report', 'report_streaming', 'dash_callbacks']
+
+# Dash 콜백 시나리오: (국가 수, 지표 수, 기간 비율) - None이면 전체
+DASH_FILTERS = [(None, None, None), (1, None, None), (None, 1, None), (3, 2, 0.25)]
+
+
+def _transformed(raw):
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = raw
+    return etl.transform()
+
+
+def _run_transform(raw, tmp, profiler):
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True, profiler=profiler)
+    etl.raw_data = raw
+    etl.transform()
+    return len(raw)
+
+
+def _run_load(extension):
+    def run(raw, tmp, profiler):
+        from etl_bloomberg import BloombergETL
+
+        etl = BloombergETL(use_sample=True)
+        etl.raw_data = raw
+        etl.transform()
+        etl.profiler = profiler
+        etl.load(os.path.join(tmp, f'output{extension}'))
+        return len(etl.transformed_data)
+    return run
+
+
+def _run_report(streaming):
+    def run(raw, tmp, profiler):
+        from create_excel_report import EconomicReportGenerator
+        from storage import ParquetStorage
+
+        data_path = os.path.join(tmp, 'transformed.parquet')
+        ParquetStorage().write(_transformed(raw), data_path)
+        generator = EconomicReportGenerator(data_path, streaming=streaming, profiler=profiler)
+        generator.generate_report(os.path.join(tmp, 'report.xlsx'))
+        return len(generator.df)
+    return run
+
+
+def _run_dash_callbacks(raw, tmp, profiler):
+    """경제지표 탭 콜백 (선택 항목 + 필터별 차트 생성 및 JSON 직렬화, 캐시 없이)"""
+    from plotly.io.json import to_json_plotly
+    from app import INDICATORS, service, update_indicator_charts, update_indicator_options
+
+    df = _transformed(raw)
+    countries, indicators = sorted(df['country'].unique()), sorted(df['indicator'].unique())
+    dates = sorted(df['date'].unique())
+
+    service.refresh(INDICATORS, df)
+    version = service.version(INDICATORS)
+    rows = 0
+    with profiler.stage('dash_callbacks', category='dash'):
+        payload = update_indicator_options(version)
+        for n_countries, n_indicators, period in DASH_FILTERS:
+            start_date = None if period is None else \
+                pd.Timestamp(dates[int(len(dates) * (1 - period))]).strftime('%Y-%m-%d')
+            outputs = update_indicator_charts(countries[:n_countries] if n_countries else None,
+                                              indicators[:n_indicators] if n_indicators else None,
+                                              start_date, None, version)
+            payload = to_json_plotly([payload, outputs])
+            rows += len(df)
+    return rows
+
+
+RUNNERS = {
+    'transform': _run_transform,
+    'load_csv': _run_load('.csv'),
+    'load_parquet': _run_load('.parquet'),
+    'report': _run_report(streaming=False),
+    'report_streaming': _run_report(streaming=True),
+    'dash_callbacks': _run_dash_callbacks,
+}
+
+
+def run_child(case, countries, indicators, years):
+    """단일 항목 실행 후 결과를 JSON으로 출력 (데이터 생성 시간은 제외)"""
+    from profiling import StageProfiler, configure_logging
+
+    configure_logging(logging.WARNING)
+    raw = generate_raw_data(countries, indicators, years * 12)
+    profiler = StageProfiler()
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = RUNNERS[case](raw, tmp, profiler)
+
+    # 측정 대상 단계: 최상위 단계 기록의 합
+    top = [record for record in profiler.records if record['depth'] == 0]
+    print(json.dumps({
+        'rows': rows,
+        'seconds': sum(record['wall_seconds'] for record in top),
+        'cpu_seconds': sum(record['cpu_seconds'] for record in top),
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def git_revision():
+    """현재 git 리비전 (수정 사항이 있으면 '+dirty')"""
+    try:
+        revision = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, check=True,
+                                  capture_output=True, text=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                               check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f"{revision}+dirty" if dirty else revision
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def previous_result(history, result):
+    """같은 항목/규모의 다른 리비전 결과 중 가장 최근 것"""
+    for entry in reversed(history):
+        if (entry['case'], entry['scale']) == (result['case'], result['scale']) and \
+                entry['revision'] != result['revision']:
+            return entry
+    return None
+
+
+def regressions(result, previous, threshold):
+    """이전 결과 대비 threshold 비율 이상 나빠진 지표 목록"""
+    if previous is None:
+        return []
+    worse = []
+    if result['seconds'] > previous['seconds'] * (1 + threshold):
+        worse.append('time')
+    if result['peak_rss_mb'] > previous['peak_rss_mb'] * (1 + threshold):
+        worse.append('memory')
+    return worse
+
+
+def _change(current, previous):
+    return f"{(current / previous - 1) * 100:+.0f}%" if previous else '-'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--countries', type=int, default=20, help='국가 수')
+    parser.add_argument('--indicators', type=int, default=10, help='지표 수')
+    parser.add_argument('--years', type=int, default=20, help='연도 수 (월별 발표)')
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES, help='실행할 항목')
+    parser.add_argument('--history', default=HISTORY_PATH, help='결과 이력 파일 (JSON Lines)')
+    parser.add_argument('--no-save', action='store_true', help='결과를 이력에 추가하지 않음')
+    parser.add_argument('--threshold', type=float, default=0.1, help='회귀로 표시할 악화 비율')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1')
+    parser.add_argument('--child', choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.countries, args.indicators, args.years)
+        return
+
+    history = load_history(args.history)
+    context = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'scale': f"{args.countries}x{args.indicators}x{args.years}y",
+    }
+    print(f"revision {context['revision']}, scale {context['scale']} (countries x indicators x years)")
+    print(f"{'case':<18} {'rows':>10} {'seconds':>9} {'rows/sec':>11} {'peak RSS (MB)':>14} "
+          f"{'vs':>10} {'time':>6} {'RSS':>6}")
+
+    results, regressed = [], []
+    for case in args.cases:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.suite', '--child', case, '--countries', str(args.countries),
+             '--indicators', str(args.indicators), '--years', str(args.years)],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout
+        result = dict(context, case=case, **json.loads(output.strip().splitlines()[-1]))
+        result['rows_per_sec'] = result['rows'] / result['seconds']
+        results.append(result)
+
+        previous = previous_result(history, result)
+        worse = regressions(result, previous, args.threshold)
+        if worse:
+            regressed.append((case, worse))
+        print(f"{case:<18} {result['rows']:>10,} {result['seconds']:>9.2f} {result['rows_per_sec']:>11,.0f} "
+              f"{result['peak_rss_mb']:>14.1f} {previous['revision'] if previous else '-':>10} "
+              f"{_change(result['seconds'], previous and previous['seconds']):>6} "
+              f"{_change(result['peak_rss_mb'], previous and previous['peak_rss_mb']):>6}"
+              f"{'  ⚠️ 회귀: ' + ', '.join(worse) if worse else ''}")
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.history)), exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result) + '\n')
+        print(f"\n💾 결과 이력: {args.history}")
+
+    if regressed and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+벤치마크용 합성 거시경제 데이터 생성기
+
+bloomberg_sample_data.csv와 같은 스키마(date, indicator, country, forecast, actual, previous)를
+국가 × 지표 × 기간 규모로 결정적으로(seed 고정) 생성합니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+def generate_raw_data(n_countries=10, n_indicators=10, n_periods=120, seed=0):
+    """
+    원시(추출 직후) 데이터 생성
+
+    Args:
+        n_countries: 국가 수
+        n_indicators: 지표 수
+        n_periods: 월별 발표 횟수
+        seed: 난수 시드
+    """
+    rng = np.random.default_rng(seed)
+    countries = [f"C{i:03d}" for i in range(n_countries)]
+    indicators = [f"Indicator {i:03d}" for i in range(n_indicators)]
+    dates = pd.date_range('2000-01-15', periods=n_periods, freq='MS') + pd.Timedelta(days=14)
+
+    n_series = n_countries * n_indicators
+    n_rows = n_series * n_periods
+
+    # 시계열별 기준 수준 + 랜덤워크
+    level = rng.uniform(0.5, 10.0, size=n_series)
+    steps = rng.normal(0, 0.2, size=(n_periods, n_series))
+    actual = np.round(level + np.cumsum(steps, axis=0), 1)
+    previous = np.vstack([actual[:1], actual[:-1]])
+    forecast = np.round(previous + rng.normal(0, 0.15, size=actual.shape), 1)
+
+    return pd.DataFrame({
+        'date': np.repeat(dates.strftime('%Y-%m-%d').to_numpy(), n_series),
+        'indicator': np.tile(np.repeat(indicators, n_countries), n_periods),
+        'country': np.tile(countries, n_indicators * n_periods),
+        'forecast': forecast.reshape(n_rows),
+        'actual': actual.reshape(n_rows),
+        'previous': previous.reshape(n_rows),
+    })
+
+
+def shape_for_rows(n_rows, n_indicators=10, max_periods=600):
+    """
+    목표 행 수에 맞는 (국가, 지표, 기간) 규모 계산
+
+    기간은 최대 max_periods개월(기본 50년)까지 늘리고, 그 이상은 국가 수를 늘립니다.
+    """
+    n_periods = min(max(1, -(-n_rows // (10 * n_indicators))), max_periods)
+    n_countries = max(10, -(-n_rows // (n_indicators * n_periods)))
+    return n_countries, n_indicators, n_periods
+
+
+def generate_transformed_data(n_countries=10, n_indicators=10, n_periods=120, seed=0):
+    """
+    BloombergETL.transform을 거친 레포트 입력 데이터 생성
+
+    진행 메시지는 'pipeline' 로거로 출력되므로 벤치마크 스크립트에서 configure_logging(logging.WARNING)으로 끕니다.
+    """
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = generate_raw_data(n_countries, n_indicators, n_periods, seed)
+    return etl.transform()
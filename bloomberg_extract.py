@@ -0,0 +1,204 @@
+"""
+블룸버그 HistoricalDataRequest 추출 엔진
+티커를 배치로 나누어 여러 요청을 동시에 보내고, PARTIAL_RESPONSE 이벤트를 받는 즉시 컬럼 버퍼에 파싱합니다.
+"""
+from array import array
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from profiling import get_logger
+
+
+ACTUAL_FIELD = 'PX_LAST'
+FORECAST_FIELD = 'ECO_FUTURE_MEDIAN'
+
+logger = get_logger('extract')
+
+
+def bloomberg_ticker(indicator, country):
+    """블룸버그 티커 형식: INDICATOR COUNTRY Index"""
+    return f"{indicator} {country} Index"
+
+
+class ColumnBuffer:
+    """추출 결과를 행 객체 없이 컬럼별로 누적하는 버퍼"""
+
+    def __init__(self):
+        self.date = []
+        self.indicator = []
+        self.country = []
+        self.forecast = array('d')
+        self.actual = array('d')
+
+    def __len__(self):
+        return len(self.date)
+
+    def to_frame(self):
+        """date, indicator, country, forecast, actual DataFrame 생성"""
+        return pd.DataFrame({
+            'date': pd.to_datetime(self.date).strftime('%Y-%m-%d') if self.date else [],
+            'indicator': self.indicator,
+            'country': self.country,
+            'forecast': np.frombuffer(self.forecast, dtype=np.float64),
+            'actual': np.frombuffer(self.actual, dtype=np.float64),
+        })
+
+
+def with_previous(points):
+    """
+    발표 데이터를 정렬하고 previous 컬럼 추가
+
+    previous는 같은 (국가, 지표) 시계열의 직전 발표 actual 값입니다.
+    """
+    df = points.sort_values(['date', 'indicator', 'country'], kind='stable', ignore_index=True)
+    df['previous'] = df.groupby(['country', 'indicator'], sort=False)['actual'].shift(1)
+    return df
+
+
+class BloombergExtractor:
+    """배치/동시 요청 기반 블룸버그 과거 데이터 추출기"""
+
+    def __init__(self, session, bloomberg_api, batch_size=50, max_in_flight=4, max_retries=2,
+                 timeout_ms=500, max_idle_timeouts=120):
+        """
+        Args:
+            session: 시작되어 //blp/refdata 서비스가 열린 세션
+            bloomberg_api: blpapi 모듈 (또는 fake_blpapi)
+            batch_size: 요청당 종목 수
+            max_in_flight: 동시에 응답을 기다리는 최대 요청 수
+            max_retries: 실패 종목 재시도 횟수
+            timeout_ms: nextEvent 대기 시간
+            max_idle_timeouts: 응답 없이 연속으로 허용할 TIMEOUT 이벤트 수
+        """
+        self.session = session
+        self.api = bloomberg_api
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.timeout_ms = timeout_ms
+        self.max_idle_timeouts = max_idle_timeouts
+        self.failed_securities = {}
+        self.requests_sent = 0
+
+    def _send(self, service, securities, start_date, end_date, correlation_value):
+        request = service.createRequest("HistoricalDataRequest")
+        for ticker in securities:
+            request.append("securities", ticker)
+        request.append("fields", ACTUAL_FIELD)
+        request.append("fields", FORECAST_FIELD)
+        request.set("startDate", start_date.replace("-", ""))
+        request.set("endDate", end_date.replace("-", ""))
+        self.session.sendRequest(request, correlationId=self.api.CorrelationId(correlation_value))
+        self.requests_sent += 1
+
+    def _parse_security(self, security_data, series, buffer):
+        """securityData 요소 하나를 버퍼에 추가, 실패 시 오류 메시지 반환"""
+        ticker = security_data.getElementAsString("security")
+        if security_data.hasElement("securityError"):
+            return ticker, security_data.getElement("securityError").getElementAsString("message")
+
+        indicator, country = series[ticker]
+        field_data = security_data.getElement("fieldData")
+        for i in range(field_data.numValues()):
+            point = field_data.getValueAsElement(i)
+            buffer.date.append(point.getElementAsDatetime("date"))
+            buffer.indicator.append(indicator)
+            buffer.country.append(country)
+            buffer.actual.append(point.getElementAsFloat(ACTUAL_FIELD)
+                                 if point.hasElement(ACTUAL_FIELD) else np.nan)
+            buffer.forecast.append(point.getElementAsFloat(FORECAST_FIELD)
+                                   if point.hasElement(FORECAST_FIELD) else np.nan)
+        return ticker, None
+
+    def extract(self, indicators, countries, start_date, end_date):
+        """
+        모든 (지표, 국가) 시계열 추출
+
+        Returns:
+            date, indicator, country, forecast, actual, previous 컬럼 DataFrame
+        """
+        series = {bloomberg_ticker(indicator, country): (indicator, country)
+                  for country in countries for indicator in indicators}
+        return with_previous(self.fetch(series, start_date, end_date))
+
+    def fetch(self, series, start_date, end_date):
+        """
+        지정한 티커들의 기간 데이터 요청
+
+        Args:
+            series: {티커: (지표, 국가)}
+            start_date, end_date: 기간 (YYYY-MM-DD)
+
+        Returns:
+            date, indicator, country, forecast, actual 컬럼 DataFrame (previous 없음)
+        """
+        service = self.session.getService("//blp/refdata")
+        buffer = ColumnBuffer()
+
+        pending = list(series)
+        attempt = 0
+        self.failed_securities = {}
+        next_id = 0
+
+        while pending and attempt <= self.max_retries:
+            batches = deque(pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size))
+            in_flight = {}
+            failed = {}
+            idle_timeouts = 0
+
+            while batches or in_flight:
+                # 동시 요청 수 한도까지 요청 전송
+                while batches and len(in_flight) < self.max_in_flight:
+                    batch = batches.popleft()
+                    next_id += 1
+                    in_flight[next_id] = set(batch)
+                    self._send(service, batch, start_date, end_date, next_id)
+
+                event = self.session.nextEvent(self.timeout_ms)
+                event_type = event.eventType()
+                if event_type == self.api.Event.TIMEOUT:
+                    idle_timeouts += 1
+                    if idle_timeouts > self.max_idle_timeouts:
+                        raise TimeoutError("블룸버그 응답 대기 시간 초과")
+                    continue
+                idle_timeouts = 0
+
+                if event_type not in (self.api.Event.PARTIAL_RESPONSE, self.api.Event.RESPONSE,
+                                      self.api.Event.REQUEST_STATUS):
+                    continue
+
+                for message in event:
+                    correlation_value = message.correlationIds()[0].value()
+                    outstanding = in_flight.get(correlation_value)
+                    if outstanding is None:
+                        continue
+                    if event_type == self.api.Event.REQUEST_STATUS:
+                        # 요청 전체 실패 -> 남은 종목 재시도
+                        failed.update({ticker: 'request failure' for ticker in outstanding})
+                        outstanding.clear()
+                    elif message.hasElement("securityData"):
+                        ticker, error = self._parse_security(message.getElement("securityData"), series, buffer)
+                        outstanding.discard(ticker)
+                        if error is not None:
+                            failed[ticker] = error
+
+                # 최종 응답을 받은 요청 정리 (응답에 빠진 종목은 실패로 처리)
+                if event_type in (self.api.Event.RESPONSE, self.api.Event.REQUEST_STATUS):
+                    for message in event:
+                        correlation_value = message.correlationIds()[0].value()
+                        for ticker in in_flight.pop(correlation_value, ()):
+                            failed.setdefault(ticker, 'missing from response')
+
+            pending = list(failed)
+            self.failed_securities = failed
+            attempt += 1
+            if pending and attempt <= self.max_retries:
+                logger.warning("🔁 실패 종목 %d개 재시도 (%d/%d)", len(pending), attempt, self.max_retries)
+
+        if self.failed_securities:
+            logger.warning("⚠️  추출 실패 종목 %d개: %s", len(self.failed_securities),
+                           ', '.join(sorted(self.failed_securities)))
+
+        return buffer.to_frame()
@@ -0,0 +1,122 @@
+"""
+ETL / 레포트 / 대시보드 통합 명령줄 도구
+
+하위 명령이 실제로 필요한 모듈(pandas, openpyxl, dash 등)만 실행 시점에 import하므로
+--help나 인자 오류는 무거운 라이브러리를 로드하지 않고 바로 끝납니다.
+
+    python cli.py etl --sample --output bloomberg_transformed_data.csv
+    python cli.py report --input bloomberg_transformed_data.csv --output Economic_Report.xlsx
+    python cli.py report --renderer html --output report.html --summary-only
+    python cli.py serve --workers 4 --port 8050
+"""
+import argparse
+import logging
+import os
+
+
+RENDERERS = ('openpyxl', 'xlsxwriter', 'html', 'csv')
+ETL_MODES = ('pipeline', 'chunked', 'graph', 'incremental')
+# --output 기본값 (incremental은 파일이 아니라 분할 저장 디렉터리)
+ETL_OUTPUT = 'bloomberg_transformed_data.csv'
+INCREMENTAL_OUTPUT = 'bloomberg_data'
+
+
+def run_etl(args):
+    """블룸버그 ETL 실행 (incremental은 --output을 분할 저장 디렉터리로 사용)"""
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=args.sample, features=args.features, validation=not args.no_validation,
+                       quarantine_path=args.quarantine)
+    options = dict(indicators=args.indicators, countries=args.countries,
+                   start_date=args.start_date, end_date=args.end_date)
+    if args.mode == 'incremental':
+        etl.run_incremental(output_dir=args.output or INCREMENTAL_OUTPUT, trace_path=args.trace, **options)
+    else:
+        run = {'pipeline': etl.run_pipeline, 'chunked': etl.run_chunked, 'graph': etl.run_graph}[args.mode]
+        run(output_path=args.output or ETL_OUTPUT, trace_path=args.trace, **options)
+
+
+def run_report(args):
+    """변환 결과(파일 또는 상주 ETL 데몬)로 레포트 생성"""
+    from create_excel_report import EconomicReportGenerator
+
+    options = dict(streaming=args.streaming, workers=args.workers, include_rows=not args.summary_only,
+                   renderer=args.renderer, start_date=args.start_date, end_date=args.end_date)
+    if args.daemon_socket:
+        from etl_daemon import DaemonClient
+
+        generator = EconomicReportGenerator(None, data=DaemonClient(args.daemon_socket).data(), **options)
+    else:
+        generator = EconomicReportGenerator(args.input, **options)
+    print(f"📁 생성된 레포트: {generator.generate_report(args.output, trace_path=args.trace)}")
+
+
+def run_serve(args):
+    """Dash 앱 서비스 (--dev면 개발 서버, 아니면 워커 프로세스 WSGI 서비스)"""
+    if args.dev:
+        from app import app
+
+        app.run(host=args.host, port=args.port, debug=True)
+        return
+
+    from serving import serve
+    from wsgi import application
+
+    serve(application, args.host, args.port, args.workers, args.threads)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="거시경제 지표 ETL / 레포트 / 대시보드 명령줄 도구")
+    parser.add_argument('-q', '--quiet', action='store_true', help='진행 메시지 끄기 (경고/오류만 출력)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    etl = commands.add_parser('etl', help='블룸버그 데이터 추출 / 검증 / 변환 / 저장')
+    etl.add_argument('--sample', action='store_true', help='블룸버그 API 대신 샘플 데이터 사용')
+    etl.add_argument('--mode', choices=ETL_MODES, default='pipeline', help='실행 방식 (기본: pipeline)')
+    etl.add_argument('--output', help=f"저장 경로 (.csv / .parquet, 기본: {ETL_OUTPUT}) "
+                                      f"- incremental은 분할 저장 디렉터리 (기본: {INCREMENTAL_OUTPUT})")
+    etl.add_argument('--indicators', nargs='+')
+    etl.add_argument('--countries', nargs='+')
+    etl.add_argument('--start-date', help='YYYY-MM-DD')
+    etl.add_argument('--end-date', help='YYYY-MM-DD')
+    etl.add_argument('--features', action='store_true', help='시계열 feature도 계산')
+    etl.add_argument('--no-validation', action='store_true', help='품질 검증 생략')
+    etl.add_argument('--quarantine', help='격리한 행 저장 경로')
+    etl.add_argument('--trace', help='단계별 계측 trace-event JSON 저장 경로')
+    etl.set_defaults(handler=run_etl)
+
+    report = commands.add_parser('report', help='변환 결과로 레포트 생성')
+    report.add_argument('--input', default='bloomberg_transformed_data.csv', help='변환 결과 파일 (.csv / .parquet)')
+    report.add_argument('--daemon-socket', default=os.environ.get('ETL_DAEMON_SOCKET'),
+                        help='상주 ETL 데몬 소켓 (지정하면 --input 대신 데몬의 현재 데이터셋 사용)')
+    report.add_argument('--output', default='Economic_Report.xlsx', help='레포트 경로 (csv 렌더러는 디렉터리)')
+    report.add_argument('--renderer', choices=RENDERERS, default='openpyxl')
+    report.add_argument('--streaming', action='store_true', help='write-only 워크북 (openpyxl, 대용량)')
+    report.add_argument('--workers', type=int, default=1, help='지표별 시트 생성 프로세스 수 (--streaming)')
+    report.add_argument('--summary-only', action='store_true', help='원본 행 시트 없이 요약/집계 시트만 생성')
+    report.add_argument('--start-date', help='YYYY-MM-DD')
+    report.add_argument('--end-date', help='YYYY-MM-DD')
+    report.add_argument('--trace', help='단계별 계측 trace-event JSON 저장 경로')
+    report.set_defaults(handler=run_report)
+
+    serve = commands.add_parser('serve', help='Dash 대시보드 서비스')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8050)
+    serve.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='워커 프로세스 수')
+    serve.add_argument('--threads', type=int, default=8, help='워커당 요청 처리 스레드 수')
+    serve.add_argument('--dev', action='store_true', help='개발 서버 (디버그 모드, 단일 프로세스)')
+    serve.set_defaults(handler=run_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.quiet:
+        from profiling import configure_logging
+
+        configure_logging(logging.WARNING)
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
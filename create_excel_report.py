@@ -1,38 +1,318 @@
 """
 거시경제 데이터 엑셀 레포트 생성 코드
 openpyxl을 사용하여 스타일링된 엑셀 레포트를 생성합니다.
+openpyxl은 openpyxl 렌더러로 워크북을 만들 때 import합니다 (다른 렌더러와 CLI 시작 시간에서 제외).
 """
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.chart import BarChart, LineChart, Reference
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
 from datetime import datetime
 
+import pandas as pd
+
+from profiling import StageProfiler, get_logger, measure
+from report_aggregates import indicator_series, rolling_accuracy, surprise_counts, ROLLING_WINDOW
+from report_model import CHART_ROWS, FONT_KEYS, STYLES, TITLE_SPAN, Chart, Sheet, SignRule, Table
+from report_renderers import get_renderer
+from storage import get_storage
+
+
+logger = get_logger('report')
+
+
+# 레포트에서 사용하는 컬럼 (저장소에서 이 컬럼만 읽음)
+REPORT_COLUMNS = ['date', 'country', 'indicator', 'forecast', 'actual', 'previous',
+                  'forecast_error', 'forecast_error_pct', 'mom_change', 'mom_change_pct',
+                  'forecast_accuracy', 'surprise', 'trend']
+
+# 지표별 시트 컬럼 / 헤더
+INDICATOR_COLUMNS = ['date', 'country', 'forecast', 'actual', 'previous',
+                     'forecast_error_pct', 'mom_change_pct', 'forecast_accuracy', 'trend']
+INDICATOR_HEADERS = ['Date', 'Country', 'Forecast', 'Actual', 'Previous',
+                     'Error %', 'MoM %', 'Accuracy %', 'Trend']
+INDICATOR_NUMBER_COLUMNS = [3, 4, 5, 6, 7, 8]
+
+# 상세 데이터 시트 숫자 컬럼 (Forecast ~ Accuracy %)
+DETAIL_NUMBER_COLUMNS = [4, 5, 6, 7, 8, 9, 10, 11]
+
+def build_named_styles():
+    """
+    레포트에서 공유하는 NamedStyle 목록 생성 (report_model.STYLES 정의를 openpyxl 서식으로 변환)
+
+    셀마다 Alignment/PatternFill/Border 객체를 새로 만드는 대신
+    워크북에 한 번만 등록하고 이름으로 참조합니다.
+    """
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
+
+    thin = Side(style='thin')
+    thin_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    styles = []
+    for name, spec in STYLES.items():
+        font = {key: spec[key] for key in FONT_KEYS if key in spec}
+        options = {'font': Font(**font) if font else DEFAULT_FONT}
+        if 'fill' in spec:
+            options['fill'] = PatternFill(start_color=spec['fill'], end_color=spec['fill'], fill_type='solid')
+        if 'align' in spec:
+            options['alignment'] = Alignment(horizontal=spec['align'], vertical='center')
+        if spec.get('border'):
+            options['border'] = thin_border
+        if 'number_format' in spec:
+            options['number_format'] = spec['number_format']
+        styles.append(NamedStyle(name=name, **options))
+    return styles
+
+
+def register_named_styles(wb):
+    """워크북에 공유 스타일을 등록 (이미 등록된 이름은 건너뜀)"""
+    for style in build_named_styles():
+        if style.name not in wb.named_styles:
+            wb.add_named_style(style)
+
+
+# 스트리밍 워크북이 사용하는 openpyxl 내부 구현 (공개 API로는 셀 스타일 번호 고정과 미리 만든 시트 XML 연결이 불가능)
+# requirements.txt에 고정한 openpyxl 버전 범위에서 확인했으며, 내부 구현이 바뀌면 check_openpyxl_internals가 실패
+OPENPYXL_WORKBOOK_INTERNALS = ['_cell_styles', '_named_styles']
+OPENPYXL_SHEET_WRITER_METHODS = ['write_rows', 'write_tail', 'close', 'cleanup']
+
+
+def check_openpyxl_internals(wb):
+    """
+    스트리밍 워크북이 의존하는 openpyxl 내부 속성이 있는지 확인
+
+    없으면 잘못된 파일을 만드는 대신 ImportError를 발생시킵니다.
+    """
+    import openpyxl
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+    from openpyxl.worksheet._writer import WorksheetWriter
+
+    missing = [f'Workbook.{name}' for name in OPENPYXL_WORKBOOK_INTERNALS if not hasattr(wb, name)]
+    missing += [f'WorksheetWriter.{name}' for name in OPENPYXL_SHEET_WRITER_METHODS
+                if not hasattr(WorksheetWriter, name)]
+    if not hasattr(WriteOnlyWorksheet, '_writer'):
+        missing.append('WriteOnlyWorksheet._writer')
+    if missing:
+        raise ImportError(f"스트리밍 레포트를 지원하지 않는 openpyxl 버전입니다: {openpyxl.__version__} "
+                          f"(없는 내부 속성: {', '.join(missing)}) - requirements.txt의 openpyxl 버전을 설치하거나 "
+                          f"streaming=False로 실행하세요.")
+
+
+def new_streaming_workbook():
+    """
+    공유 스타일을 등록한 write-only 워크북
+
+    셀 스타일 번호(시트 XML의 s 속성)는 처음 사용된 순서로 매겨지므로, 모든 공유 스타일을
+    미리 같은 순서로 등록해 둡니다. 이렇게 하면 다른 프로세스에서 만든 시트 XML을
+    번호 변환 없이 그대로 합칠 수 있습니다.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    check_openpyxl_internals(wb)
+    register_named_styles(wb)
+    for style in build_named_styles():
+        wb._cell_styles.add(wb._named_styles[style.name].as_tuple())
+    return wb
+
+
+def write_indicator_rows(ws, df_display):
+    """지표별 시트 내용을 write-only 시트에 기록"""
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils.dataframe import dataframe_to_rows
+
+    for col in range(1, len(INDICATOR_HEADERS) + 1):
+        ws.column_dimensions[chr(64 + col)].width = 15
+
+    def styled(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    ws.append([styled(header, 'indicator_header') for header in INDICATOR_HEADERS])
+    for row in dataframe_to_rows(df_display, index=False, header=False):
+        ws.append([
+            styled(value, 'indicator_number' if c_idx in INDICATOR_NUMBER_COLUMNS else 'indicator_text')
+            for c_idx, value in enumerate(row, 1)
+        ])
+
+
+def render_indicator_sheet(df_display):
+    """
+    지표별 시트 XML을 임시 파일로 생성 (프로세스 풀 작업 함수)
+
+    Returns:
+        str: 시트 XML 파일 경로 (RenderedSheetWriter로 워크북에 합침)
+    """
+    ws = new_streaming_workbook().create_sheet()
+    write_indicator_rows(ws, df_display)
+    ws.close()
+    path = getattr(ws._writer, 'out', None)
+    if path is None or not os.path.exists(path):
+        raise ImportError("openpyxl write-only 시트의 XML 임시 파일 경로(_writer.out)를 찾을 수 없습니다.")
+    return path
+
+
+def attach_rendered_sheet(ws, path):
+    """미리 생성한 시트 XML 파일을 write-only 시트 내용으로 연결 (저장 시 그대로 복사)"""
+    ws._writer = RenderedSheetWriter(path)
+
+
+class RenderedSheetWriter:
+    """
+    미리 생성한 시트 XML 파일을 write-only 시트에 연결하는 writer
+
+    저장 시 ExcelWriter가 호출하는 WorksheetWriter 메서드 중 필요한 것만 구현합니다.
+    """
+
+    def __init__(self, path):
+        from openpyxl.packaging.relationship import RelationshipList
+
+        self.out = path
+        self._rels = RelationshipList()
+
+    def write_rows(self):
+        pass
+
+    def write_tail(self):
+        pass
+
+    def close(self):
+        pass
+
+    def cleanup(self):
+        os.remove(self.out)
+
+
+def column_widths(df, headers, max_width=20):
+    """
+    DataFrame에서 열 너비를 벡터 연산으로 계산
+
+    셀을 다시 순회하며 str()을 호출하는 대신 각 컬럼의 문자열 길이 최대값을 구합니다.
+    결과는 기존 방식(헤더 포함 최대 길이 + 2, 최대 max_width)과 동일합니다.
+    """
+    widths = []
+    for header, column in zip(headers, df.columns):
+        values = df[column]
+        longest = values.astype(str).str.len().max() if len(values) else 0
+        widths.append(min(max(len(str(header)), int(longest)) + 2, max_width))
+    return widths
+
 
 class EconomicReportGenerator:
     """거시경제 엑셀 레포트 생성기"""
 
-    def __init__(self, data_path):
+    def __init__(self, data_path, streaming=False, start_date=None, end_date=None, workers=1,
+                 include_rows=True, profiler=None, data=None, renderer='openpyxl'):
         """
         Args:
-            data_path: 변환된 데이터 CSV 파일 경로
+            data_path: 변환된 데이터 파일 경로 (.csv / .parquet), data를 지정하면 None 가능
+            streaming: True면 write-only 워크북으로 행을 바로 기록 (대용량 데이터용, 메모리 사용량 일정)
+            start_date, end_date: 지정하면 해당 기간 데이터만 읽음 (YYYY-MM-DD)
+            workers: 지표별 시트를 생성할 프로세스 수 (streaming=True에서만 2 이상 사용 가능,
+                     프로세스 수와 관계없이 같은 파일 생성)
+            include_rows: False면 원본 행 시트(All Data, 지표별 시트)를 생략하고 요약/집계 시트만 생성
+                          (파일 크기와 여는 시간이 행 수가 아닌 집계 크기에 비례)
+            profiler: 단계/시트별 시간, 메모리, 행 수를 기록할 StageProfiler (None이면 기본 설정으로 생성)
+            data: 변환된 DataFrame - 지정하면 파일을 읽지 않고 사용 (작업 그래프에서 메모리로 전달)
+            renderer: 'openpyxl'(기본, 엑셀) 또는 report_renderers 백엔드 이름('xlsxwriter', 'html', 'csv')
+                      - openpyxl 외 렌더러는 report_model()의 레이아웃 모델을 출력하며 streaming/workers를 사용하지 않음
         """
+        if workers > 1 and not streaming:
+            raise ValueError("workers는 streaming=True에서만 2 이상으로 지정할 수 있습니다.")
+        if renderer != 'openpyxl':
+            get_renderer(renderer)  # 지원하지 않는 렌더러면 데이터를 읽기 전에 ValueError
         self.data_path = data_path
+        self.data = data
+        self.renderer = renderer
+        self.streaming = streaming
+        self.workers = workers
+        self.include_rows = include_rows
+        self.start_date = start_date
+        self.end_date = end_date
+        self.profiler = profiler if profiler is not None else StageProfiler()
         self.df = None
         self.wb = None
 
     def load_data(self):
         """데이터 로드"""
-        print("📥 데이터 로딩 중...")
-        self.df = pd.read_csv(self.data_path)
-        self.df['date'] = pd.to_datetime(self.df['date'])
-        print(f"✅ {len(self.df)}개 레코드 로드 완료")
+        logger.info("📥 데이터 로딩 중...")
+        with self.profiler.stage('load_data', category='report', path=self.data_path) as record:
+            if self.data is not None:
+                df = self.data[REPORT_COLUMNS]
+                if self.start_date is not None:
+                    df = df[df['date'] >= pd.Timestamp(self.start_date)]
+                if self.end_date is not None:
+                    df = df[df['date'] <= pd.Timestamp(self.end_date)]
+                self.df = df
+            else:
+                self.df = get_storage(self.data_path).read(
+                    self.data_path, columns=REPORT_COLUMNS, start_date=self.start_date, end_date=self.end_date)
+            record['rows_out'] = len(self.df)
+        logger.info("✅ %d개 레코드 로드 완료", len(self.df))
         return self.df
 
+    def _report_info(self):
+        """요약 시트의 보고서 정보 항목"""
+        return [
+            ('Report Date:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            ('Data Period:', f"{self.df['date'].min().strftime('%Y-%m-%d')} ~ {self.df['date'].max().strftime('%Y-%m-%d')}"),
+            ('Total Records:', len(self.df)),
+        ]
+
+    def _country_summary(self):
+        """국가별 데이터 수 및 평균 예측 정확도"""
+        country_summary = self.df.groupby('country', observed=True).agg({
+            'actual': 'count',
+            'forecast_accuracy': 'mean'
+        }).round(2)
+        country_summary.columns = ['Data Points', 'Avg Forecast Accuracy (%)']
+        return country_summary
+
+    @contextmanager
+    def _sheet_stage(self, ws, rows_in=None):
+        """시트 생성 단계 계측 (출력 행 수는 시트에 기록된 행 수)"""
+        rows_in = len(self.df) if rows_in is None else rows_in
+        with self.profiler.stage(f'sheet:{ws.title}', category='sheet', rows_in=rows_in) as record:
+            if not self.streaming:
+                yield record
+                record['rows_out'] = ws.max_row
+                return
+
+            # write-only 시트는 기록한 행 수를 보관하지 않으므로 append 호출 수를 셈
+            append = ws.append
+            record['rows_out'] = 0
+
+            def counting_append(row):
+                record['rows_out'] += 1
+                append(row)
+
+            ws.append = counting_append
+            try:
+                yield record
+            finally:
+                del ws.append
+
+    @staticmethod
+    def _styled_cell(ws, value, style):
+        """write-only 시트용 공유 스타일 셀 (제목/헤더용, 데이터 셀은 호출부에서 WriteOnlyCell 직접 생성)"""
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
     def create_summary_sheet(self, ws):
         """요약 시트 생성"""
-        print("📄 요약 시트 생성 중...")
+        logger.info("📄 요약 시트 생성 중...")
+
+        if self.streaming:
+            self._stream_summary_sheet(ws)
+            logger.info("✅ 요약 시트 완료")
+            return
+
+        from openpyxl.styles import Alignment, Font, PatternFill
 
         # 헤더
         ws['A1'] = 'Economic Indicators Report'
@@ -43,12 +323,9 @@ class EconomicReportGenerator:
         ws.row_dimensions[1].height = 30
 
         # 보고서 정보
-        ws['A3'] = 'Report Date:'
-        ws['B3'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ws['A4'] = 'Data Period:'
-        ws['B4'] = f"{self.df['date'].min().strftime('%Y-%m-%d')} ~ {self.df['date'].max().strftime('%Y-%m-%d')}"
-        ws['A5'] = 'Total Records:'
-        ws['B5'] = len(self.df)
+        for row, (label, value) in enumerate(self._report_info(), 3):
+            ws[f'A{row}'] = label
+            ws[f'B{row}'] = value
 
         # 스타일 적용
         for row in range(3, 6):
@@ -62,11 +339,7 @@ class EconomicReportGenerator:
         ws['A7'].font = Font(size=12, bold=True, color='FFFFFF')
         ws.merge_cells('A7:F7')
 
-        country_summary = self.df.groupby('country').agg({
-            'actual': 'count',
-            'forecast_accuracy': 'mean'
-        }).round(2)
-        country_summary.columns = ['Data Points', 'Avg Forecast Accuracy (%)']
+        country_summary = self._country_summary()
 
         start_row = 8
         ws['A8'] = 'Country'
@@ -89,12 +362,143 @@ class EconomicReportGenerator:
         ws.column_dimensions['B'].width = 20
         ws.column_dimensions['C'].width = 25
 
-        print("✅ 요약 시트 완료")
+        logger.info("✅ 요약 시트 완료")
+
+    def _stream_summary_sheet(self, ws):
+        """요약 시트를 write-only 시트에 행 단위로 기록"""
+        # write-only 시트는 행/열 서식과 병합 범위를 행 기록 전에 지정해야 함
+        ws.column_dimensions['A'].width = 20
+        ws.column_dimensions['B'].width = 20
+        ws.column_dimensions['C'].width = 25
+        ws.row_dimensions[1].height = 30
+        ws.merged_cells.add('A1:F1')
+        ws.merged_cells.add('A7:F7')
+
+        ws.append([self._styled_cell(ws, 'Economic Indicators Report', 'report_title')])
+        ws.append([])
+        for label, value in self._report_info():
+            ws.append([self._styled_cell(ws, label, 'report_label'), value])
+        ws.append([])
+        ws.append([self._styled_cell(ws, 'Summary by Country', 'report_section')])
+        ws.append([self._styled_cell(ws, header, 'report_table_header')
+                   for header in ['Country', 'Data Points', 'Avg Forecast Accuracy (%)']])
+
+        for country, data in self._country_summary().iterrows():
+            ws.append([country, data['Data Points'], data['Avg Forecast Accuracy (%)']])
+
+    @staticmethod
+    def _format_label(value):
+        """집계표 행 이름 (날짜는 YYYY-MM-DD 문자열)"""
+        return value.strftime('%Y-%m-%d') if isinstance(value, pd.Timestamp) else value
+
+    def _append_table(self, ws, row, title, table, index_label):
+        """
+        제목과 집계표를 ws의 row행부터 추가 (write-only 시트와 일반 시트 공용)
+
+        Returns:
+            (헤더 행, 마지막 데이터 행)
+        """
+        ws.append([self._styled_cell(ws, title, 'report_section')])
+        ws.append([self._styled_cell(ws, header, 'report_table_header')
+                   for header in [index_label, *map(str, table.columns)]])
+        for label, values in zip(table.index, table.to_numpy(dtype=object)):
+            ws.append([self._format_label(label), *(None if pd.isna(value) else value for value in values)])
+        return row + 1, row + 1 + len(table)
+
+    @staticmethod
+    def _add_chart(ws, chart, header_row, last_row, n_series, anchor):
+        """집계표(1열: 분류, 2열부터: 계열)를 원본으로 하는 차트 추가"""
+        from openpyxl.chart import Reference
+
+        chart.add_data(Reference(ws, min_col=2, max_col=1 + n_series, min_row=header_row, max_row=last_row),
+                       titles_from_data=True)
+        chart.set_categories(Reference(ws, min_col=1, min_row=header_row + 1, max_row=last_row))
+        ws.add_chart(chart, anchor)
+
+    def _append_blank_rows(self, ws, row, next_row):
+        for _ in range(row, next_row):
+            ws.append([])
+        return next_row
+
+    def create_aggregate_sheets(self):
+        """지표 추이 / 예측 정확도 / 서프라이즈 집계 시트와 엑셀 차트 생성"""
+        logger.info("📄 집계 시트 생성 중...")
+        from openpyxl.chart import BarChart, LineChart
+        from openpyxl.utils import get_column_letter
+
+        # 지표별 국가 실제치 추이
+        ws = self.wb.create_sheet(title='Trends')
+        with self._sheet_stage(ws):
+            ws.column_dimensions['A'].width = 14
+            row = 1
+            for indicator, table in indicator_series(self.df).items():
+                header_row, last_row = self._append_table(ws, row, indicator, table, 'Date')
+                chart = LineChart()
+                chart.title = indicator
+                chart.y_axis.title = 'Actual'
+                self._add_chart(ws, chart, header_row, last_row, len(table.columns),
+                                f"{get_column_letter(len(table.columns) + 3)}{row}")
+                row = self._append_blank_rows(ws, last_row + 1, max(last_row + 2, row + CHART_ROWS))
+
+        # 국가별 예측 정확도 이동 평균
+        ws = self.wb.create_sheet(title='Accuracy')
+        with self._sheet_stage(ws):
+            ws.column_dimensions['A'].width = 14
+            table = rolling_accuracy(self.df)
+            header_row, last_row = self._append_table(
+                ws, 1, f'Rolling Forecast Accuracy (%, last {ROLLING_WINDOW} releases)', table, 'Date')
+            chart = LineChart()
+            chart.title = 'Rolling Forecast Accuracy (%)'
+            self._add_chart(ws, chart, header_row, last_row, len(table.columns),
+                            f"{get_column_letter(len(table.columns) + 3)}1")
+
+        # 국가별 / 지표별 서프라이즈 횟수
+        ws = self.wb.create_sheet(title='Surprises')
+        with self._sheet_stage(ws):
+            ws.column_dimensions['A'].width = 24
+            row = 1
+            for by, title in [('country', 'Country'), ('indicator', 'Indicator')]:
+                table = surprise_counts(self.df, by)
+                header_row, last_row = self._append_table(ws, row, f'Surprises by {title}', table, title)
+                chart = BarChart()
+                chart.type = 'col'
+                chart.grouping = 'stacked'
+                chart.overlap = 100
+                chart.title = f'Surprises by {title}'
+                self._add_chart(ws, chart, header_row, last_row, len(table.columns),
+                                f"{get_column_letter(len(table.columns) + 3)}{row}")
+                row = self._append_blank_rows(ws, last_row + 1, max(last_row + 2, row + CHART_ROWS))
+
+        logger.info("✅ 집계 시트 완료 (Trends, Accuracy, Surprises)")
 
     def create_detail_sheet(self, ws):
         """상세 데이터 시트 생성"""
-        print("📄 상세 데이터 시트 생성 중...")
+        logger.info("📄 상세 데이터 시트 생성 중...")
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        from openpyxl.utils.dataframe import dataframe_to_rows
+
+        def styled(value, style):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style
+            return cell
+
+        df_display, headers = self._detail_frame()
+
+        # 열 너비(DataFrame 문자열 길이로 계산)와 필터를 먼저 지정한 뒤,
+        # 셀마다 공유 스타일(테두리, 숫자 포맷, 정렬, 조건부 색상)을 한 번에 적용하며 기록
+        for col_num, width in enumerate(column_widths(df_display, headers), 1):
+            ws.column_dimensions[get_column_letter(col_num)].width = width
+        ws.auto_filter.ref = f"A1:{chr(64 + len(headers))}{len(df_display) + 1}"
 
+        ws.append([self._styled_cell(ws, header, 'detail_header') for header in headers])
+        for row in dataframe_to_rows(df_display, index=False, header=False):
+            ws.append([styled(value, self._detail_style(c_idx, value)) for c_idx, value in enumerate(row, 1)])
+
+        logger.info("✅ 상세 데이터 시트 완료 (%d rows)", len(df_display))
+
+    def _detail_frame(self):
+        """상세 데이터 시트 표시용 데이터 (최신 날짜 순, 날짜 문자열)와 헤더"""
         # 데이터 정렬
         df_sorted = self.df.sort_values(['date', 'country', 'indicator'], ascending=[False, True, True])
 
@@ -111,11 +515,76 @@ class EconomicReportGenerator:
         headers = ['Date', 'Country', 'Indicator', 'Forecast', 'Actual', 'Previous',
                    'Forecast Error', 'Error %', 'MoM Change', 'MoM %',
                    'Accuracy %', 'Surprise', 'Trend']
+        return df_display, headers
+
+    @staticmethod
+    def _detail_style(c_idx, value):
+        """상세 데이터 셀 공유 스타일 (숫자 포맷, Error % 양수/음수 색상)"""
+        if c_idx not in DETAIL_NUMBER_COLUMNS:
+            return 'detail_text'
+        if c_idx == 8 and isinstance(value, (int, float)):  # Forecast Error %
+            if value > 0:
+                return 'detail_positive'
+            if value < 0:
+                return 'detail_negative'
+        return 'detail_number'
+
+    def _indicator_frames(self):
+        """지표별 시트 데이터 (groupby 한 번으로 분할, 지표 등장 순서)"""
+        for indicator, df_indicator in self.df.groupby('indicator', sort=False, observed=True):
+            df_display = df_indicator.sort_values('date', ascending=False)[INDICATOR_COLUMNS].copy()
+            df_display['date'] = df_display['date'].dt.strftime('%Y-%m-%d')
+            yield indicator, df_display
 
-        for col_num, header in enumerate(headers, 1):
+    def create_indicator_sheets(self):
+        """지표별 시트 생성"""
+        logger.info("📄 지표별 시트 생성 중...")
+
+        frames = list(self._indicator_frames())
+
+        if self.streaming:
+            # 시트 XML을 프로세스별로 생성한 뒤 지표 순서대로 워크북에 연결
+            # (하위 프로세스에서 측정한 시트별 기록은 프로세스 id와 함께 합침)
+            if self.workers > 1:
+                with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [executor.submit(measure, f'sheet:{indicator}', render_indicator_sheet, frame,
+                                               category='sheet', rows_in=len(frame))
+                               for indicator, frame in frames]
+                    rendered = [future.result() for future in futures]
+                paths = []
+                for path, record in rendered:
+                    self.profiler.add(dict(record, rows_out=record['rows_in'] + 1))
+                    paths.append(path)
+            else:
+                paths = []
+                for indicator, frame in frames:
+                    with self.profiler.stage(f'sheet:{indicator}', category='sheet', rows_in=len(frame),
+                                             rows_out=len(frame) + 1):
+                        paths.append(render_indicator_sheet(frame))
+            for (indicator, _), path in zip(frames, paths):
+                logger.info("  - %s 시트 생성 완료", indicator)
+                attach_rendered_sheet(self.wb.create_sheet(title=indicator), path)
+            logger.info("✅ %d개 지표별 시트 완료", len(frames))
+            return
+
+        for indicator, df_display in frames:
+            logger.info("  - %s 시트 생성 중...", indicator)
+            ws = self.wb.create_sheet(title=indicator)
+            with self._sheet_stage(ws, rows_in=len(df_display)):
+                self._write_indicator_sheet(ws, df_display)
+
+        logger.info("✅ %d개 지표별 시트 완료", len(frames))
+
+    @staticmethod
+    def _write_indicator_sheet(ws, df_display):
+        """지표별 시트 내용 기록 (일반 워크북)"""
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils.dataframe import dataframe_to_rows
+
+        for col_num, header in enumerate(INDICATOR_HEADERS, 1):
             cell = ws.cell(row=1, column=col_num, value=header)
             cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid')
+            cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
             cell.alignment = Alignment(horizontal='center', vertical='center')
 
         # 데이터 작성
@@ -124,131 +593,156 @@ class EconomicReportGenerator:
                 cell = ws.cell(row=r_idx, column=c_idx, value=value)
                 cell.alignment = Alignment(horizontal='center', vertical='center')
 
-                # 숫자 포맷
-                if c_idx in [4, 5, 6, 7, 8, 9, 10, 11]:  # 숫자 컬럼
+                if c_idx in INDICATOR_NUMBER_COLUMNS:
                     cell.number_format = '#,##0.00'
 
-                # 조건부 서식
-                if c_idx == 8:  # Forecast Error %
-                    if isinstance(value, (int, float)):
-                        if value > 0:
-                            cell.fill = PatternFill(start_color='C6EFCE', end_color='C6EFCE', fill_type='solid')
-                        elif value < 0:
-                            cell.fill = PatternFill(start_color='FFC7CE', end_color='FFC7CE', fill_type='solid')
-
-        # 테두리 추가
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        for row in ws.iter_rows(min_row=1, max_row=len(df_display) + 1, min_col=1, max_col=len(headers)):
-            for cell in row:
-                cell.border = thin_border
-
-        # 열 너비 자동 조정
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 20)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        # 필터 추가
-        ws.auto_filter.ref = f"A1:{chr(64 + len(headers))}{len(df_display) + 1}"
-
-        print(f"✅ 상세 데이터 시트 완료 ({len(df_display)} rows)")
-
-    def create_indicator_sheets(self):
-        """지표별 시트 생성"""
-        print("📄 지표별 시트 생성 중...")
-
-        indicators = self.df['indicator'].unique()
-
-        for indicator in indicators:
-            print(f"  - {indicator} 시트 생성 중...")
-            ws = self.wb.create_sheet(title=indicator)
+        # 열 너비 조정
+        for col in range(1, len(INDICATOR_HEADERS) + 1):
+            ws.column_dimensions[chr(64 + col)].width = 15
 
-            # 해당 지표 데이터 필터링
-            df_indicator = self.df[self.df['indicator'] == indicator].sort_values('date', ascending=False)
+    def _aggregate_table(self, title, table, index_label, chart):
+        """집계표를 레이아웃 모델 표로 변환 (1열: 행 이름, 2열부터: 계열)"""
+        data = table.reset_index(drop=True)
+        data.columns = [str(column) for column in table.columns]
+        data.insert(0, index_label, [self._format_label(label) for label in table.index], allow_duplicates=True)
+        return Table(data, data.columns, title=title, chart=chart)
 
-            # 컬럼 선택
-            columns = ['date', 'country', 'forecast', 'actual', 'previous',
-                       'forecast_error_pct', 'mom_change_pct', 'forecast_accuracy', 'trend']
-            df_display = df_indicator[columns].copy()
-            df_display['date'] = df_display['date'].dt.strftime('%Y-%m-%d')
-
-            # 헤더
-            headers = ['Date', 'Country', 'Forecast', 'Actual', 'Previous',
-                       'Error %', 'MoM %', 'Accuracy %', 'Trend']
+    def report_model(self):
+        """
+        레포트 내용을 렌더러 독립 레이아웃 모델로 생성 (load_data 이후 호출)
 
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
-                cell.font = Font(bold=True, color='FFFFFF')
-                cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+        시트 구성, 표, 셀 스타일, 조건부 색상, 열 너비는 openpyxl 레포트와 같습니다.
 
-            # 데이터 작성
-            for r_idx, row in enumerate(dataframe_to_rows(df_display, index=False, header=False), 2):
-                for c_idx, value in enumerate(row, 1):
-                    cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
+        Returns:
+            list of report_model.Sheet
+        """
+        country_summary = self._country_summary().reset_index()
+        sheets = [Sheet('Summary', [Table(country_summary, ['Country', 'Data Points', 'Avg Forecast Accuracy (%)'],
+                                          title='Summary by Country', title_span=TITLE_SPAN)],
+                        widths={1: 20, 2: 20, 3: 25}, title='Economic Indicators Report', info=self._report_info())]
+
+        sheets.append(Sheet('Trends', [
+            self._aggregate_table(indicator, table, 'Date', Chart('line', indicator, y_title='Actual'))
+            for indicator, table in indicator_series(self.df).items()
+        ], widths={1: 14}))
+        sheets.append(Sheet('Accuracy', [
+            self._aggregate_table(f'Rolling Forecast Accuracy (%, last {ROLLING_WINDOW} releases)',
+                                  rolling_accuracy(self.df), 'Date', Chart('line', 'Rolling Forecast Accuracy (%)'))
+        ], widths={1: 14}))
+        sheets.append(Sheet('Surprises', [
+            self._aggregate_table(f'Surprises by {title}', surprise_counts(self.df, by), title,
+                                  Chart('stacked_column', f'Surprises by {title}'))
+            for by, title in [('country', 'Country'), ('indicator', 'Indicator')]
+        ], widths={1: 24}))
+
+        if self.include_rows:
+            df_display, headers = self._detail_frame()
+            column_styles = ['detail_number' if c_idx in DETAIL_NUMBER_COLUMNS else 'detail_text'
+                             for c_idx in range(1, len(headers) + 1)]
+            column_styles[7] = SignRule('detail_positive', 'detail_negative', 'detail_number')  # Error %
+            sheets.append(Sheet('All Data', [Table(df_display, headers, header_style='detail_header',
+                                                   column_styles=column_styles)],
+                                widths=dict(enumerate(column_widths(df_display, headers), 1)), auto_filter=True))
+
+            column_styles = ['indicator_number' if c_idx in INDICATOR_NUMBER_COLUMNS else 'indicator_text'
+                             for c_idx in range(1, len(INDICATOR_HEADERS) + 1)]
+            for indicator, df_display in self._indicator_frames():
+                sheets.append(Sheet(indicator, [Table(df_display, INDICATOR_HEADERS, header_style='indicator_header',
+                                                      column_styles=column_styles)],
+                                    widths={col: 15 for col in range(1, len(INDICATOR_HEADERS) + 1)}))
+        return sheets
+
+    def generate_report(self, output_path='Economic_Report.xlsx', trace_path=None):
+        """
+        전체 레포트 생성
 
-                    if c_idx in [3, 4, 5, 6, 7, 8]:
-                        cell.number_format = '#,##0.00'
+        Args:
+            trace_path: 지정하면 단계/시트별 계측 결과를 trace-event JSON으로 저장
+        """
+        logger.info("=" * 70)
+        logger.info("📊 엑셀 레포트 생성 시작")
+        logger.info("=" * 70)
 
-            # 열 너비 조정
-            for col in range(1, len(headers) + 1):
-                ws.column_dimensions[chr(64 + col)].width = 15
+        with self.profiler.stage('report', category='report', path=output_path):
+            self._build_report(output_path)
+        if trace_path is not None:
+            self.profiler.write_trace(trace_path)
 
-        print(f"✅ {len(indicators)}개 지표별 시트 완료")
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✅ 엑셀 레포트 생성 완료: %s", output_path)
+        logger.info("=" * 70)
 
-    def generate_report(self, output_path='Economic_Report.xlsx'):
-        """전체 레포트 생성"""
-        print("=" * 70)
-        print("📊 엑셀 레포트 생성 시작")
-        print("=" * 70)
+        return output_path
 
+    def _build_report(self, output_path):
         # 데이터 로드
         self.load_data()
 
+        if self.renderer != 'openpyxl':
+            renderer = get_renderer(self.renderer)
+            with self.profiler.stage('report_model', category='report', rows_in=len(self.df)):
+                sheets = self.report_model()
+            logger.info("💾 레포트 저장 중 (%s): %s", self.renderer, output_path)
+            with self.profiler.stage('render', category='report', renderer=self.renderer, path=output_path):
+                renderer.render(sheets, output_path, profiler=self.profiler)
+            return
+
         # 워크북 생성
-        self.wb = Workbook()
-        self.wb.remove(self.wb.active)  # 기본 시트 제거
+        if self.streaming:
+            # write-only 워크북은 기본 시트가 없고, 셀 스타일은 등록된 NamedStyle로 공유
+            self.wb = new_streaming_workbook()
+        else:
+            from openpyxl import Workbook
+
+            self.wb = Workbook()
+            self.wb.remove(self.wb.active)  # 기본 시트 제거
+            register_named_styles(self.wb)
 
         # 요약 시트
         summary_ws = self.wb.create_sheet(title='Summary')
-        self.create_summary_sheet(summary_ws)
+        with self._sheet_stage(summary_ws):
+            self.create_summary_sheet(summary_ws)
+
+        # 집계 시트 (차트 포함)
+        self.create_aggregate_sheets()
 
-        # 상세 데이터 시트
-        detail_ws = self.wb.create_sheet(title='All Data')
-        self.create_detail_sheet(detail_ws)
+        if self.include_rows:
+            # 상세 데이터 시트
+            detail_ws = self.wb.create_sheet(title='All Data')
+            with self._sheet_stage(detail_ws):
+                self.create_detail_sheet(detail_ws)
 
-        # 지표별 시트
-        self.create_indicator_sheets()
+            # 지표별 시트
+            self.create_indicator_sheets()
 
         # 파일 저장
-        print(f"\n💾 레포트 저장 중: {output_path}")
-        self.wb.save(output_path)
+        logger.info("")
+        logger.info("💾 레포트 저장 중: %s", output_path)
+        with self.profiler.stage('save', category='report', path=output_path):
+            self.wb.save(output_path)
 
-        print()
-        print("=" * 70)
-        print(f"✅ 엑셀 레포트 생성 완료: {output_path}")
-        print("=" * 70)
 
-        return output_path
+def render_report(df, output_path, **options):
+    """
+    메모리의 변환 결과로 레포트 생성 (작업 그래프 / 프로세스 풀 작업 함수)
+
+    Args:
+        df: 변환된 DataFrame
+        output_path: 레포트 저장 경로
+        **options: EconomicReportGenerator 옵션 (streaming, include_rows, renderer, start_date 등)
+    """
+    return EconomicReportGenerator(None, data=df, **options).generate_report(output_path)
 
 
 if __name__ == "__main__":
-    # 레포트 생성 예제
-    generator = EconomicReportGenerator('bloomberg_transformed_data.csv')
+    # 레포트 생성 예제 (ETL_DAEMON_SOCKET을 지정하면 상주 ETL 데몬의 현재 데이터셋 사용)
+    daemon_socket = os.environ.get('ETL_DAEMON_SOCKET')
+    if daemon_socket:
+        from etl_daemon import DaemonClient
+        generator = EconomicReportGenerator(None, data=DaemonClient(daemon_socket).data())
+    else:
+        generator = EconomicReportGenerator('bloomberg_transformed_data.csv')
     report_path = generator.generate_report('Economic_Report.xlsx')
 
     print(f"\n📁 생성된 레포트: {report_path}")
@@ -0,0 +1,320 @@
+"""
+추출 데이터 품질 검증 (추출 -> 검증 -> 변환)
+스키마, dtype, 결측, 0 나눗수, 중복 키, 이상치를 컬럼 단위(벡터화) 연산으로 한 번에 검사하고,
+통과하지 못한 행은 사유와 함께 격리(quarantine) 프레임으로 분리합니다.
+
+날짜는 고유 값만 파싱하고 country/indicator는 Categorical로 바꿔 검증 결과로 넘기므로,
+변환 엔진은 같은 변환을 다시 하지 않습니다.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+
+REQUIRED_COLUMNS = ['date', 'indicator', 'country', 'forecast', 'actual', 'previous']
+VALUE_COLUMNS = ['forecast', 'actual', 'previous']
+# 결측이면 안 되는 값 컬럼 (previous는 시계열 첫 발표에서 비어 있을 수 있음)
+NOT_NULL_COLUMNS = ['forecast', 'actual']
+# 변환 시 나눗수로 사용하는 컬럼 (0이면 오차율/변화율이 inf)
+DIVISOR_COLUMNS = ['forecast', 'previous']
+
+# 검증 규칙 (격리 사유 표시 순서)
+RULES = ['missing_key', 'bad_type', 'missing_value', 'non_finite', 'zero_divisor', 'duplicate_key', 'outlier']
+
+# (국가, 지표) 시계열의 나머지 값 평균에서 나머지 값 표준편차의 몇 배 이상 벗어난 actual을 이상치로 판단
+# (자신을 포함한 평균/표준편차는 이상치가 표준편차를 키워 n개 중 최대 |z|가 sqrt(n - 1)에 그치므로
+#  38개 미만인 시계열에서는 6배를 넘을 수 없음)
+DEFAULT_OUTLIER_Z = 6.0
+# 이상치 판단에 필요한 시계열별 최소 값 수 (배치 + 이전 이력)
+MIN_OUTLIER_COUNT = 8
+# 증분 배치의 이상치 판단에 함께 쓸 시계열별 이전 발표 수
+OUTLIER_HISTORY = 24
+
+# 중복 키 검사에서 (날짜 × 국가 × 지표) 조합 수가 행 수의 이 배수 이하면 해시 대신 bincount 사용
+_DENSE_KEY_RATIO = 4
+
+
+class ValidationResult:
+    """검증 결과 - 통과한 행(valid), 격리한 행(quarantine, reasons 컬럼 포함), 규칙별 건수(summary)"""
+
+    def __init__(self, valid, quarantine, summary):
+        self.valid = valid
+        self.quarantine = quarantine
+        self.summary = summary
+
+
+def empty_summary():
+    return {'rows_in': 0, 'rows_valid': 0, 'rows_quarantined': 0, 'rules': dict.fromkeys(RULES, 0)}
+
+
+def merge_summary(total, summary):
+    """배치별 검증 요약을 누적 (total을 갱신하여 반환)"""
+    for key in ('rows_in', 'rows_valid', 'rows_quarantined'):
+        total[key] += summary[key]
+    for rule, count in summary['rules'].items():
+        total['rules'][rule] += count
+    return total
+
+
+def format_summary(summary):
+    """로그용 격리 사유 요약 (예: 'zero_divisor 12, duplicate_key 3')"""
+    return ', '.join(f"{rule} {count}" for rule, count in summary['rules'].items() if count)
+
+
+def _parse_dates(values):
+    """
+    날짜 컬럼 파싱 - 고유 값만 파싱하여 행 위치로 펼침
+
+    Returns:
+        (datetime64 배열, 날짜 코드(결측 -1), 고유 날짜 수, 파싱 실패 마스크 또는 None)
+    """
+    codes, uniques = pd.factorize(values)
+    if is_datetime64_any_dtype(values):
+        parsed = pd.DatetimeIndex(uniques)
+    else:
+        parsed = pd.to_datetime(pd.Index(uniques), errors='coerce')
+    dates = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    failed = None
+    unparsed = np.asarray(parsed.isna())
+    if unparsed.any():
+        failed = unparsed[codes] & (codes >= 0)
+        codes = np.where(failed, -1, codes)
+    return dates, codes, len(uniques), failed
+
+
+def _numbers(values):
+    """숫자 컬럼 -> (float64 배열, 숫자로 바꿀 수 없는 값 마스크 또는 None)"""
+    if is_numeric_dtype(values):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan), None
+    converted = pd.to_numeric(values, errors='coerce')
+    failed = (converted.isna() & values.notna()).to_numpy()
+    return converted.to_numpy(dtype=np.float64, na_value=np.nan), failed if failed.any() else None
+
+
+def _duplicated(key, n_keys):
+    """정수 키 배열에서 두 번째 이후 등장 위치 (첫 행은 유지)"""
+    if n_keys <= _DENSE_KEY_RATIO * max(len(key), 1):
+        # 조합 수가 작으면 해시 테이블 대신 개수 세기로 후보만 골라 해시 검사
+        candidates = np.flatnonzero(np.bincount(key, minlength=n_keys)[key] > 1)
+        if not len(candidates):
+            return candidates
+        return candidates[pd.Series(key[candidates]).duplicated().to_numpy()]
+    return np.flatnonzero(pd.Series(key).duplicated().to_numpy())
+
+
+def _outliers(group, actual, n_series, outlier_z, history_group=None, history_actual=None):
+    """
+    (국가, 지표) 시계열별 이상치 위치 (group은 시계열 코드)
+
+    각 값을 같은 시계열의 나머지 값 평균/표준편차(leave-one-out)와 비교하므로 이상치 자신이 기준을 흐리지 않습니다.
+    history_*를 주면 이전 이력 값도 통계에 포함하고 배치 행만 판단합니다.
+    값이 MIN_OUTLIER_COUNT개보다 적거나 나머지 값이 모두 같은 시계열은 판단하지 않습니다.
+    """
+    n = len(actual)
+    if history_group is not None and len(history_group):
+        group = np.concatenate([group, history_group])
+        values = np.concatenate([actual, history_actual])
+    else:
+        values = actual
+    count = np.bincount(group, minlength=n_series)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.bincount(group, weights=values, minlength=n_series) / count
+        # 시계열 평균 기준 편차로 계산 (큰 값의 제곱합 차이로 생기는 자릿수 손실 방지)
+        squares = np.bincount(group, weights=np.square(values - mean[group]), minlength=n_series)
+        group = group[:n]
+        deviation = actual - mean[group]
+        others = count[group] - 1
+        # 나머지 값의 평균은 mean - deviation / others, 분산은 (squares - deviation²) / others - (deviation / others)²
+        rest_shift = deviation / others
+        rest_var = (squares[group] - deviation * deviation) / others - rest_shift * rest_shift
+        score = np.abs(deviation + rest_shift) / np.sqrt(rest_var)
+        # 나머지 값이 모두 같으면 rest_var는 반올림 오차만 남음
+        varied = rest_var > 1e-12 * squares[group] / others
+    return np.flatnonzero((count[group] >= MIN_OUTLIER_COUNT) & varied & (score > outlier_z))
+
+
+def _history_values(history, categoricals, n_indicators):
+    """이력 프레임 -> 검증 배치와 같은 코드의 (시계열 코드, actual) - 배치에 없는 국가/지표와 결측 값 제외"""
+    codes = {column: pd.Categorical(history[column].astype(str),
+                                    categories=categoricals[column].categories.astype(str)).codes
+             for column in ('country', 'indicator')}
+    actual = pd.to_numeric(history['actual'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    rows = (codes['country'] >= 0) & (codes['indicator'] >= 0) & np.isfinite(actual)
+    group = codes['country'][rows].astype(np.int64) * n_indicators + codes['indicator'][rows]
+    return group, actual[rows]
+
+
+def validate_raw(raw, outlier_z=DEFAULT_OUTLIER_Z, history=None):
+    """
+    추출 데이터 검증 - 모든 규칙을 컬럼 단위로 검사하고 실패한 행을 격리
+
+    규칙:
+        missing_key: date / country / indicator 결측
+        bad_type: 날짜 또는 숫자로 바꿀 수 없는 값
+        missing_value: forecast / actual 결측 (previous는 첫 발표에서 비어 있을 수 있어 허용)
+        non_finite: forecast / actual / previous 가 inf
+        zero_divisor: forecast 또는 previous가 0 (변환 시 오차율/변화율이 inf)
+        duplicate_key: (date, country, indicator) 중복 - 처음 행은 유지하고 이후 행 격리
+        outlier: actual이 같은 (국가, 지표) 시계열 나머지 값의 평균에서 outlier_z 표준편차 이상 벗어남
+                 (배치와 history를 합쳐 MIN_OUTLIER_COUNT개 미만인 시계열은 판단하지 않음)
+
+    중복 키는 입력 프레임(배치) 안에서만 판단합니다. 이상치는 history를 주면 이전 이력까지 포함한
+    시계열 통계로 판단하므로, 시계열마다 발표 몇 건뿐인 증분 배치도 검사할 수 있습니다.
+
+    Args:
+        raw: date, indicator, country, forecast, actual, previous 컬럼을 가진 추출 데이터
+        outlier_z: 이상치 기준 표준편차 배수 (None이면 이상치 검사 생략)
+        history: 이상치 통계에 포함할 이전 이력 (country, indicator, actual 컬럼, 격리 대상 아님)
+
+    Returns:
+        ValidationResult: valid는 date가 datetime64, country/indicator가 Categorical인 통과 행
+                          (원본 인덱스 유지), quarantine은 원본 값 그대로의 격리 행과 reasons 컬럼
+
+    Raises:
+        ValueError: 필수 컬럼이 없는 경우 (스키마 오류 - 배치 전체 거부)
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in raw.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)} (필요: {', '.join(REQUIRED_COLUMNS)})")
+
+    n = len(raw)
+    flagged = {}
+
+    def flag(rule, mask):
+        if mask is not None:
+            positions = np.flatnonzero(mask)
+            if len(positions):
+                flagged[rule] = np.union1d(flagged[rule], positions) if rule in flagged else positions
+
+    # 키 컬럼: 날짜는 고유 값만 파싱, country/indicator는 Categorical 코드로 결측/중복 판단
+    dates, date_codes, n_dates, bad_dates = _parse_dates(raw['date'])
+    flag('bad_type', bad_dates)
+    categoricals = {column: raw[column].array if isinstance(raw[column].dtype, pd.CategoricalDtype)
+                    else pd.Categorical(raw[column]) for column in ('country', 'indicator')}
+    n_countries = len(categoricals['country'].categories)
+    n_indicators = len(categoricals['indicator'].categories)
+    n_series = n_countries * n_indicators
+    # (날짜, 국가, 지표) 조합 수에 맞는 가장 작은 정수형으로 키 계산 (메모리 대역폭 절약)
+    code_dtype = np.int32 if n_dates * n_series < 2 ** 31 else np.int64
+    country_codes = categoricals['country'].codes
+    indicator_codes = categoricals['indicator'].codes
+    key_rows = None
+    if n and min(date_codes.min(), country_codes.min(), indicator_codes.min()) < 0:
+        key_ok = (date_codes >= 0) & (country_codes >= 0) & (indicator_codes >= 0)
+        flag('missing_key', ~key_ok if bad_dates is None else ~key_ok & ~bad_dates)
+        key_rows = np.flatnonzero(key_ok)
+    series = country_codes.astype(code_dtype) * n_indicators + indicator_codes
+    if key_rows is not None:
+        series = series[key_rows]
+
+    # 값 컬럼: 정상 행은 곱의 유한/0 여부만으로 통과시키고, 실패한 행만 사유별로 다시 확인
+    # (previous 결측이나 곱의 overflow/underflow로 걸러진 행은 아래에서 해당 사유가 없어 통과)
+    values = {}
+    for column in VALUE_COLUMNS:
+        values[column], bad_numbers = _numbers(raw[column])
+        flag('bad_type', bad_numbers)
+    divisors = values['forecast'] * values['previous']
+    value_ok = np.isfinite(divisors * values['actual']) & (divisors != 0)
+    del divisors
+    if not value_ok.all():
+        failed = np.flatnonzero(~value_ok)
+        subset = {column: array[failed] for column, array in values.items()}
+        typed = np.zeros(len(failed), dtype=bool)
+        if 'bad_type' in flagged:
+            typed[np.isin(failed, flagged['bad_type'])] = True
+        missing_value = np.zeros(len(failed), dtype=bool)
+        non_finite = np.zeros(len(failed), dtype=bool)
+        for column, array in subset.items():
+            if column in NOT_NULL_COLUMNS:
+                missing_value |= np.isnan(array)
+            non_finite |= np.isinf(array)
+        zero = np.zeros(len(failed), dtype=bool)
+        for column in DIVISOR_COLUMNS:
+            zero |= subset[column] == 0
+        for rule, mask in (('missing_value', missing_value & ~typed), ('non_finite', non_finite),
+                           ('zero_divisor', zero)):
+            if mask.any():
+                flagged[rule] = failed[mask]
+
+    # 중복 키: (날짜, 국가, 지표) 코드를 정수 하나로 합쳐 검사
+    if key_rows is None:
+        key = date_codes.astype(code_dtype) * n_series + series
+        duplicates = _duplicated(key, n_dates * n_series)
+    else:
+        key = date_codes[key_rows].astype(code_dtype) * n_series + series
+        duplicates = key_rows[_duplicated(key, n_dates * n_series)]
+    del key
+    if len(duplicates):
+        flagged['duplicate_key'] = duplicates
+
+    # 이상치: 시계열 코드별 bincount로 나머지 값 평균/표준편차 계산
+    series_count = np.bincount(series, minlength=n_series)
+    if outlier_z is not None:
+        actual = values['actual'] if key_rows is None else values['actual'][key_rows]
+        history_values = (None, None) if history is None or history.empty else \
+            _history_values(history, categoricals, n_indicators)
+        finite = np.isfinite(actual)
+        if finite.all():
+            outliers = _outliers(series, actual, n_series, outlier_z, *history_values)
+        else:
+            rows = np.flatnonzero(finite)
+            outliers = rows[_outliers(series[rows], actual[rows], n_series, outlier_z, *history_values)]
+        if len(outliers):
+            flagged['outlier'] = outliers if key_rows is None else key_rows[outliers]
+
+    summary = empty_summary()
+    summary['rows_in'] = n
+    for rule, positions in flagged.items():
+        summary['rules'][rule] = len(positions)
+
+    rejected = np.unique(np.concatenate(list(flagged.values()))) if flagged else np.zeros(0, dtype=np.intp)
+    bits = np.zeros(len(rejected), dtype=np.uint8)
+    for bit, rule in enumerate(RULES):
+        if rule in flagged:
+            bits[np.searchsorted(rejected, flagged[rule])] |= np.uint8(1 << bit)
+
+    # 검증 통과 행 - 변환 엔진이 다시 변환하지 않도록 파싱한 배열에서 바로 구성
+    keep = None
+    if len(rejected):
+        mask = np.ones(n, dtype=bool)
+        mask[rejected] = False
+        keep = np.flatnonzero(mask)
+        # 모든 행이 격리된 국가/지표는 범주에서 제거 (검증 없이 변환한 결과와 같은 범주)
+        removed = rejected if key_rows is None else \
+            np.searchsorted(key_rows, rejected[np.isin(rejected, key_rows)])
+        kept = (series_count - np.bincount(series[removed], minlength=n_series)).reshape(n_countries, n_indicators)
+        used = {'country': kept.sum(axis=1) > 0, 'indicator': kept.sum(axis=0) > 0}
+    columns = {}
+    for column in raw.columns:
+        if column == 'date':
+            columns[column] = dates if keep is None else dates.take(keep)
+        elif column in categoricals:
+            columns[column] = categoricals[column] if keep is None else \
+                _take_categorical(categoricals[column], keep, used[column])
+        elif column in values:
+            columns[column] = values[column] if keep is None else values[column][keep]
+        else:
+            columns[column] = raw[column].array if keep is None else raw[column].array.take(keep)
+    index = raw.index if keep is None else raw.index.take(keep)
+    valid = pd.DataFrame(columns, index=index, copy=False)
+
+    summary['rows_valid'] = len(valid)
+    summary['rows_quarantined'] = len(rejected)
+    return ValidationResult(valid, _quarantine_frame(raw.iloc[rejected], bits), summary)
+
+
+def _take_categorical(values, keep, used):
+    """Categorical 행 선택 - used가 False인(남은 행이 없는) 범주는 제거"""
+    codes = values.codes[keep]
+    if used.all():
+        return pd.Categorical.from_codes(codes, dtype=values.dtype)
+    remap = np.full(len(used) + 1, -1, dtype=codes.dtype)
+    remap[np.flatnonzero(used)] = np.arange(used.sum())
+    return pd.Categorical.from_codes(remap[codes], categories=values.categories[used])
+
+
+def _quarantine_frame(rows, bits):
+    """격리 행(원본 값) + 사유 컬럼 (여러 사유는 ';'로 구분)"""
+    labels = {value: ';'.join(rule for bit, rule in enumerate(RULES) if value & (1 << bit))
+              for value in np.unique(bits).tolist()}
+    return rows.assign(reasons=pd.Series(bits, index=rows.index).map(labels).astype(object))
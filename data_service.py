@@ -0,0 +1,276 @@
+"""
+Dash 앱 데이터 접근 계층
+콜백은 DataFrame을 직접 스캔하지 않고 이 서비스의 색인 조회와 메모이즈된 차트/화면을 사용합니다.
+여러 워커 프로세스로 서비스할 때는 SharedResultCache로 워커 간에 결과를 공유합니다.
+"""
+import hashlib
+import io
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from plotly.basedatatypes import BaseFigure
+
+from pipeline_dag import frame_fingerprint
+
+
+def _figure_from_dict(figure_class, data):
+    """저장된 차트 복원 (저장 전에 이미 검증된 값이므로 plotly 속성 검증 생략)"""
+    return figure_class(data, _validate=False)
+
+
+class _ResultPickler(pickle.Pickler):
+    """plotly 차트를 dict로 저장하는 pickler (기본 pickle 복원은 모든 속성을 다시 검증하여 차트 생성만큼 느림)"""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, BaseFigure):
+            return _figure_from_dict, (type(obj), obj.to_dict())
+        return NotImplemented
+
+
+class SharedResultCache:
+    """
+    워커 프로세스 간 공유 결과 캐시 (SQLite 파일, pickle 직렬화, LRU 제거)
+
+    키는 (데이터셋, 데이터 식별자, 종류)의 해시이므로 같은 데이터를 가진 워커끼리만 결과를 공유합니다.
+    연결은 프로세스별로 처음 사용할 때 만들므로 fork 전에 생성해도 됩니다.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 ** 2, timeout=5.0):
+        """
+        Args:
+            path: 캐시 파일 경로
+            max_bytes: 캐시 최대 크기, 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            timeout: 다른 워커가 쓰는 중일 때 대기할 최대 시간(초)
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._db = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._db is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 자동 커밋 + WAL: 읽기는 쓰기를 기다리지 않음
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_access)")
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    @staticmethod
+    def key(name, token, kind):
+        """캐시 키 (종류는 JSON으로 직렬화 가능한 값 또는 튜플)"""
+        payload = json.dumps([name, token, kind], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        """캐시 결과 조회 (없으면 None)"""
+        with self._lock:
+            db = self._connection()
+            row = db.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return pickle.loads(row[0])
+
+    def put(self, key, value):
+        """결과 저장 후 최대 크기를 넘으면 LRU 순으로 제거"""
+        buffer = io.BytesIO()
+        _ResultPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+        payload = buffer.getvalue()
+        with self._lock:
+            db = self._connection()
+            db.execute("INSERT OR REPLACE INTO results (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                       (key, payload, len(payload), time.time()))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total > self.max_bytes:
+                for old_key, size in db.execute("SELECT key, size FROM results ORDER BY last_access").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    db.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                    total -= size
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'size': size}
+
+
+class DatasetService:
+    """
+    데이터셋 색인 조회 및 차트/화면 캐시
+
+    - register: 데이터 또는 로더 등록 (로더는 처음 사용할 때 한 번 실행)
+    - lookup: 항목 이름 -> 행(dict) 색인으로 O(1) 조회
+    - figure / cached: (데이터셋, 버전)별 결과를 LRU 캐시에 보관
+    - refresh: 데이터 교체 시 버전을 올려 해당 데이터셋의 색인과 캐시를 무효화
+    - shared_cache를 지정하면 cached 결과를 (데이터셋, 데이터 식별자, 종류)로 워커 간에 공유
+    """
+
+    def __init__(self, max_figures=32, shared_cache=None):
+        """
+        Args:
+            max_figures: 캐시에 보관할 최대 항목 수 (차트, 화면 등)
+            shared_cache: 워커 간 공유 결과 캐시 (SharedResultCache, None이면 프로세스 내 캐시만 사용)
+        """
+        self.max_figures = max_figures
+        self.shared_cache = shared_cache
+        self._datasets = {}
+        self._figures = OrderedDict()
+        self._lock = threading.RLock()
+        self.figure_builds = 0
+
+    def register(self, name, df=None, key_column=None, value_column=None, title=None, loader=None, token=None):
+        """
+        데이터셋 등록
+
+        Args:
+            name: 데이터셋 이름
+            df: 데이터 (loader를 지정하면 생략)
+            key_column: 항목 이름 컬럼 (드롭다운 값, 차트 x축) - None이면 항목 색인을 만들지 않음
+            value_column: 차트 y축 컬럼
+            title: 차트 제목
+            loader: 데이터를 반환하는 함수 - 처음 조회할 때 실행 (지연 로딩)
+            token: 현재 데이터 식별자를 반환하는 함수 - 공유 캐시 키로 사용 (None이면 데이터 내용 해시)
+        """
+        with self._lock:
+            self._datasets[name] = {
+                'key_column': key_column,
+                'value_column': value_column,
+                'title': title,
+                'loader': loader,
+                'token_fn': token,
+                'token': None,
+                'version': 0,
+            }
+        if df is not None:
+            self.refresh(name, df)
+
+    def names(self):
+        return list(self._datasets)
+
+    def is_loaded(self, name):
+        return 'df' in self._datasets[name]
+
+    def _dataset(self, name):
+        """데이터셋 조회 (아직 로드되지 않았으면 로더 실행)"""
+        dataset = self._datasets[name]
+        if 'df' not in dataset:
+            with self._lock:
+                if 'df' not in dataset:
+                    self.refresh(name, dataset['loader']())
+        return dataset
+
+    def refresh(self, name, df):
+        """데이터 교체 - 색인 재생성 및 이전 버전 캐시 제거"""
+        key_column = self._datasets[name]['key_column']
+        index = {}
+        if key_column is not None:
+            index = df.drop_duplicates(key_column).set_index(key_column, drop=False).to_dict('index')
+        token = None
+        if self.shared_cache is not None:
+            token_fn = self._datasets[name]['token_fn']
+            token = token_fn() if token_fn is not None else frame_fingerprint(df)
+        with self._lock:
+            dataset = self._datasets[name]
+            dataset['df'] = df
+            dataset['index'] = index
+            dataset['token'] = token
+            dataset['version'] += 1
+            for key in [key for key in self._figures if key[0] == name]:
+                del self._figures[key]
+
+    def version(self, name):
+        return self._datasets[name]['version']
+
+    def token(self, name):
+        """
+        데이터 식별자 (공유 캐시를 사용하면 워커 간 같은 값, 아니면 버전 문자열)
+
+        브라우저에 보내는 데이터 버전에는 이 값을 사용해야 요청마다 다른 워커가 응답해도
+        버전이 바뀐 것으로 판단하지 않습니다.
+        """
+        dataset = self._dataset(name)
+        return dataset['token'] if dataset['token'] is not None else str(dataset['version'])
+
+    def data(self, name):
+        return self._dataset(name)['df']
+
+    def items(self, name):
+        """항목 이름 목록 (차트 x축 순서)"""
+        return list(self._dataset(name)['index'])
+
+    def lookup(self, name, item):
+        """항목 이름으로 행 조회 (없으면 None)"""
+        return self._dataset(name)['index'].get(item)
+
+    def cached(self, name, kind, builder, shared=True):
+        """
+        (데이터셋, 버전, 종류)별로 builder() 결과를 메모이즈
+
+        Args:
+            kind: 캐시 항목 종류 (예: 'figure', 'tab')
+            builder: 결과를 만드는 함수
+            shared: False면 워커 간 공유 캐시를 쓰지 않고 프로세스 안에서만 보관 (색인처럼 큰 객체)
+        """
+        dataset = self._dataset(name)
+        with self._lock:
+            key = (name, dataset['version'], kind)
+            value = self._figures.get(key)
+            if value is not None:
+                self._figures.move_to_end(key)
+                return value
+            shared_key = self.shared_cache.key(name, dataset['token'], kind) \
+                if self.shared_cache is not None and shared else None
+
+        value = self.shared_cache.get(shared_key) if shared_key is not None else None
+        if value is None:
+            value = builder()
+            if shared_key is not None:
+                self.shared_cache.put(shared_key, value)
+
+        with self._lock:
+            # 생성 중 refresh된 경우 이전 버전 결과는 캐시하지 않음
+            if dataset['version'] == key[1]:
+                self._figures[key] = value
+                while len(self._figures) > self.max_figures:
+                    self._figures.popitem(last=False)
+        return value
+
+    def figure(self, name):
+        """데이터셋 막대 차트 (같은 버전이면 캐시된 차트 반환)"""
+        dataset = self._dataset(name)
+
+        def build():
+            # plotly.express는 import 비용이 커서 첫 차트를 만들 때 로드
+            import plotly.express as px
+
+            with self._lock:
+                self.figure_builds += 1
+            return px.bar(dataset['df'], x=dataset['key_column'], y=dataset['value_column'],
+                          title=dataset['title'])
+
+        return self.cached(name, 'figure', build)
@@ -2,21 +2,74 @@
 블룸버그 단말기에서 거시경제 데이터 추출 ETL 코드
 실제 환경에서는 블룸버그 API (blpapi)를 사용합니다.
 """
+import threading
+
+import numpy as np
 import pandas as pd
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta
+from functools import partial
+
+from pandas.api.types import union_categoricals
+
+from bloomberg_extract import BloombergExtractor
+from data_quality import (DEFAULT_OUTLIER_Z, OUTLIER_HISTORY, empty_summary, format_summary, merge_summary,
+                          validate_raw)
+from extract_cache import CachedExtractor
+from extract_sources import ExtractorSource, MultiSourceExtractor
+from feature_engine import FEATURE_COLUMNS, FEATURE_WINDOW, compute_features, extend_features
+from incremental_store import PartitionedStore
+from pipeline_dag import TaskGraph
+from profiling import StageProfiler, get_logger
+from storage import CSVStorage, get_storage
+from transform_engine import transform_indicators
+
 
+logger = get_logger('etl')
 
 class BloombergETL:
     """블룸버그 단말기 데이터 추출, 변환, 적재"""
 
-    def __init__(self, use_sample=False):
+    def __init__(self, use_sample=False, bloomberg_api=None, batch_size=50, max_in_flight=4, max_retries=2,
+                 cache=None, features=False, profiler=None, validation=True, outlier_z=DEFAULT_OUTLIER_Z,
+                 quarantine_path=None, sources=None):
         """
         Args:
             use_sample: True면 샘플 데이터 사용, False면 실제 블룸버그 API 사용
+            bloomberg_api: blpapi 대신 사용할 모듈 (예: fake_blpapi), None이면 blpapi
+            batch_size: 블룸버그 요청당 종목 수
+            max_in_flight: 동시에 응답을 기다리는 최대 요청 수
+            max_retries: 실패 종목 재시도 횟수
+            cache: ExtractionCache - 지정하면 캐시에 없는 (티커, 월) 구간만 요청
+            features: True면 변환 시 시계열 feature(이동 통계, z-score, 전년 대비, 국가 순위)도 계산
+            profiler: 단계별 시간/메모리/행 수를 기록할 StageProfiler (None이면 기본 설정으로 생성)
+            validation: True면 변환 전에 데이터 품질 검증 (실패한 행은 격리하고 변환하지 않음)
+            outlier_z: 이상치 기준 표준편차 배수 (None이면 이상치 검사 생략)
+            quarantine_path: 지정하면 격리한 행을 사유(reasons)와 함께 저장 (.csv / .parquet)
+            sources: 추출 소스 목록 (extract_sources의 HTTPSource / FileDropSource 등, 우선순위 순서)
+                     - 'bloomberg' 항목은 이 설정의 blpapi 추출기, None이면 blpapi만 사용
+                     - 소스마다 동시에 추출하여 (date, country, indicator) 기준으로 합침
         """
         self.use_sample = use_sample
+        self.bloomberg_api = bloomberg_api
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.cache = cache
+        self.features = features
+        self.profiler = profiler if profiler is not None else StageProfiler()
+        self.validation = validation
+        self.outlier_z = outlier_z
+        self.quarantine_path = quarantine_path
+        self.sources = sources
+        self.quarantined = None
+        self.validation_summary = None
+        self._validation_lock = threading.Lock()
         self.raw_data = None
         self.transformed_data = None
+        self.rewritten_partitions = []
+        self.failed_securities = {}
+        self._session_extractor = None
 
     def extract_from_bloomberg(self, indicators, countries, start_date, end_date):
         """
@@ -28,129 +81,234 @@ class BloombergETL:
             start_date: 시작일 (YYYY-MM-DD)
             end_date: 종료일 (YYYY-MM-DD)
         """
-        print("📥 블룸버그 단말기에서 데이터 추출 중...")
+        logger.info("📥 블룸버그 단말기에서 데이터 추출 중...")
+
+        with self.profiler.stage('extract', category='etl') as record:
+            if self.use_sample:
+                # 샘플 데이터 사용
+                logger.warning("⚠️  샘플 데이터 모드 - 실제 블룸버그 API 대신 샘플 데이터 사용")
+                self.raw_data = pd.read_csv('bloomberg_sample_data.csv')
+            else:
+                # 실제 블룸버그 API 사용 (sources를 지정하면 여러 소스를 동시에 추출하여 합침)
+                with self._bloomberg_extractor() as extractor:
+                    self.raw_data = extractor.extract(indicators, countries, start_date, end_date)
+                    self.failed_securities = extractor.failed_securities
+            record['rows_out'] = len(self.raw_data)
+
+        logger.info("✅ %d개 레코드 추출 완료", len(self.raw_data))
+        return self.raw_data
 
-        if self.use_sample:
-            # 샘플 데이터 사용
-            print("⚠️  샘플 데이터 모드 - 실제 블룸버그 API 대신 샘플 데이터 사용")
-            self.raw_data = pd.read_csv('bloomberg_sample_data.csv')
-        else:
-            # 실제 블룸버그 API 사용
+    @contextmanager
+    def persistent_session(self):
+        """
+        블룸버그 세션을 한 번 열어 블록 안의 모든 추출에서 재사용 (상주 데몬용)
+
+        샘플 모드이거나 이미 열린 세션이 있으면 아무것도 하지 않습니다.
+        """
+        if self.use_sample or self._session_extractor is not None:
+            yield
+            return
+        with self._bloomberg_extractor() as extractor:
+            self._session_extractor = extractor
             try:
+                yield
+            finally:
+                self._session_extractor = None
+
+    @contextmanager
+    def _bloomberg_extractor(self):
+        """
+        추출기(캐시 설정 시 CachedExtractor)를 제공하고 종료 시 세션/연결 정리
+
+        sources를 지정하면 소스들을 동시에 추출하는 MultiSourceExtractor, 아니면 blpapi 추출기입니다.
+        """
+        if self._session_extractor is not None:
+            # persistent_session으로 열어 둔 세션 재사용
+            yield self._session_extractor
+            return
+        with ExitStack() as stack:
+            if self.sources is None:
+                extractor = stack.enter_context(self._blpapi_extractor())
+            else:
+                sources = [ExtractorSource(stack.enter_context(self._blpapi_extractor()))
+                           if source == 'bloomberg' else source for source in self.sources]
+                extractor = stack.enter_context(MultiSourceExtractor(sources))
+            yield CachedExtractor(extractor, self.cache) if self.cache is not None else extractor
+
+    @contextmanager
+    def _blpapi_extractor(self):
+        """블룸버그 세션을 열고 BloombergExtractor를 제공, 종료 시 세션 정리"""
+        try:
+            blpapi = self.bloomberg_api
+            if blpapi is None:
                 import blpapi
 
-                # 블룸버그 세션 시작
-                sessionOptions = blpapi.SessionOptions()
-                sessionOptions.setServerHost("localhost")
-                sessionOptions.setServerPort(8194)
-                session = blpapi.Session(sessionOptions)
+            # 블룸버그 세션 시작
+            sessionOptions = blpapi.SessionOptions()
+            sessionOptions.setServerHost("localhost")
+            sessionOptions.setServerPort(8194)
+            session = blpapi.Session(sessionOptions)
 
-                if not session.start():
-                    raise Exception("블룸버그 세션 시작 실패")
+            if not session.start():
+                raise Exception("블룸버그 세션 시작 실패")
 
+            try:
                 if not session.openService("//blp/refdata"):
                     raise Exception("블룸버그 서비스 열기 실패")
 
-                # 데이터 추출 로직
-                # (실제 블룸버그 티커와 필드를 사용하여 데이터 요청)
-                refDataService = session.getService("//blp/refdata")
-                request = refDataService.createRequest("HistoricalDataRequest")
-
-                data_list = []
-                for country in countries:
-                    for indicator in indicators:
-                        # 블룸버그 티커 형식: INDICATOR COUNTRY Index
-                        ticker = f"{indicator} {country} Index"
-                        request.append("securities", ticker)
-
-                request.set("startDate", start_date.replace("-", ""))
-                request.set("endDate", end_date.replace("-", ""))
-                request.append("fields", "PX_LAST")  # 실제값
-                request.append("fields", "ECO_FUTURE_MEDIAN")  # 예측값
-
-                session.sendRequest(request)
-
-                # 응답 처리
-                while True:
-                    ev = session.nextEvent(500)
-                    # 응답 파싱 및 DataFrame 변환 로직
-                    # ... (실제 구현 필요)
-                    if ev.eventType() == blpapi.Event.RESPONSE:
-                        break
-
-                self.raw_data = pd.DataFrame(data_list)
+                # 티커 배치별 요청을 동시에 보내고 응답을 컬럼 버퍼로 파싱
+                extractor = BloombergExtractor(
+                    session, blpapi,
+                    batch_size=self.batch_size,
+                    max_in_flight=self.max_in_flight,
+                    max_retries=self.max_retries,
+                )
+                yield extractor
+            finally:
                 session.stop()
 
-            except ImportError:
-                print("❌ blpapi 패키지가 설치되지 않았습니다.")
-                print("   pip install blpapi 로 설치하거나")
-                print("   use_sample=True로 샘플 데이터를 사용하세요.")
-                raise
-            except Exception as e:
-                print(f"❌ 블룸버그 데이터 추출 실패: {e}")
-                raise
-
-        print(f"✅ {len(self.raw_data)}개 레코드 추출 완료")
-        return self.raw_data
-
-    def transform(self):
-        """데이터 변환 및 계산"""
-        print("🔄 데이터 변환 중...")
+        except ImportError:
+            logger.error("❌ blpapi 패키지가 설치되지 않았습니다.")
+            logger.error("   pip install blpapi 로 설치하거나")
+            logger.error("   use_sample=True로 샘플 데이터를 사용하세요.")
+            raise
+        except Exception as e:
+            logger.error("❌ 블룸버그 데이터 추출 실패: %s", e)
+            raise
 
-        if self.raw_data is None:
-            raise ValueError("먼저 extract_from_bloomberg()를 실행해주세요.")
+    def iter_extract(self, indicators, countries, start_date, end_date, chunk_size=100_000, indicators_per_chunk=1):
+        """
+        레코드 배치 단위 추출 (제너레이터)
 
-        df = self.raw_data.copy()
+        실제 API 모드는 지표 이름 순으로 indicators_per_chunk개 지표씩 전체 국가를 추출하므로
+        한 배치에 시계열 전체가 들어가며, 배치 안에서는 (date, indicator, country) 순으로 정렬됩니다.
+        샘플 모드는 샘플 파일을 chunk_size행씩 읽습니다.
 
-        # 날짜 형식 변환
-        df['date'] = pd.to_datetime(df['date'])
+        Args:
+            chunk_size: 샘플 모드 배치당 행 수
+            indicators_per_chunk: 실제 API 모드 배치당 지표 수
+        """
+        if self.use_sample:
+            logger.warning("⚠️  샘플 데이터 모드 - 실제 블룸버그 API 대신 샘플 데이터 사용")
+            yield from pd.read_csv('bloomberg_sample_data.csv', chunksize=chunk_size)
+            return
+
+        indicators = sorted(indicators)
+        with self._bloomberg_extractor() as extractor:
+            for i in range(0, len(indicators), indicators_per_chunk):
+                batch = extractor.extract(indicators[i:i + indicators_per_chunk], countries, start_date, end_date)
+                self.failed_securities.update(extractor.failed_securities)
+                yield batch
+
+    def transform(self, features=None, history=None):
+        """
+        데이터 변환 및 계산
 
-        # 예측 오차 계산
-        df['forecast_error'] = df['actual'] - df['forecast']
-        df['forecast_error_pct'] = ((df['actual'] - df['forecast']) / df['forecast'] * 100).round(2)
+        Args:
+            features: 시계열 feature 계산 여부 (None이면 self.features)
+            history: 이상치 검증에 함께 쓸 이전 이력 (validate_raw 참고)
+        """
+        logger.info("🔄 데이터 변환 중...")
 
-        # 전월 대비 변화
-        df['mom_change'] = df['actual'] - df['previous']
-        df['mom_change_pct'] = ((df['actual'] - df['previous']) / df['previous'] * 100).round(2)
+        if self.raw_data is None:
+            raise ValueError("먼저 extract_from_bloomberg()를 실행해주세요.")
 
-        # 예측 정확도
-        df['forecast_accuracy'] = (100 - abs(df['forecast_error_pct'])).clip(0, 100).round(2)
+        self._reset_validation()
+        self.transformed_data = df = self._transform_batch(self.raw_data, features, history)
+        logger.info("✅ 데이터 변환 완료 - %d개 레코드, %d개 컬럼", len(df), len(df.columns))
+        return self.transformed_data
 
-        # 서프라이즈 판단 (예측과 실제의 차이가 클 때)
-        df['surprise'] = df['forecast_error_pct'].apply(
-            lambda x: 'Positive Surprise' if x > 1 else
-                     'Negative Surprise' if x < -1 else
-                     'In Line'
-        )
+    def _transform_batch(self, raw, features=None, history=None):
+        """검증, 파생 지표(와 feature) 계산 - 단계별 계측 포함 (features가 None이면 self.features)"""
+        if self.validation:
+            # 결측 / 0 나눗수 / 중복 / 이상치 행은 격리하고 통과한 행만 변환
+            with self.profiler.stage('validate', category='etl', rows_in=len(raw)) as record:
+                result = validate_raw(raw, self.outlier_z, history)
+                record['rows_out'] = len(result.valid)
+                record['quarantined'] = len(result.quarantine)
+            self._record_validation(result)
+            raw = result.valid
+        with self.profiler.stage('transform', category='etl', rows_in=len(raw)) as record:
+            # 파생 지표 계산 (벡터화, 원본 전체 복사 없음)
+            df = transform_indicators(raw)
+            record['rows_out'] = len(df)
+        if self.features if features is None else features:
+            # 시계열 feature (정렬/그룹 단위 벡터 연산)
+            with self.profiler.stage('features', category='etl', rows_in=len(df)) as record:
+                df = compute_features(df)
+                record['rows_out'] = len(df)
+        return df
+
+    def _reset_validation(self):
+        self.quarantined = None
+        self.validation_summary = empty_summary() if self.validation else None
+
+    def _record_validation(self, result):
+        """배치 검증 결과 누적 (작업 그래프에서는 변환 작업 스레드에서 동시에 호출)"""
+        if result.summary['rows_quarantined']:
+            logger.warning("⚠️  품질 검증 실패 %d개 레코드 격리 (%s)",
+                           result.summary['rows_quarantined'], format_summary(result.summary))
+        with self._validation_lock:
+            if self.validation_summary is None:
+                self.validation_summary = empty_summary()
+            merge_summary(self.validation_summary, result.summary)
+            if self.quarantined is None or not len(self.quarantined):
+                self.quarantined = result.quarantine
+            elif len(result.quarantine):
+                self.quarantined = pd.concat([self.quarantined, result.quarantine])
+
+    def write_quarantine(self, path=None):
+        """
+        격리한 행 저장 (격리 행이 없으면 저장하지 않음)
 
-        # 트렌드 판단
-        df['trend'] = df['mom_change'].apply(
-            lambda x: '↑ Improving' if x > 0 else
-                     '↓ Declining' if x < 0 else
-                     '→ Stable'
-        )
+        Args:
+            path: 저장 경로 (.csv / .parquet), None이면 quarantine_path
 
-        self.transformed_data = df
-        print(f"✅ 데이터 변환 완료 - {len(df)}개 레코드, {len(df.columns)}개 컬럼")
-        return self.transformed_data
+        Returns:
+            int: 저장한 격리 행 수
+        """
+        path = path if path is not None else self.quarantine_path
+        if path is None or self.quarantined is None or not len(self.quarantined):
+            return 0
+        logger.info("💾 격리 데이터 저장: %s (%d개 레코드)", path, len(self.quarantined))
+        get_storage(path).write(self.quarantined, path)
+        return len(self.quarantined)
+
+    def load(self, output_path, csv_export_path=None):
+        """
+        변환된 데이터 저장 (확장자에 따라 CSV 또는 Parquet)
 
-    def load(self, output_path):
-        """변환된 데이터를 CSV로 저장"""
-        print(f"💾 데이터 저장 중: {output_path}")
+        Args:
+            output_path: 저장 경로 (.csv / .parquet)
+            csv_export_path: 지정하면 CSV 파일로도 내보냄 (엑셀 등 외부 도구용)
+        """
+        logger.info("💾 데이터 저장 중: %s", output_path)
 
         if self.transformed_data is None:
             raise ValueError("먼저 transform()을 실행해주세요.")
 
-        self.transformed_data.to_csv(output_path, index=False, encoding='utf-8-sig')
-        print(f"✅ 데이터 저장 완료")
+        rows = len(self.transformed_data)
+        with self.profiler.stage('load', category='etl', rows_in=rows, rows_out=rows, path=output_path):
+            get_storage(output_path).write(self.transformed_data, output_path)
+        if csv_export_path is not None:
+            logger.info("💾 CSV 내보내기: %s", csv_export_path)
+            with self.profiler.stage('csv_export', category='etl', rows_in=rows, path=csv_export_path):
+                CSVStorage().write(self.transformed_data, csv_export_path)
+        logger.info("✅ 데이터 저장 완료")
         return self.transformed_data
 
     def run_pipeline(self, indicators=None, countries=None,
-                     start_date=None, end_date=None, output_path='bloomberg_data.csv'):
-        """전체 ETL 파이프라인 실행"""
-        print("=" * 70)
-        print("🚀 블룸버그 ETL 파이프라인 시작")
-        print("=" * 70)
+                     start_date=None, end_date=None, output_path='bloomberg_data.csv',
+                     csv_export_path=None, trace_path=None):
+        """
+        전체 ETL 파이프라인 실행
+
+        Args:
+            trace_path: 지정하면 단계별 계측 결과를 trace-event JSON으로 저장
+        """
+        logger.info("=" * 70)
+        logger.info("🚀 블룸버그 ETL 파이프라인 시작")
+        logger.info("=" * 70)
 
         # 기본값 설정
         if indicators is None:
@@ -162,22 +320,393 @@ class BloombergETL:
         if end_date is None:
             end_date = datetime.now().strftime('%Y-%m-%d')
 
-        print(f"📍 지표: {', '.join(indicators)}")
-        print(f"📍 국가: {', '.join(countries)}")
-        print(f"📍 기간: {start_date} ~ {end_date}")
-        print()
+        logger.info("📍 지표: %s", ', '.join(indicators))
+        logger.info("📍 국가: %s", ', '.join(countries))
+        logger.info("📍 기간: %s ~ %s", start_date, end_date)
+        logger.info("")
+
+        with self.profiler.stage('etl_pipeline', category='etl') as record:
+            self.extract_from_bloomberg(indicators, countries, start_date, end_date)
+            self.transform()
+            result = self.load(output_path, csv_export_path)
+            self.write_quarantine()
+            record['rows_out'] = len(result)
+        if trace_path is not None:
+            self.profiler.write_trace(trace_path)
+
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✅ ETL 파이프라인 완료")
+        logger.info("=" * 70)
 
-        self.extract_from_bloomberg(indicators, countries, start_date, end_date)
-        self.transform()
-        result = self.load(output_path)
+        return result
 
-        print()
-        print("=" * 70)
-        print("✅ ETL 파이프라인 완료")
-        print("=" * 70)
+    def run_chunked(self, indicators=None, countries=None, start_date=None, end_date=None,
+                    output_path='bloomberg_data.csv', chunk_size=100_000, indicators_per_chunk=1,
+                    trace_path=None):
+        """
+        청크 단위 ETL 파이프라인 실행 (메모리보다 큰 이력용)
+
+        추출한 배치마다 변환하여 출력 파일에 이어 쓰므로 최대 메모리 사용량이 배치 크기로 제한됩니다.
+        행 단위 지표는 run_pipeline과 같은 값이며, 출력 행 순서는 배치 순서(지표 이름 순)로 고정됩니다.
+        raw_data / transformed_data에는 마지막 배치만 남습니다. 품질 검증의 중복 키/이상치는 배치 안에서 판단하며,
+        격리한 행은 배치별로 누적하여 마지막에 quarantine_path로 저장합니다.
+
+        Args:
+            output_path: 저장 경로 (.csv / .parquet)
+            chunk_size: 샘플 모드 배치당 행 수
+            indicators_per_chunk: 실제 API 모드 배치당 지표 수
+            trace_path: 지정하면 배치별 계측 결과를 trace-event JSON으로 저장
+
+        Returns:
+            int: 저장한 레코드 수
+        """
+        logger.info("=" * 70)
+        logger.info("🚀 블룸버그 청크 ETL 파이프라인 시작")
+        logger.info("=" * 70)
+
+        if indicators is None:
+            indicators = ['GDP', 'CPI', 'UNEMPLOYMENT']
+        if countries is None:
+            countries = ['US', 'CN', 'JP']
+        if start_date is None:
+            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+        if self.features and self.use_sample:
+            # 샘플 파일은 행 단위로 나뉘어 시계열이 여러 배치에 걸치므로 feature 계산 불가
+            raise ValueError("샘플 모드 청크 처리에서는 features=True를 사용할 수 없습니다.")
+
+        logger.info("📍 지표: %s", ', '.join(indicators))
+        logger.info("📍 국가: %s", ', '.join(countries))
+        logger.info("📍 기간: %s ~ %s", start_date, end_date)
+        logger.info("💾 저장 경로: %s", output_path)
+        logger.info("")
+
+        self._reset_validation()
+        batches = self.iter_extract(indicators, countries, start_date, end_date, chunk_size, indicators_per_chunk)
+        with self.profiler.stage('etl_chunked', category='etl') as pipeline_record, \
+                get_storage(output_path).open_writer(output_path) as writer:
+            number = 1
+            while True:
+                # 제너레이터의 다음 배치를 받는 시간이 배치 추출 시간
+                with self.profiler.stage('extract', category='etl', batch=number) as record:
+                    raw = next(batches, None)
+                    record['rows_out'] = 0 if raw is None else len(raw)
+                if raw is None:
+                    break
+                self.raw_data = raw
+                self.transformed_data = self._transform_batch(raw)
+                rows = len(self.transformed_data)
+                with self.profiler.stage('load', category='etl', rows_in=rows, rows_out=rows, batch=number):
+                    writer.write(self.transformed_data)
+                logger.info("  - 배치 %d: %d개 레코드 (누적 %d개)", number, len(raw), writer.rows)
+                number += 1
+            pipeline_record['rows_out'] = writer.rows
+        self.write_quarantine()
+        if trace_path is not None:
+            self.profiler.write_trace(trace_path)
+
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✅ 청크 ETL 완료 - %d개 레코드 저장", writer.rows)
+        logger.info("=" * 70)
+
+        return writer.rows
+
+    def _extract_batch(self, indicators, countries, start_date, end_date):
+        """지표 배치 하나를 별도 세션으로 추출 (작업 그래프 I/O 작업)"""
+        with self.profiler.stage('extract', category='etl', indicators=indicators) as record:
+            with self._bloomberg_extractor() as extractor:
+                raw = extractor.extract(indicators, countries, start_date, end_date)
+                self.failed_securities.update(extractor.failed_securities)
+            record['rows_out'] = len(raw)
+        return raw
+
+    def run_graph(self, indicators=None, countries=None, start_date=None, end_date=None,
+                  output_path='bloomberg_data.csv', reports=(), state_dir='.pipeline_state',
+                  indicators_per_batch=1, io_workers=4, cpu_workers=1, report_processes=0, trace_path=None):
+        """
+        작업 그래프(DAG)로 ETL과 레포트 생성 실행
+
+        지표 배치별 추출(I/O 스레드)과 변환(CPU 스레드)이 겹쳐 실행되고, 합친 변환 결과를
+        저장 작업과 레포트 작업들에 메모리로 전달합니다 (레포트가 파일을 다시 읽지 않음).
+        작업별 fingerprint를 state_dir에 기록하여, 추출 결과(내용 해시)와 설정이 같은 배치 변환,
+        저장, 레포트는 다음 실행에서 생략합니다. 출력 행 순서와 값은 run_pipeline과 같습니다
+        (features=True의 이동 통계는 배치별로 누적합을 계산하므로 부동소수점 오차 범위에서 같음).
+        생략한 변환 작업은 다시 검증하지 않으므로 quarantined에는 이번에 실행한 배치의 격리 행만 남습니다.
+
+        Args:
+            output_path: 변환 결과 저장 경로 (.csv / .parquet)
+            reports: 레포트 설정 목록 - {'output_path': ..., 나머지는 EconomicReportGenerator 옵션}
+                     (예: [{'output_path': 'full.xlsx', 'streaming': True},
+                           {'output_path': 'summary.xlsx', 'streaming': True, 'include_rows': False}])
+            state_dir: fingerprint / 중간 결과 저장 디렉터리 (None이면 매번 전체 실행)
+            indicators_per_batch: 실제 API 모드 추출 배치당 지표 수
+            io_workers: 동시에 실행할 추출/저장 작업 수
+            cpu_workers: 동시에 실행할 변환/레포트 작업 스레드 수
+            report_processes: 2 이상이면 레포트 작업을 프로세스 풀에서 병렬 실행
+            trace_path: 지정하면 작업별 계측 결과를 trace-event JSON으로 저장
+
+        Returns:
+            GraphResult: 실행(ran) / 생략(skipped)한 작업 이름, value('combine')로 변환 결과 조회
+        """
+        from create_excel_report import render_report
+
+        logger.info("=" * 70)
+        logger.info("🚀 블룸버그 작업 그래프 파이프라인 시작")
+        logger.info("=" * 70)
+
+        if indicators is None:
+            indicators = ['GDP', 'CPI', 'UNEMPLOYMENT']
+        if countries is None:
+            countries = ['US', 'CN', 'JP']
+        if start_date is None:
+            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        graph = TaskGraph(state_dir, io_workers=io_workers, cpu_workers=cpu_workers,
+                          process_workers=report_processes if report_processes > 1 else 0, profiler=self.profiler)
+
+        # 추출 (외부 데이터이므로 항상 실행, 결과 내용 해시로 이후 작업 생략 여부 결정) -> 배치별 변환
+        if self.use_sample:
+            logger.warning("⚠️  샘플 데이터 모드 - 실제 블룸버그 API 대신 샘플 데이터 사용")
+            batches = {'sample': partial(pd.read_csv, 'bloomberg_sample_data.csv')}
+        else:
+            indicators = sorted(indicators)
+            batches = {
+                '+'.join(batch): partial(self._extract_batch, batch, countries, start_date, end_date)
+                for batch in (indicators[i:i + indicators_per_batch]
+                              for i in range(0, len(indicators), indicators_per_batch))
+            }
+        for name, extract in batches.items():
+            graph.add(f'extract:{name}', extract, kind='io', always_run=True)
+            graph.add(f'transform:{name}', self._transform_batch, deps=[f'extract:{name}'],
+                      params={'features': self.features, 'validation': self.validation, 'outlier_z': self.outlier_z})
+        graph.add('combine', _combine_batches, deps=[f'transform:{name}' for name in batches])
+
+        # 저장 / 레포트 (같은 변환 결과에서 동시에 실행)
+        graph.add('load', partial(_write_output, output_path=output_path), deps=['combine'], kind='io',
+                  params={'output_path': output_path}, output_path=output_path)
+        for options in reports:
+            options = dict(options)
+            report_path = options.pop('output_path')
+            graph.add(f'report:{report_path}', partial(render_report, output_path=report_path, **options),
+                      deps=['combine'], kind='process', params=dict(options, output_path=report_path),
+                      output_path=report_path)
+
+        self._reset_validation()
+        result = graph.run()
+        self.write_quarantine()
+        if trace_path is not None:
+            self.profiler.write_trace(trace_path)
+
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✅ 작업 그래프 완료 - 실행 %d개, 생략 %d개", len(result.ran), len(result.skipped))
+        logger.info("=" * 70)
+
+        return result
+
+    def run_incremental(self, indicators=None, countries=None, start_date=None, end_date=None,
+                        output_dir='bloomberg_data', lookback_days=31, storage=None, trace_path=None):
+        """
+        증분 ETL 파이프라인 실행
+
+        (국가, 지표)별 워터마크 이후 발표분만 변환하여 지표 × 월 파티션에 병합합니다.
+        워터마크 이전 lookback_days 기간은 다시 추출하여, 저장된 값(forecast/actual/previous)과
+        달라진 재발표 행이 있으면 해당 행이 속한 파티션만 다시 씁니다.
+        워터마크가 없는 시계열(나중에 indicators / countries에 추가한 시계열)은 start_date부터 적재합니다.
+
+        Args:
+            output_dir: 분할 저장 디렉터리
+            lookback_days: 재발표 확인을 위해 워터마크 이전으로 다시 추출할 일수
+            storage: 파티션 파일 저장소 백엔드 (기본: CSVStorage)
+            trace_path: 지정하면 단계별 계측 결과를 trace-event JSON으로 저장
+        """
+        logger.info("=" * 70)
+        logger.info("🚀 블룸버그 증분 ETL 파이프라인 시작")
+        logger.info("=" * 70)
+
+        if indicators is None:
+            indicators = ['GDP', 'CPI', 'UNEMPLOYMENT']
+        if countries is None:
+            countries = ['US', 'CN', 'JP']
+        if end_date is None:
+            end_date = datetime.now().strftime('%Y-%m-%d')
+
+        store = PartitionedStore(output_dir, storage)
+        watermarks = store.load_watermarks()
+
+        if start_date is None:
+            start_date = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        if watermarks:
+            # 저장된 워터마크 중 가장 이른 시점 - lookback부터 추출
+            # 워터마크가 없는(새로 추가한) 시계열이 있으면 요청한 시작일부터의 이력도 필요하므로 더 이른 날짜 사용
+            lookback_start = min(watermarks.values()) - timedelta(days=lookback_days)
+            requested = {(country, indicator) for indicator in indicators for country in countries}
+            if not requested - set(watermarks):
+                start_date = lookback_start.strftime('%Y-%m-%d')
+            else:
+                start_date = min(pd.Timestamp(start_date), lookback_start).strftime('%Y-%m-%d')
+
+        logger.info("📍 워터마크: %d개 시계열", len(watermarks))
+        logger.info("📍 기간: %s ~ %s", start_date, end_date)
+        logger.info("")
+
+        with self.profiler.stage('etl_incremental', category='etl') as record:
+            result = self._merge_incremental(store, watermarks, indicators, countries, start_date, end_date,
+                                             lookback_days)
+            record['rows_out'] = len(result)
+        if trace_path is not None:
+            self.profiler.write_trace(trace_path)
+        if result.empty:
+            return result
+
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✅ 증분 ETL 완료 - %d개 파티션 갱신", len(self.rewritten_partitions))
+        logger.info("=" * 70)
 
         return result
 
+    def _merge_incremental(self, store, watermarks, indicators, countries, start_date, end_date, lookback_days):
+        """증분 추출 -> 변경 행 선별 -> 검증/변환 -> 파티션 병합 -> 워터마크 갱신 (변경 행 변환 결과 반환)"""
+        raw = self.extract_from_bloomberg(indicators, countries, start_date, end_date)
+        raw_dates = pd.to_datetime(raw['date'])
+
+        # 시계열별 워터마크와 비교하여 신규 / 재확인 대상 구분
+        series_watermark = pd.Series(
+            [watermarks.get(key) for key in zip(raw['country'], raw['indicator'])],
+            index=raw.index, dtype='datetime64[ns]',
+        )
+        # 추출 구간의 시계열 첫 발표는 직전 발표가 구간 밖에 있어 previous가 비므로 저장된 값으로 채움
+        # (워터마크 이전 발표는 같은 행의 저장된 previous, 이후 발표는 워터마크 발표의 actual)
+        first = raw_dates.groupby([raw['country'], raw['indicator']]).transform('min').eq(raw_dates)
+        first &= series_watermark.notna() & raw['previous'].isna()
+        if first.any():
+            after_watermark = raw_dates[first] > series_watermark[first]
+            stored = store.lookup(pd.DataFrame({
+                'date': raw_dates[first].where(~after_watermark, series_watermark[first]),
+                'country': raw.loc[first, 'country'],
+                'indicator': raw.loc[first, 'indicator'],
+            }), columns=['actual', 'previous'])
+            raw.loc[first, 'previous'] = stored['actual'].where(after_watermark, stored['previous'])
+
+        is_new = series_watermark.isna() | (raw_dates > series_watermark)
+        in_lookback = ~is_new & (raw_dates > series_watermark - timedelta(days=lookback_days))
+
+        with self.profiler.stage('diff', category='etl', rows_in=len(raw)) as record:
+            restated = store.changed_rows(raw[in_lookback])
+            changed = pd.concat([raw[is_new], restated]).sort_index()
+            record['rows_out'] = len(changed)
+        logger.info("🔍 신규 %d개, 재발표 %d개 레코드", int(is_new.sum()), len(restated))
+
+        if changed.empty:
+            self.transformed_data = changed
+            self.rewritten_partitions = []
+            logger.info("✅ 변경된 데이터 없음 - 파티션 유지")
+            return changed
+
+        self.raw_data = changed
+        # 변경 행은 시계열마다 몇 건뿐이므로 이상치는 저장된 이전 발표까지 포함한 통계로 판단
+        history = None
+        if self.validation and self.outlier_z is not None:
+            history = self._outlier_history(store, changed)
+        # feature는 변경 행만으로 계산하면 이력이 필요한 값(전년 대비, 이동 통계)이 비므로 저장된 이력과 이어서 계산
+        self.transform(features=False, history=history)
+        if self.features:
+            with self.profiler.stage('features', category='etl', rows_in=len(self.transformed_data)) as record:
+                self.transformed_data = self._extend_stored_features(store, self.transformed_data)
+                record['rows_out'] = len(self.transformed_data)
+        self.write_quarantine()
+
+        logger.info("💾 파티션 병합 중: %s", store.root)
+        rows = len(self.transformed_data)
+        with self.profiler.stage('load', category='etl', rows_in=rows, rows_out=rows, path=store.root):
+            self.rewritten_partitions = store.write(self.transformed_data)
+        for indicator, month in self.rewritten_partitions:
+            logger.info("  - %s / %s", indicator, month)
+
+        # 워터마크 갱신
+        latest = self.transformed_data.groupby(['country', 'indicator'], observed=True)['date'].max()
+        for key, value in latest.items():
+            watermarks[key] = max(value, watermarks.get(key, value))
+        store.save_watermarks(watermarks)
+        return self.transformed_data
+
+    @staticmethod
+    def _outlier_history(store, raw):
+        """증분 배치 시계열별 첫 발표 이전에 저장된 발표 (시계열마다 최근 OUTLIER_HISTORY건 이상)"""
+        dates = pd.to_datetime(raw['date'])
+        first_dates = dates.groupby([raw['country'].astype(str), raw['indicator'].astype(str)]).min()
+        history = store.read_history(first_dates.to_dict(), OUTLIER_HISTORY, 12)
+        if history.empty:
+            return history
+        keys = pd.MultiIndex.from_arrays([history['country'].astype(str), history['indicator'].astype(str)])
+        first = first_dates.reindex(keys).to_numpy()
+        return history[pd.to_datetime(history['date']).to_numpy() < first]
+
+    @staticmethod
+    def _extend_stored_features(store, transformed):
+        """
+        증분 ETL 변경 행의 feature를 저장된 이력과 이어서 계산
+
+        변경 행이 속한 지표의 저장된 이력 꼬리(이동 통계 구간, 12개월 전 발표)를 읽어 extend_features로 계산하고,
+        변경 행 때문에 feature가 달라진 저장 행(재발표 이후 발표의 이동 통계 / 전년 대비, 같은 날짜 다른 국가의 순위)도
+        함께 반환합니다.
+        """
+        keys = transformed.assign(country=transformed['country'].astype(str),
+                                  indicator=transformed['indicator'].astype(str))
+        first_dates = keys.groupby(['country', 'indicator'])['date'].min()
+        history = store.read_history(first_dates.to_dict(), FEATURE_WINDOW + 1, 12)
+        if history.empty:
+            return compute_features(transformed)
+        if not set(FEATURE_COLUMNS) <= set(history.columns):
+            raise ValueError("저장된 파티션에 feature 컬럼이 없습니다. features=True로 바꾸려면 output_dir을 새로 만들어 주세요.")
+
+        # 재발표로 교체되는 저장 행은 이력에서 제외
+        history_keys = pd.MultiIndex.from_arrays(
+            [history['date'], history['country'].astype(str), history['indicator'].astype(str)])
+        replaced = history_keys.isin(pd.MultiIndex.from_frame(keys[['date', 'country', 'indicator']]))
+        history = history[~replaced].reset_index(drop=True)
+        combined = extend_features(history, transformed)
+        recomputed = combined.iloc[:len(history)]
+
+        # 변경 행 이후 발표는 시계열 feature가, 나머지 저장 행은 국가 순위만 달라질 수 있음
+        # (그 이전 행은 읽은 이력이 잘려 있어 다시 계산한 값을 쓰지 않음)
+        first = first_dates.reindex(history_keys[~replaced].droplevel(0)).to_numpy()
+        downstream = history['date'].to_numpy() > first
+        updated = history.copy()
+        updated.loc[downstream, FEATURE_COLUMNS] = recomputed.loc[downstream, FEATURE_COLUMNS]
+        updated['country_rank'] = recomputed['country_rank'].to_numpy()
+        differs = np.zeros(len(history), dtype=bool)
+        for column in FEATURE_COLUMNS:
+            differs |= ~np.isclose(updated[column].to_numpy(dtype=np.float64),
+                                   history[column].to_numpy(dtype=np.float64), equal_nan=True)
+        return pd.concat([updated[differs], combined.iloc[len(history):]], ignore_index=True)
+
+
+def _combine_batches(*frames):
+    """배치별 변환 결과를 합쳐 run_pipeline과 같은 행 순서 / dtype으로 정리"""
+    if len(frames) == 1:
+        return frames[0]
+    combined = pd.concat(frames, ignore_index=True)
+    for column in frames[0].columns:
+        # 배치마다 범주가 다른 Categorical(지표 등)은 concat 후 object가 되므로 범주를 합쳐 복원
+        if isinstance(frames[0][column].dtype, pd.CategoricalDtype) and \
+                not isinstance(combined[column].dtype, pd.CategoricalDtype):
+            combined[column] = union_categoricals([frame[column] for frame in frames], sort_categories=True)
+    return combined.sort_values(['date', 'indicator', 'country'], kind='stable', ignore_index=True)
+
+
+def _write_output(df, output_path):
+    """작업 그래프 저장 작업"""
+    logger.info("💾 데이터 저장 중: %s", output_path)
+    get_storage(output_path).write(df, output_path)
+    return output_path
+
 
 if __name__ == "__main__":
     # ETL 실행 예제 (샘플 데이터 모드)
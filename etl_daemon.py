@@ -0,0 +1,297 @@
+"""
+상주 ETL 데몬
+블룸버그 세션 하나와 변환 결과를 메모리에 유지하면서 asyncio로 정해진 주기마다 갱신하고,
+Unix 소켓으로 현재 데이터셋의 Arrow 스냅샷(공유 메모리 디렉터리의 파일) 위치를 알려줍니다.
+소비자(Dash 앱, 레포트 생성)는 파이프라인을 다시 실행하지 않고 스냅샷을 메모리 매핑하여 바로 사용합니다.
+
+    python etl_daemon.py --sample --interval 300                 # 데몬 실행
+    python etl_daemon.py --status                                # 현재 데이터셋 정보
+    python etl_daemon.py --refresh                               # 즉시 갱신 요청
+    ETL_DAEMON_SOCKET=/tmp/etl_daemon.sock python app.py          # Dash 앱이 데몬 데이터 사용
+
+요청/응답은 한 줄짜리 JSON입니다: {"cmd": "current" | "status" | "refresh" | "stop"}
+--status / --refresh / --stop 요청은 pandas를 import하지 않습니다 (스냅샷 매핑과 갱신 때 로드).
+"""
+import argparse
+import asyncio
+import contextlib
+import glob
+import json
+import os
+import signal
+import socket
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from profiling import get_logger
+
+
+logger = get_logger('daemon')
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'etl_daemon.sock')
+# 스냅샷은 가능하면 메모리 파일 시스템에 기록 (디스크 I/O 없이 페이지 캐시 공유)
+DEFAULT_SNAPSHOT_DIR = '/dev/shm/etl_daemon' if os.path.isdir('/dev/shm') else \
+    os.path.join(tempfile.gettempdir(), 'etl_daemon')
+COMMANDS = ('current', 'status', 'refresh', 'stop')
+
+
+class ETLDaemon:
+    """
+    주기적으로 갱신되는 상주 데이터셋
+
+    - 갱신(추출 -> 검증/변환 -> 스냅샷 기록)은 실행기 스레드에서 실행하므로 갱신 중에도 요청에 응답
+    - 변환 결과 내용 해시가 이전과 같으면 스냅샷을 새로 만들지 않음 (소비자 캐시 유지)
+    - 블룸버그 세션은 데몬이 실행되는 동안 한 번만 열고, 갱신이 실패하면 다음 갱신 때 다시 연결
+    - etl.profiler에는 마지막 갱신의 단계 기록만 남김
+    """
+
+    def __init__(self, etl, interval=300, socket_path=DEFAULT_SOCKET, snapshot_dir=DEFAULT_SNAPSHOT_DIR,
+                 indicators=None, countries=None, lookback_days=365, keep_snapshots=2):
+        """
+        Args:
+            etl: 추출/변환에 사용할 BloombergETL
+            interval: 갱신 주기(초)
+            socket_path: 요청을 받을 Unix 소켓 경로
+            snapshot_dir: 데이터셋 스냅샷 디렉터리
+            indicators, countries: 추출 대상 (None이면 run_pipeline 기본값)
+            lookback_days: 갱신 시점부터 거슬러 올라가 추출할 일수
+            keep_snapshots: 보관할 스냅샷 수 (이전 스냅샷을 매핑 중인 소비자를 위해 2 이상 권장)
+        """
+        self.etl = etl
+        self.interval = interval
+        self.socket_path = socket_path
+        self.snapshot_dir = snapshot_dir
+        self.indicators = indicators or ['GDP', 'CPI', 'UNEMPLOYMENT']
+        self.countries = countries or ['US', 'CN', 'JP']
+        self.lookback_days = lookback_days
+        self.keep_snapshots = keep_snapshots
+        self.version = 0
+        self.token = None
+        self.path = None
+        self.rows = 0
+        self.refreshes = 0
+        self.refreshed_at = None
+        self.refresh_seconds = None
+        self.last_error = None
+        self._session = contextlib.ExitStack()
+        self._session_open = False
+        self._refresh_lock = None
+        self._stop = None
+        self.ready = threading.Event()
+
+    def info(self):
+        """현재 데이터셋 정보 (소켓 응답)"""
+        return {
+            'version': self.version,
+            'token': self.token,
+            'path': self.path,
+            'rows': self.rows,
+            'refreshes': self.refreshes,
+            'refreshed_at': self.refreshed_at,
+            'refresh_seconds': self.refresh_seconds,
+            'last_error': self.last_error,
+            'pid': os.getpid(),
+        }
+
+    def _refresh_sync(self):
+        """추출 -> 검증/변환 -> 스냅샷 기록 (실행기 스레드, 데이터가 같으면 None)"""
+        from indicator_data import write_snapshot
+        from pipeline_dag import frame_fingerprint
+
+        # 데몬이 실행되는 동안 계측 기록이 쌓이지 않도록 갱신마다 비움 (마지막 갱신 기록만 유지)
+        self.etl.profiler.reset()
+        if not self._session_open:
+            self._session.enter_context(self.etl.persistent_session())
+            self._session_open = True
+        end = datetime.now()
+        start = end - timedelta(days=self.lookback_days)
+        self.etl.extract_from_bloomberg(self.indicators, self.countries,
+                                        start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d'))
+        df = self.etl.transform()
+        token = frame_fingerprint(df)
+        if token == self.token:
+            return None
+        path = os.path.join(self.snapshot_dir, f"dataset-{token[:16]}.arrow")
+        write_snapshot(df, path)
+        return token, path, len(df)
+
+    async def refresh(self):
+        """
+        데이터셋 갱신 (동시에 요청되면 진행 중인 갱신이 끝난 뒤 한 번 더 실행하지 않고 결과 공유)
+
+        Returns:
+            bool: 새 데이터셋을 게시했으면 True
+        """
+        waited = self._refresh_lock.locked()
+        async with self._refresh_lock:
+            if waited:
+                return False
+            start = time.perf_counter()
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(None, self._refresh_sync)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error("❌ 데이터셋 갱신 실패: %s", e)
+                # 세션 문제일 수 있으므로 다음 갱신 때 다시 연결
+                self._session.close()
+                self._session_open = False
+                return False
+            self.last_error = None
+            self.refreshes += 1
+            self.refreshed_at = time.time()
+            self.refresh_seconds = time.perf_counter() - start
+            if result is None:
+                logger.info("🔁 데이터 변경 없음 (%.2f초)", self.refresh_seconds)
+                return False
+            self.token, self.path, self.rows = result
+            self.version += 1
+            self._remove_old_snapshots()
+            logger.info("✅ 데이터셋 v%d 게시 - %d개 레코드 (%.2f초)", self.version, self.rows, self.refresh_seconds)
+            return True
+
+    def _remove_old_snapshots(self):
+        snapshots = sorted(glob.glob(os.path.join(self.snapshot_dir, 'dataset-*.arrow')), key=os.path.getmtime)
+        for old_path in snapshots[:-self.keep_snapshots]:
+            if old_path != self.path:
+                # 매핑 중인 소비자는 삭제 후에도 기존 내용을 계속 읽을 수 있음 (POSIX)
+                os.remove(old_path)
+
+    async def _schedule(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh()
+
+    async def _handle(self, reader, writer):
+        try:
+            line = await reader.readline()
+            try:
+                command = json.loads(line or b'{}').get('cmd', 'current')
+            except (ValueError, AttributeError):
+                command = None
+            if command not in COMMANDS:
+                response = {'error': f"지원하지 않는 요청입니다: {command} (지원: {', '.join(COMMANDS)})"}
+            else:
+                if command == 'refresh':
+                    await self.refresh()
+                elif command == 'stop':
+                    self._stop.set()
+                response = self.info()
+            writer.write(json.dumps(response).encode() + b'\n')
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        """첫 갱신 후 소켓 요청을 받고, 중지 요청(stop / SIGTERM / SIGINT)까지 주기적으로 갱신"""
+        self._refresh_lock = asyncio.Lock()
+        self._stop = asyncio.Event()
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        loop = asyncio.get_running_loop()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(signum, self._stop.set)
+
+        logger.info("🚀 ETL 데몬 시작 - 갱신 주기 %d초, 소켓 %s", self.interval, self.socket_path)
+        await self.refresh()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        scheduler = asyncio.create_task(self._schedule())
+        self.ready.set()
+        try:
+            await self._stop.wait()
+        finally:
+            scheduler.cancel()
+            server.close()
+            await server.wait_closed()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.socket_path)
+            self._session.close()
+            logger.info("🛑 ETL 데몬 종료")
+
+    def run(self):
+        asyncio.run(self.serve())
+
+
+class DaemonClient:
+    """ETL 데몬 클라이언트 - 현재 데이터셋 스냅샷을 메모리 매핑 (바뀌지 않았으면 이전 DataFrame 재사용)"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, timeout=30.0):
+        """
+        Args:
+            socket_path: 데몬 Unix 소켓 경로
+            timeout: 응답 대기 시간(초) - refresh 요청은 갱신이 끝날 때까지 대기
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.token = None
+        self._data = None
+
+    def request(self, command):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(None if command == 'refresh' else self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps({'cmd': command}).encode() + b'\n')
+            with sock.makefile('rb') as f:
+                response = json.loads(f.readline())
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response
+
+    def status(self):
+        return self.request('status')
+
+    def refresh(self):
+        """즉시 갱신 요청 (갱신이 끝난 뒤의 데이터셋 정보 반환)"""
+        return self.request('refresh')
+
+    def stop(self):
+        return self.request('stop')
+
+    def data(self):
+        """현재 데이터셋 (token 속성이 반환한 데이터의 식별자)"""
+        info = self.request('current')
+        if info['path'] is None:
+            raise RuntimeError(f"데몬에 게시된 데이터셋이 없습니다 (마지막 오류: {info['last_error']})")
+        if info['token'] != self.token:
+            from indicator_data import map_snapshot
+
+            try:
+                df = map_snapshot(info['path'])
+            except FileNotFoundError:
+                # 조회와 매핑 사이에 더 새 스냅샷으로 교체된 경우
+                return self.data()
+            self._data, self.token = df, info['token']
+        return self._data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상주 ETL 데몬 (주기적 갱신, Unix 소켓으로 데이터셋 제공)")
+    parser.add_argument('--socket', default=os.environ.get('ETL_DAEMON_SOCKET', DEFAULT_SOCKET))
+    parser.add_argument('--snapshot-dir', default=DEFAULT_SNAPSHOT_DIR)
+    parser.add_argument('--interval', type=int, default=300, help='갱신 주기(초)')
+    parser.add_argument('--indicators', nargs='+')
+    parser.add_argument('--countries', nargs='+')
+    parser.add_argument('--lookback-days', type=int, default=365)
+    parser.add_argument('--sample', action='store_true', help='블룸버그 API 대신 샘플 데이터 사용')
+    parser.add_argument('--status', action='store_true', help='실행 중인 데몬의 데이터셋 정보 출력')
+    parser.add_argument('--refresh', action='store_true', help='실행 중인 데몬에 즉시 갱신 요청')
+    parser.add_argument('--stop', action='store_true', help='실행 중인 데몬 종료')
+    args = parser.parse_args()
+
+    for command in ('status', 'refresh', 'stop'):
+        if getattr(args, command):
+            print(json.dumps(DaemonClient(args.socket).request(command), ensure_ascii=False, indent=2))
+            return
+
+    from etl_bloomberg import BloombergETL
+
+    ETLDaemon(BloombergETL(use_sample=args.sample), interval=args.interval, socket_path=args.socket,
+              snapshot_dir=args.snapshot_dir, indicators=args.indicators, countries=args.countries,
+              lookback_days=args.lookback_days).run()
+
+
+if __name__ == '__main__':
+    main()
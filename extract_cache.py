@@ -0,0 +1,244 @@
+"""
+블룸버그 추출 결과 디스크 캐시
+(티커, 필드, 월) 단위 요청 파라미터의 해시를 키로 SQLite 파일에 저장하고,
+요청 기간 중 캐시에 없는 구간만 블룸버그에서 가져옵니다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from bloomberg_extract import ACTUAL_FIELD, FORECAST_FIELD, ColumnBuffer, bloomberg_ticker, with_previous
+
+
+# 최근 발표분 필드별 TTL(초) - 최근 구간이 아닌 과거 발표분은 만료되지 않음
+DEFAULT_FIELD_TTLS = {
+    ACTUAL_FIELD: 6 * 3600,
+    FORECAST_FIELD: 3600,
+}
+
+
+def request_key(ticker, fields, start_date, end_date):
+    """요청 파라미터의 SHA-256 해시 (캐시 키)"""
+    params = json.dumps({'ticker': ticker, 'fields': sorted(fields),
+                         'start': start_date, 'end': end_date}, sort_keys=True)
+    return hashlib.sha256(params.encode()).hexdigest()
+
+
+def month_chunks(start_date, end_date):
+    """기간을 달력 월 단위 (월초, 월말) 구간으로 분할"""
+    start = pd.Timestamp(start_date).to_period('M')
+    end = pd.Timestamp(end_date).to_period('M')
+    return [(period.start_time.strftime('%Y-%m-%d'), period.end_time.strftime('%Y-%m-%d'))
+            for period in pd.period_range(start, end, freq='M')]
+
+
+class ExtractionCache:
+    """
+    추출 결과 캐시 (SQLite, LRU 제거)
+
+    stats()로 적중/미적중 횟수와 읽은/쓴 바이트 수를 확인할 수 있습니다.
+    작업 그래프의 I/O 스레드나 상주 데몬의 executor 스레드에서 함께 사용할 수 있도록
+    연결 하나를 잠금으로 보호하여 공유합니다.
+    """
+
+    def __init__(self, path='.bloomberg_cache.sqlite', max_bytes=512 * 1024 ** 2,
+                 field_ttls=None, recent_days=90, clock=time.time):
+        """
+        Args:
+            path: 캐시 파일 경로
+            max_bytes: 캐시 최대 크기, 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            field_ttls: {필드: TTL(초)} - 최근 recent_days 이내 구간에 적용
+            recent_days: 이 기간 이내 발표분은 수정될 수 있으므로 TTL 적용
+            clock: 현재 시각(epoch 초) 함수
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.field_ttls = dict(DEFAULT_FIELD_TTLS if field_ttls is None else field_ttls)
+        self.recent_days = recent_days
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+        self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def ttl_for(self, fields, chunk_end):
+        """구간 끝이 최근 recent_days 이내면 필드별 TTL 중 최소값, 아니면 None(만료 없음)"""
+        today = date.fromtimestamp(self.clock())
+        if pd.Timestamp(chunk_end).date() < today - timedelta(days=self.recent_days):
+            return None
+        return min(self.field_ttls.get(field, min(self.field_ttls.values(), default=0)) for field in fields)
+
+    def get(self, key):
+        """캐시 항목 조회 (없거나 만료되면 None)"""
+        now = self.clock()
+        with self._lock:
+            row = self._db.execute("SELECT payload, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._db.commit()
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            self.bytes_read += len(row[0])
+            return row[0]
+
+    def put(self, key, payload, ttl=None):
+        now = self.clock()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), None if ttl is None else now + ttl, now),
+            )
+            self.bytes_written += len(payload)
+
+    def commit(self):
+        """변경 사항 저장 후 최대 크기를 넘으면 LRU 순으로 제거"""
+        with self._lock:
+            total = self.size()
+            if total > self.max_bytes:
+                removed = 0
+                for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    total -= size
+                    removed += 1
+                self.evictions += removed
+            self._db.commit()
+
+    def size(self):
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'bytes_read': self.bytes_read,
+                'bytes_written': self.bytes_written,
+                'evictions': self.evictions,
+                'entries': self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0],
+                'size': self.size(),
+            }
+
+
+def _encode(points):
+    return json.dumps({
+        'date': points['date'].tolist(),
+        'forecast': points['forecast'].tolist(),
+        'actual': points['actual'].tolist(),
+    }).encode()
+
+
+def _decode(payload, indicator, country):
+    data = json.loads(payload)
+    return pd.DataFrame({
+        'date': data['date'],
+        'indicator': indicator,
+        'country': country,
+        'forecast': np.asarray(data['forecast'], dtype=np.float64),
+        'actual': np.asarray(data['actual'], dtype=np.float64),
+    })
+
+
+class CachedExtractor:
+    """BloombergExtractor 앞단 캐시 - 캐시에 없는 (티커, 월) 구간만 요청"""
+
+    fields = (ACTUAL_FIELD, FORECAST_FIELD)
+
+    def __init__(self, extractor, cache):
+        self.extractor = extractor
+        self.cache = cache
+        self.failed_securities = {}
+
+    def extract(self, indicators, countries, start_date, end_date):
+        """BloombergExtractor.extract와 같은 결과를 캐시를 거쳐 반환"""
+        series = {bloomberg_ticker(indicator, country): (indicator, country)
+                  for country in countries for indicator in indicators}
+        chunks = month_chunks(start_date, end_date)
+
+        frames = []
+        missing = {}  # 티커 -> 캐시에 없는 월 구간 목록
+        for ticker, (indicator, country) in series.items():
+            for chunk in chunks:
+                payload = self.cache.get(request_key(ticker, self.fields, *chunk))
+                if payload is None:
+                    missing.setdefault(ticker, []).append(chunk)
+                else:
+                    frames.append(_decode(payload, indicator, country))
+
+        # 연속된 누락 월을 하나의 기간으로 합치고, 같은 기간의 티커끼리 묶어 요청
+        gaps = {}
+        for ticker, ticker_chunks in missing.items():
+            for gap in _merge_chunks(ticker_chunks):
+                gaps.setdefault(gap, []).append(ticker)
+
+        self.failed_securities = {}
+        for (gap_start, gap_end), tickers in gaps.items():
+            fetched = self.extractor.fetch({ticker: series[ticker] for ticker in tickers}, gap_start, gap_end)
+            self.failed_securities.update(self.extractor.failed_securities)
+            frames.append(fetched)
+            self._store(fetched, tickers, series, gap_start, gap_end)
+        self.cache.commit()
+
+        points = pd.concat(frames, ignore_index=True) if frames else ColumnBuffer().to_frame()
+        points = points[(points['date'] >= start_date) & (points['date'] <= end_date)]
+        return with_previous(points)
+
+    def _store(self, fetched, tickers, series, gap_start, gap_end):
+        """가져온 데이터를 (티커, 월) 단위로 저장 (실패 종목은 저장하지 않음)"""
+        month = fetched['date'].str[:7]
+        groups = {key: group for key, group in fetched.groupby([fetched['indicator'], fetched['country'], month])}
+        empty = fetched.iloc[:0]
+        for ticker in tickers:
+            if ticker in self.extractor.failed_securities:
+                continue
+            indicator, country = series[ticker]
+            for chunk in month_chunks(gap_start, gap_end):
+                points = groups.get((indicator, country, chunk[0][:7]), empty)
+                self.cache.put(request_key(ticker, self.fields, *chunk), _encode(points),
+                               ttl=self.cache.ttl_for(self.fields, chunk[1]))
+
+
+def _merge_chunks(chunks):
+    """연속된 월 구간을 하나의 (시작일, 종료일)로 병합"""
+    merged = []
+    for start, end in chunks:
+        if merged and pd.Timestamp(merged[-1][1]) + pd.Timedelta(days=1) == pd.Timestamp(start):
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
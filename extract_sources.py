@@ -0,0 +1,471 @@
+"""
+다중 소스 추출 프레임워크
+블룸버그(blpapi) 외에 파일 드롭 디렉터리와 사내 REST 미러에서 같은 거시경제 시계열을 읽습니다.
+소스마다 독립적으로 병렬 추출(asyncio)한 뒤 (date, country, indicator) 기준으로 합치며,
+같은 키가 여러 소스에 있으면 먼저 지정한 소스의 값을 사용합니다.
+
+소스는 다음 인터페이스를 가진 객체입니다.
+- name: 로그와 실패 사유에 쓰는 이름
+- async fetch(series, start_date, end_date): {티커: (지표, 국가)} 기간 데이터
+  -> date, indicator, country, forecast, actual DataFrame (previous는 합친 뒤 계산)
+- failed_securities: 마지막 fetch에서 실패한 {티커: 사유} (여러 스레드가 공유하는 소스는 스레드별)
+- close(): 연결 등 자원 정리
+"""
+import asyncio
+import glob
+import os
+import threading
+from array import array
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from bloomberg_extract import ACTUAL_FIELD, FORECAST_FIELD, ColumnBuffer, bloomberg_ticker, with_previous
+from profiling import get_logger
+from storage import get_storage
+
+
+RAW_COLUMNS = ['date', 'indicator', 'country', 'forecast', 'actual']
+MERGE_KEYS = ['date', 'country', 'indicator']
+
+logger = get_logger('extract')
+
+
+class ExtractorSource:
+    """동기 추출기(BloombergExtractor / CachedExtractor 등 fetch를 가진 객체)를 실행기 스레드에서 실행하는 소스"""
+
+    def __init__(self, extractor, name='bloomberg'):
+        self.extractor = extractor
+        self.name = name
+        self.failed_securities = {}
+
+    async def fetch(self, series, start_date, end_date):
+        df = await asyncio.get_running_loop().run_in_executor(
+            None, self.extractor.fetch, series, start_date, end_date)
+        self.failed_securities = dict(self.extractor.failed_securities)
+        return df
+
+    def close(self):
+        pass
+
+
+class FileDropSource:
+    """
+    파일 드롭 디렉터리 소스 (.csv / .parquet, date/indicator/country/forecast/actual 컬럼)
+
+    파일들을 최대 max_workers개씩 동시에 읽고 요청한 시계열과 기간만 남깁니다.
+    드롭에 없는 시계열은 실패가 아니라 이 소스에 데이터가 없는 것으로 봅니다.
+    """
+
+    def __init__(self, directory, pattern='*.csv', max_workers=4, name=None):
+        """
+        Args:
+            directory: 드롭 디렉터리
+            pattern: 읽을 파일 glob 패턴
+            max_workers: 동시에 읽을 파일 수
+        """
+        self.directory = directory
+        self.pattern = pattern
+        self.max_workers = max_workers
+        self.name = name or f"files:{os.path.basename(os.path.normpath(directory))}"
+        self.failed_securities = {}
+
+    def _read(self, path, keys, start_date, end_date):
+        df = get_storage(path).read(path, columns=RAW_COLUMNS, start_date=start_date, end_date=end_date)
+        selected = pd.MultiIndex.from_arrays([df['indicator'].astype(str), df['country'].astype(str)]).isin(keys)
+        df = df[selected]
+        return df.assign(date=pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d'),
+                         indicator=df['indicator'].astype(str), country=df['country'].astype(str))
+
+    async def fetch(self, series, start_date, end_date):
+        paths = sorted(glob.glob(os.path.join(self.directory, self.pattern)))
+        keys = pd.MultiIndex.from_tuples(list(series.values()))
+        semaphore = asyncio.Semaphore(self.max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def read(path):
+            async with semaphore:
+                return await loop.run_in_executor(None, self._read, path, keys, start_date, end_date)
+
+        frames = await asyncio.gather(*(read(path) for path in paths))
+        self.failed_securities = {}
+        frames = [frame for frame in frames if len(frame)]
+        return pd.concat(frames, ignore_index=True) if frames else ColumnBuffer().to_frame()
+
+    def close(self):
+        pass
+
+
+class _HostPool:
+    """호스트별 keep-alive 연결 풀 (동시 요청 수를 limit개로 제한)"""
+
+    def __init__(self, host, port, limit):
+        self.host = host
+        self.port = port
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle = []
+
+    async def acquire(self):
+        """(reader, writer, 재사용 여부) - 유휴 연결이 있으면 재사용"""
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return reader, writer, False
+
+    def release(self, reader, writer, reusable):
+        if reusable:
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for _, writer in self.idle:
+            writer.close()
+        self.idle = []
+
+
+class _StaleConnection(Exception):
+    """재사용한 keep-alive 연결이 서버에서 이미 닫힌 경우 (새 연결로 다시 요청)"""
+
+
+class HTTPSource:
+    """
+    사내 REST 미러 소스 (asyncio HTTP/1.1 클라이언트)
+
+    - 호스트별 연결 풀: 응답을 끝까지 읽은 연결은 다음 요청에 재사용 (keep-alive)
+    - 호스트별 동시 요청 수 제한 (max_per_host), 미러가 여러 개면 시계열을 번갈아 배분
+    - 응답 본문(Content-Length / chunked)을 조각 단위로 읽어 행 객체 없이 컬럼 버퍼에 파싱
+    - 5xx / 연결 오류는 max_retries번 재시도, 404는 실패 종목으로 기록
+
+    요청은 소스 전용 이벤트 루프 스레드 하나에서 실행합니다. 여러 스레드(작업 그래프 I/O 작업마다
+    MultiSourceExtractor 루프 하나)에서 동시에 fetch해도 연결 풀과 호스트별 동시 요청 제한을 함께 쓰고,
+    failed_securities는 fetch를 호출한 스레드별로 기록합니다.
+    """
+
+    def __init__(self, base_urls, max_per_host=8, keep_alive=True, timeout=30.0, max_retries=2, name=None):
+        """
+        Args:
+            base_urls: 미러 주소 (예: 'http://mirror:8080') 또는 주소 목록
+            max_per_host: 호스트별 최대 동시 요청 수 (= 최대 연결 수)
+            keep_alive: False면 요청마다 새 연결 (벤치마크 비교용)
+            timeout: 요청당 응답 대기 시간(초)
+            max_retries: 실패 종목 재시도 횟수
+        """
+        self.base_urls = [base_urls] if isinstance(base_urls, str) else list(base_urls)
+        self.max_per_host = max_per_host
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.name = name or f"http:{urlsplit(self.base_urls[0]).netloc}"
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._active = 0
+        self._local = threading.local()
+
+    @property
+    def failed_securities(self):
+        """이 스레드의 마지막 fetch에서 실패한 {티커: 사유}"""
+        return getattr(self._local, 'failed_securities', {})
+
+    def _start(self):
+        """요청 루프 스레드 시작 (이미 실행 중이면 재사용) 후 진행 중인 fetch 수 증가"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=f"{self.name}-loop", daemon=True)
+                self._thread.start()
+            self._active += 1
+            return self._loop
+
+    def _pool(self, base_url):
+        url = urlsplit(base_url)
+        key = (url.hostname, url.port or 80)
+        if key not in self._pools:
+            self._pools[key] = _HostPool(url.hostname, url.port or 80, self.max_per_host)
+        return self._pools[key]
+
+    async def fetch(self, series, start_date, end_date):
+        loop = self._start()
+        try:
+            df, failed = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self._fetch(series, start_date, end_date), loop))
+        finally:
+            with self._lock:
+                self._active -= 1
+        self._local.failed_securities = failed
+        if failed:
+            logger.warning("⚠️  %s 추출 실패 종목 %d개: %s", self.name, len(failed), ', '.join(sorted(failed)))
+        return df
+
+    async def _fetch(self, series, start_date, end_date):
+        """요청 루프에서 모든 시계열 요청 - (DataFrame, {실패 티커: 사유})"""
+        buffer = ColumnBuffer()
+        failed = {}
+
+        async def fetch_series(i, ticker):
+            base_url = self.base_urls[i % len(self.base_urls)]
+            path = f"{urlsplit(base_url).path.rstrip('/')}/v1/history?security={quote(ticker)}" \
+                   f"&start={start_date}&end={end_date}"
+            error = None
+            for _ in range(self.max_retries + 1):
+                try:
+                    status, columns = await asyncio.wait_for(self._get(base_url, path), self.timeout)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                    error = f"{type(e).__name__}: {e}"
+                    continue
+                if status == 200:
+                    _extend(buffer, columns, *series[ticker])
+                    return
+                error = f"HTTP {status}"
+                if status < 500:
+                    break
+            failed[ticker] = error
+
+        await asyncio.gather(*(fetch_series(i, ticker) for i, ticker in enumerate(series)))
+        return buffer.to_frame(), failed
+
+    async def _get(self, base_url, path):
+        """GET 요청 - (상태 코드, 200이면 (date 목록, actual, forecast) 컬럼)"""
+        pool = self._pool(base_url)
+        async with pool.semaphore:
+            while True:
+                reader, writer, reused = await pool.acquire()
+                self.connections_opened += not reused
+                try:
+                    result, reusable = await self._exchange(reader, writer, pool, path, reused)
+                except _StaleConnection:
+                    writer.close()
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+                pool.release(reader, writer, reusable and self.keep_alive)
+                return result
+
+    async def _exchange(self, reader, writer, pool, path, reused):
+        connection = 'keep-alive' if self.keep_alive else 'close'
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {pool.host}:{pool.port}\r\n"
+                     f"Connection: {connection}\r\n\r\n".encode())
+        self.requests_sent += 1
+        try:
+            await writer.drain()
+            status_line = await reader.readline()
+        except ConnectionError:
+            if reused:
+                raise _StaleConnection()
+            raise
+        if not status_line:
+            if reused:
+                raise _StaleConnection()
+            raise ConnectionError("응답 없이 연결이 닫혔습니다")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        parser = _CSVColumns() if status == 200 else None
+        async for chunk in _body(reader, headers):
+            if parser is not None:
+                parser.feed(chunk)
+        reusable = headers.get('connection', '').lower() != 'close'
+        return (status, parser.close() if parser is not None else None), reusable
+
+    async def _shutdown(self):
+        for pool in self._pools.values():
+            pool.close()
+        self._pools = {}
+        # 닫은 연결의 transport 정리 콜백 실행
+        await asyncio.sleep(0)
+
+    def close(self):
+        """
+        연결을 닫고 요청 루프 스레드 종료
+
+        다른 스레드의 fetch가 진행 중이면 연결 풀을 그대로 둡니다 (마지막으로 닫는 추출기가 정리).
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or self._active:
+                return
+            self._loop = self._thread = None
+        asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+async def _body(reader, headers):
+    """응답 본문을 조각 단위로 읽기 (chunked / Content-Length / 연결 종료까지)"""
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                # 마지막 조각 뒤 trailer 헤더와 빈 줄
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readexactly(2)
+    elif 'content-length' in headers:
+        remaining = int(headers['content-length'])
+        while remaining:
+            chunk = await reader.read(min(remaining, 65536))
+            if not chunk:
+                raise asyncio.IncompleteReadError(b'', remaining)
+            remaining -= len(chunk)
+            yield chunk
+    else:
+        while chunk := await reader.read(65536):
+            yield chunk
+
+
+class _CSVColumns:
+    """CSV 응답 조각을 받는 대로 date / actual / forecast 컬럼에 파싱 (조각 경계의 행은 이어 붙임)"""
+
+    def __init__(self):
+        self.date = []
+        self.actual = array('d')
+        self.forecast = array('d')
+        self._positions = None
+        self._rest = b''
+
+    def feed(self, chunk):
+        lines = (self._rest + chunk).split(b'\n')
+        self._rest = lines.pop()
+        for line in lines:
+            self._line(line)
+
+    def _line(self, line):
+        fields = line.rstrip(b'\r').decode().split(',')
+        if self._positions is None:
+            self._positions = [fields.index(name) for name in ('date', ACTUAL_FIELD, FORECAST_FIELD)]
+            return
+        if len(fields) < 2:
+            return
+        date_at, actual_at, forecast_at = self._positions
+        self.date.append(fields[date_at])
+        self.actual.append(float(fields[actual_at]) if fields[actual_at] else np.nan)
+        self.forecast.append(float(fields[forecast_at]) if fields[forecast_at] else np.nan)
+
+    def close(self):
+        if self._rest:
+            self._line(self._rest)
+            self._rest = b''
+        return self.date, self.actual, self.forecast
+
+
+def _extend(buffer, columns, indicator, country):
+    """한 시계열 응답 컬럼을 공유 버퍼에 추가 (응답을 모두 받은 뒤 추가하므로 재시도해도 중복 없음)"""
+    dates, actual, forecast = columns
+    buffer.date.extend(dates)
+    buffer.indicator.extend([indicator] * len(dates))
+    buffer.country.extend([country] * len(dates))
+    buffer.actual.extend(actual)
+    buffer.forecast.extend(forecast)
+
+
+def merge_sources(frames):
+    """
+    소스별 추출 결과를 (date, country, indicator) 기준으로 합침
+
+    Args:
+        frames: 우선순위 순서의 DataFrame 목록 (같은 키는 앞 소스의 행 사용)
+
+    Returns:
+        date, indicator, country, forecast, actual DataFrame (previous는 with_previous로 계산)
+    """
+    frames = [frame[RAW_COLUMNS] for frame in frames if len(frame)]
+    if not frames:
+        return ColumnBuffer().to_frame()
+    merged = pd.concat(frames, ignore_index=True)
+    return merged[~merged.duplicated(MERGE_KEYS, keep='first')].reset_index(drop=True)
+
+
+class MultiSourceExtractor:
+    """
+    여러 소스를 동시에 추출하여 합치는 추출기 (BloombergExtractor와 같은 extract / fetch 인터페이스)
+
+    이벤트 루프 하나를 추출기 수명 동안 유지하여 반복 추출(상주 데몬)마다 루프를 새로 만들지 않습니다.
+    CachedExtractor로 감싸면 캐시에 없는 구간만 소스들에서 가져옵니다.
+    """
+
+    def __init__(self, sources):
+        """
+        Args:
+            sources: 우선순위 순서의 소스 목록
+        """
+        if not sources:
+            raise ValueError("추출 소스를 하나 이상 지정해야 합니다.")
+        self.sources = list(sources)
+        self.failed_securities = {}
+        self.source_rows = {}
+        self._loop = None
+
+    def extract(self, indicators, countries, start_date, end_date):
+        """모든 (지표, 국가) 시계열 추출 - date, indicator, country, forecast, actual, previous DataFrame"""
+        series = {bloomberg_ticker(indicator, country): (indicator, country)
+                  for country in countries for indicator in indicators}
+        return with_previous(self.fetch(series, start_date, end_date))
+
+    def fetch(self, series, start_date, end_date):
+        """
+        지정한 티커들의 기간 데이터를 모든 소스에서 동시에 요청하여 합침 (previous 없음)
+
+        어느 소스에서도 데이터를 받지 못한 티커만 failed_securities에 소스별 사유와 함께 기록합니다.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        frames = self._loop.run_until_complete(self._fetch_all(series, start_date, end_date))
+        self.source_rows = {source.name: len(frame) for source, frame in zip(self.sources, frames)}
+
+        merged = merge_sources(frames)
+        received = set(zip(merged['indicator'], merged['country']))
+        self.failed_securities = {}
+        for ticker, key in series.items():
+            if key in received:
+                continue
+            reasons = [f"{source.name}: {source.failed_securities[ticker]}"
+                       for source in self.sources if ticker in source.failed_securities]
+            if reasons:
+                self.failed_securities[ticker] = '; '.join(reasons)
+        if self.failed_securities:
+            logger.warning("⚠️  모든 소스에서 추출 실패한 종목 %d개: %s", len(self.failed_securities),
+                           ', '.join(sorted(self.failed_securities)))
+        return merged
+
+    async def _fetch_all(self, series, start_date, end_date):
+        async def timed(source):
+            start = self._loop.time()
+            df = await source.fetch(series, start_date, end_date)
+            logger.info("📥 %s: %d개 레코드 (%.2f초)", source.name, len(df), self._loop.time() - start)
+            return df
+
+        return await asyncio.gather(*(timed(source) for source in self.sources))
+
+    def close(self):
+        for source in self.sources:
+            source.close()
+        if self._loop is not None:
+            # 닫은 연결의 transport 정리 콜백 실행 후 루프 종료
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,222 @@
+"""
+테스트/벤치마크용 블룸버그 API(blpapi) 대체 모듈
+블룸버그 단말기 없이 //blp/refdata HistoricalDataRequest를 프로세스 내에서 흉내냅니다.
+
+blpapi와 같은 이름(SessionOptions, Session, Event, CorrelationId)을 제공하므로
+BloombergETL(bloomberg_api=fake_blpapi)처럼 모듈 자체를 주입해 사용합니다.
+요청마다 백그라운드 스레드가 지연(latency) 후 응답을 페이지 단위 PARTIAL_RESPONSE 이벤트로 나누어 보냅니다.
+"""
+import hashlib
+import queue
+import threading
+import time
+from datetime import date
+
+
+class Event:
+    """blpapi.Event 이벤트 타입"""
+
+    PARTIAL_RESPONSE = 6
+    RESPONSE = 5
+    REQUEST_STATUS = 4
+    TIMEOUT = 10
+
+    def __init__(self, event_type, messages=()):
+        self._event_type = event_type
+        self._messages = list(messages)
+
+    def eventType(self):
+        return self._event_type
+
+    def __iter__(self):
+        return iter(self._messages)
+
+
+class CorrelationId:
+    def __init__(self, value):
+        self._value = value
+
+    def value(self):
+        return self._value
+
+
+class Element:
+    """blpapi.Element의 최소 구현 (dict/list 기반)"""
+
+    def __init__(self, value):
+        self._value = value
+
+    def hasElement(self, name):
+        return name in self._value
+
+    def getElement(self, name):
+        return Element(self._value[name])
+
+    def getElementAsString(self, name):
+        return str(self._value[name])
+
+    def getElementAsFloat(self, name):
+        return float(self._value[name])
+
+    def getElementAsDatetime(self, name):
+        return self._value[name]
+
+    def numValues(self):
+        return len(self._value)
+
+    def getValueAsElement(self, index):
+        return Element(self._value[index])
+
+
+class Message:
+    def __init__(self, correlation_id, body):
+        self._correlation_id = correlation_id
+        self._body = Element(body)
+
+    def correlationIds(self):
+        return [self._correlation_id]
+
+    def hasElement(self, name):
+        return self._body.hasElement(name)
+
+    def getElement(self, name):
+        return self._body.getElement(name)
+
+
+class Request:
+    def __init__(self):
+        self.securities = []
+        self.fields = []
+        self.params = {}
+
+    def append(self, name, value):
+        getattr(self, name).append(value)
+
+    def set(self, name, value):
+        self.params[name] = value
+
+
+class Service:
+    def createRequest(self, name):
+        if name != 'HistoricalDataRequest':
+            raise ValueError(f"지원하지 않는 요청입니다: {name}")
+        return Request()
+
+
+class SessionOptions:
+    def setServerHost(self, host):
+        self.host = host
+
+    def setServerPort(self, port):
+        self.port = port
+
+
+def fake_history(ticker, start, end):
+    """
+    티커별 결정적 월별 발표 데이터 생성 (매월 15일)
+
+    Returns:
+        [{'date': date, 'PX_LAST': float, 'ECO_FUTURE_MEDIAN': float}, ...]
+    """
+    seed = int(hashlib.md5(ticker.encode()).hexdigest()[:8], 16)
+    base = 1 + (seed % 900) / 100
+    rows = []
+    current = date(start.year, start.month, 15)
+    if current < start:
+        current = date(current.year + current.month // 12, current.month % 12 + 1, 15)
+    while current <= end:
+        step = ((seed >> (current.month % 16)) % 21 - 10) / 100
+        actual = round(base + step * (current.year % 7), 2)
+        rows.append({
+            'date': current,
+            'PX_LAST': actual,
+            'ECO_FUTURE_MEDIAN': round(actual - step / 2, 2),
+        })
+        current = date(current.year + current.month // 12, current.month % 12 + 1, 15)
+    return rows
+
+
+class Session:
+    """
+    프로세스 내 가짜 refdata 세션
+
+    클래스 속성으로 동작을 조정합니다 (테스트에서 서브클래스나 인스턴스 속성으로 변경).
+    latency: 요청당 응답 지연(초), latency_per_security: 종목당 추가 처리 시간(초),
+    page_size: PARTIAL_RESPONSE 이벤트당 종목 수,
+    failures: {티커: 실패 횟수} - 해당 횟수만큼 securityError 응답
+    """
+
+    latency = 0.05
+    latency_per_security = 0.0
+    page_size = 10
+    failures = {}
+
+    def __init__(self, options=None):
+        self.options = options
+        self._events = queue.Queue()
+        self._lock = threading.Lock()
+        self._remaining_failures = dict(self.failures)
+        self.requests_sent = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+
+    def start(self):
+        return True
+
+    def stop(self):
+        return True
+
+    def openService(self, name):
+        return name == '//blp/refdata'
+
+    def getService(self, name):
+        return Service()
+
+    def sendRequest(self, request, correlationId=None):
+        with self._lock:
+            self.requests_sent += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        threading.Thread(target=self._respond, args=(request, correlationId), daemon=True).start()
+        return correlationId
+
+    def _should_fail(self, ticker):
+        with self._lock:
+            remaining = self._remaining_failures.get(ticker, 0)
+            if remaining:
+                self._remaining_failures[ticker] = remaining - 1
+            return remaining > 0
+
+    def _respond(self, request, correlation_id):
+        time.sleep(self.latency + self.latency_per_security * len(request.securities))
+        start = _parse_date(request.params['startDate'])
+        end = _parse_date(request.params['endDate'])
+
+        messages = []
+        for sequence, ticker in enumerate(request.securities):
+            security = {'security': ticker, 'sequenceNumber': sequence}
+            if self._should_fail(ticker):
+                security['securityError'] = {'category': 'BAD_SEC', 'message': 'Unknown/Invalid security'}
+            else:
+                security['fieldData'] = [
+                    {'date': row['date'], **{field: row[field] for field in request.fields if field in row}}
+                    for row in fake_history(ticker, start, end)
+                ]
+            messages.append(Message(correlation_id, {'securityData': security}))
+
+        pages = [messages[i:i + self.page_size] for i in range(0, len(messages), self.page_size)] or [[]]
+        with self._lock:
+            self._in_flight -= 1
+        for page in pages[:-1]:
+            self._events.put(Event(Event.PARTIAL_RESPONSE, page))
+        self._events.put(Event(Event.RESPONSE, pages[-1]))
+
+    def nextEvent(self, timeout=0):
+        try:
+            return self._events.get(timeout=timeout / 1000 if timeout else None)
+        except queue.Empty:
+            return Event(Event.TIMEOUT)
+
+
+def _parse_date(value):
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
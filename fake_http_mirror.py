@@ -0,0 +1,169 @@
+"""
+테스트/벤치마크용 사내 REST 미러 대체 서버
+블룸버그 미러의 과거 데이터 API를 로컬 스레드 HTTP 서버로 흉내냅니다.
+fake_blpapi와 같은 시계열(fake_history)을 응답하므로 두 소스의 추출 결과를 그대로 비교할 수 있습니다.
+
+    GET /v1/history?security=CPI%20US%20Index&start=2024-01-01&end=2024-12-31
+    -> 200 text/csv (HTTP/1.1 keep-alive, chunked 전송)
+       date,PX_LAST,ECO_FUTURE_MEDIAN
+       2024-01-15,3.21,3.16
+
+    with FakeMirrorServer(latency=0.01) as server:
+        source = HTTPSource(server.url)
+"""
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from bloomberg_extract import ACTUAL_FIELD, FORECAST_FIELD
+from fake_blpapi import fake_history
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # chunked 조각을 나누어 쓰므로 Nagle 알고리즘을 끄지 않으면 keep-alive 연결에서 지연 ACK만큼 대기
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.mirror._count('connections')
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        mirror = self.server.mirror
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        mirror._enter()
+        try:
+            time.sleep(mirror.latency)
+            ticker = params.get('security')
+            if url.path != '/v1/history' or not ticker:
+                return self._reply(400, b'security is required\n')
+            if ticker in mirror.missing:
+                return self._reply(404, b'Unknown/Invalid security\n')
+            if mirror._should_fail(ticker):
+                return self._reply(503, b'mirror busy\n')
+            rows = fake_history(ticker, date.fromisoformat(params['start']), date.fromisoformat(params['end']))
+            self._stream(rows)
+        finally:
+            mirror._leave()
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, rows):
+        """chunked 전송으로 page_rows행씩 나누어 응답"""
+        page_rows = self.server.mirror.page_rows
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/csv')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        lines = [f"date,{ACTUAL_FIELD},{FORECAST_FIELD}\n"]
+        lines += [f"{row['date'].isoformat()},{row[ACTUAL_FIELD]},{row[FORECAST_FIELD]}\n" for row in rows]
+        for i in range(0, len(lines), page_rows):
+            chunk = ''.join(lines[i:i + page_rows]).encode()
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        self.wfile.write(b'0\r\n\r\n')
+
+
+class _MirrorHTTPServer(ThreadingHTTPServer):
+    # 기본 listen backlog(5)로는 동시 연결이 많을 때 SYN 재전송(1초) 대기가 생김
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeMirrorServer:
+    """
+    로컬 REST 미러 서버 (백그라운드 스레드, 요청마다 처리 스레드)
+
+    latency: 요청당 응답 지연(초), page_rows: chunked 전송 조각당 행 수,
+    failures: {티커: 실패 횟수} - 해당 횟수만큼 503 응답, missing: 404로 응답할 티커
+    통계: requests(요청 수), connections(연결 수), max_concurrent(최대 동시 처리 요청 수)
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, page_rows=64, failures=None, missing=()):
+        self.latency = latency
+        self.page_rows = page_rows
+        self.missing = set(missing)
+        self._remaining_failures = dict(failures or {})
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        self.max_concurrent = 0
+        self._concurrent = 0
+        self._server = _MirrorHTTPServer((host, port), _MirrorHandler)
+        self._server.mirror = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _enter(self):
+        with self._lock:
+            self.requests += 1
+            self._concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self._concurrent)
+
+    def _leave(self):
+        with self._lock:
+            self._concurrent -= 1
+
+    def _should_fail(self, ticker):
+        with self._lock:
+            remaining = self._remaining_failures.get(ticker, 0)
+            if remaining:
+                self._remaining_failures[ticker] = remaining - 1
+            return remaining > 0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="테스트/벤치마크용 REST 미러 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help='0이면 빈 포트 선택')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 응답 지연(초)')
+    parser.add_argument('--page-rows', type=int, default=64, help='chunked 전송 조각당 행 수')
+    args = parser.parse_args()
+
+    server = FakeMirrorServer(args.host, args.port, latency=args.latency, page_rows=args.page_rows)
+    # 벤치마크가 주소를 읽을 수 있도록 첫 줄에 출력
+    print(server.url, flush=True)
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+시계열 파생 지표(feature) 엔진
+(국가, 지표) 시계열별 이동 평균/표준편차, 서프라이즈 z-score, 자체 이력 기반 변화량,
+전년 동월 대비 변화, 지표·날짜별 국가 순위를 계산합니다.
+
+모든 계산은 (시계열, 날짜) 순으로 정렬한 배열에 누적합과 인덱스 연산을 적용하여
+그룹별 Python 반복 없이 처리합니다. extend_features는 새로 추가된 행과 필요한 이전 구간만 다시 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+# 이동 통계 구간 (발표 횟수)
+FEATURE_WINDOW = 12
+
+FEATURE_COLUMNS = ['actual_change', 'error_roll_mean', 'error_roll_std', 'surprise_zscore',
+                   'yoy_change', 'yoy_change_pct', 'country_rank']
+
+SERIES_COLUMNS = ['country', 'indicator']
+
+
+def _series_codes(df):
+    """(국가, 지표) 시계열 번호 - Categorical이면 코드 연산으로 계산"""
+    country, indicator = df['country'], df['indicator']
+    if isinstance(country.dtype, pd.CategoricalDtype) and isinstance(indicator.dtype, pd.CategoricalDtype):
+        return (country.cat.codes.to_numpy(dtype=np.int64) * len(indicator.cat.categories)
+                + indicator.cat.codes.to_numpy(dtype=np.int64))
+    return df.groupby(SERIES_COLUMNS, observed=True, sort=False).ngroup().to_numpy()
+
+
+def _series_order(df):
+    """(시계열 번호, 정렬 순서) - 시계열 내부는 날짜 순"""
+    series = _series_codes(df)
+    dates = df['date'].to_numpy().astype('datetime64[ns]').view(np.int64)
+    return series, np.lexsort((dates, series))
+
+
+def _window_stats(values, position, window, exclude_current=False):
+    """
+    시계열별 최근 window개 값의 (평균, 표본 표준편차) - 정렬된 배열 기준
+
+    Args:
+        values: (시계열, 날짜) 순으로 정렬된 값 (NaN은 제외하고 계산)
+        position: 각 행의 시계열 내 순번 (0부터)
+        exclude_current: True면 현재 행을 제외한 직전 window개로 계산
+    """
+    valid = ~np.isnan(values)
+    # 누적합 오차를 줄이기 위해 전체 평균을 빼고 계산
+    center = values[valid].mean() if valid.any() else 0.0
+    x = np.where(valid, values - center, 0.0)
+
+    def cumulative(array):
+        return np.concatenate([[0.0], np.cumsum(array)])
+
+    total, squares, count = cumulative(x), cumulative(x * x), cumulative(valid.astype(np.float64))
+
+    index = np.arange(len(values))
+    hi = index if exclude_current else index + 1
+    lo = hi - np.minimum(position + (0 if exclude_current else 1), window)
+
+    n = count[hi] - count[lo]
+    s = total[hi] - total[lo]
+    s2 = squares[hi] - squares[lo]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(n >= 1, s / n, np.nan)
+        variance = np.where(n >= 2, (s2 - s * s / n) / (n - 1), np.nan)
+    return mean + center, np.sqrt(np.clip(variance, 0, None))
+
+
+def _series_features(df, window):
+    """시계열 단위 feature (순위 제외), 입력 행 순서로 반환"""
+    series, order = _series_order(df)
+    series = series[order]
+    actual = df['actual'].to_numpy(dtype=np.float64)[order]
+    error = df['forecast_error'].to_numpy(dtype=np.float64)[order]
+
+    # 시계열 시작 위치와 시계열 내 순번
+    starts = np.flatnonzero(np.r_[True, series[1:] != series[:-1]])
+    lengths = np.diff(np.r_[starts, len(series)])
+    position = np.arange(len(series)) - np.repeat(starts, lengths)
+
+    # 자체 이력 기반 직전 발표 대비 변화
+    previous = np.r_[np.nan, actual[:-1]]
+    actual_change = np.where(position > 0, actual - previous, np.nan)
+
+    # 예측 오차 이동 평균/표준편차, 직전 구간 대비 z-score
+    error_mean, error_std = _window_stats(error, position, window)
+    prior_mean, prior_std = _window_stats(error, position, window, exclude_current=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        surprise_zscore = np.where(prior_std > 0, (error - prior_mean) / prior_std, np.nan)
+
+    # 전년 동월 대비: (시계열, 연*12+월) 키로 12개월 전 값 조회
+    dates = pd.DatetimeIndex(df['date'].to_numpy()[order])
+    month = dates.year.to_numpy(dtype=np.int64) * 12 + dates.month.to_numpy(dtype=np.int64) - 1
+    keys = pd.Index(series.astype(np.int64) * 1_000_000 + month)
+    last = ~keys.duplicated(keep='last')
+    lookup = pd.Index(keys[last]).get_indexer(series.astype(np.int64) * 1_000_000 + month - 12)
+    year_ago = np.where(lookup >= 0, actual[last][lookup], np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yoy_change = actual - year_ago
+        yoy_change_pct = np.round(yoy_change / year_ago * 100, 2)
+
+    features = {
+        'actual_change': actual_change,
+        'error_roll_mean': error_mean,
+        'error_roll_std': error_std,
+        'surprise_zscore': surprise_zscore,
+        'yoy_change': yoy_change,
+        'yoy_change_pct': yoy_change_pct,
+    }
+    # 정렬 순서 -> 입력 행 순서
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(len(order))
+    return {name: values[inverse] for name, values in features.items()}
+
+
+def _country_rank(df):
+    """지표·날짜별 실제치 국가 순위 (높은 값이 1위)"""
+    return df.groupby(['indicator', 'date'], observed=True)['actual'].rank(
+        method='min', ascending=False).to_numpy()
+
+
+def compute_features(df, window=FEATURE_WINDOW):
+    """
+    전체 이력에 대해 feature 계산
+
+    Args:
+        df: date, country, indicator, actual, forecast_error 컬럼을 가진 DataFrame (transform 결과)
+        window: 이동 통계 구간 (발표 횟수)
+
+    Returns:
+        DataFrame: 입력 컬럼 + FEATURE_COLUMNS (입력과 같은 행 순서/인덱스)
+    """
+    features = _series_features(df, window)
+    features['country_rank'] = _country_rank(df)
+    return df.assign(**features)
+
+
+def extend_features(featured, new_rows, window=FEATURE_WINDOW):
+    """
+    feature가 계산된 이력에 새 행을 추가
+
+    새 행이 속한 시계열의 마지막 window + 1개 발표와 12개월 이전 구간만 다시 읽어 새 행의 feature를 계산하고,
+    새 행이 추가된 (지표, 날짜)의 국가 순위만 다시 매깁니다.
+    새 행이 기존 시계열의 마지막 발표일 이전 날짜를 포함하면 전체를 다시 계산합니다.
+
+    Args:
+        featured: compute_features / extend_features 결과
+        new_rows: featured와 같은 입력 컬럼을 가진 새 행
+
+    Returns:
+        DataFrame: featured 행 뒤에 new_rows를 붙인 결과 (인덱스 새로 부여)
+    """
+    base_columns = [column for column in featured.columns if column not in FEATURE_COLUMNS]
+    combined = pd.concat([featured, new_rows], ignore_index=True)
+    is_new = np.r_[np.zeros(len(featured), dtype=bool), np.ones(len(new_rows), dtype=bool)]
+    for column in SERIES_COLUMNS:
+        if isinstance(featured[column].dtype, pd.CategoricalDtype):
+            combined[column] = combined[column].astype('category')
+
+    # 시계열 번호 (이력 + 새 행 공통)
+    series = _series_codes(combined)
+    dates = combined['date']
+    new_series = np.unique(series[is_new])
+
+    # 새 행이 이력 중간에 끼어들면 이후 행 feature가 바뀌므로 전체 재계산
+    last_date = dates[~is_new].groupby(series[~is_new]).max()
+    first_new = dates[is_new].groupby(series[is_new]).min()
+    overlap = last_date.reindex(first_new.index)
+    if (overlap.notna() & (first_new <= overlap)).any():
+        return compute_features(combined[base_columns], window)
+
+    # 새 행 시계열의 이전 구간: 마지막 window + 1개 발표, 새 행 첫 날짜 12개월 전 이후
+    history = ~is_new & np.isin(series, new_series)
+    from_end = dates[history].groupby(series[history]).rank(method='first', ascending=False)
+    year_before = (first_new.dt.to_period('M') - 12).dt.to_timestamp().reindex(series[history]).to_numpy()
+    context = np.zeros(len(combined), dtype=bool)
+    context[np.flatnonzero(history)] = (from_end.to_numpy() <= window + 1) | \
+        (dates[history].to_numpy() >= year_before)
+
+    subset = combined[context | is_new]
+    features = _series_features(subset[base_columns], window)
+    subset_new = is_new[context | is_new]
+    for name, values in features.items():
+        combined.loc[is_new, name] = values[subset_new]
+
+    # 새 행이 추가된 (지표, 날짜)의 국가 순위 재계산
+    touched = pd.MultiIndex.from_frame(combined.loc[is_new, ['indicator', 'date']]).unique()
+    in_touched = pd.MultiIndex.from_frame(combined[['indicator', 'date']]).isin(touched)
+    combined.loc[in_touched, 'country_rank'] = _country_rank(combined[in_touched])
+    return combined
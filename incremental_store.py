@@ -0,0 +1,196 @@
+"""
+증분 ETL용 분할 저장소
+변환 결과를 지표 × 월 단위 파티션으로 저장하고, (국가, 지표)별 워터마크를 관리합니다.
+"""
+import json
+import os
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from storage import CSVStorage
+
+
+KEY_COLUMNS = ['date', 'country', 'indicator']
+RAW_VALUE_COLUMNS = ['forecast', 'actual', 'previous']
+WATERMARK_FILE = '_watermarks.json'
+
+
+def _atomic_write(path, write):
+    """임시 파일에 쓴 뒤 교체하여 중간 실패 시 기존 파일을 보존"""
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class PartitionedStore:
+    """indicator=<지표>/month=<YYYY-MM>.<확장자> 형태로 분할 저장된 ETL 결과"""
+
+    def __init__(self, root, storage=None):
+        """
+        Args:
+            root: 파티션과 워터마크 파일을 저장할 디렉터리
+            storage: 파티션 파일 저장소 백엔드 (기본: CSVStorage)
+        """
+        self.root = root
+        self.storage = storage if storage is not None else CSVStorage()
+
+    # 워터마크
+
+    def load_watermarks(self):
+        """(country, indicator) -> 마지막으로 적재한 발표일(Timestamp)"""
+        path = os.path.join(self.root, WATERMARK_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            stored = json.load(f)
+        return {tuple(key.split('|', 1)): pd.Timestamp(value) for key, value in stored.items()}
+
+    def save_watermarks(self, watermarks):
+        os.makedirs(self.root, exist_ok=True)
+        stored = {f"{country}|{indicator}": value.strftime('%Y-%m-%d')
+                  for (country, indicator), value in sorted(watermarks.items())}
+
+        def write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(stored, f, ensure_ascii=False, indent=2)
+
+        _atomic_write(os.path.join(self.root, WATERMARK_FILE), write)
+
+    # 파티션
+
+    def partition_path(self, indicator, month):
+        return os.path.join(self.root, f"indicator={quote(str(indicator), safe=' ')}", f"month={month}{self.storage.extension}")
+
+    def partitions(self):
+        """저장된 (indicator, month) 파티션 목록"""
+        if not os.path.isdir(self.root):
+            return []
+        result = []
+        for indicator_dir in sorted(os.listdir(self.root)):
+            if not indicator_dir.startswith('indicator='):
+                continue
+            indicator = unquote(indicator_dir[len('indicator='):])
+            for name in sorted(os.listdir(os.path.join(self.root, indicator_dir))):
+                if name.startswith('month=') and name.endswith(self.storage.extension):
+                    result.append((indicator, name[len('month='):-len(self.storage.extension)]))
+        return result
+
+    def read_partition(self, indicator, month):
+        path = self.partition_path(indicator, month)
+        if not os.path.exists(path):
+            return None
+        return self.storage.read(path)
+
+    def read_all(self):
+        """전체 파티션을 (date, country, indicator) 순으로 읽기"""
+        frames = [self.read_partition(indicator, month) for indicator, month in self.partitions()]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True).sort_values(KEY_COLUMNS, ignore_index=True)
+
+    @staticmethod
+    def _months(df):
+        return pd.to_datetime(df['date']).dt.strftime('%Y-%m')
+
+    def read_history(self, first_dates, releases, months):
+        """
+        시계열별 기준일 이후 저장된 행과 기준일 이전 이력 꼬리 읽기 (feature 증분 계산용)
+
+        지표마다 가장 이른 기준일의 months개월 전 파티션부터 마지막 파티션까지 읽고, 기준일 이전 발표가
+        releases개보다 적은 시계열이 있으면 그 이전 파티션을 한 달씩 더 읽습니다.
+        파티션 단위로 읽으므로 같은 지표의 다른 국가 행도 함께 읽습니다.
+
+        Args:
+            first_dates: {(country, indicator): 기준일(Timestamp)}
+            releases: 기준일 이전에 필요한 시계열별 발표 수
+            months: 기준일 이전에 필요한 개월 수
+
+        Returns:
+            DataFrame (읽은 파티션이 없으면 빈 DataFrame)
+        """
+        stored_months = {}
+        for indicator, month in self.partitions():
+            stored_months.setdefault(indicator, []).append(month)
+
+        frames = []
+        for indicator in sorted({indicator for _, indicator in first_dates}):
+            dates = {country: date for (country, key), date in first_dates.items() if key == indicator}
+            floor = (min(dates.values()).to_period('M') - months).strftime('%Y-%m')
+            available = stored_months.get(indicator, [])
+            earlier = [month for month in available if month < floor]
+            parts = [self.read_partition(indicator, month) for month in available if month >= floor]
+            while earlier:
+                loaded = pd.concat(parts) if parts else None
+                if loaded is not None and all(
+                        ((loaded['country'] == country) & (loaded['date'] < date)).sum() >= releases
+                        for country, date in dates.items()):
+                    break
+                parts.insert(0, self.read_partition(indicator, earlier.pop()))
+            frames += parts
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def lookup(self, keys, columns=RAW_VALUE_COLUMNS):
+        """
+        (date, country, indicator) 키의 저장된 값 - keys와 같은 인덱스, 저장되지 않은 키는 NaN
+
+        키가 속한 파티션만 읽습니다.
+        """
+        dates = pd.to_datetime(keys['date'])
+        frames = [pd.DataFrame(columns=columns, index=keys.index[:0], dtype='float64')]
+        for (indicator, month), group in keys.groupby([keys['indicator'], self._months(keys)], sort=False):
+            stored = self.read_partition(indicator, month)
+            if stored is None:
+                continue
+            merged = pd.DataFrame({
+                'date': dates[group.index], 'country': group['country'], 'indicator': group['indicator'],
+            }).merge(stored[KEY_COLUMNS + list(columns)], on=KEY_COLUMNS, how='left')
+            frames.append(merged[list(columns)].set_axis(group.index))
+        return pd.concat(frames).reindex(keys.index)
+
+    def changed_rows(self, raw):
+        """
+        이미 적재된 기간의 원시 행 중 저장된 값과 달라진(재발표된) 행만 반환
+
+        비교 대상 파티션만 읽으므로 비용은 해당 행이 속한 파티션 수에 비례합니다.
+        """
+        if raw.empty:
+            return raw
+        raw_dates = pd.to_datetime(raw['date'])
+        changed = []
+        for (indicator, month), group in raw.groupby([raw['indicator'], self._months(raw)], sort=False):
+            stored = self.read_partition(indicator, month)
+            if stored is None:
+                changed.append(group)
+                continue
+            merged = pd.DataFrame({
+                'date': raw_dates[group.index], 'country': group['country'], 'indicator': group['indicator'],
+            }).merge(stored[KEY_COLUMNS + RAW_VALUE_COLUMNS], on=KEY_COLUMNS, how='left')
+            differs = pd.Series(False, index=group.index)
+            for column in RAW_VALUE_COLUMNS:
+                new_values = group[column].to_numpy()
+                old_values = merged[column].to_numpy()
+                differs |= ~((new_values == old_values) | (pd.isna(new_values) & pd.isna(old_values)))
+            changed.append(group[differs.to_numpy()])
+        return pd.concat(changed)
+
+    def write(self, transformed):
+        """
+        변환된 행을 해당 파티션에 병합 (같은 키는 새 값으로 교체)
+
+        Returns:
+            다시 쓴 (indicator, month) 파티션 목록
+        """
+        rewritten = []
+        for (indicator, month), group in transformed.groupby(
+                [transformed['indicator'].astype(str), self._months(transformed)], sort=True):
+            existing = self.read_partition(indicator, month)
+            merged = group if existing is None else pd.concat([existing, group], ignore_index=True)
+            merged = (merged.drop_duplicates(KEY_COLUMNS, keep='last')
+                      .sort_values(['date', 'country'], ignore_index=True))
+
+            path = self.partition_path(indicator, month)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _atomic_write(path, lambda tmp: self.storage.write(merged, tmp))
+            rewritten.append((indicator, month))
+        return rewritten
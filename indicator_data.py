@@ -0,0 +1,332 @@
+"""
+경제지표 대시보드용 ETL 결과 접근 계층
+ETL 출력은 파일이 바뀐 경우에만 다시 읽고, 필터링과 집계는 서버에서 처리하여
+차트에 필요한 점만 브라우저로 보냅니다.
+
+여러 워커 프로세스로 서비스할 때 shared_dir를 지정하면 합친 결과를 Arrow IPC 스냅샷 파일로 한 번 기록하고,
+다른 워커는 파일을 다시 파싱하지 않고 메모리 매핑으로 공유합니다 (페이지 캐시를 공유하므로 워커 수만큼 복사되지 않음).
+"""
+import fcntl
+import glob
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from incremental_store import PartitionedStore
+from storage import get_storage
+
+
+DASHBOARD_COLUMNS = [
+    'date', 'country', 'indicator', 'forecast', 'actual',
+    'forecast_error_pct', 'surprise', 'trend', 'forecast_accuracy',
+]
+CATEGORY_COLUMNS = ['country', 'indicator', 'surprise', 'trend']
+
+# 스냅샷 파일 형식이 바뀌면 올려서 이전 스냅샷을 무효화
+SNAPSHOT_VERSION = 1
+
+
+def _empty_frame():
+    df = pd.DataFrame({column: pd.Series(dtype=float) for column in DASHBOARD_COLUMNS})
+    df['date'] = pd.Series(dtype='datetime64[ns]')
+    for column in CATEGORY_COLUMNS:
+        df[column] = pd.Categorical([])
+    return df
+
+
+class ETLOutputSource:
+    """
+    ETL 결과 파일 변경 감지 캐시
+
+    파일마다 (수정 시각, 크기)를 기억하여 바뀐 파일만 다시 읽습니다.
+    run_incremental의 분할 저장 디렉터리를 지정하면 갱신된 지표 × 월 파티션만 다시 읽고,
+    Parquet 파일은 메모리 매핑으로 읽습니다.
+    """
+
+    def __init__(self, path, storage=None, shared_dir=None):
+        """
+        Args:
+            path: ETL 결과 파일 (.csv / .parquet) 또는 분할 저장 디렉터리
+            storage: 분할 저장 디렉터리의 파티션 저장소 백엔드 (기본: CSVStorage)
+            shared_dir: 워커 간 공유 Arrow 스냅샷 디렉터리 (None이면 프로세스마다 파일을 읽음, pyarrow 필요)
+        """
+        self.path = path
+        self.storage = storage
+        self.shared_dir = shared_dir
+        self.version = 0
+        self.file_reads = 0
+        self.snapshot_maps = 0
+        self._stats = None
+        self._frames = {}
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _files(self):
+        """(파티션 키 -> 파일 경로), 단일 파일이면 키는 None"""
+        if os.path.isdir(self.path):
+            store = PartitionedStore(self.path, self.storage)
+            return {partition: store.partition_path(*partition) for partition in store.partitions()}
+        if os.path.exists(self.path):
+            return {None: self.path}
+        return {}
+
+    def _read(self, path):
+        storage = self.storage if self.storage is not None and os.path.isdir(self.path) else get_storage(path)
+        self.file_reads += 1
+        return storage.read(path, columns=DASHBOARD_COLUMNS)
+
+    def poll(self):
+        """
+        바뀐 파일만 다시 읽기
+
+        Returns:
+            bool: 데이터가 바뀌었으면 True
+        """
+        with self._lock:
+            files = self._files()
+            stats = {}
+            for key, path in files.items():
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                stats[key] = (stat.st_mtime_ns, stat.st_size)
+            if stats == self._stats:
+                return False
+
+            if self.shared_dir is not None:
+                if not self._write_shared(files, stats):
+                    return False
+                self._stats = stats
+                self._data = None
+                self.version += 1
+                return True
+
+            frames = {key: frame for key, frame in self._frames.items() if key in stats}
+            for key, stat in stats.items():
+                if self._stats is not None and self._stats.get(key) == stat:
+                    continue
+                try:
+                    frames[key] = self._read(files[key])
+                except (OSError, ValueError):
+                    # 쓰는 중인 파일 - 이전 데이터를 유지하고 다음 확인 때 다시 시도
+                    return False
+
+            self._frames = frames
+            self._stats = stats
+            self._data = None
+            self.version += 1
+            return True
+
+    def data(self):
+        """현재 ETL 결과 (처음 호출 시 파일을 읽음)"""
+        if self._stats is None:
+            self.poll()
+        with self._lock:
+            if self._data is None:
+                if self.shared_dir is not None:
+                    self._data = self._map_shared()
+                else:
+                    self._data = self._combine(list(self._frames.values()))
+            if self._data is not None:
+                return self._data
+        # 매핑하기 전에 다른 워커가 더 새 스냅샷으로 교체한 경우 - 파일 상태를 다시 확인
+        self._stats = None
+        return self.data()
+
+    def token(self):
+        """현재 데이터 식별자 (파일 경로와 (수정 시각, 크기)의 해시 - 워커 간 같은 값)"""
+        if self._stats is None:
+            self.poll()
+        with self._lock:
+            return self._token(self._stats)
+
+    def _token(self, stats):
+        payload = json.dumps([SNAPSHOT_VERSION, os.path.abspath(self.path), DASHBOARD_COLUMNS,
+                              sorted((repr(key), stat) for key, stat in (stats or {}).items())])
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _snapshot_prefix(self):
+        return hashlib.sha256(os.path.abspath(self.path).encode()).hexdigest()[:16]
+
+    def _snapshot_path(self, stats):
+        return os.path.join(self.shared_dir, f"{self._snapshot_prefix()}-{self._token(stats)}.arrow")
+
+    def _write_shared(self, files, stats):
+        """
+        현재 상태의 스냅샷이 없으면 파일을 읽어 기록 (동시에 확인한 워커 중 하나만 읽고 나머지는 대기)
+
+        Returns:
+            bool: 스냅샷이 준비되었으면 True, 쓰는 중인 파일이 있으면 False
+        """
+        path = self._snapshot_path(stats)
+        if os.path.exists(path):
+            return True
+        os.makedirs(self.shared_dir, exist_ok=True)
+        with open(os.path.join(self.shared_dir, f"{self._snapshot_prefix()}.lock"), 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if os.path.exists(path):
+                return True
+            try:
+                frames = [self._read(files[key]) for key in stats]
+            except (OSError, ValueError):
+                # 쓰는 중인 파일 - 다음 확인 때 다시 시도
+                return False
+            write_snapshot(self._combine(frames), path)
+            for old_path in glob.glob(os.path.join(self.shared_dir, f"{self._snapshot_prefix()}-*.arrow")):
+                if old_path != path:
+                    # 매핑 중인 워커는 삭제 후에도 기존 내용을 계속 읽을 수 있음 (POSIX)
+                    os.remove(old_path)
+        return True
+
+    def _map_shared(self):
+        """현재 상태의 스냅샷 매핑 (그 사이 삭제되었으면 None)"""
+        try:
+            df = map_snapshot(self._snapshot_path(self._stats))
+        except FileNotFoundError:
+            return None
+        self.snapshot_maps += 1
+        return df
+
+    @staticmethod
+    def _combine(frames):
+        if not frames:
+            return _empty_frame()
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        df = df.sort_values(['date', 'country', 'indicator'], ignore_index=True)
+        for column in CATEGORY_COLUMNS:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+        return df
+
+
+class DaemonSource:
+    """
+    상주 ETL 데몬(etl_daemon.py)의 현재 데이터셋 (ETLOutputSource와 같은 poll / data / token 인터페이스)
+
+    파일을 읽지 않고 데몬이 게시한 Arrow 스냅샷을 메모리 매핑하며, 데몬이 새 데이터셋을 게시한 경우에만
+    대시보드 컬럼을 정렬한 프레임을 다시 만듭니다.
+    """
+
+    def __init__(self, socket_path):
+        """
+        Args:
+            socket_path: 데몬 Unix 소켓 경로
+        """
+        from etl_daemon import DaemonClient
+
+        self.client = DaemonClient(socket_path)
+        self.version = 0
+        self._token = None
+        self._data = None
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """
+        데몬이 새 데이터셋을 게시했는지 확인
+
+        Returns:
+            bool: 데이터가 바뀌었으면 True
+        """
+        token = self.client.request('current')['token']
+        with self._lock:
+            if token == self._token:
+                return False
+            self._token = token
+            self._data = None
+            self.version += 1
+            return True
+
+    def data(self):
+        """현재 데이터셋의 대시보드 컬럼 (date, country, indicator 순 정렬)"""
+        if self._token is None:
+            self.poll()
+        with self._lock:
+            if self._data is None:
+                df = self.client.data()
+                self._data = ETLOutputSource._combine([df[DASHBOARD_COLUMNS]])
+                # 확인 이후 다시 게시된 경우 실제로 읽은 데이터셋 기준
+                self._token = self.client.token
+            return self._data
+
+    def token(self):
+        """현재 데이터 식별자 (데몬이 게시한 내용 해시 - 워커 간 같은 값)"""
+        if self._token is None:
+            self.poll()
+        return self._token
+
+
+def write_snapshot(df, path):
+    """
+    DataFrame을 Arrow IPC 파일로 원자적으로 기록
+
+    실수 컬럼은 NaN을 null로 바꾸지 않고 그대로 저장하므로, 매핑해서 읽을 때
+    null 채우기 복사 없이 파일 버퍼를 그대로 사용합니다 (zero-copy).
+    """
+    import pyarrow as pa
+
+    arrays = [pa.array(df[column].to_numpy(), from_pandas=False) if df[column].dtype.kind == 'f'
+              else pa.Array.from_pandas(df[column]) for column in df.columns]
+    table = pa.Table.from_arrays(arrays, names=list(df.columns))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as f:
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def map_snapshot(path):
+    """Arrow IPC 스냅샷을 메모리 매핑하여 DataFrame으로 반환 (숫자/날짜 컬럼은 읽기 전용 공유 버퍼)"""
+    import pyarrow as pa
+
+    # 읽은 버퍼가 매핑을 참조하므로 파일을 닫지 않음 (DataFrame이 해제될 때 함께 해제)
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def filter_rows(df, countries=None, indicators=None, start_date=None, end_date=None):
+    """국가 / 지표 / 기간 필터 (None이나 빈 목록이면 전체)"""
+    mask = np.ones(len(df), dtype=bool)
+    if countries:
+        mask &= df['country'].isin(countries).to_numpy()
+    if indicators:
+        mask &= df['indicator'].isin(indicators).to_numpy()
+    if start_date is not None:
+        mask &= (df['date'] >= pd.Timestamp(start_date)).to_numpy()
+    if end_date is not None:
+        mask &= (df['date'] <= pd.Timestamp(end_date)).to_numpy()
+    return df[mask]
+
+
+def downsample(df, max_points):
+    """
+    (국가, 지표) 시계열별로 최대 max_points개 구간 평균으로 축소
+
+    Args:
+        df: date 순으로 정렬된 ETL 결과
+        max_points: 시계열당 최대 점 수
+
+    Returns:
+        DataFrame: country, indicator, date(구간 시작일), actual, forecast (구간 평균)
+    """
+    keys = ['country', 'indicator']
+    groups = df.groupby(keys, observed=True, sort=False)
+    position = groups.cumcount().to_numpy()
+    size = groups['date'].transform('size').to_numpy()
+    bucket = np.where(size > max_points, position * max_points // np.maximum(size, 1), position)
+
+    points = df[keys + ['date', 'actual', 'forecast']].assign(bucket=bucket).groupby(
+        keys + ['bucket'], observed=True, sort=True
+    ).agg(date=('date', 'first'), actual=('actual', 'mean'), forecast=('forecast', 'mean'))
+    return points.reset_index(level='bucket', drop=True).reset_index()
+
+
+def surprise_counts(df):
+    """국가 × 서프라이즈 구분별 발표 횟수"""
+    return df.groupby(['country', 'surprise'], observed=True).size().unstack(fill_value=0)
@@ -0,0 +1,151 @@
+"""
+변환된 경제지표 데이터 색인 조회
+(indicator, country, date) 순으로 한 번 정렬하고 시계열별 시작 위치(오프셋)를 미리 계산하여,
+시계열 / 시점 / 기간 / 최신값 조회를 전체 행을 훑는 불리언 마스크 없이 이진 탐색과 슬라이스로 처리합니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+class IndicatorQuery:
+    """
+    ETL 결과 색인 조회 객체
+
+    - frame: (indicator, country, date) 순으로 정렬한 데이터 (원본 컬럼 유지, 조회 결과도 같은 컬럼)
+    - index: frame 행 순서와 같은 (indicator, country, date) MultiIndex
+    - 시계열(지표, 국가)마다 frame 안의 [시작, 끝) 위치를 offsets에 보관
+    - 조회 비용은 선택한 시계열 수 × log(시계열 길이) + 결과 행 수 (전체 행 수와 무관)
+    """
+
+    def __init__(self, df):
+        """
+        Args:
+            df: date, country, indicator 컬럼을 가진 변환 결과 (country/indicator는 Categorical 권장)
+        """
+        indicators = _categorical(df['indicator'])
+        countries = _categorical(df['country'])
+        self.indicators = list(indicators.categories)
+        self.countries = list(countries.categories)
+        self._indicator_position = {name: i for i, name in enumerate(self.indicators)}
+        self._country_position = {name: i for i, name in enumerate(self.countries)}
+        n_countries = len(self.countries)
+
+        dates = pd.to_datetime(df['date']).to_numpy()
+        # 결측 키 행은 조회 대상에서 제외
+        keep = (indicators.codes >= 0) & (countries.codes >= 0) & ~np.isnat(dates)
+        positions = np.flatnonzero(keep)
+        series = indicators.codes[positions].astype(np.int64) * n_countries + countries.codes[positions]
+        # 시계열 코드, 날짜 순 정렬 (lexsort는 마지막 키가 1순위, 안정 정렬이므로 같은 키는 원래 순서 유지)
+        order = positions[np.lexsort((dates[positions], series))]
+        series = indicators.codes[order].astype(np.int64) * n_countries + countries.codes[order]
+
+        self._dates = dates[order]
+        self.offsets = np.searchsorted(series, np.arange(len(self.indicators) * n_countries + 1))
+        self.frame = df.iloc[order].reset_index(drop=True)
+        # 컬럼 이름과 겹치지 않도록 frame이 아닌 별도 속성으로 보관 (groupby 키가 모호해지지 않게)
+        date_codes, unique_dates = pd.factorize(self._dates)
+        self.index = pd.MultiIndex(
+            levels=[indicators.categories, countries.categories, pd.DatetimeIndex(unique_dates)],
+            codes=[indicators.codes[order], countries.codes[order], date_codes],
+            names=['indicator', 'country', 'date'], verify_integrity=False,
+        )
+
+    def __len__(self):
+        return len(self.frame)
+
+    def date_range(self):
+        """(가장 이른 날짜, 가장 늦은 날짜), 데이터가 없으면 (None, None)"""
+        if not len(self._dates):
+            return None, None
+        return pd.Timestamp(self._dates.min()), pd.Timestamp(self._dates.max())
+
+    def _series_ids(self, indicators=None, countries=None):
+        """선택한 (지표, 국가) 시계열 번호 (None이나 빈 목록이면 전체, 없는 이름은 무시)"""
+        indicator_ids = range(len(self.indicators)) if not indicators else \
+            [self._indicator_position[name] for name in indicators if name in self._indicator_position]
+        country_ids = range(len(self.countries)) if not countries else \
+            [self._country_position[name] for name in countries if name in self._country_position]
+        n_countries = len(self.countries)
+        return np.array([i * n_countries + c for i in indicator_ids for c in country_ids], dtype=np.int64)
+
+    def _bound(self, value):
+        return np.datetime64(pd.Timestamp(value)).astype(self._dates.dtype)
+
+    def _positions(self, series_ids, start_date=None, end_date=None):
+        """시계열별 기간 경계를 이진 탐색하여 결과 행 위치 배열 생성"""
+        starts, ends = self.offsets[series_ids], self.offsets[series_ids + 1]
+        if start_date is not None or end_date is not None:
+            lower = self._bound(start_date) if start_date is not None else None
+            upper = self._bound(end_date) if end_date is not None else None
+            bounded_starts, bounded_ends = starts.copy(), ends.copy()
+            for k, (start, end) in enumerate(zip(starts, ends)):
+                if start == end:
+                    continue
+                dates = self._dates[start:end]
+                if lower is not None:
+                    bounded_starts[k] = start + np.searchsorted(dates, lower, side='left')
+                if upper is not None:
+                    bounded_ends[k] = start + np.searchsorted(dates, upper, side='right')
+            starts, ends = bounded_starts, np.maximum(bounded_ends, bounded_starts)
+        lengths = ends - starts
+        if not lengths.sum():
+            return np.zeros(0, dtype=np.int64)
+        # 구간들을 이어 붙인 위치: 구간 시작값을 반복한 뒤 구간 안의 순번을 더함
+        total = lengths.sum()
+        return np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths) + np.arange(total)
+
+    def series(self, indicator, country):
+        """(지표, 국가) 시계열 전체 (날짜 순) - 없으면 빈 프레임"""
+        series_ids = self._series_ids([indicator], [country])
+        if not len(series_ids):
+            return self.frame.iloc[:0]
+        return self.frame.iloc[self.offsets[series_ids[0]]:self.offsets[series_ids[0] + 1]]
+
+    def point(self, indicator, country, date):
+        """
+        (지표, 국가, 날짜) 한 행 조회
+
+        Returns:
+            dict 또는 None: 해당 날짜 발표가 없으면 None
+        """
+        series_ids = self._series_ids([indicator], [country])
+        if not len(series_ids):
+            return None
+        start, end = self.offsets[series_ids[0]], self.offsets[series_ids[0] + 1]
+        target = self._bound(date)
+        position = start + np.searchsorted(self._dates[start:end], target)
+        if position == end or self._dates[position] != target:
+            return None
+        return self.frame.iloc[position].to_dict()
+
+    def range(self, indicators=None, countries=None, start_date=None, end_date=None):
+        """
+        지표 / 국가 / 기간 조회 (filter_rows와 같은 조건, 결과는 (indicator, country, date) 순)
+
+        Args:
+            indicators, countries: 이름 목록 (None이나 빈 목록이면 전체)
+            start_date, end_date: 기간 경계 (포함, None이면 제한 없음)
+        """
+        positions = self._positions(self._series_ids(indicators, countries), start_date, end_date)
+        return self.frame.iloc[positions]
+
+    def latest(self, indicators=None, countries=None, as_of=None):
+        """
+        시계열별 최신 발표 (as_of를 지정하면 그 날짜 이전 마지막 발표)
+
+        Returns:
+            DataFrame: 시계열당 한 행, 발표가 없는 시계열은 제외
+        """
+        series_ids = self._series_ids(indicators, countries)
+        starts, ends = self.offsets[series_ids], self.offsets[series_ids + 1]
+        if as_of is not None:
+            upper = self._bound(as_of)
+            ends = np.array([start + np.searchsorted(self._dates[start:end], upper, side='right')
+                             for start, end in zip(starts, ends)], dtype=np.int64)
+        return self.frame.iloc[(ends - 1)[ends > starts]]
+
+
+def _categorical(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.array
+    return pd.Categorical(values)
@@ -0,0 +1,272 @@
+"""
+작업 그래프(DAG) 파이프라인 실행기
+
+작업(task)과 의존 관계를 등록하면 의존 작업이 끝나는 대로 실행합니다.
+I/O 작업(추출, 저장)과 CPU 작업(변환, 레포트)은 별도 스레드 풀에서 실행되므로
+뒤 배치 추출과 앞 배치 변환이 겹쳐 실행되고, 결과는 프로세스 간 파일 왕복 없이 메모리로 전달됩니다.
+
+작업마다 (이름, 파라미터, 버전, 입력 결과 fingerprint)로 fingerprint를 계산하여 state_dir에 기록하고,
+다음 실행에서 fingerprint가 같으면 작업을 건너뛰고 저장된 결과(또는 출력 파일)를 사용합니다.
+DataFrame 결과의 fingerprint는 내용 해시이므로, 추출 결과가 같으면 이후 작업이 모두 생략됩니다.
+"""
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from profiling import StageProfiler, get_logger
+
+
+logger = get_logger('dag')
+
+KINDS = ('io', 'cpu', 'process')
+
+
+def frame_fingerprint(df):
+    """DataFrame 내용 해시 (컬럼, dtype, 인덱스, 값)"""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class Task:
+    """그래프 작업 정의"""
+
+    def __init__(self, name, fn, deps=(), params=None, kind='cpu', version='', always_run=False,
+                 output_path=None):
+        """
+        Args:
+            name: 작업 이름 (그래프 안에서 고유)
+            fn: fn(*의존 작업 결과) 형태로 호출할 함수 (kind='process'면 pickle 가능한 최상위 함수)
+            deps: 의존 작업 이름 목록 (결과가 이 순서로 fn 인자로 전달됨)
+            params: fingerprint에 포함할 파라미터 (JSON 직렬화 가능, 함수에는 전달되지 않음)
+            kind: 'io'(I/O 스레드 풀) / 'cpu'(CPU 스레드 풀) / 'process'(프로세스 풀)
+            version: 로직이 바뀌면 올려서 이전 결과를 무효화
+            always_run: True면 fingerprint와 관계없이 항상 실행 (외부 데이터 추출 등)
+            output_path: 결과가 파일이면 경로 - 파일이 있고 fingerprint가 같을 때만 생략
+        """
+        if kind not in KINDS:
+            raise ValueError(f"kind는 {KINDS} 중 하나여야 합니다: {kind}")
+        self.name = name
+        self.fn = fn
+        self.deps = list(deps)
+        self.params = params
+        self.kind = kind
+        self.version = version
+        self.always_run = always_run
+        self.output_path = output_path
+
+
+class GraphResult:
+    """그래프 실행 결과 (생략한 작업의 결과는 요청할 때 저장소에서 읽음)"""
+
+    def __init__(self, graph, ran, skipped):
+        self._graph = graph
+        self.ran = ran
+        self.skipped = skipped
+
+    def value(self, name):
+        return self._graph._value(name)
+
+
+class TaskGraph:
+    """의존 관계에 따라 작업을 동시에 실행하고, 입력이 바뀌지 않은 작업은 생략하는 실행기"""
+
+    def __init__(self, state_dir=None, io_workers=4, cpu_workers=1, process_workers=0, profiler=None):
+        """
+        Args:
+            state_dir: fingerprint와 작업 결과를 저장할 디렉터리 (None이면 생략 없이 매번 실행)
+            io_workers: I/O 작업 스레드 수
+            cpu_workers: CPU 작업 스레드 수
+            process_workers: kind='process' 작업 프로세스 수 (0이면 CPU 스레드 풀에서 실행)
+            profiler: 작업별 시간/메모리를 기록할 StageProfiler
+        """
+        self.state_dir = state_dir
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self.process_workers = process_workers
+        self.profiler = profiler if profiler is not None else StageProfiler()
+        self.tasks = {}
+        self._state = {}
+        self._values = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, fn, deps=(), **options):
+        """작업 등록 (옵션은 Task 참고)"""
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업입니다: {name}")
+        missing = [dep for dep in deps if dep not in self.tasks]
+        if missing:
+            raise ValueError(f"등록되지 않은 의존 작업: {', '.join(missing)}")
+        self.tasks[name] = Task(name, fn, deps, **options)
+        return self.tasks[name]
+
+    # 상태 저장소 ------------------------------------------------------------
+
+    def _state_path(self):
+        return os.path.join(self.state_dir, 'state.json')
+
+    def _load_state(self):
+        if self.state_dir is None or not os.path.exists(self._state_path()):
+            return {}
+        with open(self._state_path(), encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_state(self, state):
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self._state_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self._state_path())
+
+    def _result_path(self, fingerprint):
+        return os.path.join(self.state_dir, f'{fingerprint}.pkl')
+
+    def _task_fingerprint(self, task):
+        payload = json.dumps([task.name, task.params, task.version,
+                              [self._fingerprints[dep] for dep in task.deps]], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _value(self, name):
+        """작업 결과 (생략한 작업은 저장된 결과를 처음 요청할 때 읽음)"""
+        with self._lock:
+            if name not in self._values:
+                task = self.tasks[name]
+                if task.output_path is not None:
+                    self._values[name] = task.output_path
+                else:
+                    self._values[name] = pd.read_pickle(self._result_path(self._state[name]['fingerprint']))
+            return self._values[name]
+
+    # 실행 ------------------------------------------------------------------
+
+    def _can_skip(self, task, fingerprint):
+        previous = self._state.get(task.name)
+        if self.state_dir is None or task.always_run or previous is None or previous['fingerprint'] != fingerprint:
+            return False
+        if task.output_path is not None:
+            return os.path.exists(task.output_path)
+        return os.path.exists(self._result_path(fingerprint))
+
+    def _execute(self, task):
+        args = [self._value(dep) for dep in task.deps]
+        with self.profiler.stage(task.name, category=task.kind) as record:
+            result = task.fn(*args)
+            if isinstance(result, pd.DataFrame):
+                record['rows_out'] = len(result)
+        return result
+
+    def _finish(self, task, fingerprint, result):
+        """실행 결과 기록 - DataFrame은 내용 해시를 출력 fingerprint로 사용"""
+        output_fingerprint = frame_fingerprint(result) if isinstance(result, pd.DataFrame) else fingerprint
+        with self._lock:
+            self._values[task.name] = result
+        self._fingerprints[task.name] = output_fingerprint
+        if self.state_dir is None:
+            return
+
+        previous = self._state.get(task.name)
+        # 항상 실행하는 작업의 결과는 다시 읽을 일이 없으므로 저장하지 않음
+        if task.output_path is None and not task.always_run and isinstance(result, pd.DataFrame):
+            os.makedirs(self.state_dir, exist_ok=True)
+            if not os.path.exists(self._result_path(fingerprint)):
+                result.to_pickle(self._result_path(fingerprint))
+            if previous is not None and previous['fingerprint'] != fingerprint and \
+                    os.path.exists(self._result_path(previous['fingerprint'])):
+                os.remove(self._result_path(previous['fingerprint']))
+        self._state[task.name] = {'fingerprint': fingerprint, 'output': output_fingerprint}
+
+    def run(self, targets=None):
+        """
+        그래프 실행
+
+        Args:
+            targets: 실행할 작업 이름 목록 (의존 작업 포함), None이면 전체
+
+        Returns:
+            GraphResult: 실행한 / 생략한 작업 이름과 결과 조회
+        """
+        names = self._closure(targets) if targets is not None else list(self.tasks)
+        self._state = self._load_state()
+        self._values = {}
+        self._fingerprints = {}
+        ran, skipped = [], []
+
+        waiting = {name: set(self.tasks[name].deps) for name in names}
+        pools = {
+            'io': ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='dag-io'),
+            'cpu': ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix='dag-cpu'),
+        }
+        pools['process'] = ProcessPoolExecutor(max_workers=self.process_workers) \
+            if self.process_workers > 0 else pools['cpu']
+        running = {}
+        try:
+            while waiting or running:
+                # 의존 작업이 모두 끝난 작업: 생략하거나 풀에 제출 (등록 순서 유지)
+                ready = [name for name, deps in waiting.items() if not deps]
+                for name in ready:
+                    del waiting[name]
+                    task = self.tasks[name]
+                    fingerprint = self._task_fingerprint(task)
+                    if self._can_skip(task, fingerprint):
+                        self._fingerprints[name] = self._state[name]['output']
+                        skipped.append(name)
+                        logger.info("⏭️  %s - 입력 변경 없음, 생략", name)
+                        self._release(waiting, name)
+                        continue
+                    in_process = task.kind == 'process' and self.process_workers > 0
+                    if in_process:
+                        args = [self._value(dep) for dep in task.deps]
+                        future = pools['process'].submit(_execute_in_process, task.name, task.fn, args)
+                    else:
+                        future = pools[task.kind].submit(self._execute, task)
+                    running[future] = (task, fingerprint, in_process)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, fingerprint, in_process = running.pop(future)
+                    result = future.result()
+                    if in_process:
+                        # 하위 프로세스에서 측정한 단계 기록을 합침
+                        result, record = result
+                        self.profiler.add(record)
+                    self._finish(task, fingerprint, result)
+                    ran.append(task.name)
+                    logger.info("✅ %s 완료", task.name)
+                    self._release(waiting, task.name)
+        finally:
+            for pool in set(pools.values()):
+                pool.shutdown(wait=True, cancel_futures=True)
+            if self.state_dir is not None:
+                self._save_state(self._state)
+
+        return GraphResult(self, ran, skipped)
+
+    def _closure(self, targets):
+        """targets와 모든 상위 의존 작업 (등록 순서)"""
+        needed, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.tasks[name].deps)
+        return [name for name in self.tasks if name in needed]
+
+    @staticmethod
+    def _release(waiting, name):
+        for deps in waiting.values():
+            deps.discard(name)
+
+
+def _execute_in_process(name, fn, args):
+    """프로세스 풀 작업 실행 - (결과, 단계 기록) 반환"""
+    from profiling import measure
+
+    return measure(name, fn, *args, category='process')
@@ -0,0 +1,310 @@
+"""
+ETL / 레포트 파이프라인 단계별 계측과 로거
+
+단계(stage)마다 경과 시간, CPU 시간, 단계 중 최대 RSS 증가량, 입력/출력 행 수를 기록하고
+Chrome trace-event JSON(chrome://tracing, Perfetto에서 열기)으로 저장합니다.
+필요하면 단계별 cProfile / tracemalloc 측정을 함께 켤 수 있습니다.
+
+진행 메시지는 'pipeline' 로거로 출력합니다. 기본값은 INFO 수준으로 표준 출력에 메시지만 쓰며,
+configure_logging(logging.WARNING)처럼 수준을 올리면 메시지 포맷팅 비용 없이 꺼집니다.
+"""
+import cProfile
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+LOGGER_NAME = 'pipeline'
+# 단계 진행 중 현재 RSS 샘플링 간격(초)
+RSS_INTERVAL = 0.01
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """호출 시점의 sys.stdout에 기록하는 핸들러 (redirect_stdout / pytest 캡처와 호환)"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def configure_logging(level=logging.INFO, handler=None):
+    """
+    파이프라인 로거 설정
+
+    Args:
+        level: 로그 수준 (logging.WARNING 이상이면 진행 메시지 생략)
+        handler: 사용할 logging.Handler, None이면 표준 출력에 메시지만 출력
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    for existing in list(logger.handlers):
+        logger.removeHandler(existing)
+    if handler is None:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def get_logger(name):
+    """파이프라인 하위 로거 (예: get_logger('etl') -> 'pipeline.etl')"""
+    return logging.getLogger(f'{LOGGER_NAME}.{name}')
+
+
+if not logging.getLogger(LOGGER_NAME).handlers:
+    configure_logging()
+
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else None
+_psutil_process = None
+
+
+def _current_rss_bytes():
+    """
+    프로세스 현재 RSS (/proc/self/statm, 없으면 psutil, 둘 다 없으면 None)
+
+    ru_maxrss는 프로세스 수명 동안의 최대치라 이미 더 큰 최대치를 찍은 뒤의 단계에서는 변하지 않으므로 사용하지 않습니다.
+    """
+    global _psutil_process
+    if _PAGE_SIZE is not None and os.path.exists('/proc/self/statm'):
+        with open('/proc/self/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    if _psutil_process is None:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        _psutil_process = psutil.Process()
+    return _psutil_process.memory_info().rss
+
+
+class _RSSSampler:
+    """진행 중인 단계들의 RSS 최대치를 주기적으로 갱신하는 백그라운드 스레드 (진행 중인 단계가 없으면 종료)"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._frames = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, frame):
+        """단계 시작 - frame['rss_start'] / frame['rss_peak']를 현재 RSS로 설정 (측정 불가면 False)"""
+        rss = _current_rss_bytes()
+        if rss is None:
+            return False
+        frame['rss_start'] = frame['rss_peak'] = rss
+        with self._lock:
+            self._frames[id(frame)] = frame
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+                self._thread.start()
+        return True
+
+    def stop(self, frame):
+        """단계 종료 - 단계 중 최대 RSS 증가량(바이트)"""
+        with self._lock:
+            del self._frames[id(frame)]
+        rss = _current_rss_bytes()
+        return max(frame['rss_peak'], rss) - frame['rss_start']
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            rss = _current_rss_bytes()
+            with self._lock:
+                if not self._frames:
+                    self._thread = None
+                    return
+                for frame in self._frames.values():
+                    if rss > frame['rss_peak']:
+                        frame['rss_peak'] = rss
+
+
+def measure(name, fn, *args, category='stage', rows_in=None, **kwargs):
+    """
+    fn(*args, **kwargs)를 실행하고 (결과, 단계 기록)을 반환 (하위 프로세스에서 측정 후 StageProfiler.add로 합칠 때 사용)
+
+    결과가 DataFrame이면 행 수를 출력 행 수로 기록합니다.
+    """
+    import pandas as pd
+
+    profiler = StageProfiler()
+    with profiler.stage(name, category=category, rows_in=rows_in) as record:
+        result = fn(*args, **kwargs)
+        if isinstance(result, pd.DataFrame):
+            record['rows_out'] = len(result)
+    return result, profiler.records[0]
+
+
+class StageProfiler:
+    """파이프라인 단계별 시간 / 메모리 / 행 수 기록기"""
+
+    def __init__(self, profile=False, trace_memory=False, rss_interval=RSS_INTERVAL):
+        """
+        Args:
+            profile: True면 모든 최상위 단계를, 단계 이름 목록이면 해당 단계만 cProfile로 측정
+                     (같은 이름의 단계는 스레드별 Profile에 누적하고 profiles 속성에서 합쳐 조회)
+            trace_memory: True면 tracemalloc으로 단계별 파이썬 할당 최대치(py_peak_bytes) 측정
+                          (여러 스레드에서 동시에 실행되는 단계는 프로세스 전체 기준)
+            rss_interval: 단계 중 최대 RSS 증가량(peak_rss_delta_bytes) 샘플링 간격(초)
+                          (단계 시작 RSS 기준, 동시에 실행되는 단계는 프로세스 전체 기준)
+        """
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.records = []
+        self._profiles = {}
+        self._sampler = _RSSSampler(rss_interval)
+        self.origin = time.perf_counter()
+        # 진행 중인 단계 스택은 스레드별로 관리 (여러 스레드에서 동시에 단계 측정 가능)
+        self._local = threading.local()
+
+    @property
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+            self._local.profiling = False
+        return self._local.stack
+
+    def _should_profile(self, name):
+        if not self.profile or self._local.profiling:
+            return False
+        return self.profile is True or name in self.profile
+
+    @contextmanager
+    def stage(self, name, category='stage', rows_in=None, rows_out=None, **args):
+        """
+        단계 측정 컨텍스트. 반환한 기록(dict)의 'rows_out'을 단계 안에서 지정합니다.
+
+            with profiler.stage('transform', rows_in=len(raw)) as record:
+                df = transform(raw)
+                record['rows_out'] = len(df)
+
+        Args:
+            name: 단계 이름
+            category: trace-event 분류 (예: 'etl', 'report', 'sheet')
+            rows_in: 입력 행 수
+            rows_out: 출력 행 수 (미리 알 때)
+            **args: trace-event에 함께 기록할 추가 정보
+        """
+        record = {'name': name, 'category': category, 'rows_in': rows_in, 'rows_out': rows_out,
+                  'pid': os.getpid(), 'tid': threading.get_ident(), 'depth': len(self._stack), 'args': args}
+
+        stack = self._stack
+        profiler = None
+        if self._should_profile(name):
+            # Profile은 한 스레드에서만 enable할 수 있으므로 같은 이름의 단계도 스레드별로 따로 누적
+            profiler = self._profiles.setdefault((name, threading.get_ident()), cProfile.Profile())
+            self._local.profiling = True
+
+        tracing = self.trace_memory
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            traced_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        frame = {'child_peak': 0}
+        stack.append(frame)
+
+        sampling = self._sampler.start(frame)
+        cpu_start = time.process_time()
+        record['start'] = time.perf_counter()
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+는 프로세스에서 프로파일러 하나만 활성화 가능 (다른 스레드가 측정 중)
+                profiler = None
+                self._local.profiling = False
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._local.profiling = False
+            record['wall_seconds'] = time.perf_counter() - record['start']
+            record['cpu_seconds'] = time.process_time() - cpu_start
+            record['peak_rss_delta_bytes'] = self._sampler.stop(frame) if sampling else None
+
+            stack.pop()
+            if tracing:
+                # 하위 단계가 reset_peak를 호출하므로 하위 단계 최대치와 합쳐 계산
+                peak = max(tracemalloc.get_traced_memory()[1], frame['child_peak'])
+                record['py_peak_bytes'] = peak - traced_start
+                if stack:
+                    stack[-1]['child_peak'] = max(stack[-1]['child_peak'], peak)
+            self.records.append(record)
+
+    def reset(self):
+        """기록과 cProfile 결과를 비우고 시간 기준점을 다시 설정 (상주 프로세스에서 실행마다 새로 측정)"""
+        self.records = []
+        self._profiles = {}
+        self.origin = time.perf_counter()
+
+    @property
+    def profiles(self):
+        """단계 이름 -> 스레드별 cProfile 결과를 합친 pstats.Stats (측정 중인 단계가 없을 때 조회)"""
+        stats = {}
+        for (name, _), profiler in list(self._profiles.items()):
+            if name in stats:
+                stats[name].add(profiler)
+            else:
+                stats[name] = pstats.Stats(profiler)
+        return stats
+
+    def add(self, record):
+        """다른 프로세스에서 measure()로 측정한 단계 기록 추가"""
+        self.records.append(dict(record, depth=len(self._stack)))
+
+    def table(self):
+        """단계 기록 요약 DataFrame (시작 순서)"""
+        import pandas as pd
+
+        columns = ['name', 'category', 'wall_seconds', 'cpu_seconds', 'peak_rss_delta_bytes',
+                   'py_peak_bytes', 'rows_in', 'rows_out', 'pid']
+        records = sorted(self.records, key=lambda record: record['start'])
+        return pd.DataFrame(records, columns=columns).astype({'rows_in': 'Int64', 'rows_out': 'Int64'})
+
+    def trace_events(self):
+        """Chrome trace-event 형식 ('X' 완료 이벤트, 단위: 마이크로초)"""
+        events = []
+        for record in sorted(self.records, key=lambda record: (record['start'], record['depth'])):
+            args = {key: record[key] for key in ('cpu_seconds', 'peak_rss_delta_bytes', 'py_peak_bytes',
+                                                 'rows_in', 'rows_out') if record.get(key) is not None}
+            args.update(record['args'])
+            events.append({
+                'name': record['name'],
+                'cat': record['category'],
+                'ph': 'X',
+                'ts': round((record['start'] - self.origin) * 1e6, 3),
+                'dur': round(record['wall_seconds'] * 1e6, 3),
+                'pid': record['pid'],
+                'tid': record['tid'],
+                'args': args,
+            })
+        return events
+
+    def write_trace(self, path):
+        """trace-event JSON 파일 저장 (chrome://tracing / ui.perfetto.dev 에서 열기)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+        return path
+
+    def dump_profiles(self, directory):
+        """단계별 cProfile 결과를 <단계 이름>.prof 파일로 저장 (pstats / snakeviz로 열기)"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for name, stats in self.profiles.items():
+            path = os.path.join(directory, f"{name.replace(os.sep, '_')}.prof")
+            stats.dump_stats(path)
+            paths.append(path)
+        return paths
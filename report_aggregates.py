@@ -0,0 +1,64 @@
+"""
+엑셀 레포트 요약 시트용 사전 집계
+원본 행 대신 (국가, 지표, 날짜) 단위로 미리 집계한 작은 표를 만들어 요약 시트와 차트에 사용합니다.
+모든 집계는 groupby / pivot_table 벡터 연산으로 계산합니다.
+"""
+import pandas as pd
+
+from transform_engine import SURPRISE_CATEGORIES
+
+
+# 예측 정확도 이동 평균 구간 (발표 횟수)
+ROLLING_WINDOW = 3
+
+
+def indicator_series(df):
+    """
+    지표별 국가 실제치 시계열
+
+    Returns:
+        dict: 지표 -> DataFrame(index=date, columns=country), 지표는 데이터 등장 순서
+    """
+    table = df.pivot_table(index=['indicator', 'date'], columns='country', values='actual',
+                           aggfunc='mean', observed=True)
+    series = {}
+    for indicator in pd.unique(df['indicator']):
+        frame = table.xs(indicator, level='indicator').dropna(axis=1, how='all')
+        frame.columns.name = None
+        series[indicator] = frame
+    return series
+
+
+def rolling_accuracy(df, window=ROLLING_WINDOW):
+    """
+    국가별 예측 정확도 이동 평균
+
+    (국가, 지표) 시계열마다 최근 window회 발표의 평균 정확도를 구한 뒤 날짜 × 국가별로 평균합니다.
+
+    Returns:
+        DataFrame: index=date, columns=country
+    """
+    ordered = df[['date', 'country', 'indicator', 'forecast_accuracy']].sort_values('date', kind='stable')
+    rolled = ordered.groupby(['country', 'indicator'], observed=True, sort=False)['forecast_accuracy'] \
+        .rolling(window, min_periods=1).mean() \
+        .reset_index(level=['country', 'indicator'], drop=True)
+    table = ordered.assign(accuracy=rolled).pivot_table(
+        index='date', columns='country', values='accuracy', aggfunc='mean', observed=True)
+    table.columns.name = None
+    return table.round(2)
+
+
+def surprise_counts(df, by='country'):
+    """
+    서프라이즈 구분별 발표 횟수
+
+    Args:
+        by: 행 기준 컬럼 ('country' 또는 'indicator')
+
+    Returns:
+        DataFrame: index=by, columns=SURPRISE_CATEGORIES
+    """
+    counts = df.groupby([by, 'surprise'], observed=True).size().unstack(fill_value=0)
+    counts = counts.reindex(columns=SURPRISE_CATEGORIES, fill_value=0)
+    counts.columns = list(counts.columns)
+    return counts
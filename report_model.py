@@ -0,0 +1,137 @@
+"""
+렌더러 독립 레포트 레이아웃 모델
+
+EconomicReportGenerator.report_model()이 시트(제목, 보고서 정보, 표, 차트, 열 너비)와
+셀 스타일 이름을 이 모델로 만들고, report_renderers의 백엔드(xlsxwriter / HTML / CSV)가
+같은 모델을 각 형식으로 출력합니다. openpyxl 레포트도 같은 STYLES 정의로 NamedStyle을 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+# 공용 셀 스타일 (렌더러가 각 형식의 서식으로 변환)
+# bold/size/color: 글꼴, fill: 배경색, align: 가로 정렬(세로는 가운데), border: 얇은 테두리, number_format: 표시 형식
+# 글꼴 키가 없는 스타일은 기본 글꼴을 사용합니다. 순서는 엑셀 셀 스타일 번호 순서입니다.
+NUMBER_FORMAT = '#,##0.00'
+
+STYLES = {
+    'report_title': {'bold': True, 'size': 16, 'color': 'FFFFFF', 'fill': '1F4E78', 'align': 'center'},
+    'report_label': {'bold': True, 'fill': 'E7E6E6'},
+    'report_section': {'bold': True, 'size': 12, 'color': 'FFFFFF', 'fill': '4472C4'},
+    'report_table_header': {'bold': True, 'fill': 'D9E1F2'},
+    'detail_header': {'bold': True, 'color': 'FFFFFF', 'fill': '1F4E78', 'align': 'center', 'border': True},
+    'detail_text': {'align': 'center', 'border': True},
+    'detail_number': {'align': 'center', 'border': True, 'number_format': NUMBER_FORMAT},
+    'detail_positive': {'align': 'center', 'border': True, 'number_format': NUMBER_FORMAT, 'fill': 'C6EFCE'},
+    'detail_negative': {'align': 'center', 'border': True, 'number_format': NUMBER_FORMAT, 'fill': 'FFC7CE'},
+    'indicator_header': {'bold': True, 'color': 'FFFFFF', 'fill': '4472C4', 'align': 'center'},
+    'indicator_text': {'align': 'center'},
+    'indicator_number': {'align': 'center', 'number_format': NUMBER_FORMAT},
+}
+
+FONT_KEYS = ('bold', 'size', 'color')
+
+# 집계 시트 차트 한 개가 차지하는 행 수 (차트 기본 높이 7.5cm)
+CHART_ROWS = 16
+
+# 요약 시트 제목 / 구역 제목 병합 열 수와 제목 행 높이
+TITLE_SPAN = 6
+TITLE_HEIGHT = 30
+
+
+class SignRule:
+    """숫자 열 조건부 스타일: 양수 / 음수 / 그 외(NaN, 0, 문자열)"""
+
+    def __init__(self, positive, negative, default):
+        self.positive = positive
+        self.negative = negative
+        self.default = default
+
+    def styles(self, values):
+        """열 값 배열에 대한 셀 스타일 이름 배열 (벡터 연산)"""
+        numbers = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+        return np.select([numbers > 0, numbers < 0], [self.positive, self.negative], default=self.default)
+
+
+class Chart:
+    """표를 원본으로 하는 차트 (1열: 분류, 2열부터: 계열)"""
+
+    def __init__(self, kind, title, y_title=None):
+        """
+        Args:
+            kind: 'line' 또는 'stacked_column'
+            title: 차트 제목
+            y_title: 세로축 제목
+        """
+        self.kind = kind
+        self.title = title
+        self.y_title = y_title
+
+
+class Table:
+    """제목(선택), 헤더 행, 데이터 행으로 이루어진 표"""
+
+    def __init__(self, data, headers, title=None, header_style='report_table_header', column_styles=None,
+                 chart=None, title_span=None):
+        """
+        Args:
+            data: 표시용 DataFrame (날짜는 문자열, 결측은 NaN/None)
+            headers: 헤더 행
+            title: 표 위 구역 제목 (report_section 스타일)
+            header_style: 헤더 셀 스타일 이름
+            column_styles: 열별 스타일 이름 또는 SignRule (None이면 스타일 없음)
+            chart: Chart - 표 오른쪽에 배치 (엑셀 렌더러)
+            title_span: 구역 제목을 병합할 열 수
+        """
+        self.data = data
+        self.headers = list(headers)
+        self.title = title
+        self.header_style = header_style
+        self.column_styles = list(column_styles) if column_styles is not None else [None] * len(self.headers)
+        self.chart = chart
+        self.title_span = title_span
+
+    def cell_styles(self):
+        """열별 셀 스타일 (문자열 하나 또는 행별 스타일 배열)"""
+        return [style.styles(self.data.iloc[:, i]) if isinstance(style, SignRule) else style
+                for i, style in enumerate(self.column_styles)]
+
+
+class Sheet:
+    """레포트 시트 (제목 / 보고서 정보 / 표 순서로 배치)"""
+
+    def __init__(self, name, tables, widths=None, title=None, info=None, auto_filter=False):
+        """
+        Args:
+            name: 시트 이름
+            tables: Table 목록 (차트가 있는 표는 다음 표까지 CHART_ROWS행 이상 띄움)
+            widths: {열 번호(1부터): 너비}
+            title: 시트 제목 (report_title 스타일, TITLE_SPAN열 병합)
+            info: 제목 아래 (라벨, 값) 목록 (라벨은 report_label 스타일)
+            auto_filter: True면 첫 표 전체에 자동 필터
+        """
+        self.name = name
+        self.tables = tables
+        self.widths = widths or {}
+        self.title = title
+        self.info = info or []
+        self.auto_filter = auto_filter
+
+    def layout(self):
+        """
+        표별 시작 행(0부터) 계산
+
+        Returns:
+            list of int: 각 표의 첫 행 (제목이 있으면 제목 행, 없으면 헤더 행)
+        """
+        row = 0
+        if self.title is not None:
+            row += 2
+        if self.info:
+            row += len(self.info) + 1
+        starts = []
+        for table in self.tables:
+            starts.append(row)
+            last_row = row + (table.title is not None) + len(table.data)
+            row = max(last_row + 2, row + CHART_ROWS) if table.chart is not None else last_row + 2
+        return starts
@@ -0,0 +1,305 @@
+"""
+레포트 렌더러 백엔드
+
+report_model의 레이아웃 모델(Sheet / Table / Chart)을 파일 형식별로 출력합니다.
+- xlsxwriter: constant_memory 모드 엑셀 (행 단위 기록, 네이티브 차트, 메모리 사용량 일정)
+- html: 정적 HTML 한 파일 (STYLES를 CSS 클래스로 변환, 차트 없음)
+- csv: 디렉터리에 표마다 CSV 한 개 (서식 없음)
+
+    from report_renderers import get_renderer
+    get_renderer('html').render(generator.report_model(), 'report.html')
+"""
+import html
+import os
+import re
+
+from profiling import StageProfiler, get_logger
+from report_model import NUMBER_FORMAT, STYLES, TITLE_HEIGHT, TITLE_SPAN
+
+
+logger = get_logger('renderers')
+
+# 파이썬 값으로 변환하는 행 단위 (표 전체를 객체로 만들지 않도록 이 크기씩 변환)
+TABLE_CHUNK_ROWS = 10_000
+
+
+def _column_values(series):
+    """열 값을 파이썬 값 목록으로 변환 (결측은 None)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+def _table_rows(table, chunk_rows=TABLE_CHUNK_ROWS):
+    """
+    표의 (값, 스타일) 행 반복자 - 스타일은 열별 문자열 또는 행별 배열에서 선택
+
+    chunk_rows행씩 파이썬 값으로 변환하므로 메모리 사용량이 표 크기가 아니라 청크 크기에 비례합니다.
+    """
+    data = table.data
+    styles = table.cell_styles()
+    for start in range(0, len(data), chunk_rows):
+        chunk = data.iloc[start:start + chunk_rows]
+        columns = [_column_values(chunk.iloc[:, i]) for i in range(chunk.shape[1])]
+        chunk_styles = [[style] * len(chunk) if style is None or isinstance(style, str)
+                        else style[start:start + chunk_rows].tolist() for style in styles]
+        yield from zip(zip(*columns), zip(*chunk_styles))
+
+
+def _sheet_stage(profiler, sheet):
+    rows = sum(len(table.data) for table in sheet.tables)
+    return profiler.stage(f'sheet:{sheet.name}', category='sheet', rows_in=rows)
+
+
+class XlsxWriterRenderer:
+    """xlsxwriter constant_memory 모드 엑셀 렌더러 (행 순서대로 기록 후 바로 파일로 내보냄)"""
+
+    extension = '.xlsx'
+
+    @staticmethod
+    def _import_xlsxwriter():
+        try:
+            import xlsxwriter
+            return xlsxwriter
+        except ImportError:
+            logger.error("❌ xlsxwriter 패키지가 설치되지 않았습니다.")
+            logger.error("   pip install xlsxwriter 로 설치하거나")
+            logger.error("   renderer='openpyxl'을 사용하세요.")
+            raise
+
+    @staticmethod
+    def _formats(workbook):
+        """STYLES를 xlsxwriter Format으로 변환"""
+        formats = {}
+        for name, spec in STYLES.items():
+            options = {}
+            if spec.get('bold'):
+                options['bold'] = True
+            if 'size' in spec:
+                options['font_size'] = spec['size']
+            if 'color' in spec:
+                options['font_color'] = f"#{spec['color']}"
+            if 'fill' in spec:
+                options.update(pattern=1, bg_color=f"#{spec['fill']}")
+            if 'align' in spec:
+                options.update(align=spec['align'], valign='vcenter')
+            if spec.get('border'):
+                options['border'] = 1
+            if 'number_format' in spec:
+                options['num_format'] = spec['number_format']
+            formats[name] = workbook.add_format(options)
+        return formats
+
+    def render(self, sheets, output_path, profiler=None):
+        """
+        Args:
+            sheets: report_model.Sheet 목록
+            output_path: 엑셀 파일 경로
+            profiler: 시트별 시간/행 수를 기록할 StageProfiler
+        """
+        xlsxwriter = self._import_xlsxwriter()
+        profiler = profiler if profiler is not None else StageProfiler()
+        workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'nan_inf_to_errors': True})
+        formats = self._formats(workbook)
+        for sheet in sheets:
+            with _sheet_stage(profiler, sheet) as record:
+                record['rows_out'] = self._write_sheet(workbook, formats, sheet)
+        workbook.close()
+        return output_path
+
+    def _write_sheet(self, workbook, formats, sheet):
+        """시트 기록 (constant_memory 모드는 행 순서대로만 기록 가능) - 기록한 행 수 반환"""
+        ws = workbook.add_worksheet(sheet.name)
+        for col, width in sheet.widths.items():
+            ws.set_column(col - 1, col - 1, width)
+
+        row = -1
+        if sheet.title is not None:
+            ws.set_row(0, TITLE_HEIGHT)
+            ws.merge_range(0, 0, 0, TITLE_SPAN - 1, sheet.title, formats['report_title'])
+            row = 1
+        for label, value in sheet.info:
+            row += 1
+            ws.write(row, 0, label, formats['report_label'])
+            ws.write(row, 1, value)
+
+        for table, start in zip(sheet.tables, sheet.layout()):
+            row = start
+            if table.title is not None:
+                if table.title_span:
+                    ws.merge_range(row, 0, row, table.title_span - 1, table.title, formats['report_section'])
+                else:
+                    ws.write(row, 0, table.title, formats['report_section'])
+                row += 1
+            header_row = row
+            ws.write_row(row, 0, table.headers, formats[table.header_style])
+            for values, styles in _table_rows(table):
+                row += 1
+                for col, (value, style) in enumerate(zip(values, styles)):
+                    cell_format = formats[style] if style is not None else None
+                    if value is None:
+                        ws.write_blank(row, col, None, cell_format)
+                    else:
+                        ws.write(row, col, value, cell_format)
+
+            if sheet.auto_filter and table is sheet.tables[0]:
+                ws.autofilter(header_row, 0, row, len(table.headers) - 1)
+            if table.chart is not None and row > header_row:
+                self._insert_chart(workbook, ws, sheet.name, table, start, header_row, row)
+        return row + 1
+
+    @staticmethod
+    def _insert_chart(workbook, ws, sheet_name, table, start, header_row, last_row):
+        """표(1열: 분류, 2열부터: 계열)를 원본으로 하는 차트를 표 오른쪽에 배치"""
+        chart_spec = table.chart
+        if chart_spec.kind == 'stacked_column':
+            chart = workbook.add_chart({'type': 'column', 'subtype': 'stacked'})
+        else:
+            chart = workbook.add_chart({'type': chart_spec.kind})
+        for col in range(1, len(table.headers)):
+            series = {
+                'name': [sheet_name, header_row, col],
+                'categories': [sheet_name, header_row + 1, 0, last_row, 0],
+                'values': [sheet_name, header_row + 1, col, last_row, col],
+            }
+            if chart_spec.kind == 'stacked_column':
+                series['overlap'] = 100
+            chart.add_series(series)
+        chart.set_title({'name': chart_spec.title})
+        if chart_spec.y_title is not None:
+            chart.set_y_axis({'name': chart_spec.y_title})
+        ws.insert_chart(start, len(table.headers) + 2, chart)
+
+
+class HTMLRenderer:
+    """정적 HTML 렌더러 (시트마다 구역 하나, 셀 스타일은 CSS 클래스)"""
+
+    extension = '.html'
+
+    @staticmethod
+    def stylesheet():
+        """STYLES를 CSS 규칙으로 변환"""
+        rules = ['body { font-family: Calibri, Arial, sans-serif; font-size: 11pt; }',
+                 'table { border-collapse: collapse; margin-bottom: 1.5em; }',
+                 'td, th { padding: 2px 6px; text-align: left; }']
+        for name, spec in STYLES.items():
+            declarations = []
+            if spec.get('bold'):
+                declarations.append('font-weight: bold')
+            if 'size' in spec:
+                declarations.append(f"font-size: {spec['size']}pt")
+            if 'color' in spec:
+                declarations.append(f"color: #{spec['color']}")
+            if 'fill' in spec:
+                declarations.append(f"background-color: #{spec['fill']}")
+            if 'align' in spec:
+                declarations.append(f"text-align: {spec['align']}")
+            if spec.get('border'):
+                declarations.append('border: 1px solid #000')
+            if 'number_format' in spec:
+                declarations.append('font-variant-numeric: tabular-nums')
+            rules.append(f".{name} {{ {'; '.join(declarations)} }}")
+        return '\n'.join(rules)
+
+    @staticmethod
+    def _cell_text(value, style):
+        """셀 표시 문자열 (숫자 서식 스타일은 천 단위 구분, 소수 둘째 자리)"""
+        if value is None:
+            return ''
+        if style is not None and STYLES[style].get('number_format') == NUMBER_FORMAT and \
+                isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f"{value:,.2f}"
+        return html.escape(str(value))
+
+    @staticmethod
+    def _cell(tag, text, style):
+        return f'<{tag} class="{style}">{text}</{tag}>' if style is not None else f'<{tag}>{text}</{tag}>'
+
+    def render(self, sheets, output_path, profiler=None):
+        """
+        Args:
+            sheets: report_model.Sheet 목록
+            output_path: HTML 파일 경로
+            profiler: 시트별 시간/행 수를 기록할 StageProfiler
+        """
+        profiler = profiler if profiler is not None else StageProfiler()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n')
+            title = next((sheet.title for sheet in sheets if sheet.title is not None), 'Report')
+            f.write(f'<title>{html.escape(title)}</title>\n<style>\n{self.stylesheet()}\n</style>\n</head>\n<body>\n')
+            f.write('<nav>' + ' | '.join(f'<a href="#sheet-{i}">{html.escape(sheet.name)}</a>'
+                                         for i, sheet in enumerate(sheets)) + '</nav>\n')
+            for i, sheet in enumerate(sheets):
+                with _sheet_stage(profiler, sheet) as record:
+                    record['rows_out'] = self._write_sheet(f, i, sheet)
+            f.write('</body>\n</html>\n')
+        return output_path
+
+    def _write_sheet(self, f, index, sheet):
+        """시트 구역 기록 - 기록한 행 수 반환"""
+        f.write(f'<section id="sheet-{index}">\n<h2>{html.escape(sheet.name)}</h2>\n')
+        if sheet.title is not None:
+            f.write(f'<h1 class="report_title">{html.escape(sheet.title)}</h1>\n')
+        if sheet.info:
+            f.write('<table>\n')
+            for label, value in sheet.info:
+                f.write(f'<tr>{self._cell("th", html.escape(label), "report_label")}'
+                        f'<td>{html.escape(str(value))}</td></tr>\n')
+            f.write('</table>\n')
+
+        rows = 0
+        for table in sheet.tables:
+            if table.title is not None:
+                f.write(f'<h3 class="report_section">{html.escape(table.title)}</h3>\n')
+            f.write('<table>\n<thead><tr>')
+            f.write(''.join(self._cell('th', html.escape(str(header)), table.header_style)
+                            for header in table.headers))
+            f.write('</tr></thead>\n<tbody>\n')
+            for values, styles in _table_rows(table):
+                f.write('<tr>' + ''.join(self._cell('td', self._cell_text(value, style), style)
+                                         for value, style in zip(values, styles)) + '</tr>\n')
+            f.write('</tbody>\n</table>\n')
+            rows += len(table.data) + 1
+        f.write('</section>\n')
+        return rows
+
+
+class CSVRenderer:
+    """CSV 렌더러 (output_path 디렉터리에 표마다 '<시트>[_<번호>].csv', 서식/차트 없음)"""
+
+    extension = ''
+
+    @staticmethod
+    def _file_name(sheet, index):
+        name = re.sub(r'[^\w.-]+', '_', sheet.name).strip('_') or 'sheet'
+        return f"{name}_{index + 1}.csv" if len(sheet.tables) > 1 else f"{name}.csv"
+
+    def render(self, sheets, output_path, profiler=None):
+        """
+        Args:
+            sheets: report_model.Sheet 목록
+            output_path: CSV 파일을 저장할 디렉터리 (없으면 생성)
+            profiler: 시트별 시간/행 수를 기록할 StageProfiler
+        """
+        profiler = profiler if profiler is not None else StageProfiler()
+        os.makedirs(output_path, exist_ok=True)
+        for sheet in sheets:
+            with _sheet_stage(profiler, sheet) as record:
+                record['rows_out'] = 0
+                for i, table in enumerate(sheet.tables):
+                    table.data.to_csv(os.path.join(output_path, self._file_name(sheet, i)),
+                                      header=table.headers, index=False, encoding='utf-8-sig')
+                    record['rows_out'] += len(table.data) + 1
+        return output_path
+
+
+RENDERERS = {
+    'xlsxwriter': XlsxWriterRenderer,
+    'html': HTMLRenderer,
+    'csv': CSVRenderer,
+}
+
+
+def get_renderer(name):
+    """이름으로 렌더러 백엔드 선택"""
+    if name not in RENDERERS:
+        raise ValueError(f"지원하지 않는 렌더러입니다: {name} (지원: openpyxl, {', '.join(RENDERERS)})")
+    return RENDERERS[name]()
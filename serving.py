@@ -0,0 +1,120 @@
+"""
+Dash 앱 운영 서비스 도구 (WSGI)
+
+- install_compression: JSON / HTML / JS / CSS 응답 gzip 압축
+- preload: fork 전에 데이터 로드와 Dash 서버 초기화
+- serve: 소켓을 공유하는 waitress 워커 프로세스 (pre-fork)
+
+진입점은 wsgi.py입니다.
+"""
+import gzip
+import os
+import signal
+import socket
+
+from flask import request
+
+from profiling import get_logger
+
+
+logger = get_logger('serving')
+
+
+# 압축할 응답 형식 (이미지/폰트 등 이미 압축된 형식 제외)
+COMPRESS_MIMETYPES = ('application/json', 'text/html', 'text/css', 'text/plain',
+                      'application/javascript', 'text/javascript')
+
+
+def install_compression(server, level=6, min_size=500):
+    """
+    Flask 서버 응답 gzip 압축 (클라이언트가 Accept-Encoding: gzip을 보낸 경우)
+
+    Args:
+        server: Flask 앱 (app.server)
+        level: gzip 압축 수준 (1~9)
+        min_size: 이 크기(바이트) 미만 응답은 압축하지 않음
+    """
+    @server.after_request
+    def compress_response(response):
+        if (response.direct_passthrough or response.status_code != 200
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESS_MIMETYPES
+                or 'gzip' not in request.accept_encodings):
+            return response
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=level, mtime=0))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+
+    return server
+
+
+def preload(app, service):
+    """
+    워커가 요청을 받기 전에 할 일을 미리 실행 (fork 전에 호출하면 워커가 결과를 그대로 물려받음)
+
+    - 모든 데이터셋 로드 (공유 디렉터리를 쓰면 Arrow 스냅샷 매핑)
+    - Dash 서버 초기화: 첫 요청 때 콜백 목록을 채우므로, 동시에 들어온 첫 요청들이
+      채우는 중인 목록을 보고 실패하지 않도록 미리 한 번 요청
+    """
+    for name in service.names():
+        service.data(name)
+    app.server.test_client().get('/_dash-layout')
+
+
+def _import_waitress():
+    try:
+        import waitress
+        return waitress
+    except ImportError:
+        logger.error("❌ waitress 패키지가 설치되지 않았습니다.")
+        logger.error("   pip install waitress 로 설치하거나")
+        logger.error("   gunicorn -w 4 --preload wsgi:application 으로 실행하세요.")
+        raise
+
+
+def serve(application, host='127.0.0.1', port=8050, workers=1, threads=8):
+    """
+    워커 프로세스 서비스 (소켓을 먼저 열고 fork하여 워커들이 같은 소켓에서 연결을 받음)
+
+    Args:
+        application: WSGI 앱 (preload를 마친 상태)
+        workers: 워커 프로세스 수
+        threads: 워커당 요청 처리 스레드 수
+    """
+    waitress = _import_waitress()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+
+    logger.info("🚀 http://%s:%d (워커 %d개 × 스레드 %d개)", host, port, workers, threads)
+    if workers <= 1:
+        waitress.serve(application, sockets=[sock], threads=threads)
+        return
+
+    children = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            waitress.serve(application, sockets=[sock], threads=threads)
+            os._exit(0)
+        children.append(pid)
+
+    def stop(signum, frame):
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for child in children:
+        os.waitpid(child, 0)
+    sock.close()
@@ -0,0 +1,241 @@
+"""
+ETL 결과 저장소 (CSV / Parquet)
+BloombergETL.load와 EconomicReportGenerator.load_data가 파일 확장자에 따라 같은 백엔드를 사용합니다.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from profiling import get_logger
+
+
+# Parquet 스키마 메타데이터: float32로 저장한 컬럼과 복원 시 반올림 자릿수
+FLOAT32_METADATA_KEY = b'economic_report.float32_decimals'
+
+logger = get_logger('storage')
+
+
+def _filter_dates(df, start_date, end_date):
+    if start_date is not None:
+        df = df[df['date'] >= pd.Timestamp(start_date)]
+    if end_date is not None:
+        df = df[df['date'] <= pd.Timestamp(end_date)]
+    return df
+
+
+def float32_decimals(values, max_decimals=6):
+    """
+    float32로 저장해도 손실이 없는지 확인하고, 복원에 필요한 소수 자릿수 반환
+
+    값이 소수 d자리로 반올림되어 있고 float32 -> float64 변환 후 d자리 반올림으로
+    원래 값이 정확히 복원될 때만 d를 반환하며, 그렇지 않으면 None을 반환합니다.
+    """
+    finite = values[np.isfinite(values)]
+    for decimals in range(max_decimals + 1):
+        if not np.array_equal(np.round(finite, decimals), finite):
+            continue
+        with np.errstate(over='ignore'):
+            restored = np.round(finite.astype(np.float32).astype(np.float64), decimals)
+        return decimals if np.array_equal(restored, finite) else None
+    return None
+
+
+class CSVStorage:
+    """UTF-8-BOM CSV 저장소 (엑셀 호환 내보내기용)"""
+
+    extension = '.csv'
+
+    def write(self, df, path):
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+    def open_writer(self, path):
+        """배치 단위로 이어 쓰는 writer (청크 파이프라인용)"""
+        return CSVBatchWriter(path)
+
+    def read(self, path, columns=None, start_date=None, end_date=None):
+        """
+        Args:
+            columns: 읽을 컬럼 목록 (None이면 전체)
+            start_date, end_date: date 컬럼 범위 (읽은 뒤 필터링)
+        """
+        usecols = None
+        if columns is not None:
+            usecols = list(columns)
+            if 'date' not in usecols and (start_date is not None or end_date is not None):
+                usecols.append('date')
+        df = pd.read_csv(path, usecols=usecols)
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+        df = _filter_dates(df, start_date, end_date)
+        if columns is not None:
+            df = df[list(columns)]
+        return df.reset_index(drop=True)
+
+
+class ParquetStorage:
+    """
+    Parquet 저장소 (pyarrow 필요)
+
+    datetime/Categorical dtype을 그대로 보존하고, 손실 없이 줄일 수 있는 float64 컬럼은
+    float32로 저장합니다. 읽을 때는 컬럼 선택과 날짜 조건을 파일 단위로 적용(pushdown)합니다.
+    """
+
+    extension = '.parquet'
+
+    def __init__(self, row_group_size=256 * 1024, compression='zstd'):
+        """
+        Args:
+            row_group_size: row group 행 수 (날짜 조건 pushdown 단위)
+            compression: Parquet 압축 코덱
+        """
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+    @staticmethod
+    def _import_pyarrow():
+        try:
+            import pyarrow
+            import pyarrow.parquet
+            return pyarrow, pyarrow.parquet
+        except ImportError:
+            logger.error("❌ pyarrow 패키지가 설치되지 않았습니다.")
+            logger.error("   pip install pyarrow 로 설치하거나")
+            logger.error("   .csv 경로를 사용하세요.")
+            raise
+
+    def write(self, df, path):
+        pa, pq = self._import_pyarrow()
+
+        downcast = {}
+        columns = {}
+        for name in df.columns:
+            column = df[name]
+            if column.dtype == np.float64:
+                decimals = float32_decimals(column.to_numpy())
+                if decimals is not None:
+                    downcast[name] = decimals
+                    column = column.astype(np.float32)
+            columns[name] = column
+
+        table = pa.Table.from_pandas(pd.DataFrame(columns, copy=False), preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[FLOAT32_METADATA_KEY] = json.dumps(downcast).encode()
+        table = table.replace_schema_metadata(metadata)
+
+        pq.write_table(table, path, row_group_size=self.row_group_size, compression=self.compression)
+
+    def open_writer(self, path):
+        """배치 단위로 row group을 추가하는 writer (청크 파이프라인용)"""
+        return ParquetBatchWriter(path, self)
+
+    def read(self, path, columns=None, start_date=None, end_date=None):
+        """
+        Args:
+            columns: 읽을 컬럼 목록 (None이면 전체, 선택한 컬럼만 디스크에서 읽음)
+            start_date, end_date: date 컬럼 범위 (row group 통계로 pushdown)
+
+        로컬 파일은 메모리 매핑으로 읽어 읽기 버퍼 복사를 줄입니다.
+        """
+        _, pq = self._import_pyarrow()
+
+        filters = []
+        if start_date is not None:
+            filters.append(('date', '>=', pd.Timestamp(start_date)))
+        if end_date is not None:
+            filters.append(('date', '<=', pd.Timestamp(end_date)))
+
+        table = pq.read_table(path, columns=list(columns) if columns is not None else None,
+                              filters=filters or None, memory_map=True)
+        downcast = json.loads((table.schema.metadata or {}).get(FLOAT32_METADATA_KEY, b'{}'))
+        df = table.to_pandas()
+
+        # float32로 저장한 컬럼을 원래 float64 값으로 복원
+        for name, decimals in downcast.items():
+            if name in df.columns:
+                df[name] = np.round(df[name].astype(np.float64), decimals)
+        return df
+
+
+class CSVBatchWriter:
+    """CSV 배치 writer - 첫 배치만 BOM과 헤더를 쓰고 이후 배치는 이어 씀"""
+
+    def __init__(self, path):
+        self.path = path
+        self.rows = 0
+        self._file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._columns = None
+        self._header_written = False
+
+    def write(self, df):
+        if self._columns is None:
+            self._columns = list(df.columns)
+        elif list(df.columns) != self._columns:
+            raise ValueError(f"배치 컬럼이 다릅니다: {list(df.columns)} (기존: {self._columns})")
+        # 빈 배치(전부 격리/필터된 배치)도 헤더는 쓰므로 행 수가 아니라 별도 플래그로 한 번만 기록
+        df.to_csv(self._file, index=False, header=not self._header_written)
+        self._header_written = True
+        self.rows += len(df)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ParquetBatchWriter:
+    """
+    Parquet 배치 writer - 배치마다 row group을 추가
+
+    배치 간 스키마를 맞추기 위해 float 컬럼은 float64 그대로 저장하고(float32 축소 없음),
+    Categorical 컬럼은 int32 인덱스 dictionary로 고정합니다.
+    """
+
+    def __init__(self, path, storage):
+        self.path = path
+        self.rows = 0
+        self._pa, self._pq = storage._import_pyarrow()
+        self._compression = storage.compression
+        self._schema = None
+        self._writer = None
+
+    def write(self, df):
+        pa = self._pa
+        if self._schema is None:
+            schema = pa.Schema.from_pandas(df, preserve_index=False)
+            for i, field in enumerate(schema):
+                if pa.types.is_dictionary(field.type):
+                    schema = schema.set(i, field.with_type(pa.dictionary(pa.int32(), field.type.value_type)))
+            self._schema = schema
+            self._writer = self._pq.ParquetWriter(self.path, schema, compression=self._compression)
+        self._writer.write_table(pa.Table.from_pandas(df, schema=self._schema, preserve_index=False))
+        self.rows += len(df)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+STORAGE_BACKENDS = {
+    CSVStorage.extension: CSVStorage,
+    ParquetStorage.extension: ParquetStorage,
+}
+
+
+def get_storage(path):
+    """파일 확장자로 저장소 백엔드 선택"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in STORAGE_BACKENDS:
+        raise ValueError(f"지원하지 않는 저장 형식입니다: {path} (지원: {', '.join(STORAGE_BACKENDS)})")
+    return STORAGE_BACKENDS[extension]()
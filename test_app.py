@@ -101,3 +101,260 @@ def test_button_callback():
     assert count_clicks(0) == "버튼 클릭 횟수: 0"
     assert count_clicks(5) == "버튼 클릭 횟수: 5"
     assert count_clicks(100) == "버튼 클릭 횟수: 100"
+
+
+def test_dataset_service_lookup_and_figure_cache():
+    """데이터 서비스 색인 조회, 차트 메모이즈 및 갱신 시 무효화 테스트"""
+    import pandas as pd
+    from data_service import DatasetService
+
+    service = DatasetService(max_figures=1)
+    df = pd.DataFrame({"과일": ["사과", "배"], "수량": [10, 5], "가격": [1000, 2000]})
+    service.register("fruits", df, key_column="과일", value_column="수량", title="과일별 수량")
+
+    assert service.lookup("fruits", "배")["가격"] == 2000
+    assert service.lookup("fruits", "없는과일") is None
+
+    fig = service.figure("fruits")
+    assert service.figure("fruits") is fig
+    assert service.figure_builds == 1
+
+    service.refresh("fruits", df.assign(수량=[1, 2]))
+    assert service.version("fruits") == 2
+    refreshed = service.figure("fruits")
+    assert refreshed is not fig
+    assert list(refreshed.data[0].y) == [1, 2]
+
+    # max_figures=1 -> 다른 데이터셋 차트가 캐시되면 이전 차트 제거
+    service.register("meats", df.rename(columns={"과일": "육류"}), key_column="육류",
+                     value_column="수량", title="육류별 수량")
+    service.figure("meats")
+    assert service.figure("fruits") is not refreshed
+    assert service.figure_builds == 4
+
+    # loader로 등록한 데이터셋은 처음 사용할 때 불러옴
+    service.register("lazy", key_column="과일", value_column="수량", title="지연 로딩", loader=lambda: df)
+    assert not service.is_loaded("lazy")
+    assert service.lookup("lazy", "사과")["수량"] == 10
+    assert service.is_loaded("lazy")
+
+
+def test_app_callbacks_use_data_service():
+    """선택 콜백이 정보 텍스트와 막대 강조 Patch만 반환하는지 테스트"""
+    from app import HIGHLIGHT_COLOR, BAR_COLOR, display_item_info, highlight_selected, service
+
+    assert display_item_info("fruits", "바나나") == ("선택된 과일: 바나나", "수량: 7개", "가격: 500원")
+    assert display_item_info("meats", "닭고기")[1] == "수량: 20kg"
+    assert display_item_info("meats", None) == ("육류를 선택해주세요.", "", "")
+    assert display_item_info("fruits", "두리안") == ("과일을 선택해주세요.", "", "")   # 목록에 없는 이전 선택 값
+
+    operation, = highlight_selected("fruits", "바나나").to_plotly_json()["operations"]
+    assert operation["location"] == ["data", 0, "marker", "color"]
+    colors = operation["params"]["value"]
+    assert colors[service.items("fruits").index("바나나")] == HIGHLIGHT_COLOR
+    assert colors.count(BAR_COLOR) == len(colors) - 1
+
+
+def test_callbacks_are_registry_driven():
+    """카테고리 수와 무관하게 패턴 매칭 콜백 하나씩만 등록되고 클릭 카운트는 클라이언트에서 처리되는지 테스트"""
+    import json
+    from app import app
+
+    dependencies = [dependency for dependency in json.loads(app.server.test_client().get('/_dash-dependencies').data)
+                    if 'indicator-' not in dependency['output']]
+    assert len(dependencies) == 4
+
+    clientside = {dependency['clientside_function']['function_name']
+                  for dependency in dependencies if dependency.get('clientside_function')}
+    assert clientside == {'countClicks', 'showTab'}
+
+
+def test_tab_content_loaded_on_first_view():
+    """탭 내용이 처음 선택할 때만 서버에서 생성되고 다시 선택하면 요청이 없는지 테스트"""
+    from benchmarks.bench_dash_payload import CLIENTSIDE
+    from benchmarks.dash_harness import DashSession
+    from app import app
+
+    session = DashSession(app, clientside=CLIENTSIDE)
+    session.load()
+    assert session.get_prop({"type": "info-name", "index": "fruits"}, "children") == "선택된 과일: 사과"
+    assert session.get_prop({"type": "info-name", "index": "meats"}, "children") is None
+
+    session.set_prop("tabs", "value", "tab-meats")
+    assert session.get_prop({"type": "info-name", "index": "meats"}, "children") == "선택된 육류: 소고기"
+
+    requests = session.requests
+    session.set_prop("tabs", "value", "tab-fruits")
+    assert session.requests == requests
+    assert session.get_prop({"type": "tab-panel", "index": "fruits"}, "style") == {"display": "block"}
+
+
+def test_etl_output_source_rereads_only_changed_partitions(tmp_path):
+    """ETL 결과 분할 저장 디렉터리에서 바뀐 파티션만 다시 읽는지 테스트"""
+    import os
+    import pandas as pd
+    from incremental_store import PartitionedStore
+    from indicator_data import ETLOutputSource, downsample, filter_rows
+    from transform_engine import transform_indicators
+
+    sample_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bloomberg_sample_data.csv')
+    transformed = transform_indicators(pd.read_csv(sample_path))
+    store = PartitionedStore(str(tmp_path))
+    partitions = store.write(transformed)
+
+    source = ETLOutputSource(str(tmp_path))
+    assert len(source.data()) == len(transformed)
+    assert source.file_reads == len(partitions)
+    assert not source.poll()
+
+    # 한 파티션만 다시 쓰면 그 파일만 다시 읽음
+    changed = transformed[transformed['date'] == transformed['date'].max()].copy()
+    changed['actual'] = changed['actual'] + 1
+    rewritten = store.write(changed)
+    os.utime(store.partition_path(*rewritten[0]), ns=(0, 1))
+    assert source.poll()
+    assert source.file_reads == len(partitions) + len(rewritten)
+    assert source.version == 2
+
+    usa = filter_rows(source.data(), countries=['USA'], start_date='2024-06-01')
+    assert set(usa['country']) == {'USA'} and usa['date'].min() >= pd.Timestamp('2024-06-01')
+
+    # 시계열당 10개 -> 4개 구간 평균 (구간: 3, 2, 3, 2개)
+    series = pd.DataFrame({
+        'country': 'USA', 'indicator': 'CPI',
+        'date': pd.date_range('2024-01-01', periods=10, freq='MS'),
+        'actual': range(10), 'forecast': 0.0,
+    })
+    points = downsample(series, max_points=4)
+    assert list(points['actual']) == [1.0, 3.5, 6.0, 8.5]
+    assert list(points['date']) == list(series['date'].iloc[[0, 3, 5, 8]])
+
+
+def test_indicator_charts_use_scattergl():
+    """경제지표 차트가 서버에서 필터링되어 WebGL 트레이스로 반환되는지 테스트"""
+    import os
+    import pandas as pd
+    from app import INDICATORS, service, update_indicator_charts
+    from transform_engine import transform_indicators
+
+    sample_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bloomberg_sample_data.csv')
+    service.refresh(INDICATORS, transform_indicators(pd.read_csv(sample_path)))
+
+    summary, series, surprises = update_indicator_charts(['USA'], ['CPI'], '2024-03-01', None, 1)
+    assert summary == "2개 레코드 → 차트 2개 점"
+    trace, = series.data
+    assert trace.type == "scattergl" and trace.name == "USA CPI"
+    assert sum(sum(bar.y) for bar in surprises.data) == 2
+
+    assert update_indicator_charts(['USA'], ['CPI'], '2024-03-01', None, 1) is \
+        update_indicator_charts(['USA'], ['CPI'], '2024-03-01', None, 1)
+
+
+def test_indicator_query_matches_mask_filter():
+    """색인 조회(시계열/기간/시점/최신값)가 마스크 필터와 같은 행을 돌려주는지 테스트"""
+    import pandas as pd
+    from benchmarks.synthetic import generate_transformed_data
+    from indicator_data import filter_rows
+    from indicator_query import IndicatorQuery
+
+    df = generate_transformed_data(n_countries=4, n_indicators=3, n_periods=60)
+    query = IndicatorQuery(df)
+    keys = ['indicator', 'country', 'date']
+    assert list(query.index.names) == keys and query.index.is_monotonic_increasing
+
+    countries, indicators = query.countries[1:3], query.indicators[:2]
+    expected = filter_rows(df, countries, indicators, '2002-01-01', '2003-06-30')
+    expected = expected.sort_values(keys, kind='stable').reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        query.range(indicators, countries, '2002-01-01', '2003-06-30').reset_index(drop=True), expected)
+    assert len(query.range()) == len(df)
+    assert query.range(['없는 지표']).empty
+
+    row = df.iloc[100]
+    assert query.point(row['indicator'], row['country'], row['date']) == row.to_dict()
+    assert query.point(row['indicator'], row['country'], '1990-01-01') is None
+    assert len(query.series(row['indicator'], row['country'])) == \
+        len(filter_rows(df, [row['country']], [row['indicator']]))
+
+    latest = query.latest(as_of='2003-06-30')
+    assert len(latest) == len(query.indicators) * len(query.countries)
+    assert (latest['date'] <= pd.Timestamp('2003-06-30')).all()
+    last = filter_rows(df, end_date='2003-06-30').groupby(['indicator', 'country'], observed=True)['date'].max()
+    assert list(latest['date']) == list(last)
+
+
+def test_shared_result_cache_between_workers(tmp_path):
+    """공유 결과 캐시: 같은 데이터를 가진 다른 워커(서비스)는 결과를 다시 계산하지 않는지 테스트"""
+    import json
+    import pandas as pd
+    from data_service import DatasetService, SharedResultCache
+
+    df = pd.DataFrame({"과일": ["사과", "배"], "수량": [10, 5], "가격": [1000, 2000]})
+    workers = [DatasetService(shared_cache=SharedResultCache(str(tmp_path / "cache.sqlite"))) for _ in range(2)]
+    for service in workers:
+        service.register("fruits", df.copy(), key_column="과일", value_column="수량", title="과일별 수량")
+
+    assert workers[0].token("fruits") == workers[1].token("fruits")
+    fig = workers[0].figure("fruits")
+    shared = workers[1].figure("fruits")
+    assert workers[1].figure_builds == 0
+    assert type(shared) is type(fig)
+    assert json.loads(shared.to_json()) == json.loads(fig.to_json())
+
+    # 데이터가 바뀐 워커는 다른 키를 사용하므로 새로 계산
+    workers[1].refresh("fruits", df.assign(수량=[1, 2]))
+    assert list(workers[1].figure("fruits").data[0].y) == [1, 2]
+    assert workers[1].figure_builds == 1
+    assert workers[1].shared_cache.stats()["entries"] == 2
+
+
+def test_etl_output_source_shared_snapshot(tmp_path):
+    """공유 디렉터리를 지정하면 한 워커만 파일을 읽고 나머지는 Arrow 스냅샷을 매핑하는지 테스트"""
+    pytest.importorskip('pyarrow')
+    import os
+    import pandas as pd
+    from indicator_data import ETLOutputSource
+    from transform_engine import transform_indicators
+
+    sample_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bloomberg_sample_data.csv')
+    path = str(tmp_path / 'etl.csv')
+    transform_indicators(pd.read_csv(sample_path)).to_csv(path, index=False)
+    shared_dir = str(tmp_path / 'shared')
+
+    private = ETLOutputSource(path)
+    first, second = ETLOutputSource(path, shared_dir=shared_dir), ETLOutputSource(path, shared_dir=shared_dir)
+    pd.testing.assert_frame_equal(first.data(), private.data())
+    pd.testing.assert_frame_equal(second.data(), private.data())
+    assert (first.file_reads, second.file_reads) == (1, 0)
+    assert first.token() == second.token()
+    # 숫자 컬럼은 복사 없이 매핑된 읽기 전용 버퍼
+    assert not second.data()['actual'].to_numpy().flags.writeable
+
+    # 파일이 바뀌면 먼저 확인한 워커가 새 스냅샷을 기록하고 이전 스냅샷 삭제
+    os.utime(path, ns=(0, 1))
+    assert second.poll() and first.poll()
+    assert (first.file_reads, second.file_reads) == (1, 1)
+    assert len([name for name in os.listdir(shared_dir) if name.endswith('.arrow')]) == 1
+    assert len(first.data()) == len(private.data())
+
+
+def test_gzip_compression():
+    """Accept-Encoding: gzip 요청의 큰 응답만 압축되는지 테스트"""
+    import gzip
+    import json
+    import flask
+    from serving import install_compression
+
+    server = install_compression(flask.Flask(__name__), min_size=100)
+    server.add_url_rule("/big", "big", lambda: flask.jsonify(values=list(range(1000))))
+    server.add_url_rule("/small", "small", lambda: flask.jsonify(ok=True))
+    client = server.test_client()
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert json.loads(gzip.decompress(response.data))["values"][-1] == 999
+    assert int(response.headers["Content-Length"]) == len(response.data)
+
+    assert "Content-Encoding" not in client.get("/big").headers
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
@@ -0,0 +1,898 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bloomberg_sample_data.csv')
+
+
+def test_transform_indicators_values():
+    """파생 지표 계산 및 분류 경계값 테스트"""
+    from transform_engine import transform_indicators
+
+    raw = pd.DataFrame({
+        'date': ['2024-01-15'] * 5,
+        'indicator': ['CPI'] * 5,
+        'country': ['USA', 'Japan', 'China', 'USA', 'Japan'],
+        'forecast': [2.0, 100.0, 0.0, np.nan, -3.0],
+        'actual': [2.1, 99.0, 1.0, 1.0, -3.0],
+        'previous': [2.1, 98.0, 1.0, 2.0, -2.0],
+    })
+    df = transform_indicators(raw)
+
+    assert list(df['forecast_error_pct'][:2]) == [5.0, -1.0]
+    assert list(df['surprise']) == ['Positive Surprise', 'In Line', 'Positive Surprise', 'In Line', 'In Line']
+    assert list(df['trend']) == ['→ Stable', '↑ Improving', '→ Stable', '↓ Declining', '↓ Declining']
+    assert np.isinf(df['forecast_error_pct'][2])
+    assert df['forecast_accuracy'][2] == 0
+    assert np.isnan(df['forecast_accuracy'][3])
+
+
+def test_transform_indicators_dtypes():
+    """범주형 컬럼 dtype 및 원본 데이터 불변 테스트"""
+    from transform_engine import transform_indicators
+
+    raw = pd.read_csv(SAMPLE_PATH)
+    before = raw.copy()
+    df = transform_indicators(raw)
+
+    for column in ['country', 'indicator', 'surprise', 'trend']:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+    assert list(df.columns[:6]) == list(raw.columns)
+    pd.testing.assert_frame_equal(raw, before)
+
+
+def test_etl_transform_uses_engine():
+    """BloombergETL.transform 결과 테스트"""
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = pd.read_csv(SAMPLE_PATH)
+    df = etl.transform()
+
+    assert len(df) == 30
+    assert len(df.columns) == 13
+    assert df['forecast_error'].equals(df['actual'] - df['forecast'])
+
+
+def test_incremental_pipeline_rewrites_only_changed_partitions(tmp_path, monkeypatch):
+    """증분 ETL이 신규/재발표 행이 속한 파티션만 다시 쓰는지 테스트"""
+    from etl_bloomberg import BloombergETL
+    from incremental_store import PartitionedStore
+
+    monkeypatch.chdir(tmp_path)
+    sample = pd.read_csv(SAMPLE_PATH)
+    sample.to_csv('bloomberg_sample_data.csv', index=False)
+
+    etl = BloombergETL(use_sample=True)
+    etl.run_incremental(output_dir='out')
+    assert len(etl.rewritten_partitions) == 10
+
+    # 변경 없음 -> 다시 쓰는 파티션 없음
+    etl = BloombergETL(use_sample=True)
+    assert etl.run_incremental(output_dir='out').empty
+    assert etl.rewritten_partitions == []
+
+    # 2024-10 CPI의 previous 재발표 + 2024-11 CPI 신규 발표
+    sample.loc[(sample['date'] == '2024-10-15') & (sample['country'] == 'USA'), 'previous'] = 3.0
+    new_row = {'date': '2024-11-15', 'indicator': 'CPI', 'country': 'USA',
+               'forecast': 2.6, 'actual': 2.7, 'previous': 2.6}
+    pd.concat([sample, pd.DataFrame([new_row])]).to_csv('bloomberg_sample_data.csv', index=False)
+
+    etl = BloombergETL(use_sample=True)
+    changed = etl.run_incremental(output_dir='out')
+    assert len(changed) == 2
+    assert etl.rewritten_partitions == [('CPI', '2024-10'), ('CPI', '2024-11')]
+
+    store = PartitionedStore('out')
+    assert store.load_watermarks()[('USA', 'CPI')] == pd.Timestamp('2024-11-15')
+    restated = store.read_partition('CPI', '2024-10')
+    usa = restated[restated['country'] == 'USA'].iloc[0]
+    assert usa['previous'] == 3.0
+    assert usa['mom_change'] == usa['actual'] - 3.0
+    assert len(store.read_all()) == 31
+
+
+def test_incremental_rerun_keeps_partitions(tmp_path, monkeypatch):
+    """원천 데이터가 같으면 증분 ETL을 다시 실행해도 파티션 파일이 바이트 단위로 같은지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0)
+    output_dir = tmp_path / 'out'
+    options = dict(indicators=['GDP', 'CPI'], countries=['US', 'JP'], start_date='2024-01-01',
+                   end_date='2024-05-15', output_dir=str(output_dir))
+    BloombergETL(bloomberg_api=fake_blpapi).run_incremental(**options)
+    files = {path: path.read_bytes() for path in output_dir.rglob('month=*.csv')}
+
+    # lookback 구간(2024-04-14 ~)의 첫 발표도 previous가 저장된 값과 같아야 재발표로 보지 않음
+    etl = BloombergETL(bloomberg_api=fake_blpapi)
+    assert etl.run_incremental(**options).empty
+    assert etl.rewritten_partitions == []
+    assert {path: path.read_bytes() for path in output_dir.rglob('month=*.csv')} == files
+
+
+def test_incremental_features_match_full_recompute(tmp_path, monkeypatch):
+    """증분 ETL의 feature(전년 대비, 이동 통계, 순위)가 전체 재계산과 같은지 테스트 (신규 발표 + 재발표)"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from feature_engine import FEATURE_COLUMNS
+    from incremental_store import PartitionedStore
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0)
+    options = dict(indicators=['GDP', 'CPI'], countries=['US', 'JP', 'CN'], start_date='2022-01-01')
+    output_dir = str(tmp_path / 'out')
+
+    def check(end_date):
+        expected = BloombergETL(bloomberg_api=fake_blpapi, features=True).run_pipeline(
+            end_date=end_date, output_path=str(tmp_path / 'full.csv'), **options)
+        stored = PartitionedStore(output_dir).read_all()
+        expected = expected.astype({'country': str, 'indicator': str}).sort_values(
+            ['date', 'country', 'indicator'], ignore_index=True)
+        assert len(stored) == len(expected)
+        for column in FEATURE_COLUMNS:
+            assert np.allclose(stored[column], expected[column], equal_nan=True), column
+
+    BloombergETL(bloomberg_api=fake_blpapi, features=True).run_incremental(
+        end_date='2024-03-31', output_dir=output_dir, **options)
+    BloombergETL(bloomberg_api=fake_blpapi, features=True).run_incremental(
+        end_date='2024-06-30', output_dir=output_dir, **options)
+    check('2024-06-30')
+
+    # 2024-05 US CPI 재발표 -> 이후 발표의 변화량/이동 통계와 같은 날짜 국가 순위도 갱신
+    history = fake_blpapi.fake_history
+
+    def restated(ticker, start, end):
+        rows = history(ticker, start, end)
+        for row in rows:
+            if ticker == 'CPI US Index' and row['date'].isoformat() == '2024-05-15':
+                row['PX_LAST'] += 0.3
+        return rows
+
+    monkeypatch.setattr(fake_blpapi, 'fake_history', restated)
+    etl = BloombergETL(bloomberg_api=fake_blpapi, features=True)
+    etl.run_incremental(end_date='2024-06-30', output_dir=output_dir, lookback_days=62, **options)
+    assert etl.rewritten_partitions == [('CPI', '2024-05'), ('CPI', '2024-06')]
+    check('2024-06-30')
+
+
+def test_incremental_backfills_added_series(tmp_path, monkeypatch):
+    """나중에 추가한 시계열은 워터마크 기준이 아니라 start_date부터 적재하는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from incremental_store import PartitionedStore
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0)
+    output_dir = str(tmp_path / 'out')
+    BloombergETL(bloomberg_api=fake_blpapi).run_incremental(
+        ['GDP', 'CPI'], ['US', 'JP'], '2024-01-01', '2024-05-31', output_dir=output_dir)
+    BloombergETL(bloomberg_api=fake_blpapi).run_incremental(
+        ['GDP', 'CPI'], ['US', 'JP', 'CN'], '2024-01-01', '2024-05-31', output_dir=output_dir)
+
+    stored = PartitionedStore(output_dir).read_all()
+    added = stored[stored['country'] == 'CN']
+    assert len(added) == 2 * 5
+    assert added['date'].min() == pd.Timestamp('2024-01-15')
+    assert len(stored) == 3 * 2 * 5
+
+
+def test_load_parquet_roundtrip(tmp_path):
+    """Parquet 저장 시 dtype/값 보존, 컬럼 선택 및 기간 조건 읽기 테스트"""
+    pytest.importorskip('pyarrow')
+    from etl_bloomberg import BloombergETL
+    from storage import get_storage
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = pd.read_csv(SAMPLE_PATH)
+    etl.transform()
+    path = str(tmp_path / 'data.parquet')
+    etl.load(path, csv_export_path=str(tmp_path / 'data.csv'))
+
+    storage = get_storage(path)
+    pd.testing.assert_frame_equal(storage.read(path), etl.transformed_data, check_exact=True)
+    assert (tmp_path / 'data.csv').exists()
+
+    subset = storage.read(path, columns=['country', 'actual'], start_date='2024-05-01', end_date='2024-06-30')
+    assert list(subset.columns) == ['country', 'actual']
+    assert len(subset) == 6
+
+
+def test_float32_decimals():
+    """float32 저장 가능 여부 판단 테스트"""
+    from storage import float32_decimals
+
+    assert float32_decimals(np.array([2.5, -1.25, np.nan, np.inf])) == 2
+    assert float32_decimals(np.array([1 / 3])) is None
+    assert float32_decimals(np.array([123456789.5])) is None
+
+
+def test_extract_with_fake_bloomberg(monkeypatch):
+    """배치/동시 요청, PARTIAL_RESPONSE 파싱, 실패 종목 재시도 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+
+    sessions = []
+
+    class RecordingSession(fake_blpapi.Session):
+        latency = 0.01
+        page_size = 2
+        failures = {'CPI JP Index': 1, 'GDP US Index': 10}
+
+        def __init__(self, options=None):
+            super().__init__(options)
+            sessions.append(self)
+
+    monkeypatch.setattr(fake_blpapi, 'Session', RecordingSession)
+
+    etl = BloombergETL(bloomberg_api=fake_blpapi, batch_size=2, max_in_flight=3, max_retries=2)
+    df = etl.extract_from_bloomberg(['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'],
+                                    '2024-01-01', '2024-06-30')
+
+    # GDP US는 재시도 후에도 실패, 나머지 8개 시계열 × 6개월
+    assert len(df) == 8 * 6
+    assert list(etl.failed_securities) == ['GDP US Index']
+    assert list(df.columns) == ['date', 'indicator', 'country', 'forecast', 'actual', 'previous']
+    assert ((df['indicator'] == 'CPI') & (df['country'] == 'JP')).sum() == 6
+    assert sessions[0].max_in_flight > 1
+    # 첫 시도 5개 배치 + 재시도 (CPI JP, GDP US) + 재시도 (GDP US)
+    assert sessions[0].requests_sent == 7
+
+    usa_cpi = df[(df['indicator'] == 'CPI') & (df['country'] == 'US')]
+    assert np.isnan(usa_cpi['previous'].iloc[0])
+    assert (usa_cpi['previous'].iloc[1:].to_numpy() == usa_cpi['actual'].iloc[:-1].to_numpy()).all()
+
+
+def test_extraction_cache_fetches_only_gaps(tmp_path, monkeypatch):
+    """캐시된 구간은 다시 요청하지 않고 누락 구간만 요청하는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from extract_cache import ExtractionCache
+
+    requested = []
+
+    class RecordingSession(fake_blpapi.Session):
+        latency = 0
+
+        def sendRequest(self, request, correlationId=None):
+            requested.append((request.params['startDate'], request.params['endDate'], len(request.securities)))
+            return super().sendRequest(request, correlationId)
+
+    monkeypatch.setattr(fake_blpapi, 'Session', RecordingSession)
+    cache = ExtractionCache(str(tmp_path / 'cache.sqlite'))
+    etl = BloombergETL(bloomberg_api=fake_blpapi, cache=cache)
+
+    etl.extract_from_bloomberg(['GDP', 'CPI'], ['US', 'JP'], '2020-01-01', '2020-12-31')
+    assert cache.stats()['hits'] == 0
+
+    requested.clear()
+    df = etl.extract_from_bloomberg(['GDP', 'CPI'], ['US', 'JP'], '2020-07-01', '2021-03-31')
+    assert requested == [('20210101', '20210331', 4)]
+    assert cache.stats()['hits'] == 4 * 6
+    assert len(df) == 4 * 9
+
+    uncached = BloombergETL(bloomberg_api=fake_blpapi).extract_from_bloomberg(
+        ['GDP', 'CPI'], ['US', 'JP'], '2020-07-01', '2021-03-31')
+    pd.testing.assert_frame_equal(df, uncached)
+
+
+def test_extraction_cache_ttl_and_lru(tmp_path):
+    """최근 구간 TTL 만료 및 최대 크기 초과 시 LRU 제거 테스트"""
+    from extract_cache import ExtractionCache
+
+    now = [pd.Timestamp('2024-06-30').timestamp()]
+    cache = ExtractionCache(str(tmp_path / 'cache.sqlite'), max_bytes=25,
+                            field_ttls={'PX_LAST': 100}, recent_days=30, clock=lambda: now[0])
+
+    assert cache.ttl_for(['PX_LAST'], '2024-01-31') is None
+    assert cache.ttl_for(['PX_LAST'], '2024-06-30') == 100
+
+    cache.put('old', b'x' * 10)
+    cache.put('recent', b'y' * 10, ttl=100)
+    cache.commit()
+    now[0] += 50
+    assert cache.get('old') == b'x' * 10  # old가 최근 사용 항목이 됨
+
+    cache.put('new', b'z' * 10)
+    cache.commit()
+    assert cache.stats()['evictions'] == 1
+    assert cache.get('recent') is None
+    assert cache.get('old') is not None
+
+    now[0] += 1000
+    cache.put('recent', b'y' * 10, ttl=100)
+    now[0] += 101
+    assert cache.get('recent') is None
+    assert cache.get('new') == b'z' * 10
+
+
+def test_feature_engine_matches_pandas_and_extends_incrementally():
+    """시계열 feature가 pandas 그룹 연산 결과와 같고, 증분 계산이 전체 재계산과 같은지 테스트"""
+    import numpy as np
+    from benchmarks.synthetic import generate_raw_data
+    from feature_engine import FEATURE_COLUMNS, compute_features, extend_features
+    from transform_engine import transform_indicators
+
+    df = transform_indicators(generate_raw_data(4, 3, 30, seed=1))
+    featured = compute_features(df, window=6)
+
+    ordered = df.sort_values(['country', 'indicator', 'date'])
+    groups = ordered.groupby(['country', 'indicator'], observed=True)
+    expected = pd.DataFrame({
+        'actual_change': groups['actual'].diff(),
+        'error_roll_mean': groups['forecast_error'].transform(lambda x: x.rolling(6, min_periods=1).mean()),
+        'error_roll_std': groups['forecast_error'].transform(lambda x: x.rolling(6, min_periods=2).std()),
+        'yoy_change': groups['actual'].diff(12),
+    }).reindex(df.index)
+    for column in expected.columns:
+        assert np.allclose(featured[column], expected[column], equal_nan=True), column
+    assert featured.loc[featured['date'] == df['date'].max(), 'country_rank'].max() == 4
+
+    # 마지막 3개월 발표분을 나중에 추가
+    cutoff = sorted(df['date'].unique())[-3]
+    extended = extend_features(compute_features(df[df['date'] < cutoff], window=6),
+                               df[df['date'] >= cutoff], window=6)
+    full = compute_features(pd.concat([df[df['date'] < cutoff], df[df['date'] >= cutoff]], ignore_index=True),
+                            window=6)
+    for column in FEATURE_COLUMNS:
+        assert np.allclose(extended[column], full[column], equal_nan=True), column
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.parquet'])
+def test_chunked_pipeline_matches_in_memory(tmp_path, monkeypatch, extension):
+    """청크 파이프라인 결과가 메모리 내 파이프라인과 같고 행 순서가 고정되는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from storage import get_storage
+
+    if extension == '.parquet':
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0.0)
+    args = (['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+
+    full_path = str(tmp_path / f'full{extension}')
+    BloombergETL(bloomberg_api=fake_blpapi).run_pipeline(*args, output_path=full_path)
+    expected = get_storage(full_path).read(full_path)
+
+    etl = BloombergETL(bloomberg_api=fake_blpapi)
+    path = str(tmp_path / f'chunked{extension}')
+    assert etl.run_chunked(*args, output_path=path) == len(expected)
+    assert len(etl.raw_data) == 9 * 18 // 3  # 마지막 배치 (지표 1개)만 메모리에 남음
+
+    actual = get_storage(path).read(path)
+    assert list(actual['indicator'].drop_duplicates()) == ['CPI', 'GDP', 'UNEMPLOYMENT']
+    keys = ['indicator', 'date', 'country']
+    expected = expected.sort_values(keys, ignore_index=True)
+    for column in expected.columns:
+        left, right = actual[column], expected[column]
+        if pd.api.types.is_float_dtype(right):
+            assert np.array_equal(left.to_numpy(), right.to_numpy(), equal_nan=True), column
+        else:
+            assert (left.astype(str) == right.astype(str)).all(), column
+
+
+def test_csv_batch_writer_header_once_after_empty_batch(tmp_path):
+    """첫 배치가 비어 있어도 CSV 헤더를 한 번만 쓰는지 테스트"""
+    from storage import CSVStorage
+
+    df = pd.DataFrame({'date': ['2024-01-15', '2024-02-15'], 'actual': [1.0, 2.0]})
+    path = str(tmp_path / 'out.csv')
+    with CSVStorage().open_writer(path) as writer:
+        writer.write(df.iloc[:0])
+        writer.write(df.iloc[:1])
+        writer.write(df.iloc[1:])
+    assert writer.rows == 2
+    pd.testing.assert_frame_equal(pd.read_csv(path, encoding='utf-8-sig'), df)
+
+
+def test_pipeline_stage_profiling_and_logger(tmp_path, monkeypatch, capsys):
+    """단계별 계측 기록 / trace-event 파일 / cProfile 훅 및 로그 수준 설정 테스트"""
+    import json
+    import logging
+    from etl_bloomberg import BloombergETL
+    from profiling import StageProfiler, configure_logging
+
+    monkeypatch.chdir(os.path.dirname(SAMPLE_PATH))
+    profiler = StageProfiler(profile=['transform'], trace_memory=True)
+    etl = BloombergETL(use_sample=True, features=True, profiler=profiler)
+    trace_path = tmp_path / 'trace.json'
+    etl.run_pipeline(output_path=str(tmp_path / 'out.csv'), trace_path=str(trace_path))
+    assert '✅ ETL 파이프라인 완료' in capsys.readouterr().out
+
+    table = profiler.table().set_index('name')
+    assert list(table.index) == ['etl_pipeline', 'extract', 'validate', 'transform', 'features', 'load']
+    assert table.loc['extract', 'rows_out'] == table.loc['validate', 'rows_in'] == len(etl.raw_data)
+    assert table.loc['validate', 'rows_out'] == table.loc['transform', 'rows_in']
+    assert table.loc['load', 'rows_out'] == len(etl.transformed_data)
+    assert (table['wall_seconds'] > 0).all() and (table['py_peak_bytes'] >= 0).all()
+    assert table.loc['etl_pipeline', 'wall_seconds'] >= table.loc[['extract', 'transform', 'load'], 'wall_seconds'].sum()
+
+    events = json.loads(trace_path.read_text(encoding='utf-8'))['traceEvents']
+    assert [event['name'] for event in events] == list(table.index)
+    assert all(event['ph'] == 'X' and event['dur'] > 0 for event in events)
+    assert events[1]['args']['rows_out'] == len(etl.raw_data)
+
+    assert list(profiler.profiles) == ['transform']
+    assert [os.path.basename(path) for path in profiler.dump_profiles(str(tmp_path / 'prof'))] == ['transform.prof']
+
+    # WARNING 이상이면 진행 메시지 출력 없음
+    try:
+        configure_logging(logging.WARNING)
+        BloombergETL(use_sample=True).run_pipeline(output_path=str(tmp_path / 'quiet.csv'))
+        assert '✅' not in capsys.readouterr().out
+    finally:
+        configure_logging()
+
+
+
+def test_stage_profiler_rss_and_threaded_profiles():
+    """단계 중 RSS 증가량이 프로세스 최대치와 무관하게 측정되고, 같은 이름 단계를 여러 스레드에서 프로파일링하는지 테스트"""
+    import threading
+    import time
+    from profiling import StageProfiler
+
+    # 프로세스 최대 RSS를 먼저 높여 두어도 이후 단계의 증가량이 0이 되지 않음
+    peak = np.ones(40_000_000)
+    del peak
+    profiler = StageProfiler(profile=True)
+    with profiler.stage('transient'):
+        block = np.ones(20_000_000)   # 160MB, 단계 안에서 해제
+        time.sleep(0.1)
+        del block
+    with profiler.stage('idle'):
+        time.sleep(0.02)
+    rss = profiler.table().set_index('name')['peak_rss_delta_bytes']
+    assert rss['transient'] > 100 * 2 ** 20 and rss['idle'] < 20 * 2 ** 20
+
+    # TaskGraph I/O 스레드처럼 같은 이름의 단계가 동시에 실행됨
+    barrier = threading.Barrier(4)
+
+    def work():
+        with profiler.stage('io'):
+            barrier.wait()
+            sorted(range(1000))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    calls = {func[2]: stat[1] for func, stat in profiler.profiles['io'].stats.items()}
+    assert calls['<built-in method builtins.sorted>'] == 4
+
+
+def test_graph_pipeline_matches_and_skips_unchanged(tmp_path, monkeypatch):
+    """작업 그래프 결과가 run_pipeline과 같고, 입력이 같은 작업은 다음 실행에서 생략되는지 테스트"""
+    import fake_blpapi
+    from openpyxl import load_workbook
+    from etl_bloomberg import BloombergETL
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0.0)
+    args = (['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+    expected_path = tmp_path / 'expected.csv'
+    BloombergETL(bloomberg_api=fake_blpapi).run_pipeline(*args, output_path=str(expected_path))
+
+    output_path = tmp_path / 'graph.csv'
+    summary = {'output_path': str(tmp_path / 'summary.xlsx'), 'streaming': True, 'include_rows': False}
+    state_dir = str(tmp_path / 'state')
+
+    def run(reports, features=False):
+        return BloombergETL(bloomberg_api=fake_blpapi, features=features).run_graph(
+            *args, output_path=str(output_path), reports=reports, state_dir=state_dir)
+
+    first = run([summary])
+    assert first.skipped == []
+    assert output_path.read_bytes() == expected_path.read_bytes()
+    assert load_workbook(summary['output_path']).sheetnames == ['Summary', 'Trends', 'Accuracy', 'Surprises']
+
+    # 추출 결과가 같으면 추출만 다시 실행하고, 새로 추가한 레포트만 생성
+    full = {'output_path': str(tmp_path / 'full.xlsx'), 'streaming': True}
+    second = run([summary, full])
+    assert sorted(second.ran) == ['extract:CPI', 'extract:GDP', 'extract:UNEMPLOYMENT', f"report:{full['output_path']}"]
+    assert len(load_workbook(full['output_path']).sheetnames) == 4 + 1 + 3
+    assert second.value('combine').equals(first.value('combine'))
+
+    # 변환 설정이 바뀌면 변환 이후 작업 모두 다시 실행
+    third = run([summary, full], features=True)
+    assert third.skipped == []
+    assert 'surprise_zscore' in third.value('combine').columns
+
+
+def test_graph_pipeline_with_extraction_cache(tmp_path, monkeypatch):
+    """작업 그래프의 I/O 스레드들이 추출 캐시 하나를 함께 사용할 수 있는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from extract_cache import ExtractionCache
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0.0)
+    args = (['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+    expected = BloombergETL(bloomberg_api=fake_blpapi).run_pipeline(*args, output_path=str(tmp_path / 'expected.csv'))
+
+    cache = ExtractionCache(str(tmp_path / 'cache.sqlite'))
+    for run in range(2):
+        result = BloombergETL(bloomberg_api=fake_blpapi, cache=cache).run_graph(
+            *args, output_path=str(tmp_path / 'graph.csv'), state_dir=None, io_workers=3)
+        pd.testing.assert_frame_equal(result.value('combine'), expected)
+    # 두 번째 실행은 9개 시계열 × 18개월 모두 캐시 적중
+    assert cache.stats()['hits'] == 9 * 18
+    cache.close()
+
+
+def test_validate_raw_quarantines_bad_rows():
+    """품질 검증 규칙별 격리 사유 / 통과 행 dtype / 스키마 오류 테스트"""
+    from data_quality import validate_raw
+    from transform_engine import transform_indicators
+
+    # 정상 시계열 50개월 + 급등 1건 (이상치)
+    dates = pd.date_range('2020-01-15', periods=51, freq='MS').strftime('%Y-%m-%d').tolist()
+    series = pd.DataFrame({
+        'date': dates, 'indicator': 'CPI', 'country': 'USA',
+        'forecast': 2.0, 'actual': [2.0 + 0.01 * (i % 5) for i in range(50)] + [100.0], 'previous': 2.0,
+    })
+    bad = pd.DataFrame({
+        'date': ['2024-01-15', '2024-01-15', 'not a date', '2024-02-15', None, '2024-01-15', '2024-03-15'],
+        'indicator': ['GDP'] * 7,
+        'country': ['Japan', 'Japan', 'Japan', 'China', 'China', None, 'Japan'],
+        'forecast': [1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 'n/a'],
+        'actual': [1.0, 2.0, 1.0, 1.0, np.nan, 1.0, 1.0],
+        'previous': [1.0, 1.0, 1.0, 1.0, 1.0, np.inf, 1.0],
+    })
+    raw = pd.concat([series, bad], ignore_index=True)
+    result = validate_raw(raw)
+
+    reasons = result.quarantine['reasons'].to_dict()
+    assert reasons == {
+        50: 'outlier', 52: 'duplicate_key', 53: 'bad_type', 54: 'zero_divisor',
+        55: 'missing_key;missing_value', 56: 'missing_key;non_finite', 57: 'bad_type',
+    }
+    assert result.quarantine.loc[53, 'date'] == 'not a date'   # 격리 행은 원본 값 그대로
+    assert result.summary['rows_in'] == len(raw)
+    assert result.summary['rows_valid'] == len(result.valid) == 51
+    assert result.summary['rules']['missing_key'] == 2
+    assert list(result.valid.index) == list(range(50)) + [51]
+
+    assert str(result.valid['date'].dtype).startswith('datetime64')
+    assert list(result.valid['country'].cat.categories) == ['Japan', 'USA']   # China는 모두 격리
+    transformed = transform_indicators(result.valid)
+    assert np.isfinite(transformed[['forecast_error_pct', 'mom_change_pct', 'forecast_accuracy']]).all().all()
+
+    assert validate_raw(raw, outlier_z=None).summary['rules']['outlier'] == 0
+    with pytest.raises(ValueError, match='previous'):
+        validate_raw(raw.drop(columns=['previous']))
+
+
+def test_validate_raw_outliers_in_short_series():
+    """12개월 시계열의 급등 / 이력을 함께 쓴 짧은 배치의 급등을 이상치로 격리하는지 테스트"""
+    from data_quality import validate_raw
+
+    def series(country, actual):
+        dates = pd.date_range('2023-01-15', periods=len(actual), freq='MS').strftime('%Y-%m-%d').tolist()
+        return pd.DataFrame({'date': dates, 'indicator': 'CPI', 'country': country,
+                             'forecast': 2.0, 'actual': actual, 'previous': 2.0})
+
+    # 평균/표준편차 기준으로는 12개 중 최대 |z|가 sqrt(11)이라 검출되지 않던 급등
+    normal = [2.0 + 0.1 * (i % 3) for i in range(11)]
+    raw = pd.concat([series('USA', normal + [10.0]), series('Japan', [0.1] * 11 + [0.5])], ignore_index=True)
+    assert validate_raw(raw).quarantine['reasons'].to_dict() == {11: 'outlier'}   # 일정하던 시계열의 변화는 유지
+
+    # 증분 배치 (발표 2건): 이력 없이는 판단하지 않고, 이력을 주면 배치 행만 판단
+    batch = series('USA', [2.1, 10.0]).assign(date=['2024-01-15', '2024-02-15'])
+    assert validate_raw(batch).summary['rules']['outlier'] == 0
+    result = validate_raw(batch, history=series('USA', normal))
+    assert result.quarantine['reasons'].to_dict() == {1: 'outlier'} and len(result.valid) == 1
+
+
+def test_incremental_quarantines_outlier_against_history(tmp_path, monkeypatch):
+    """증분 ETL이 새 발표 몇 건뿐인 배치의 이상치를 저장된 이력 기준으로 격리하는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0)
+    options = dict(indicators=['CPI'], countries=['US', 'JP'], start_date='2022-01-01',
+                   output_dir=str(tmp_path / 'out'))
+    BloombergETL(bloomberg_api=fake_blpapi).run_incremental(end_date='2024-03-31', **options)
+
+    history = fake_blpapi.fake_history
+
+    def spiked(ticker, start, end):
+        rows = history(ticker, start, end)
+        for row in rows:
+            if ticker == 'CPI US Index' and row['date'].isoformat() == '2024-05-15':
+                row['PX_LAST'] += 50
+        return rows
+
+    monkeypatch.setattr(fake_blpapi, 'fake_history', spiked)
+    etl = BloombergETL(bloomberg_api=fake_blpapi)
+    df = etl.run_incremental(end_date='2024-06-30', **options)
+    assert etl.validation_summary['rules']['outlier'] == 1
+    assert etl.quarantined[['date', 'country']].values.tolist() == [['2024-05-15', 'US']]
+    assert len(df) == 2 * 3 - 1
+
+
+def test_pipeline_quarantine_output(tmp_path, monkeypatch):
+    """ETL 파이프라인이 격리 행을 변환하지 않고 사유와 함께 저장하는지 테스트"""
+    from etl_bloomberg import BloombergETL
+
+    raw = pd.read_csv(SAMPLE_PATH)
+    raw.loc[3, 'forecast'] = 0.0
+    pd.concat([raw, raw.iloc[[5]]]).to_csv(tmp_path / 'bloomberg_sample_data.csv', index=False)
+    monkeypatch.chdir(tmp_path)
+
+    etl = BloombergETL(use_sample=True, quarantine_path=str(tmp_path / 'quarantine.csv'))
+    result = etl.run_pipeline(output_path=str(tmp_path / 'out.csv'))
+
+    assert len(result) == len(raw) - 1
+    assert np.isfinite(result['forecast_accuracy']).all()
+    assert etl.validation_summary['rows_quarantined'] == 2
+    quarantine = pd.read_csv(tmp_path / 'quarantine.csv')
+    assert sorted(quarantine['reasons']) == ['duplicate_key', 'zero_divisor']
+
+    # 검증을 끄면 기존처럼 모든 행 변환
+    unchecked = BloombergETL(use_sample=True, validation=False).run_pipeline(output_path=str(tmp_path / 'all.csv'))
+    assert len(unchecked) == len(raw) + 1
+
+
+def test_etl_daemon_serves_hot_dataset(tmp_path, monkeypatch):
+    """상주 ETL 데몬: 소켓으로 스냅샷 게시, 변경 없는 갱신은 버전 유지, 변경 시 새 데이터셋"""
+    pytest.importorskip('pyarrow')
+    import threading
+    from etl_bloomberg import BloombergETL
+    from etl_daemon import DaemonClient, ETLDaemon
+    from indicator_data import DaemonSource
+
+    raw = pd.read_csv(SAMPLE_PATH)
+    raw.to_csv(tmp_path / 'bloomberg_sample_data.csv', index=False)
+    monkeypatch.chdir(tmp_path)
+
+    daemon = ETLDaemon(BloombergETL(use_sample=True), interval=3600, socket_path=str(tmp_path / 'etl.sock'),
+                       snapshot_dir=str(tmp_path / 'snapshots'))
+    thread = threading.Thread(target=daemon.run)
+    thread.start()
+    try:
+        assert daemon.ready.wait(30)
+        client = DaemonClient(daemon.socket_path)
+        df = client.data()
+        etl = BloombergETL(use_sample=True)
+        etl.raw_data = raw
+        expected = etl.transform()
+        pd.testing.assert_frame_equal(df, expected.reset_index(drop=True), check_categorical=False)
+        assert client.data() is df   # 바뀌지 않았으면 다시 매핑하지 않음
+
+        source = DaemonSource(daemon.socket_path)
+        assert len(source.data()) == len(raw) and source.token() == client.token
+
+        # 같은 데이터로 갱신하면 버전 유지, 값이 바뀌면 새 데이터셋 게시
+        assert client.refresh()['version'] == 1
+        raw.loc[0, 'actual'] += 1
+        raw.to_csv(tmp_path / 'bloomberg_sample_data.csv', index=False)
+        info = client.refresh()
+        assert info['version'] == 2 and info['refreshes'] == 3
+        assert client.data()['actual'][0] == raw['actual'][0]
+        assert source.poll() and source.data()['actual'].sum() == pytest.approx(raw['actual'].sum())
+
+        with pytest.raises(ValueError):
+            client.request('unknown')
+    finally:
+        DaemonClient(daemon.socket_path).stop()
+        thread.join(30)
+    assert not thread.is_alive() and not os.path.exists(daemon.socket_path)
+
+
+def test_etl_daemon_refresh_with_cache(tmp_path, monkeypatch):
+    """상주 ETL 데몬: 실행기 스레드의 갱신이 추출 캐시를 사용하고, 계측 기록은 마지막 갱신 것만 남는지 테스트"""
+    pytest.importorskip('pyarrow')
+    import threading
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from etl_daemon import DaemonClient, ETLDaemon
+    from extract_cache import ExtractionCache
+
+    monkeypatch.setattr(fake_blpapi.Session, 'latency', 0.0)
+    cache = ExtractionCache(str(tmp_path / 'cache.sqlite'))
+    etl = BloombergETL(bloomberg_api=fake_blpapi, cache=cache)
+    daemon = ETLDaemon(etl, interval=3600, socket_path=str(tmp_path / 'etl.sock'),
+                       snapshot_dir=str(tmp_path / 'snapshots'))
+    thread = threading.Thread(target=daemon.run)
+    thread.start()
+    try:
+        assert daemon.ready.wait(30)
+        client = DaemonClient(daemon.socket_path)
+        assert client.status()['last_error'] is None and client.status()['version'] == 1
+        stages = [record['name'] for record in etl.profiler.records]
+        assert cache.stats()['hits'] == 0
+
+        for refreshes in (2, 3):
+            info = client.refresh()
+            assert info['last_error'] is None and info['refreshes'] == refreshes and info['version'] == 1
+            assert [record['name'] for record in etl.profiler.records] == stages
+        assert cache.stats()['hits'] > 0
+    finally:
+        DaemonClient(daemon.socket_path).stop()
+        thread.join(30)
+    assert not thread.is_alive()
+    cache.close()
+
+
+def test_persistent_session_reused_across_extracts(monkeypatch):
+    """persistent_session 블록 안의 추출은 블룸버그 세션 하나를 재사용하는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+
+    sessions = []
+
+    class RecordingSession(fake_blpapi.Session):
+        def __init__(self, options=None):
+            super().__init__(options)
+            sessions.append(self)
+
+    monkeypatch.setattr(fake_blpapi, 'Session', RecordingSession)
+
+    etl = BloombergETL(bloomberg_api=fake_blpapi)
+    with etl.persistent_session():
+        for _ in range(3):
+            etl.extract_from_bloomberg(['GDP', 'CPI'], ['US', 'JP'], '2024-01-01', '2024-03-31')
+    assert len(sessions) == 1
+    etl.extract_from_bloomberg(['GDP'], ['US'], '2024-01-01', '2024-03-31')
+    assert len(sessions) == 2
+
+
+def test_cli_etl_and_report(tmp_path, monkeypatch):
+    """통합 CLI의 etl / report 하위 명령이 각 모듈 실행과 같은 결과 파일을 만드는지 테스트"""
+    pytest.importorskip('pyarrow')
+    import shutil
+    import cli
+    from profiling import configure_logging
+
+    shutil.copy(SAMPLE_PATH, tmp_path / 'bloomberg_sample_data.csv')
+    monkeypatch.chdir(tmp_path)
+
+    try:
+        cli.main(['-q', 'etl', '--sample', '--output', 'out.parquet'])
+        assert len(pd.read_parquet(tmp_path / 'out.parquet')) == len(pd.read_csv(SAMPLE_PATH))
+        cli.main(['-q', 'report', '--input', 'out.parquet', '--renderer', 'csv', '--output', 'report_csv',
+                  '--summary-only'])
+        assert 'Summary.csv' in os.listdir(tmp_path / 'report_csv')
+    finally:
+        # -q가 바꾼 로그 레벨 복원
+        configure_logging()
+
+    with pytest.raises(SystemExit):
+        cli.main(['report', '--renderer', 'pdf'])
+
+
+def test_cli_incremental_defaults_and_trace(tmp_path, monkeypatch):
+    """CLI incremental 모드가 분할 저장 디렉터리 기본값을 쓰고 --trace로 계측 결과를 저장하는지 테스트"""
+    import json
+    import shutil
+    import cli
+    from profiling import configure_logging
+
+    shutil.copy(SAMPLE_PATH, tmp_path / 'bloomberg_sample_data.csv')
+    monkeypatch.chdir(tmp_path)
+
+    try:
+        cli.main(['-q', 'etl', '--sample', '--mode', 'incremental', '--trace', 'trace.json'])
+    finally:
+        configure_logging()
+    assert os.path.exists(tmp_path / 'bloomberg_data' / '_watermarks.json')
+    assert not os.path.exists(tmp_path / cli.ETL_OUTPUT)
+    with open(tmp_path / 'trace.json', encoding='utf-8') as f:
+        names = {event['name'] for event in json.load(f)['traceEvents']}
+    assert {'etl_incremental', 'extract', 'diff', 'validate', 'transform', 'load'} <= names
+
+
+def test_cli_defers_heavy_imports(tmp_path):
+    """CLI 시작과 openpyxl 외 렌더러 레포트가 무거운 모듈을 import하지 않는지 테스트"""
+    import subprocess
+    import sys
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = pd.read_csv(SAMPLE_PATH)
+    etl.transform()
+    etl.load(str(tmp_path / 'transformed.csv'))
+
+    script = (
+        "import sys, cli\n"
+        "cli.build_parser().parse_args(['report'])\n"
+        "print(sorted(name for name in ('pandas', 'openpyxl', 'dash', 'plotly') if name in sys.modules))\n"
+        "cli.main(['-q', 'report', '--input', sys.argv[1], '--renderer', 'html', '--output', sys.argv[2]])\n"
+        "print('openpyxl' in sys.modules)\n"
+    )
+    root = os.path.dirname(os.path.abspath(__file__))
+    output = subprocess.run([sys.executable, '-c', script, str(tmp_path / 'transformed.csv'),
+                             str(tmp_path / 'report.html')],
+                            cwd=root, check=True, capture_output=True, text=True).stdout.splitlines()
+    assert output[0] == '[]'
+    assert output[-1] == 'False'
+
+
+@pytest.fixture
+def mirror():
+    """로컬 REST 미러 서버 fixture (fake_blpapi와 같은 시계열 응답)"""
+    from fake_http_mirror import FakeMirrorServer
+
+    with FakeMirrorServer(latency=0.005, page_rows=4, failures={'CPI JP Index': 1}, missing={'GDP US Index'}) as server:
+        yield server
+
+
+def test_http_source_pools_connections(mirror):
+    """HTTP 소스가 호스트별 연결을 재사용하고 동시 요청 수를 제한하며 blpapi와 같은 데이터를 추출하는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from extract_sources import HTTPSource
+
+    source = HTTPSource(mirror.url, max_per_host=2)
+    etl = BloombergETL(sources=[source])
+    df = etl.extract_from_bloomberg(['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+
+    # 시계열 9개 + CPI JP 재시도 1번, 연결은 최대 동시 요청 수만큼만 열림
+    assert mirror.requests == 10
+    assert mirror.connections == source.connections_opened <= 2 and mirror.max_concurrent <= 2
+    assert etl.failed_securities == {'GDP US Index': f"{source.name}: HTTP 404"}
+
+    expected = BloombergETL(bloomberg_api=fake_blpapi).extract_from_bloomberg(
+        ['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+    expected = expected[(expected['indicator'] != 'GDP') | (expected['country'] != 'US')].reset_index(drop=True)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_graph_pipeline_with_http_source(mirror, tmp_path):
+    """작업 그래프의 I/O 스레드들이 HTTP 소스 하나를 함께 사용할 때 호스트별 제한/실패 종목/정리가 올바른지 테스트"""
+    import gc
+    import threading
+    import warnings
+    from etl_bloomberg import BloombergETL
+    from extract_sources import HTTPSource
+
+    args = (['GDP', 'CPI', 'UNEMPLOYMENT'], ['US', 'CN', 'JP'], '2023-01-01', '2024-06-30')
+    source = HTTPSource(mirror.url, max_per_host=2)
+    etl = BloombergETL(sources=[source])
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always', ResourceWarning)
+        result = etl.run_graph(*args, output_path=str(tmp_path / 'graph.csv'), state_dir=None,
+                               indicators_per_batch=1, io_workers=3)
+        gc.collect()
+
+    # 추출 작업 3개가 동시에 요청해도 호스트별 동시 요청/연결은 2개까지
+    assert mirror.requests == 10
+    assert mirror.connections == source.connections_opened <= 2 and mirror.max_concurrent <= 2
+    assert etl.failed_securities == {'GDP US Index': f"{source.name}: HTTP 404"}
+    # 마지막 추출 작업이 끝나면 요청 루프 스레드와 연결 정리
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+    assert f"{source.name}-loop" not in [thread.name for thread in threading.enumerate()]
+
+    expected = BloombergETL(sources=[HTTPSource(mirror.url)]).run_pipeline(
+        *args, output_path=str(tmp_path / 'expected.csv'))
+    pd.testing.assert_frame_equal(result.value('combine'), expected)
+
+
+def test_multi_source_merge_priority(mirror, tmp_path):
+    """여러 소스를 동시에 추출하여 (date, country, indicator) 기준으로 앞 소스 우선으로 합치는지 테스트"""
+    import fake_blpapi
+    from etl_bloomberg import BloombergETL
+    from extract_sources import FileDropSource, HTTPSource
+
+    # 파일 드롭: CPI US 한 건 수정본 + 미러에 없는 GDP US
+    drop = tmp_path / 'drop'
+    drop.mkdir()
+    pd.DataFrame({
+        'date': ['2024-02-15', '2024-01-15', '2024-02-15'], 'indicator': ['CPI', 'GDP', 'GDP'],
+        'country': ['US', 'US', 'US'], 'forecast': [9.0, 1.0, 1.1], 'actual': [9.5, 1.2, 1.3],
+    }).to_csv(drop / 'revisions.csv', index=False)
+
+    etl = BloombergETL(bloomberg_api=fake_blpapi,
+                       sources=[FileDropSource(str(drop)), HTTPSource(mirror.url), 'bloomberg'])
+    df = etl.extract_from_bloomberg(['GDP', 'CPI'], ['US', 'JP'], '2024-01-01', '2024-03-31')
+
+    assert len(df) == 4 * 3 and not df.duplicated(['date', 'country', 'indicator']).any()
+    assert not etl.failed_securities
+    cpi_us = df[(df['indicator'] == 'CPI') & (df['country'] == 'US')].set_index('date')
+    assert cpi_us.loc['2024-02-15', 'actual'] == 9.5
+    assert cpi_us.loc['2024-03-15', 'previous'] == 9.5
+    # GDP US: 1, 2월은 파일 드롭, 3월은 blpapi
+    gdp_us = df[(df['indicator'] == 'GDP') & (df['country'] == 'US')]
+    assert list(gdp_us['actual'].iloc[:2]) == [1.2, 1.3]
+    assert gdp_us['actual'].iloc[2] == fake_blpapi.fake_history('GDP US Index', *map(
+        pd.Timestamp.date, pd.to_datetime(['2024-03-01', '2024-03-31'])))[0]['PX_LAST']
@@ -0,0 +1,216 @@
+import os
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from openpyxl.cell.cell import MergedCell
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bloomberg_sample_data.csv')
+
+
+@pytest.fixture
+def transformed_csv(tmp_path):
+    """샘플 데이터를 변환하여 레포트 입력 CSV를 만드는 fixture"""
+    from etl_bloomberg import BloombergETL
+
+    etl = BloombergETL(use_sample=True)
+    etl.raw_data = pd.read_csv(SAMPLE_PATH)
+    etl.transform()
+    path = tmp_path / 'transformed.csv'
+    etl.load(str(path))
+    return str(path)
+
+
+def _cell_signature(cell):
+    return (cell.value, cell.number_format, cell.font.b, cell.font.color.rgb if cell.font.color else None,
+            cell.fill.fill_type, cell.fill.start_color.rgb, cell.alignment.horizontal,
+            cell.border.left.style if cell.border.left else None)
+
+
+def test_streaming_report_matches_default(transformed_csv, tmp_path):
+    """스트리밍 모드 레포트가 기본 모드와 같은 시트/서식/필터를 갖는지 테스트"""
+    from create_excel_report import EconomicReportGenerator
+
+    default_path = EconomicReportGenerator(transformed_csv).generate_report(str(tmp_path / 'default.xlsx'))
+    streaming_path = EconomicReportGenerator(transformed_csv, streaming=True).generate_report(
+        str(tmp_path / 'streaming.xlsx'))
+
+    expected = load_workbook(default_path)
+    actual = load_workbook(streaming_path)
+    assert actual.sheetnames == expected.sheetnames
+
+    for name in expected.sheetnames:
+        ws_expected, ws_actual = expected[name], actual[name]
+        assert ws_actual.dimensions == ws_expected.dimensions
+        assert ws_actual.auto_filter.ref == ws_expected.auto_filter.ref
+        assert sorted(map(str, ws_actual.merged_cells.ranges)) == sorted(map(str, ws_expected.merged_cells.ranges))
+        assert ({k: v.width for k, v in ws_actual.column_dimensions.items()} ==
+                {k: v.width for k, v in ws_expected.column_dimensions.items()})
+
+        for row_expected, row_actual in zip(ws_expected.iter_rows(), ws_actual.iter_rows()):
+            for cell_expected, cell_actual in zip(row_expected, row_actual):
+                if isinstance(cell_expected, MergedCell):
+                    continue
+                if name == 'Summary' and cell_expected.coordinate == 'B3':  # 레포트 생성 시각
+                    continue
+                assert _cell_signature(cell_actual) == _cell_signature(cell_expected), cell_expected.coordinate
+
+
+def test_streaming_report_error_fills(transformed_csv, tmp_path):
+    """스트리밍 모드에서 Error % 조건부 색상이 적용되는지 테스트"""
+    from create_excel_report import EconomicReportGenerator
+
+    path = EconomicReportGenerator(transformed_csv, streaming=True).generate_report(str(tmp_path / 'report.xlsx'))
+    ws = load_workbook(path)['All Data']
+
+    for (cell,) in ws.iter_rows(min_row=2, min_col=8, max_col=8):
+        if cell.value > 0:
+            assert cell.fill.start_color.rgb == '00C6EFCE'
+        elif cell.value < 0:
+            assert cell.fill.start_color.rgb == '00FFC7CE'
+        else:
+            assert cell.fill.fill_type is None
+
+
+def test_parallel_indicator_sheets_are_byte_stable(transformed_csv, tmp_path):
+    """지표별 시트를 여러 프로세스로 생성해도 파일 내용이 같은지 테스트"""
+    import zipfile
+    from create_excel_report import EconomicReportGenerator
+
+    def members(workers):
+        path = EconomicReportGenerator(transformed_csv, streaming=True, workers=workers).generate_report(
+            str(tmp_path / f'report_{workers}.xlsx'))
+        with zipfile.ZipFile(path) as archive:
+            # 생성 시각이 들어가는 문서 속성과 요약 시트 제외
+            return {name: archive.read(name) for name in archive.namelist()
+                    if name not in ('docProps/core.xml', 'xl/worksheets/sheet1.xml')}
+
+    serial = members(1)
+    assert members(2) == serial
+    assert sum(name.startswith('xl/worksheets/sheet') for name in serial) == 3 + 1 + 6  # 집계 3개 + All Data + 지표 6개
+
+    with pytest.raises(ValueError):
+        EconomicReportGenerator(transformed_csv, workers=2)
+
+
+def test_streaming_workbook_openpyxl_internals(monkeypatch):
+    """스트리밍 워크북이 의존하는 openpyxl 내부 구현 확인 (openpyxl 업그레이드 시 여기서 실패)"""
+    from openpyxl.worksheet._writer import WorksheetWriter
+    from create_excel_report import INDICATOR_HEADERS, new_streaming_workbook, render_indicator_sheet
+    from report_model import STYLES
+
+    # 공유 스타일 번호가 등록 순서(기본 스타일 0 다음)로 고정되어야 다른 프로세스의 시트 XML을 그대로 합칠 수 있음
+    frame = pd.DataFrame([['2024-01-15', 'USA', 1.0, 1.1, 0.9, 10.0, 22.2, 90.0, '→ Stable']])
+    path = render_indicator_sheet(frame)
+    with open(path, encoding='utf-8') as f:
+        xml = f.read()
+    os.remove(path)
+    assert xml.count(f's="{list(STYLES).index("indicator_header") + 1}"') == len(INDICATOR_HEADERS)
+    assert f's="{list(STYLES).index("indicator_number") + 1}"' in xml
+
+    monkeypatch.delattr(WorksheetWriter, 'write_tail')
+    with pytest.raises(ImportError, match='WorksheetWriter.write_tail'):
+        new_streaming_workbook()
+
+
+def test_aggregate_sheets_with_charts(transformed_csv, tmp_path):
+    """원본 행 시트 없이 집계 시트와 엑셀 차트만 생성되는지 테스트"""
+    from create_excel_report import EconomicReportGenerator
+
+    path = EconomicReportGenerator(transformed_csv, streaming=True, include_rows=False).generate_report(
+        str(tmp_path / 'aggregates.xlsx'))
+    wb = load_workbook(path)
+    assert wb.sheetnames == ['Summary', 'Trends', 'Accuracy', 'Surprises']
+    assert [len(wb[name]._charts) for name in wb.sheetnames] == [0, 6, 1, 2]
+
+    trends = list(wb['Trends'].iter_rows(min_row=1, max_row=3, values_only=True))
+    assert trends == [('GDP Growth', None, None, None), ('Date', 'China', 'Japan', 'USA'),
+                      ('2024-01-15', 5.4, 1, 2.7)]
+
+    surprises = {row[0]: row[1:] for row in wb['Surprises'].iter_rows(min_row=3, max_row=5, values_only=True)}
+    assert surprises['USA'] == (8, 0, 2)
+
+
+def test_report_sheet_profiling(transformed_csv, tmp_path):
+    """시트별(하위 프로세스 포함) 계측 기록과 행 수 테스트"""
+    from create_excel_report import EconomicReportGenerator
+
+    generator = EconomicReportGenerator(transformed_csv, streaming=True, workers=2)
+    generator.generate_report(str(tmp_path / 'report.xlsx'))
+    table = generator.profiler.table().set_index('name')
+
+    assert table.loc['load_data', 'rows_out'] == len(generator.df)
+    assert table.loc['sheet:All Data', 'rows_out'] == len(generator.df) + 1
+    indicator_sheets = table[table.index.str.startswith('sheet:') & (table['pid'] != os.getpid())]
+    assert len(indicator_sheets) == 6
+    assert (indicator_sheets['rows_out'] == indicator_sheets['rows_in'] + 1).all()
+    assert indicator_sheets['rows_in'].sum() == len(generator.df)
+    assert table.loc['report', 'wall_seconds'] >= table.loc['save', 'wall_seconds']
+
+
+def _styled_values(ws):
+    """값이 있는 셀의 값/서식 (색상은 투명도 자리를 제외한 RGB)"""
+    return {cell.coordinate: (cell.value, cell.number_format, bool(cell.font.b),
+                              cell.fill.start_color.rgb[-6:] if cell.fill.fill_type else None,
+                              cell.alignment.horizontal, cell.border.left.style if cell.border.left else None)
+            for row in ws.iter_rows() for cell in row if cell.value is not None}
+
+
+def test_xlsxwriter_renderer_matches_openpyxl(transformed_csv, tmp_path):
+    """xlsxwriter 렌더러가 openpyxl 레포트와 같은 값/서식/병합/필터/차트를 갖는지 테스트"""
+    pytest.importorskip('xlsxwriter')
+    from create_excel_report import EconomicReportGenerator
+
+    expected = load_workbook(EconomicReportGenerator(transformed_csv).generate_report(str(tmp_path / 'openpyxl.xlsx')))
+    actual = load_workbook(EconomicReportGenerator(transformed_csv, renderer='xlsxwriter').generate_report(
+        str(tmp_path / 'xlsxwriter.xlsx')))
+    assert actual.sheetnames == expected.sheetnames
+
+    for name in expected.sheetnames:
+        ws_expected, ws_actual = expected[name], actual[name]
+        values_expected, values_actual = _styled_values(ws_expected), _styled_values(ws_actual)
+        if name == 'Summary':  # 레포트 생성 시각
+            del values_expected['B3'], values_actual['B3']
+        assert values_actual == values_expected, name
+        assert ws_actual.auto_filter.ref == ws_expected.auto_filter.ref
+        assert sorted(map(str, ws_actual.merged_cells.ranges)) == sorted(map(str, ws_expected.merged_cells.ranges))
+        assert len(ws_actual._charts) == len(ws_expected._charts)
+
+
+def test_html_and_csv_renderers(transformed_csv, tmp_path):
+    """HTML / CSV 렌더러가 같은 레이아웃 모델의 시트와 조건부 스타일을 출력하는지 테스트"""
+    from create_excel_report import EconomicReportGenerator
+
+    html_path = EconomicReportGenerator(transformed_csv, renderer='html').generate_report(str(tmp_path / 'report.html'))
+    generator = EconomicReportGenerator(transformed_csv, renderer='csv')
+    csv_dir = generator.generate_report(str(tmp_path / 'report_csv'))
+    df = generator.df
+
+    with open(html_path, encoding='utf-8') as f:
+        content = f.read()
+    assert content.count('<section') == 4 + 1 + df['indicator'].nunique()
+    assert content.count('<td class="detail_positive">') == (df['forecast_error_pct'] > 0).sum()
+    assert content.count('<td class="detail_negative">') == (df['forecast_error_pct'] < 0).sum()
+
+    assert sorted(os.listdir(csv_dir))[:5] == ['Accuracy.csv', 'All_Data.csv', 'CPI.csv', 'GDP_Growth.csv',
+                                               'Industrial_Production.csv']
+    detail = pd.read_csv(os.path.join(csv_dir, 'All_Data.csv'), encoding='utf-8-sig')
+    assert list(detail.columns[:3]) == ['Date', 'Country', 'Indicator'] and len(detail) == len(df)
+    assert {'Surprises_1.csv', 'Surprises_2.csv'} <= set(os.listdir(csv_dir))
+
+    with pytest.raises(ValueError):
+        EconomicReportGenerator(transformed_csv, renderer='pdf')
+
+
+def test_table_rows_in_chunks(transformed_csv):
+    """표 행을 청크 단위로 변환해도 한 번에 변환한 값/스타일과 같은지 테스트"""
+    from create_excel_report import EconomicReportGenerator
+    from report_renderers import _table_rows
+
+    generator = EconomicReportGenerator(transformed_csv, renderer='html')
+    generator.load_data()
+    detail = next(sheet for sheet in generator.report_model() if sheet.name == 'All Data').tables[0]
+    rows = list(_table_rows(detail, chunk_rows=7))
+    assert len(rows) == len(detail.data)
+    assert rows == list(_table_rows(detail, chunk_rows=len(detail.data)))
+    assert {style for _, styles in rows for style in styles} >= {'detail_positive', 'detail_negative'}
@@ -0,0 +1,77 @@
+"""
+거시경제 지표 변환 엔진
+BloombergETL.transform과 prepare_sample_data.py가 공통으로 사용하는 컬럼 단위(벡터화) 계산 로직입니다.
+"""
+import numpy as np
+import pandas as pd
+
+
+SURPRISE_CATEGORIES = ['Positive Surprise', 'In Line', 'Negative Surprise']
+TREND_CATEGORIES = ['↑ Improving', '→ Stable', '↓ Declining']
+
+# 서프라이즈 판단 기준 (예측 오차율 %)
+SURPRISE_THRESHOLD = 1
+
+DERIVED_COLUMNS = ['forecast_error', 'forecast_error_pct', 'mom_change', 'mom_change_pct',
+                   'forecast_accuracy', 'surprise', 'trend']
+
+
+def classify(values, threshold, categories):
+    """
+    값을 양수/중립/음수 3단계 범주로 분류 (Categorical)
+
+    values > threshold 이면 categories[0], values < -threshold 이면 categories[2],
+    그 외(NaN 포함)는 categories[1]
+    """
+    codes = np.select([values > threshold, values < -threshold], [0, 2], default=1).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+
+def transform_indicators(raw_data):
+    """
+    원시 데이터에 파생 지표 컬럼을 계산하여 새 DataFrame 반환
+
+    원본 DataFrame 전체를 복사하지 않고, 필요한 컬럼만 배열로 읽어 결과 프레임을 한 번에 구성합니다.
+    country/indicator/surprise/trend는 Categorical dtype으로 저장됩니다.
+
+    Args:
+        raw_data: date, indicator, country, forecast, actual, previous 컬럼을 가진 DataFrame
+    """
+    forecast = raw_data['forecast'].to_numpy(dtype=np.float64)
+    actual = raw_data['actual'].to_numpy(dtype=np.float64)
+    previous = raw_data['previous'].to_numpy(dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 예측 오차 계산
+        forecast_error = actual - forecast
+        forecast_error_pct = np.round(forecast_error / forecast * 100, 2)
+
+        # 전월 대비 변화
+        mom_change = actual - previous
+        mom_change_pct = np.round(mom_change / previous * 100, 2)
+
+    # 예측 정확도
+    forecast_accuracy = np.round(np.clip(100 - np.abs(forecast_error_pct), 0, 100), 2)
+
+    columns = {}
+    for name in raw_data.columns:
+        if name == 'date':
+            columns[name] = pd.to_datetime(raw_data[name])
+        elif name in ('country', 'indicator'):
+            columns[name] = pd.Categorical(raw_data[name])
+        else:
+            columns[name] = raw_data[name]
+
+    columns.update({
+        'forecast_error': forecast_error,
+        'forecast_error_pct': forecast_error_pct,
+        'mom_change': mom_change,
+        'mom_change_pct': mom_change_pct,
+        'forecast_accuracy': forecast_accuracy,
+        # 서프라이즈 판단 (예측과 실제의 차이가 클 때)
+        'surprise': classify(forecast_error_pct, SURPRISE_THRESHOLD, SURPRISE_CATEGORIES),
+        # 트렌드 판단
+        'trend': classify(mom_change, 0, TREND_CATEGORIES),
+    })
+
+    return pd.DataFrame(columns, index=raw_data.index, copy=False)
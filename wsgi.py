@@ -0,0 +1,39 @@
+"""
+Dash 앱 운영 서비스 진입점 (WSGI)
+
+개발 서버(app.run) 대신 여러 워커 프로세스로 서비스합니다.
+- 데이터: ETL 결과를 Arrow 스냅샷으로 한 번 기록하고 워커는 메모리 매핑으로 공유 (DASH_SHARED_DIR)
+- 콜백 결과: 워커 간 공유 SQLite 캐시 (같은 필터 요청은 어느 워커가 받아도 다시 계산하지 않음)
+- 응답: JSON / HTML / JS / CSS 응답을 gzip으로 압축
+
+    python wsgi.py --workers 4 --threads 8 --port 8050    # waitress 워커 프로세스 (pre-fork)
+    gunicorn -w 4 --preload -b 0.0.0.0:8050 wsgi:application
+
+DASH_SHARED_DIR 환경 변수로 공유 디렉터리를 지정합니다 (기본 .dash_shared, 빈 값이면 공유하지 않음).
+import 시 데이터를 미리 로드하므로 gunicorn은 --preload로 실행하면 워커가 로드 결과를 물려받습니다.
+"""
+import argparse
+import os
+
+os.environ.setdefault("DASH_SHARED_DIR", ".dash_shared")
+
+from app import app, service  # noqa: E402
+from serving import install_compression, preload, serve  # noqa: E402
+
+
+application = install_compression(app.server)
+preload(app, service)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dash 앱 운영 서비스 (워커 프로세스, 공유 데이터/캐시, gzip)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8050)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='워커 프로세스 수')
+    parser.add_argument('--threads', type=int, default=8, help='워커당 요청 처리 스레드 수')
+    args = parser.parse_args()
+    serve(application, args.host, args.port, args.workers, args.threads)
+
+
+if __name__ == '__main__':
+    main()